@@ -35,7 +35,10 @@ from ....protocols.endorse_transaction.v1_0.util import is_author_role
 from ....revocation_anoncreds.models.issuer_cred_rev_record import (
     IssuerCredRevRecord,
 )
-from ....revocation_anoncreds.recover import generate_ledger_rrrecovery_txn
+from ....revocation_anoncreds.recover import (
+    RevocationBitmap,
+    generate_ledger_rrrecovery_txn,
+)
 from ....storage.error import StorageError
 from ....utils import sentinel
 from ....wallet.did_info import DIDInfo
@@ -725,7 +728,7 @@ class LegacyIndyRegistry(BaseAnonCredsResolver, BaseAnonCredsRegistrar):
                 rev_reg_def_id, timestamp_to=timestamp
             )
 
-            if delta is None:
+            if delta is None or not delta["value"].get("accum"):
                 raise AnonCredsObjectNotFound(
                     f"Revocation list not found for rev reg def: {rev_reg_def_id}",
                     {"ledger_id": ledger_id},
@@ -1064,16 +1067,20 @@ class LegacyIndyRegistry(BaseAnonCredsResolver, BaseAnonCredsRegistrar):
         applied_txn = {}
         async with profile.session() as session:
             recs = await IssuerCredRevRecord.query_by_ids(
-                session, rev_reg_id=rev_list.rev_reg_def_id
+                session,
+                rev_reg_id=rev_list.rev_reg_def_id,
+                state=IssuerCredRevRecord.STATE_REVOKED,
             )
 
-            revoked_ids = []
-            for rec in recs:
-                if rec.state == IssuerCredRevRecord.STATE_REVOKED:
-                    revoked_ids.append(int(rec.cred_rev_id))
-                    if int(rec.cred_rev_id) not in rev_reg_delta["value"]["revoked"]:
-                        # await rec.set_state(session, IssuerCredRevRecord.STATE_ISSUED)
-                        rec_count += 1
+            revoked_ids = RevocationBitmap.from_indexes(
+                rec.cred_rev_id
+                for rec in recs
+                if rec.state == IssuerCredRevRecord.STATE_REVOKED
+            )
+            ledger_revoked_ids = RevocationBitmap.from_indexes(
+                rev_reg_delta["value"].get("revoked") or []
+            )
+            rec_count = len(revoked_ids - ledger_revoked_ids)
 
             LOGGER.debug(">>> fixed entry recs count = %s", rec_count)
             LOGGER.debug(
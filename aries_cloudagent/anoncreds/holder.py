@@ -4,8 +4,9 @@ import asyncio
 import json
 import logging
 import re
+import time
 import uuid
-from typing import Dict, Optional, Sequence, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from anoncreds import (
     AnoncredsError,
@@ -26,12 +27,17 @@ from ..ledger.base import BaseLedger
 from ..wallet.error import WalletNotFoundError
 from .error_messages import ANONCREDS_PROFILE_REQUIRED_MSG
 from .models.anoncreds_cred_def import CredDef
+from .registry import AnonCredsRegistry
+from .revocation import AnonCredsRevocation
+from .revocation_state_cache import RevocationStateCache
 
 LOGGER = logging.getLogger(__name__)
 
 CATEGORY_CREDENTIAL = "credential"
 CATEGORY_MASTER_SECRET = "master_secret"
 
+DEFAULT_REFRESH_COUNT = 64
+
 
 def _make_cred_info(cred_id, cred: Credential):
     cred_info = cred.to_dict()  # not secure!
@@ -46,6 +52,36 @@ def _make_cred_info(cred_id, cred: Credential):
     }
 
 
+def _make_cred_info_from_tags(cred_id, tags: dict) -> Optional[dict]:
+    """Build the credential info from the tags of a stored credential.
+
+    Returns None for credentials stored without the revocation id tag, which
+    have to be loaded instead.
+    """
+    if not tags or "cred_rev_id" not in tags:
+        return None
+    attrs = {}
+    for tag, value in tags.items():
+        if tag.startswith("attr::") and tag.endswith("::value"):
+            name = tag[6:-7]
+            attrs[tags.get(f"attr::{name}::name", name)] = value
+    return {
+        "referent": cred_id,
+        "schema_id": tags["schema_id"],
+        "cred_def_id": tags["cred_def_id"],
+        "rev_reg_id": None if tags["rev_reg_id"] == "None" else tags["rev_reg_id"],
+        "cred_rev_id": None if tags["cred_rev_id"] == "None" else tags["cred_rev_id"],
+        "attrs": attrs,
+    }
+
+
+def _row_cred_info(row) -> dict:
+    """Get the credential info of a stored credential row."""
+    return _make_cred_info_from_tags(row.name, row.tags) or _make_cred_info(
+        row.name, Credential.load(row.raw_value)
+    )
+
+
 def _normalize_attr_name(name: str) -> str:
     return name.replace(" ", "")
 
@@ -227,6 +263,11 @@ class AnonCredsHolder:
             "issuer_did": cdef_id_parts[1],
             "cred_def_id": cred_def_id,
             "rev_reg_id": cred_recvd.rev_reg_id or "None",
+            "cred_rev_id": (
+                str(cred_recvd.rev_reg_index)
+                if cred_recvd.rev_reg_index is not None
+                else "None"
+            ),
         }
 
         # FIXME - sdk has some special handling for fully qualified DIDs here
@@ -236,6 +277,9 @@ class AnonCredsHolder:
             attr_name = _normalize_attr_name(k)
             # tags[f"attr::{attr_name}::marker"] = "1"
             tags[f"attr::{attr_name}::value"] = attr_value["raw"]
+            if attr_name != k:
+                # keep the original name for the credential info
+                tags[f"attr::{attr_name}::name"] = k
             if credential_attr_mime_types and k in credential_attr_mime_types:
                 mime_types[k] = credential_attr_mime_types[k]
 
@@ -280,8 +324,7 @@ class AnonCredsHolder:
                 self.profile.settings.get("wallet.askar_profile"),
             )
             async for row in rows:
-                cred = Credential.load(row.raw_value)
-                result.append(_make_cred_info(row.name, cred))
+                result.append(_row_cred_info(row))
         except AskarError as err:
             raise AnonCredsHolderError("Error retrieving credentials") from err
         except AnoncredsError as err:
@@ -299,6 +342,10 @@ class AnonCredsHolder:
     ):
         """Get credentials stored in the wallet.
 
+        Referents with the same restrictions are matched in a single scan, and
+        the credential info is read from the stored tags, so each credential is
+        processed once however many referents it matches.
+
         Args:
             presentation_request: Valid presentation request from issuer
             referents: Presentation request referents to use to search for creds
@@ -315,8 +362,8 @@ class AnonCredsHolder:
             )
         extra_query = extra_query or {}
 
-        creds = {}
-
+        # group the referents by restrictions
+        searches = {}
         for reft in referents:
             names = set()
             if reft in presentation_request["requested_attributes"]:
@@ -338,33 +385,64 @@ class AnonCredsHolder:
                 raise AnonCredsHolderError(
                     f"Unknown presentation request referent: {reft}"
                 )
-
-            tag_filter = {"$exist": [f"attr::{name}::value" for name in names]}
+            searches.setdefault(json.dumps(restr, sort_keys=True), (restr, []))[
+                1
+            ].append((reft, [f"attr::{name}::value" for name in names]))
+
+        matches = {reft: [] for reft in referents}
+        rows = {}
+        for restr, group in searches.values():
+            if len(group) == 1:
+                tag_filter = {"$exist": group[0][1]}
+                offset, limit = start, count
+            else:
+                # one scan for all; page per referent below
+                tag_filter = {"$or": [{"$exist": exist} for _, exist in group]}
+                offset, limit = 0, None
             if restr:
                 # FIXME check if restr is a list or dict? validate WQL format
                 tag_filter = {"$and": [tag_filter] + restr}
             if extra_query:
                 tag_filter = {"$and": [tag_filter, extra_query]}
 
-            rows = self.profile.store.scan(
+            wanted = (start or 0) + count if count is not None else None
+            scan = self.profile.store.scan(
                 CATEGORY_CREDENTIAL,
                 tag_filter,
-                start,
-                count,
+                offset,
+                limit,
                 self.profile.settings.get("wallet.askar_profile"),
             )
-            async for row in rows:
-                if row.name in creds:
-                    creds[row.name]["presentation_referents"].add(reft)
-                else:
-                    cred_info = _make_cred_info(
-                        row.name, Credential.load(row.raw_value)
-                    )
-                    creds[row.name] = {
-                        "cred_info": cred_info,
-                        "interval": presentation_request.get("non_revoked"),
-                        "presentation_referents": {reft},
-                    }
+            async for row in scan:
+                for reft, exist in group:
+                    if len(group) == 1 or (
+                        (wanted is None or len(matches[reft]) < wanted)
+                        and all(tag in row.tags for tag in exist)
+                    ):
+                        matches[reft].append(row.name)
+                        rows.setdefault(row.name, row)
+                if wanted is not None and all(
+                    len(matches[reft]) >= wanted for reft, _ in group
+                ):
+                    break
+            if len(group) > 1:
+                for reft, _ in group:
+                    matches[reft] = matches[reft][start or 0 :]
+
+        creds = {}
+        try:
+            for reft in referents:
+                for name in matches[reft]:
+                    if name in creds:
+                        creds[name]["presentation_referents"].add(reft)
+                    else:
+                        creds[name] = {
+                            "cred_info": _row_cred_info(rows[name]),
+                            "interval": presentation_request.get("non_revoked"),
+                            "presentation_referents": {reft},
+                        }
+        except AnoncredsError as err:
+            raise AnonCredsHolderError("Error loading stored credential") from err
 
         for cred in creds.values():
             cred["presentation_referents"] = list(cred["presentation_referents"])
@@ -572,26 +650,132 @@ class AnonCredsHolder:
     ) -> str:
         """Create current revocation state for a received credential.
 
+        States are cached per credential and revocation list. A state for a
+        newer revocation list is derived from the latest cached state for the
+        credential, rather than computed from the tails file from scratch.
+
         Args:
             cred_rev_id: credential revocation id in revocation registry
             rev_reg_def: revocation registry definition
-            rev_reg_delta: revocation delta
-            timestamp: delta timestamp
+            rev_list: revocation list
+            tails_file_path: path to the local tails file
 
         Returns:
             the revocation state
 
         """
+        cache = self.profile.inject_or(RevocationStateCache)
+        rev_reg_def_id = rev_list.get("revRegDefId")
+        timestamp = rev_list.get("timestamp")
+        if not (rev_reg_def_id and timestamp is not None):
+            cache = None
+        base = None
+        if cache:
+            rev_state = cache.get(rev_reg_def_id, int(cred_rev_id), timestamp)
+            if rev_state:
+                return rev_state
+            base = cache.base(rev_reg_def_id, int(cred_rev_id), timestamp)
+
+        rev_state = None
+        if base:
+            try:
+                rev_state = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    CredentialRevocationState.create,
+                    rev_reg_def,
+                    rev_list,
+                    int(cred_rev_id),
+                    tails_file_path,
+                    *base,
+                )
+            except AnoncredsError as err:
+                LOGGER.debug(
+                    "Could not update revocation state, creating it anew: %s", err
+                )
+        if not rev_state:
+            try:
+                rev_state = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    CredentialRevocationState.create,
+                    rev_reg_def,
+                    rev_list,
+                    int(cred_rev_id),
+                    tails_file_path,
+                )
+            except AnoncredsError as err:
+                raise AnonCredsHolderError("Error creating revocation state") from err
+        rev_state_json = rev_state.to_json()
 
-        try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
-                CredentialRevocationState.create,
-                rev_reg_def,
-                rev_list,
-                int(cred_rev_id),
-                tails_file_path,
+        if cache:
+            cache.set(
+                rev_reg_def_id, int(cred_rev_id), timestamp, rev_state_json, rev_list
             )
-        except AnoncredsError as err:
-            raise AnonCredsHolderError("Error creating revocation state") from err
-        return rev_state.to_json()
+        return rev_state_json
+
+    async def refresh_revocation_states(self, count: int = DEFAULT_REFRESH_COUNT):
+        """Update the cached revocation states of hot credentials.
+
+        The states of the most recently presented credentials are brought up to
+        date with the latest revocation lists, so that presentations find them
+        ready. The registry definition, latest revocation list and tails file
+        are fetched once per registry; registries failing to fetch are backed
+        off, and failures are logged once per registry.
+
+        Args:
+            count: The number of most recently presented credentials to refresh
+        """
+        cache = self.profile.inject_or(RevocationStateCache)
+        if not cache:
+            return
+        registry = self.profile.inject(AnonCredsRegistry)
+        revocation = AnonCredsRevocation(self.profile)
+        now = int(time.time())
+        by_registry: Dict[str, List[int]] = {}
+        for rev_reg_def_id, cred_rev_id in cache.hot(count):
+            by_registry.setdefault(rev_reg_def_id, []).append(cred_rev_id)
+
+        for rev_reg_def_id, cred_rev_ids in by_registry.items():
+            if not cache.refresh_due(rev_reg_def_id):
+                continue
+            try:
+                rev_reg_def = (
+                    await registry.get_revocation_registry_definition(
+                        self.profile, rev_reg_def_id
+                    )
+                ).revocation_registry
+                rev_list = (
+                    await registry.get_revocation_list(
+                        self.profile, rev_reg_def_id, now
+                    )
+                ).revocation_list
+                tails_file_path = await revocation.get_or_fetch_local_tails_path(
+                    rev_reg_def
+                )
+            except BaseError as err:
+                cache.refresh_failed(rev_reg_def_id)
+                LOGGER.warning(
+                    "Could not refresh revocation states in %s: %s",
+                    rev_reg_def_id,
+                    err.roll_up,
+                )
+                continue
+            cache.refresh_succeeded(rev_reg_def_id)
+
+            failed = []
+            for cred_rev_id in cred_rev_ids:
+                try:
+                    await self.create_revocation_state(
+                        str(cred_rev_id),
+                        rev_reg_def.serialize(),
+                        rev_list.serialize(),
+                        tails_file_path,
+                    )
+                except BaseError as err:
+                    failed.append((cred_rev_id, err))
+            if failed:
+                LOGGER.warning(
+                    "Could not refresh revocation states of %d credential(s) in %s: %s",
+                    len(failed),
+                    rev_reg_def_id,
+                    failed[-1][1].roll_up,
+                )
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from time import time
-from typing import Optional, Sequence
+from typing import Any, Callable, Optional, Sequence, Tuple
 
 from anoncreds import (
     AnoncredsError,
@@ -14,7 +14,7 @@ from anoncreds import (
     KeyCorrectnessProof,
     Schema,
 )
-from aries_askar import AskarError
+from aries_askar import AskarError, Entry
 
 from ..askar.profile_anon import (
     AskarAnoncredsProfile,
@@ -31,6 +31,7 @@ from .error_messages import ANONCREDS_PROFILE_REQUIRED_MSG
 from .events import CredDefFinishedEvent
 from .models.anoncreds_cred_def import CredDef, CredDefResult
 from .models.anoncreds_schema import AnonCredsSchema, SchemaResult, SchemaState
+from .object_cache import AnonCredsObjectCache, ObjectLoader
 from .registry import AnonCredsRegistry
 
 LOGGER = logging.getLogger(__name__)
@@ -107,6 +108,72 @@ class AnonCredsIssuer:
         event_bus = self.profile.inject(EventBus)
         await event_bus.notify(self._profile, event)
 
+    async def load_object(
+        self,
+        category: str,
+        ident: str,
+        parse: Callable[[Entry], Any],
+    ) -> Optional[Any]:
+        """Fetch and parse a wallet record, reusing the profile's loaded objects.
+
+        Args:
+            category: The record category
+            ident: The record identifier
+            parse: Loads the object from the record
+
+        Returns:
+            The loaded object, or None if the record does not exist
+
+        """
+
+        async def load() -> Optional[Tuple[Any, int]]:
+            async with self.profile.session() as session:
+                entry = await session.handle.fetch(category, ident)
+            if not entry:
+                return None
+            return parse(entry), len(entry.raw_value)
+
+        return await self._load_cached(category, ident, load)
+
+    async def _load_cached(
+        self, category: str, ident: str, load: ObjectLoader
+    ) -> Optional[Any]:
+        cache = self.profile.inject_or(AnonCredsObjectCache)
+        if cache:
+            return await cache.get_or_load(category, ident, load)
+        loaded = await load()
+        return loaded[0] if loaded else None
+
+    def invalidate_objects(self, *idents: str):
+        """Discard the loaded objects cached for the given identifiers."""
+        cache = self.profile.inject_or(AnonCredsObjectCache)
+        if cache:
+            cache.invalidate(*idents)
+
+    async def get_credential_definition_keys(
+        self, credential_definition_id: str
+    ) -> Tuple[Optional[CredentialDefinition], Optional[CredentialDefinitionPrivate]]:
+        """Get the loaded public and private parts of a credential definition.
+
+        Args:
+            credential_definition_id: The credential definition identifier
+
+        Returns:
+            The credential definition and its private key, each None if not found
+
+        """
+        cred_def = await self.load_object(
+            CATEGORY_CRED_DEF,
+            credential_definition_id,
+            lambda entry: CredentialDefinition.load(entry.raw_value),
+        )
+        cred_def_private = await self.load_object(
+            CATEGORY_CRED_DEF_PRIVATE,
+            credential_definition_id,
+            lambda entry: CredentialDefinitionPrivate.load(entry.raw_value),
+        )
+        return cred_def, cred_def_private
+
     async def _finish_registration(
         self,
         txn: AskarAnoncredsProfileSession,
@@ -384,6 +451,7 @@ class AnonCredsIssuer:
         if not identifier:
             raise AnonCredsIssuerError("cred def id or job id required")
 
+        self.invalidate_objects(identifier)
         try:
             async with self.profile.transaction() as txn:
                 await txn.handle.insert(
@@ -432,6 +500,7 @@ class AnonCredsIssuer:
         self, job_id: str, cred_def_id: str, options: Optional[dict] = None
     ):
         """Finish a cred def."""
+        self.invalidate_objects(job_id, cred_def_id)
         async with self.profile.transaction() as txn:
             entry = await self._finish_registration(
                 txn, CATEGORY_CRED_DEF, job_id, cred_def_id
@@ -552,7 +621,8 @@ class AnonCredsIssuer:
             The new credential offer
 
         """
-        try:
+
+        async def load_offer_keys() -> Optional[Tuple[Tuple[str, Any], int]]:
             async with self.profile.session() as session:
                 cred_def = await session.handle.fetch(
                     CATEGORY_CRED_DEF, credential_definition_id
@@ -560,24 +630,37 @@ class AnonCredsIssuer:
                 key_proof = await session.handle.fetch(
                     CATEGORY_CRED_DEF_KEY_PROOF, credential_definition_id
                 )
+            if not cred_def or not key_proof:
+                return None
+            # The tag holds the full name of the schema,
+            # as opposed to just the sequence number
+            schema_id = (
+                cred_def.tags.get("schema_id")
+                or CredentialDefinition.load(cred_def.raw_value).schema_id
+            )
+            return (
+                (schema_id, KeyCorrectnessProof.load(key_proof.raw_value)),
+                len(key_proof.raw_value),
+            )
+
+        try:
+            offer_keys = await self._load_cached(
+                CATEGORY_CRED_DEF_KEY_PROOF, credential_definition_id, load_offer_keys
+            )
         except AskarError as err:
             raise AnonCredsIssuerError(
                 "Error retrieving credential definition"
             ) from err
-        if not cred_def or not key_proof:
+        except AnoncredsError as err:
+            raise AnonCredsIssuerError("Error creating credential offer") from err
+        if not offer_keys:
             raise AnonCredsIssuerError(
                 "Credential definition not found for credential offer"
             )
         try:
-            # The tag holds the full name of the schema,
-            # as opposed to just the sequence number
-            schema_id = cred_def.tags.get("schema_id")
-            cred_def = CredentialDefinition.load(cred_def.raw_value)
-
+            schema_id, key_proof = offer_keys
             credential_offer = CredentialOffer.create(
-                schema_id or cred_def.schema_id,
-                credential_definition_id,
-                key_proof.raw_value,
+                schema_id, credential_definition_id, key_proof
             )
         except AnoncredsError as err:
             raise AnonCredsIssuerError("Error creating credential offer") from err
@@ -598,15 +681,15 @@ class AnonCredsIssuer:
         schema_attributes = schema_result.schema_value.attr_names
 
         try:
-            async with self.profile.session() as session:
-                cred_def = await session.handle.fetch(CATEGORY_CRED_DEF, cred_def_id)
-                cred_def_private = await session.handle.fetch(
-                    CATEGORY_CRED_DEF_PRIVATE, cred_def_id
-                )
+            cred_def, cred_def_private = await self.get_credential_definition_keys(
+                cred_def_id
+            )
         except AskarError as err:
             raise AnonCredsIssuerError(
                 "Error retrieving credential definition"
             ) from err
+        except AnoncredsError as err:
+            raise AnonCredsIssuerError("Error loading credential definition") from err
 
         if not cred_def or not cred_def_private:
             raise AnonCredsIssuerError(
@@ -631,8 +714,8 @@ class AnonCredsIssuer:
             credential = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: Credential.create(
-                    cred_def.raw_value,
-                    cred_def_private.raw_value,
+                    cred_def,
+                    cred_def_private,
                     credential_offer,
                     credential_request,
                     raw_values,
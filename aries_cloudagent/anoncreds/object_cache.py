@@ -0,0 +1,107 @@
+"""In-process cache of loaded AnonCreds issuance objects."""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+# Loads an object from the wallet: returns the loaded object and the size of its
+# serialized form in bytes, or None if the record does not exist
+ObjectLoader = Callable[[], Awaitable[Optional[Tuple[Any, int]]]]
+
+
+class AnonCredsObjectCache:
+    """Per-profile cache of loaded credential and revocation registry definitions.
+
+    Issuance repeatedly needs the same credential definitions, their private
+    keys and revocation registry definitions. These records do not change once
+    registered under their final identifier, so the loaded objects can be kept
+    in memory and reused, saving a wallet read and a parse per credential.
+    Entries are invalidated whenever the records for an identifier are
+    (re)written, and the least recently used are discarded once the total size
+    of their serialized forms exceeds the maximum.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_size: The maximum total size of cached objects in bytes
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[str, str], Tuple[Any, int]] = OrderedDict()
+        self._versions: Dict[str, int] = {}
+
+    def get(self, category: str, ident: str) -> Optional[Any]:
+        """Get a loaded object, if present."""
+        entry = self._entries.get((category, ident))
+        if entry is None:
+            return None
+        self._entries.move_to_end((category, ident))
+        return entry[0]
+
+    def set(self, category: str, ident: str, value: Any, size: int):
+        """Add a loaded object to the cache."""
+        key = (category, ident)
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        if size > self.max_size:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    async def get_or_load(
+        self, category: str, ident: str, load: ObjectLoader
+    ) -> Optional[Any]:
+        """Get a loaded object, loading and caching it when not present.
+
+        An object loaded while the identifier is invalidated is returned but
+        not cached, as it may reflect the records from before the change.
+        """
+        value = self.get(category, ident)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        version = self._versions.get(ident, 0)
+        loaded = await load()
+        if loaded is None:
+            return None
+        value, size = loaded
+        if self._versions.get(ident, 0) == version:
+            self.set(category, ident, value, size)
+        return value
+
+    def invalidate(self, *idents: str):
+        """Discard all objects cached for the given identifiers."""
+        idents = set(idents)
+        for ident in idents:
+            self._versions[ident] = self._versions.get(ident, 0) + 1
+        for key in [key for key in self._entries if key[1] in idents]:
+            self.size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """Discard all cached objects."""
+        for ident in {key[1] for key in self._entries}:
+            self._versions[ident] = self._versions.get(ident, 0) + 1
+        self._entries.clear()
+        self.size = 0
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(entries={}, size={}, hits={}, misses={})>".format(
+            self.__class__.__name__,
+            len(self._entries),
+            self.size,
+            self.hits,
+            self.misses,
+        )
@@ -1,8 +1,6 @@
 """Revocation through ledger agnostic AnonCreds interface."""
 
 import asyncio
-import hashlib
-import http
 import json
 import logging
 import os
@@ -12,17 +10,17 @@ from typing import List, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from uuid import uuid4
 
-import base58
 from anoncreds import (
     AnoncredsError,
     Credential,
+    CredentialDefinition,
+    CredentialDefinitionPrivate,
     CredentialRevocationConfig,
     RevocationRegistryDefinition,
     RevocationRegistryDefinitionPrivate,
     RevocationStatusList,
 )
-from aries_askar.error import AskarError
-from requests import RequestException, Session
+from aries_askar.error import AskarError, AskarErrorCode
 
 from aries_cloudagent.anoncreds.models.anoncreds_cred_def import CredDef
 
@@ -33,12 +31,15 @@ from ..askar.profile_anon import (
 from ..core.error import BaseError
 from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile, ProfileSession
+from ..revocation.provisioner import DEFAULT_STANDBY_REGISTRIES, RegistryProvisioner
 from ..tails.base import BaseTailsServer
+from ..tails.cache import TailsFileCache
+from ..tails.error import TailsDownloadError
+from ..utils.process_pool import ProcessPool
 from .error_messages import ANONCREDS_PROFILE_REQUIRED_MSG
 from .events import RevListFinishedEvent, RevRegDefFinishedEvent
 from .issuer import (
     CATEGORY_CRED_DEF,
-    CATEGORY_CRED_DEF_PRIVATE,
     STATE_FINISHED,
     AnonCredsIssuer,
 )
@@ -50,11 +51,19 @@ from .models.anoncreds_revocation import (
     RevRegDefState,
 )
 from .registry import AnonCredsRegistry
+from .revocation_index import (
+    IndexRange,
+    RevRegIndexReservations,
+    index_handed_out,
+    return_index_ranges,
+    take_index_ranges,
+)
 from .util import indy_client_dir
 
 LOGGER = logging.getLogger(__name__)
 
 CATEGORY_REV_LIST = "revocation_list"
+CATEGORY_REV_LIST_INDEX = "revocation_list_index"
 CATEGORY_REV_REG_DEF = "revocation_reg_def"
 CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
@@ -63,6 +72,44 @@ STATE_REVOCATION_PENDING = "pending"
 REV_REG_DEF_STATE_ACTIVE = "active"
 
 
+def _create_credentials(
+    credentials: Sequence[Tuple[dict, dict, dict, Optional[int]]],
+    cred_def: str,
+    cred_def_private: str,
+    revocation: Optional[Tuple[str, str, str]],
+) -> Sequence[Tuple[Optional[str], Optional[str]]]:
+    """Create credentials, in a worker process.
+
+    Returns the credential JSON or an error message for each credential.
+    """
+    results = []
+    try:
+        cred_def = CredentialDefinition.load(cred_def)
+        cred_def_private = CredentialDefinitionPrivate.load(cred_def_private)
+        if revocation:
+            rev_reg_def, rev_key, rev_list = revocation
+            rev_reg_def = RevocationRegistryDefinition.load(rev_reg_def)
+            rev_key = RevocationRegistryDefinitionPrivate.load(rev_key)
+            rev_list = RevocationStatusList.load(rev_list)
+    except AnoncredsError as err:
+        return [(None, str(err))] * len(credentials)
+    for offer, request, values, rev_reg_index in credentials:
+        revoc = (
+            CredentialRevocationConfig(rev_reg_def, rev_key, rev_list, rev_reg_index)
+            if revocation
+            else None
+        )
+        try:
+            credential = Credential.create(
+                cred_def, cred_def_private, offer, request, values, None, revoc
+            )
+        except AnoncredsError as err:
+            results.append((None, str(err)))
+        else:
+            results.append((credential.to_json(), None))
+    return results
+
+
 class AnonCredsRevocationError(BaseError):
     """Generic revocation error."""
 
@@ -234,6 +281,7 @@ class AnonCredsRevocation:
             result.revocation_registry_definition_state.revocation_registry_definition
         )
 
+        AnonCredsIssuer(self.profile).invalidate_objects(identifier)
         try:
             async with self.profile.transaction() as txn:
                 await txn.handle.insert(
@@ -269,6 +317,7 @@ class AnonCredsRevocation:
     ):
         """Mark a rev reg def as finished."""
         options = options or {}
+        AnonCredsIssuer(self.profile).invalidate_objects(job_id, rev_reg_def_id)
         async with self.profile.transaction() as txn:
             entry = await self._finish_registration(
                 txn, CATEGORY_REV_REG_DEF, job_id, rev_reg_def_id, state=STATE_FINISHED
@@ -639,47 +688,13 @@ class AnonCredsRevocation:
 
     async def retrieve_tails(self, rev_reg_def: RevRegDef) -> str:
         """Retrieve tails file from server."""
-        LOGGER.info(
-            "Downloading the tails file with hash: %s",
-            rev_reg_def.value.tails_hash,
-        )
-
-        tails_file_path = Path(self.get_local_tails_path(rev_reg_def))
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        file_hasher = hashlib.sha256()
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(
-                        rev_reg_def.value.tails_location, stream=True
-                    )
-                    # Should this directly raise an Error?
-                    if resp.status_code != http.HTTPStatus.OK:
-                        LOGGER.warning(
-                            f"Unexpected status code for tails file: {resp.status_code}"
-                        )
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise AnonCredsRevocationError(f"Error retrieving tails file: {rx}")
-
-        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-        if download_tails_hash != rev_reg_def.value.tails_hash:
-            try:
-                os.remove(tails_file_path)
-            except OSError as err:
-                LOGGER.warning(f"Could not delete invalid tails file: {err}")
-
-            raise AnonCredsRevocationError(
-                "The hash of the downloaded tails file does not match."
+        tails_cache = self.profile.inject_or(TailsFileCache) or TailsFileCache()
+        try:
+            return await tails_cache.fetch(
+                rev_reg_def.value.tails_hash, rev_reg_def.value.tails_location
             )
-
-        return str(tails_file_path)
+        except TailsDownloadError as err:
+            raise AnonCredsRevocationError(err.roll_up) from err
 
     def _check_url(self, url) -> None:
         parsed = urlparse(url)
@@ -735,75 +750,177 @@ class AnonCredsRevocation:
     async def get_or_fetch_local_tails_path(self, rev_reg_def: RevRegDef) -> str:
         """Return path to local tails file.
 
-        If not present, retrieve from tails server.
+        If not present, retrieve from tails server through the shared tails cache.
         """
         tails_file_path = self.get_local_tails_path(rev_reg_def)
         if Path(tails_file_path).is_file():
             return tails_file_path
-        return await self.retrieve_tails(rev_reg_def)
+        tails_cache = self.profile.inject_or(TailsFileCache) or TailsFileCache()
+        try:
+            return await tails_cache.get_or_fetch(
+                rev_reg_def.value.tails_hash, rev_reg_def.value.tails_location
+            )
+        except TailsDownloadError as err:
+            raise AnonCredsRevocationError(err.roll_up) from err
 
     # Registry Management
 
     async def handle_full_registry(self, rev_reg_def_id: str):
-        """Update the registry status and start the next registry generation."""
-        async with self.profile.session() as session:
-            active_rev_reg_def = await session.handle.fetch(
-                CATEGORY_REV_REG_DEF, rev_reg_def_id
+        """Switch issuance from a full registry to a standby registry.
+
+        The full registry is marked as such and a standby registry that is ready
+        for issuance is made active, in a single transaction. The standby
+        registries are then replenished, in the background when a registry
+        provisioner is configured.
+        """
+        async with self.profile.transaction() as txn:
+            active_rev_reg_def = await txn.handle.fetch(
+                CATEGORY_REV_REG_DEF, rev_reg_def_id, for_update=True
             )
-            if active_rev_reg_def:
-                # ok, we have an active rev reg.
-                # find the backup/fallover rev reg (finished and not active)
-                rev_reg_defs = await session.handle.fetch_all(
+            if not active_rev_reg_def:
+                raise AnonCredsRevocationError(
+                    f"{CATEGORY_REV_REG_DEF} with id "
+                    f"{rev_reg_def_id} could not be found"
+                )
+            cred_def_id = active_rev_reg_def.value_json["credDefId"]
+            backup_rev_reg_def = await self._get_standby_registry(txn, cred_def_id)
+            if backup_rev_reg_def:
+                await txn.handle.replace(
                     CATEGORY_REV_REG_DEF,
+                    active_rev_reg_def.name,
+                    active_rev_reg_def.value,
                     {
+                        **active_rev_reg_def.tags,
                         "active": json.dumps(False),
-                        "cred_def_id": active_rev_reg_def.value_json["credDefId"],
-                        "state": RevRegDefState.STATE_FINISHED,
+                        "state": RevRegDefState.STATE_FULL,
                     },
-                    limit=1,
-                )
-                if len(rev_reg_defs):
-                    backup_rev_reg_def_id = rev_reg_defs[0].name
-                else:
-                    # attempted to create and register here but fails in practical usage.
-                    # the indexes and list do not get set properly (timing issue?)
-                    # if max cred num = 4 for instance, will get
-                    # Revocation status list does not have the index 4
-                    # in _create_credential calling Credential.create
-                    raise AnonCredsRevocationError(
-                        "Error handling full registry. No backup registry available."
-                    )
-
-        # set the backup to active...
-        if backup_rev_reg_def_id:
-            await self.set_active_registry(backup_rev_reg_def_id)
-
-            async with self.profile.transaction() as txn:
-                # re-fetch the old active (it's been updated), we need to mark as full
-                active_rev_reg_def = await txn.handle.fetch(
-                    CATEGORY_REV_REG_DEF, rev_reg_def_id, for_update=True
                 )
-                tags = active_rev_reg_def.tags
-                tags["state"] = RevRegDefState.STATE_FULL
                 await txn.handle.replace(
                     CATEGORY_REV_REG_DEF,
-                    active_rev_reg_def.name,
-                    active_rev_reg_def.value,
-                    tags,
+                    backup_rev_reg_def.name,
+                    backup_rev_reg_def.value,
+                    {**backup_rev_reg_def.tags, "active": json.dumps(True)},
                 )
                 await txn.commit()
 
-            # create our next fallover/backup
-            backup_reg = await self.create_and_register_revocation_registry_definition(
-                issuer_id=active_rev_reg_def.value_json["issuerId"],
-                cred_def_id=active_rev_reg_def.value_json["credDefId"],
-                registry_type=active_rev_reg_def.value_json["revocDefType"],
+        provisioner = self.profile.inject_or(RegistryProvisioner)
+        if not backup_rev_reg_def:
+            if provisioner:
+                # a later retry may find the registry the provisioner creates
+                self._provision_in_background(provisioner, cred_def_id)
+            raise AnonCredsRevocationError(
+                "Error handling full registry. No backup registry available."
+            )
+
+        AnonCredsIssuer(self.profile).invalidate_objects(rev_reg_def_id)
+        # no more issuance from the full registry: record the indexes reserved
+        # from it but not handed out, so they are not taken as issued
+        await self.release_reserved_indexes(rev_reg_def_id)
+        LOGGER.info(
+            "Switched issuance for cred def %s from full registry %s to %s",
+            cred_def_id,
+            rev_reg_def_id,
+            backup_rev_reg_def.name,
+        )
+
+        if provisioner:
+            self._provision_in_background(provisioner, cred_def_id)
+        else:
+            await self.provision_standby_registries(cred_def_id)
+
+    async def _get_standby_registry(self, txn: ProfileSession, cred_def_id: str):
+        """Find a standby registry ready for issuance: registered, with a list."""
+        rev_reg_defs = await txn.handle.fetch_all(
+            CATEGORY_REV_REG_DEF,
+            {
+                "active": json.dumps(False),
+                "cred_def_id": cred_def_id,
+                "state": RevRegDefState.STATE_FINISHED,
+            },
+            for_update=True,
+        )
+        for rev_reg_def in rev_reg_defs:
+            if await txn.handle.fetch(CATEGORY_REV_LIST, rev_reg_def.name):
+                return rev_reg_def
+        return None
+
+    async def provision_standby_registries(self, cred_def_id: str) -> int:
+        """Create the missing standby registries of a credential definition.
+
+        Standby registries take over from the active registry once it fills.
+        They are created like the active registry; creation completes with the
+        tails file uploaded and the initial revocation list registered.
+
+        Args:
+            cred_def_id: The credential definition identifier
+
+        Returns:
+            The number of registries created
+
+        """
+        provisioner = self.profile.inject_or(RegistryProvisioner)
+        standby = provisioner.standby if provisioner else DEFAULT_STANDBY_REGISTRIES
+        async with self.profile.session() as session:
+            active_rev_reg_defs = await session.handle.fetch_all(
+                CATEGORY_REV_REG_DEF,
+                {"cred_def_id": cred_def_id, "active": json.dumps(True)},
+                limit=1,
+            )
+            standby_rev_reg_defs = await session.handle.fetch_all(
+                CATEGORY_REV_REG_DEF,
+                {
+                    "cred_def_id": cred_def_id,
+                    "active": json.dumps(False),
+                    "state": {
+                        "$in": [
+                            RevRegDefState.STATE_FINISHED,
+                            RevRegDefState.STATE_ACTION,
+                            RevRegDefState.STATE_WAIT,
+                        ]
+                    },
+                },
+            )
+        if not active_rev_reg_defs:
+            raise AnonCredsRevocationError(
+                f"Cred def '{cred_def_id}' has no active revocation registry"
+            )
+
+        active_rev_reg_def = active_rev_reg_defs[0].value_json
+        missing = standby - len(standby_rev_reg_defs)
+        for _ in range(missing):
+            await self.create_and_register_revocation_registry_definition(
+                issuer_id=active_rev_reg_def["issuerId"],
+                cred_def_id=cred_def_id,
+                registry_type=active_rev_reg_def["revocDefType"],
                 tag=str(uuid4()),
-                max_cred_num=active_rev_reg_def.value_json["value"]["maxCredNum"],
+                max_cred_num=active_rev_reg_def["value"]["maxCredNum"],
             )
-            LOGGER.info(f"previous rev_reg_def_id = {rev_reg_def_id}")
-            LOGGER.info(f"current rev_reg_def_id = {backup_rev_reg_def_id}")
-            LOGGER.info(f"backup reg = {backup_reg}")
+        return max(missing, 0)
+
+    def _provision_in_background(
+        self,
+        provisioner: RegistryProvisioner,
+        cred_def_id: str,
+        rev_reg_def_id: Optional[str] = None,
+    ):
+        provisioner.provision(
+            self.profile,
+            cred_def_id,
+            lambda: self.provision_standby_registries(cred_def_id),
+            rev_reg_def_id,
+        )
+
+    def _check_fill_level(
+        self,
+        cred_def_id: str,
+        rev_reg_def_id: str,
+        issued: int,
+        max_cred_num: int,
+    ):
+        """Replenish the standby registries once a registry reaches the watermark."""
+        provisioner = self.profile.inject_or(RegistryProvisioner)
+        if provisioner and provisioner.filled(rev_reg_def_id, issued, max_cred_num):
+            self._provision_in_background(provisioner, cred_def_id, rev_reg_def_id)
 
     async def decommission_registry(self, cred_def_id: str):
         """Decommission post-init registries and start the next registry generation."""
@@ -848,6 +965,9 @@ class AnonCredsRevocation:
                         tags,
                     )
             await txn.commit()
+        AnonCredsIssuer(self.profile).invalidate_objects(
+            *(rec.name for rec in recs if rec.name != new_reg.rev_reg_def_id)
+        )
         # create a second one for backup, don't make it active
         backup_reg = await self.create_and_register_revocation_registry_definition(
             issuer_id=active_reg.rev_reg_def.issuer_id,
@@ -905,18 +1025,19 @@ class AnonCredsRevocation:
         rev_reg_def_id: Optional[str] = None,
         tails_file_path: Optional[str] = None,
     ) -> Tuple[str, str]:
+        issuer = AnonCredsIssuer(self.profile)
         try:
-            async with self.profile.session() as session:
-                cred_def = await session.handle.fetch(
-                    CATEGORY_CRED_DEF, credential_definition_id
-                )
-                cred_def_private = await session.handle.fetch(
-                    CATEGORY_CRED_DEF_PRIVATE, credential_definition_id
-                )
+            cred_def, cred_def_private = await issuer.get_credential_definition_keys(
+                credential_definition_id
+            )
         except AskarError as err:
             raise AnonCredsRevocationError(
                 "Error retrieving credential definition"
             ) from err
+        except AnoncredsError as err:
+            raise AnonCredsRevocationError(
+                "Error loading credential definition"
+            ) from err
         if not cred_def or not cred_def_private:
             raise AnonCredsRevocationError(
                 "Credential definition not found for credential issuance"
@@ -938,63 +1059,71 @@ class AnonCredsRevocation:
 
         if rev_reg_def_id and tails_file_path:
             try:
-                async with self.profile.transaction() as txn:
-                    rev_list = await txn.handle.fetch(CATEGORY_REV_LIST, rev_reg_def_id)
-                    rev_reg_def = await txn.handle.fetch(
-                        CATEGORY_REV_REG_DEF, rev_reg_def_id
-                    )
-                    rev_key = await txn.handle.fetch(
-                        CATEGORY_REV_REG_DEF_PRIVATE, rev_reg_def_id
-                    )
-                    if not rev_list:
-                        raise AnonCredsRevocationError("Revocation registry not found")
-                    if not rev_reg_def:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition not found"
-                        )
-                    if not rev_key:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition private data not found"
-                        )
-                    # NOTE: we increment the index ahead of time to keep the
-                    # transaction short. The revocation registry itself will NOT
-                    # be updated because we always use ISSUANCE_BY_DEFAULT.
-                    # If something goes wrong later, the index will be skipped.
-                    # FIXME - double check issuance type in case of upgraded wallet?
-                    rev_info = rev_list.value_json
-                    rev_info_tags = rev_list.tags
-                    rev_reg_index = rev_info["next_index"]
-                    try:
-                        rev_reg_def = RevocationRegistryDefinition.load(
-                            rev_reg_def.raw_value
-                        )
-                        rev_list = RevocationStatusList.load(rev_info["rev_list"])
-                    except AnoncredsError as err:
-                        raise AnonCredsRevocationError(
-                            "Error loading revocation registry definition"
-                        ) from err
-                    if rev_reg_index > rev_reg_def.max_cred_num:
-                        raise AnonCredsRevocationRegistryFullError(
-                            "Revocation registry is full"
-                        )
-                    rev_info["next_index"] = rev_reg_index + 1
-                    await txn.handle.replace(
-                        CATEGORY_REV_LIST,
-                        rev_reg_def_id,
-                        value_json=rev_info,
-                        tags=rev_info_tags,
+                rev_reg_def = await issuer.load_object(
+                    CATEGORY_REV_REG_DEF,
+                    rev_reg_def_id,
+                    lambda entry: RevocationRegistryDefinition.load(entry.raw_value),
+                )
+                rev_key = await issuer.load_object(
+                    CATEGORY_REV_REG_DEF_PRIVATE,
+                    rev_reg_def_id,
+                    lambda entry: RevocationRegistryDefinitionPrivate.load(
+                        entry.raw_value
+                    ),
+                )
+            except AskarError as err:
+                raise AnonCredsRevocationError(
+                    "Error retrieving revocation registry definition"
+                ) from err
+            except AnoncredsError as err:
+                raise AnonCredsRevocationError(
+                    "Error loading revocation registry definition"
+                ) from err
+            if not rev_reg_def:
+                raise AnonCredsRevocationError(
+                    "Revocation registry definition not found"
+                )
+            if not rev_key:
+                raise AnonCredsRevocationError(
+                    "Revocation registry definition private data not found"
+                )
+
+            # NOTE: indexes are reserved ahead of time, in blocks, to keep the
+            # transactions short and rare. The revocation registry itself will
+            # NOT be updated because we always use ISSUANCE_BY_DEFAULT.
+            # If something goes wrong later, the index will be skipped.
+            # FIXME - double check issuance type in case of upgraded wallet?
+            rev_reg_index = await self._take_index(
+                rev_reg_def_id, rev_reg_def.max_cred_num
+            )
+            if rev_reg_index is None:
+                raise AnonCredsRevocationRegistryFullError(
+                    "Revocation registry is full"
+                )
+
+            try:
+                async with self.profile.session() as session:
+                    rev_list = await session.handle.fetch(
+                        CATEGORY_REV_LIST, rev_reg_def_id
                     )
-                    await txn.commit()
             except AskarError as err:
                 raise AnonCredsRevocationError(
-                    "Error updating revocation registry index"
+                    "Error retrieving revocation registry"
+                ) from err
+            if not rev_list:
+                raise AnonCredsRevocationError("Revocation registry not found")
+            try:
+                rev_list = RevocationStatusList.load(rev_list.value_json["rev_list"])
+            except AnoncredsError as err:
+                raise AnonCredsRevocationError(
+                    "Error loading revocation registry"
                 ) from err
 
-            # rev_info["next_index"] is 1 based but getting from
+            # revocation indexes are 1 based but getting from
             # rev_list is zero based...
             revoc = CredentialRevocationConfig(
                 rev_reg_def,
-                rev_key.raw_value,
+                rev_key,
                 rev_list,
                 rev_reg_index,
             )
@@ -1008,8 +1137,8 @@ class AnonCredsRevocation:
             credential = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: Credential.create(
-                    cred_def.raw_value,
-                    cred_def_private.raw_value,
+                    cred_def,
+                    cred_def_private,
                     credential_offer,
                     credential_request,
                     raw_values,
@@ -1022,6 +1151,102 @@ class AnonCredsRevocation:
 
         return credential.to_json(), credential_revocation_id
 
+    async def _take_index(
+        self, rev_reg_def_id: str, max_cred_num: int
+    ) -> Optional[int]:
+        """Take the next unused credential revocation index of a registry."""
+
+        async def reserve(count: int) -> Sequence[IndexRange]:
+            return await self.reserve_indexes(rev_reg_def_id, max_cred_num, count)
+
+        reservations = self.profile.inject_or(RevRegIndexReservations)
+        if reservations:
+            return await reservations.take(rev_reg_def_id, reserve)
+        ranges = await reserve(1)
+        return ranges[0][0] if ranges else None
+
+    async def reserve_indexes(
+        self, rev_reg_def_id: str, max_cred_num: int, count: int
+    ) -> Sequence[IndexRange]:
+        """Reserve unused credential revocation indexes of a registry.
+
+        The index counter is kept in its own record, apart from the revocation
+        list, so reserving indexes does not rewrite the list.
+
+        Args:
+            rev_reg_def_id: The revocation registry definition identifier
+            max_cred_num: The maximum credential number of the registry
+            count: The maximum number of indexes to reserve
+
+        Returns:
+            The ranges of indexes reserved, empty if the registry is full
+
+        """
+        for attempt in range(2):
+            try:
+                async with self.profile.transaction() as txn:
+                    entry = await txn.handle.fetch(
+                        CATEGORY_REV_LIST_INDEX, rev_reg_def_id, for_update=True
+                    )
+                    if entry:
+                        info = entry.value_json
+                    else:
+                        # start from the counter kept in the revocation list
+                        rev_list = await txn.handle.fetch(
+                            CATEGORY_REV_LIST, rev_reg_def_id
+                        )
+                        if not rev_list:
+                            raise AnonCredsRevocationError(
+                                "Revocation registry not found"
+                            )
+                        info = {"next_index": rev_list.value_json["next_index"]}
+                    ranges = take_index_ranges(info, count, max_cred_num)
+                    if entry:
+                        await txn.handle.replace(
+                            CATEGORY_REV_LIST_INDEX, rev_reg_def_id, value_json=info
+                        )
+                    else:
+                        await txn.handle.insert(
+                            CATEGORY_REV_LIST_INDEX, rev_reg_def_id, value_json=info
+                        )
+                    await txn.commit()
+                return ranges
+            except AskarError as err:
+                if err.code != AskarErrorCode.DUPLICATE or attempt:
+                    raise AnonCredsRevocationError(
+                        "Error updating revocation registry index"
+                    ) from err
+                # another instance created the counter first
+
+    async def release_reserved_indexes(self, rev_reg_def_id: str = None):
+        """Return reserved but unused credential revocation indexes to storage.
+
+        Args:
+            rev_reg_def_id: The registry to release indexes for, or None for all
+
+        """
+        reservations = self.profile.inject_or(RevRegIndexReservations)
+        if not reservations:
+            return
+        for ident, ranges in reservations.release(rev_reg_def_id).items():
+            try:
+                async with self.profile.transaction() as txn:
+                    entry = await txn.handle.fetch(
+                        CATEGORY_REV_LIST_INDEX, ident, for_update=True
+                    )
+                    if not entry:
+                        continue
+                    info = entry.value_json
+                    return_index_ranges(info, ranges)
+                    await txn.handle.replace(
+                        CATEGORY_REV_LIST_INDEX, ident, value_json=info
+                    )
+                    await txn.commit()
+            except AskarError:
+                LOGGER.exception(
+                    "Error returning unused indexes of revocation registry %s", ident
+                )
+
     async def create_credential(
         self,
         credential_offer: dict,
@@ -1095,10 +1320,11 @@ class AnonCredsRevocation:
             # max cred num is one based
             # however, if we wait until max cred num is reached, we are too late.
             if rev_reg_def_result:
-                if (
-                    rev_reg_def_result.rev_reg_def.value.max_cred_num
-                    <= int(cred_rev_id) + 1
-                ):
+                max_cred_num = rev_reg_def_result.rev_reg_def.value.max_cred_num
+                self._check_fill_level(
+                    cred_def_id, rev_reg_def_id, int(cred_rev_id), max_cred_num
+                )
+                if max_cred_num <= int(cred_rev_id) + 1:
                     await self.handle_full_registry(rev_reg_def_id)
 
             return cred_json, cred_rev_id, rev_reg_def_id
@@ -1107,6 +1333,174 @@ class AnonCredsRevocation:
             f"Cred def '{cred_def_id}' has no active revocation registry"
         )
 
+    async def create_credentials(
+        self,
+        credentials: Sequence[Tuple[dict, dict, dict]],
+        *,
+        retries: int = 5,
+    ) -> Sequence[Tuple[str, str, str]]:
+        """Create a batch of credentials for the same credential definition.
+
+        The credential definition and revocation registry are loaded once, the
+        revocation indexes are reserved together, and the credentials are
+        created in parallel in the process pool. When the active registry fills
+        up, the rest of the batch is issued from the next registry.
+
+        Args:
+            credentials: The credential offer, credential request and credential
+                values of each credential to create
+            retries: number of times to retry obtaining an active registry
+
+        Returns:
+            A tuple of created credential, revocation id and revocation registry
+            definition id for each credential, in order
+
+        """
+        if not credentials:
+            return []
+        cred_def_id = credentials[0][0]["cred_def_id"]
+        if any(offer["cred_def_id"] != cred_def_id for offer, _, _ in credentials):
+            raise AnonCredsRevocationError(
+                "All credentials in a batch must use the same credential definition"
+            )
+        issuer = AnonCredsIssuer(self.profile)
+        anoncreds_registry = self.profile.inject(AnonCredsRegistry)
+        schema_id = credentials[0][0]["schema_id"]
+        schema_result = await anoncreds_registry.get_schema(self.profile, schema_id)
+        revocable = await issuer.cred_def_supports_revocation(cred_def_id)
+
+        try:
+            cred_def, cred_def_private = await issuer.get_credential_definition_keys(
+                cred_def_id
+            )
+        except AskarError as err:
+            raise AnonCredsRevocationError(
+                "Error retrieving credential definition"
+            ) from err
+        except AnoncredsError as err:
+            raise AnonCredsRevocationError(
+                "Error loading credential definition"
+            ) from err
+        if not cred_def or not cred_def_private:
+            raise AnonCredsRevocationError(
+                "Credential definition not found for credential issuance"
+            )
+
+        items = []
+        for offer, request, credential_values in credentials:
+            raw_values = {}
+            for attribute in schema_result.schema_value.attr_names:
+                try:
+                    raw_values[attribute] = str(credential_values[attribute])
+                except KeyError:
+                    raise AnonCredsRevocationError(
+                        "Provided credential values are missing a value "
+                        f"for the schema attribute '{attribute}'"
+                    )
+            items.append((offer, request, raw_values))
+
+        pool = self.profile.inject_or(ProcessPool) or ProcessPool(max_workers=0)
+
+        async def create(batch, indexes, revocation) -> Sequence[str]:
+            results = await pool.run_chunked(
+                _create_credentials,
+                [item + (index,) for item, index in zip(batch, indexes)],
+                cred_def.to_json(),
+                cred_def_private.to_json(),
+                revocation,
+            )
+            for _, error in results:
+                if error:
+                    raise AnonCredsRevocationError(
+                        f"Error creating credential: {error}"
+                    )
+            return [credential_json for credential_json, _ in results]
+
+        if not revocable:
+            return [
+                (credential_json, None, None)
+                for credential_json in await create(items, [None] * len(items), None)
+            ]
+
+        created = []
+        attempt = 0
+        while len(created) < len(items):
+            if attempt >= max(retries, 1):
+                raise AnonCredsRevocationError(
+                    f"Cred def '{cred_def_id}' has no active revocation registry"
+                )
+            rev_reg_def_result = await self.get_or_create_active_registry(cred_def_id)
+            if (
+                rev_reg_def_result.revocation_registry_definition_state.state
+                != STATE_FINISHED
+            ):
+                attempt += 1
+                LOGGER.info(
+                    "Waiting 2s before retrying credential issuance for cred def '%s'",
+                    cred_def_id,
+                )
+                await asyncio.sleep(2)
+                continue
+            rev_reg_def_id = rev_reg_def_result.rev_reg_def_id
+            max_cred_num = rev_reg_def_result.rev_reg_def.value.max_cred_num
+
+            try:
+                rev_reg_def = await issuer.load_object(
+                    CATEGORY_REV_REG_DEF,
+                    rev_reg_def_id,
+                    lambda entry: RevocationRegistryDefinition.load(entry.raw_value),
+                )
+                rev_key = await issuer.load_object(
+                    CATEGORY_REV_REG_DEF_PRIVATE,
+                    rev_reg_def_id,
+                    lambda entry: RevocationRegistryDefinitionPrivate.load(
+                        entry.raw_value
+                    ),
+                )
+                async with self.profile.session() as session:
+                    rev_list = await session.handle.fetch(
+                        CATEGORY_REV_LIST, rev_reg_def_id
+                    )
+            except AskarError as err:
+                raise AnonCredsRevocationError(
+                    "Error retrieving revocation registry"
+                ) from err
+            except AnoncredsError as err:
+                raise AnonCredsRevocationError(
+                    "Error loading revocation registry definition"
+                ) from err
+            if not rev_reg_def or not rev_key or not rev_list:
+                raise AnonCredsRevocationError("Revocation registry not found")
+
+            ranges = await self.reserve_indexes(
+                rev_reg_def_id, max_cred_num, len(items) - len(created)
+            )
+            indexes = [index for start, end in ranges for index in range(start, end)]
+            if indexes:
+                batch = items[len(created) : len(created) + len(indexes)]
+                revocation = (
+                    rev_reg_def.to_json(),
+                    rev_key.to_json(),
+                    json.dumps(rev_list.value_json["rev_list"]),
+                )
+                for credential_json, index in zip(
+                    await create(batch, indexes, revocation), indexes
+                ):
+                    created.append((credential_json, str(index), rev_reg_def_id))
+                self._check_fill_level(
+                    cred_def_id, rev_reg_def_id, max(indexes), max_cred_num
+                )
+
+            if not indexes:
+                # unlucky, another instance filled the registry first
+                attempt += 1
+            # cred rev id is one based, max cred num is one based;
+            # switch registries before the last index is handed out
+            if not indexes or max(indexes) + 1 >= max_cred_num:
+                await self.handle_full_registry(rev_reg_def_id)
+
+        return created
+
     async def revoke_pending_credentials(
         self,
         revoc_reg_id: str,
@@ -1179,6 +1573,9 @@ class AnonCredsRevocation:
                     cred_def_entry = await session.handle.fetch(
                         CATEGORY_CRED_DEF, rev_reg_def_entry.value_json["credDefId"]
                     )
+                    rev_index_entry = await session.handle.fetch(
+                        CATEGORY_REV_LIST_INDEX, revoc_reg_id
+                    )
             except AskarError as err:
                 raise AnonCredsRevocationError(
                     f"Error retrieving cred def {rev_reg_def_entry.value_json['credDefId']}"  # noqa: E501
@@ -1204,6 +1601,8 @@ class AnonCredsRevocation:
             failed_crids = set()
             max_cred_num = rev_reg_def.value.max_cred_num
             rev_info = rev_list_entry.value_json
+            # the index counter, including indexes returned unused
+            rev_index = rev_index_entry.value_json if rev_index_entry else rev_info
             cred_revoc_ids = (rev_info["pending"] or []) + (additional_crids or [])
             rev_list = RevList.deserialize(rev_info["rev_list"])
 
@@ -1216,7 +1615,7 @@ class AnonCredsRevocation:
                         rev_id,
                     )
                     failed_crids.add(rev_id)
-                elif rev_id >= rev_info["next_index"]:
+                elif not index_handed_out(rev_index, rev_id):
                     LOGGER.warning(
                         "Skipping requested credential revocation"
                         "on rev reg id %s, cred rev id=%s not yet issued",
@@ -0,0 +1,156 @@
+"""Reservation of credential revocation indexes in blocks."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BLOCK_SIZE = 20
+
+# An index range, start inclusive and end exclusive
+IndexRange = Tuple[int, int]
+
+# Reserves up to a number of indexes in storage, returning the reserved ranges
+IndexReserver = Callable[[int], Awaitable[Sequence[IndexRange]]]
+
+
+def take_index_ranges(info: dict, count: int, max_cred_num: int) -> List[IndexRange]:
+    """Take up to a number of unused indexes from a stored index counter.
+
+    Indexes returned by earlier reservations are handed out first, then new
+    indexes up to the maximum credential number.
+
+    Args:
+        info: The stored index counter, updated in place
+        count: The number of indexes to take
+        max_cred_num: The maximum credential number of the registry
+
+    Returns:
+        The ranges of indexes taken, empty if the registry is full
+
+    """
+    ranges = []
+    free = info.setdefault("free", [])
+    while count and free:
+        start, end = free.pop(0)
+        taken = min(count, end - start)
+        ranges.append((start, start + taken))
+        count -= taken
+        if start + taken < end:
+            free.insert(0, [start + taken, end])
+    start = info["next_index"]
+    end = min(start + count, max_cred_num + 1)
+    if end > start:
+        ranges.append((start, end))
+        info["next_index"] = end
+    return ranges
+
+
+def return_index_ranges(info: dict, ranges: Sequence[IndexRange]):
+    """Return unused indexes to a stored index counter.
+
+    Args:
+        info: The stored index counter, updated in place
+        ranges: The ranges of indexes to return
+
+    """
+    free = sorted(
+        [list(r) for r in info.get("free") or []] + [[s, e] for s, e in ranges if e > s]
+    )
+    merged = []
+    for start, end in free:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    # fold a range ending at the counter back into the counter
+    if merged and merged[-1][1] >= info["next_index"]:
+        info["next_index"] = min(merged.pop()[0], info["next_index"])
+    info["free"] = merged
+
+
+def index_handed_out(info: dict, index: int) -> bool:
+    """Check whether an index has been taken from a stored index counter.
+
+    Indexes still reserved by a running instance count as taken, as they may
+    already be issued; indexes returned to the counter do not.
+
+    Args:
+        info: The stored index counter
+        index: The credential revocation index
+
+    """
+    if index >= info["next_index"]:
+        return False
+    return not any(start <= index < end for start, end in info.get("free") or ())
+
+
+class RevRegIndexReservations:
+    """In-memory blocks of revocation indexes reserved by this instance.
+
+    Rather than updating the stored index counter of a revocation registry for
+    every credential issued, a block of indexes is reserved at once and handed
+    out from memory, so concurrent issuers only contend on the counter once per
+    block. Indexes left unused can be returned to storage for reuse.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Initialize the reservations.
+
+        Args:
+            block_size: The number of indexes to reserve at once
+        """
+        self.block_size = max(block_size, 1)
+        self._ranges: Dict[str, List[List[int]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _pop(self, rev_reg_def_id: str) -> Optional[int]:
+        ranges = self._ranges.get(rev_reg_def_id)
+        while ranges:
+            start, end = ranges[0]
+            if start < end:
+                ranges[0][0] += 1
+                return start
+            ranges.pop(0)
+        return None
+
+    async def take(self, rev_reg_def_id: str, reserve: IndexReserver) -> Optional[int]:
+        """Take the next reserved index of a registry, reserving a block if needed.
+
+        Args:
+            rev_reg_def_id: The revocation registry definition identifier
+            reserve: Reserves indexes in storage
+
+        Returns:
+            The index, or None if the registry has no more indexes
+
+        """
+        index = self._pop(rev_reg_def_id)
+        if index is not None:
+            return index
+        lock = self._locks.setdefault(rev_reg_def_id, asyncio.Lock())
+        async with lock:
+            index = self._pop(rev_reg_def_id)
+            if index is None:
+                ranges = await reserve(self.block_size)
+                self._ranges.setdefault(rev_reg_def_id, []).extend(
+                    [start, end] for start, end in ranges
+                )
+                index = self._pop(rev_reg_def_id)
+        return index
+
+    def release(self, rev_reg_def_id: str = None) -> Dict[str, List[IndexRange]]:
+        """Give up unused reserved indexes.
+
+        Args:
+            rev_reg_def_id: The registry to release, or None for all registries
+
+        Returns:
+            The unused index ranges of each registry released
+
+        """
+        ids = [rev_reg_def_id] if rev_reg_def_id else list(self._ranges)
+        released = {}
+        for ident in ids:
+            ranges = [(s, e) for s, e in self._ranges.pop(ident, []) if e > s]
+            if ranges:
+                released[ident] = ranges
+        return released
@@ -6,8 +6,12 @@ from abc import ABC, abstractmethod
 from aries_cloudagent.protocols.endorse_transaction.v1_0.util import is_author_role
 
 from ..anoncreds.revocation import AnonCredsRevocation
-from ..core.event_bus import EventBus
+from ..askar.profile_anon import AskarAnoncredsProfile
+from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile
+from ..core.util import SHUTDOWN_EVENT_PATTERN
+from ..multitenant.base import BaseMultitenantManager
+from ..revocation.provisioner import RegistryProvisioner
 from ..revocation.util import notify_revocation_published_event
 from .events import (
     CRED_DEF_FINISHED_PATTERN,
@@ -41,11 +45,11 @@ class DefaultRevocationSetup(AnonCredsRevocationSetupManager):
     Rev Reg Def --> Rev List
     Rev List --> [*]
 
-    This implementation of an AnonCredsRevocationSetupManager will create two
-    revocation registries for each credential definition supporting revocation;
-    one that is active and one that is pending. When the active registry fills,
-    the pending registry will be activated and a new pending registry will be
-    created. This will continue indefinitely.
+    This implementation of an AnonCredsRevocationSetupManager will create at
+    least two revocation registries for each credential definition supporting
+    revocation; one that is active and the standby registries, one by default.
+    When the active registry fills, a standby registry will be activated and a
+    new standby registry will be created. This will continue indefinitely.
 
     This hot-swap approach to revocation registry management allows for
     issuance operations to be performed without a delay for registry
@@ -63,6 +67,7 @@ class DefaultRevocationSetup(AnonCredsRevocationSetupManager):
         event_bus.subscribe(CRED_DEF_FINISHED_PATTERN, self.on_cred_def)
         event_bus.subscribe(REV_REG_DEF_FINISHED_PATTERN, self.on_rev_reg_def)
         event_bus.subscribe(REV_LIST_FINISHED_PATTERN, self.on_rev_list)
+        event_bus.subscribe(SHUTDOWN_EVENT_PATTERN, self.on_shutdown)
 
     async def on_cred_def(self, profile: Profile, event: CredDefFinishedEvent):
         """Handle cred def finished."""
@@ -73,7 +78,12 @@ class DefaultRevocationSetup(AnonCredsRevocationSetupManager):
 
         if payload.support_revocation or auto_create_revocation:
             revoc = AnonCredsRevocation(profile)
-            for registry_count in range(self.INITIAL_REGISTRY_COUNT):
+            provisioner = profile.inject_or(RegistryProvisioner)
+            initial_count = max(
+                self.INITIAL_REGISTRY_COUNT,
+                provisioner.standby + 1 if provisioner else 0,
+            )
+            for registry_count in range(initial_count):
                 await revoc.create_and_register_revocation_registry_definition(
                     issuer_id=payload.issuer_id,
                     cred_def_id=payload.cred_def_id,
@@ -109,3 +119,13 @@ class DefaultRevocationSetup(AnonCredsRevocationSetupManager):
         await notify_revocation_published_event(
             profile, event.payload.rev_reg_id, event.payload.revoked
         )
+
+    async def on_shutdown(self, profile: Profile, event: Event):
+        """Return unused reserved revocation indexes to storage on shutdown."""
+        profiles = [profile]
+        multitenant_mgr = profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            profiles.extend(multitenant_mgr.open_profiles)
+        for open_profile in profiles:
+            if isinstance(open_profile, AskarAnoncredsProfile):
+                await AnonCredsRevocation(open_profile).release_reserved_indexes()
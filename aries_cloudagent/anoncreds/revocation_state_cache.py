@@ -0,0 +1,192 @@
+"""In-process cache of holder credential revocation states."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CREDENTIALS = 1024
+DEFAULT_STATES_PER_CREDENTIAL = 4
+MAX_REFRESH_BACKOFF = 32
+
+# A held credential: revocation registry definition id and credential revocation id
+CredentialKey = Tuple[str, int]
+
+
+class RevocationStateCache:
+    """Per-profile cache of the revocation states of held credentials.
+
+    Creating the revocation state (the non-revocation witness) of a credential
+    from scratch reads the tails file, taking time in proportion to the size of
+    the registry. States are kept per credential and revocation list timestamp,
+    so presentations against the same list reuse them, and the state for a newer
+    list is derived from the latest older one, applying only the changes between
+    the two lists. Credentials presented most recently are considered hot, and
+    their states can be refreshed against the latest list in the background.
+    Registries failing to refresh are backed off, skipping an exponentially
+    growing number of refresh rounds.
+    """
+
+    def __init__(
+        self,
+        max_credentials: int = DEFAULT_MAX_CREDENTIALS,
+        states_per_credential: int = DEFAULT_STATES_PER_CREDENTIAL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_credentials: The number of credentials to keep states for, the
+                least recently used are discarded first
+            states_per_credential: The number of states to keep per credential,
+                the oldest are discarded first
+        """
+        self.max_credentials = max_credentials
+        self.states_per_credential = max(states_per_credential, 1)
+        self.hits = 0
+        self.misses = 0
+        self._states: OrderedDict[CredentialKey, Dict[int, str]] = OrderedDict()
+        self._lists: Dict[Tuple[str, int], dict] = {}
+        self._backoff: Dict[str, Tuple[int, int]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def get(
+        self, rev_reg_def_id: str, cred_rev_id: int, timestamp: int
+    ) -> Optional[str]:
+        """Get the revocation state of a credential for a revocation list."""
+        key = (rev_reg_def_id, cred_rev_id)
+        states = self._states.get(key)
+        state = states and states.get(timestamp)
+        if state:
+            self._states.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return state
+
+    def base(
+        self, rev_reg_def_id: str, cred_rev_id: int, timestamp: int
+    ) -> Optional[Tuple[str, dict]]:
+        """Find the latest state of a credential preceding a revocation list.
+
+        Returns:
+            The revocation state and the revocation list it was created for, or
+            None if there is no earlier state
+
+        """
+        states = self._states.get((rev_reg_def_id, cred_rev_id))
+        earlier = [stamp for stamp in states or () if stamp < timestamp]
+        if not earlier:
+            return None
+        stamp = max(earlier)
+        return states[stamp], self._lists[(rev_reg_def_id, stamp)]
+
+    def set(
+        self,
+        rev_reg_def_id: str,
+        cred_rev_id: int,
+        timestamp: int,
+        rev_state: str,
+        rev_list: dict,
+    ):
+        """Add the revocation state of a credential for a revocation list."""
+        key = (rev_reg_def_id, cred_rev_id)
+        states = self._states.setdefault(key, {})
+        self._states.move_to_end(key)
+        states[timestamp] = rev_state
+        self._lists[(rev_reg_def_id, timestamp)] = rev_list
+        while len(states) > self.states_per_credential:
+            del states[min(states)]
+        pruned = {rev_reg_def_id}
+        while len(self._states) > self.max_credentials:
+            (evicted, _), _ = self._states.popitem(last=False)
+            pruned.add(evicted)
+        for ident in pruned:
+            self._prune_lists(ident)
+
+    def _prune_lists(self, rev_reg_def_id: str):
+        """Discard the revocation lists of a registry no state refers to."""
+        used = {
+            stamp
+            for (ident, _), states in self._states.items()
+            if ident == rev_reg_def_id
+            for stamp in states
+        }
+        for list_key in [
+            list_key
+            for list_key in self._lists
+            if list_key[0] == rev_reg_def_id and list_key[1] not in used
+        ]:
+            del self._lists[list_key]
+
+    def hot(self, count: int = None) -> List[CredentialKey]:
+        """Get the most recently used credentials, most recent first."""
+        keys = list(reversed(self._states))
+        return keys[:count] if count else keys
+
+    def refresh_due(self, rev_reg_def_id: str) -> bool:
+        """Check whether a registry is due a refresh, counting down its backoff."""
+        failures, skip = self._backoff.get(rev_reg_def_id, (0, 0))
+        if skip:
+            self._backoff[rev_reg_def_id] = (failures, skip - 1)
+            return False
+        return True
+
+    def refresh_failed(self, rev_reg_def_id: str):
+        """Back off refreshing a registry after a failure."""
+        failures = self._backoff.get(rev_reg_def_id, (0, 0))[0] + 1
+        self._backoff[rev_reg_def_id] = (
+            failures,
+            min(2**failures - 1, MAX_REFRESH_BACKOFF),
+        )
+
+    def refresh_succeeded(self, rev_reg_def_id: str):
+        """Reset the backoff of a registry after a successful refresh."""
+        self._backoff.pop(rev_reg_def_id, None)
+
+    def schedule_refresh(self, interval: float, refresh: Callable[[], Awaitable]):
+        """Periodically run a refresh of the hot credentials, if not already."""
+        if self._timer or self._task or not interval:
+            return
+
+        def start():
+            self._timer = None
+            self._task = asyncio.ensure_future(refresh())
+            self._task.add_done_callback(done)
+
+        def done(task: asyncio.Task):
+            self._task = None
+            if task.cancelled():
+                return
+            if task.exception():
+                LOGGER.warning(
+                    "Error refreshing revocation states: %s", task.exception()
+                )
+            self.schedule_refresh(interval, refresh)
+
+        self._timer = asyncio.get_event_loop().call_later(interval, start)
+
+    def stop(self):
+        """Stop refreshing in the background."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._task:
+            self._task.cancel()
+
+    def clear(self):
+        """Discard all cached states."""
+        self._states.clear()
+        self._lists.clear()
+        self._backoff.clear()
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(credentials={}, hits={}, misses={})>".format(
+            self.__class__.__name__,
+            len(self._states),
+            self.hits,
+            self.misses,
+        )
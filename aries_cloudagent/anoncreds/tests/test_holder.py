@@ -36,6 +36,7 @@ from aries_cloudagent.wallet.error import WalletNotFoundError
 
 from .. import holder as test_module
 from ..models.anoncreds_cred_def import CredDef, CredDefValue, CredDefValuePrimary
+from ..revocation_state_cache import RevocationStateCache
 
 
 class MockCredReceived:
@@ -53,6 +54,7 @@ class MockCredReceived:
     schema_id = "Sc886XPwD1gDcHwmmLDeR2:2:degree schema:45.101.94"
     cred_def_id = "Sc886XPwD1gDcHwmmLDeR2:3:CL:229975:faber.agent.degree_schema"
     rev_reg_id = None
+    rev_reg_index = None
 
     def to_json_buffer(self):
         return b"credential"
@@ -84,6 +86,7 @@ class MockCredEntry:
         self.name = "name"
         self.value = mock_cred
         self.raw_value = mock_cred
+        self.tags = {}
 
     def decode(self):
         return MOCK_CRED
@@ -363,6 +366,83 @@ class TestAnonCredsHolder(IsolatedAsyncioTestCase):
                 mock_pres_req, "not-found-ref", start=0, count=10
             )
 
+    @mock.patch.object(Credential, "load")
+    async def test_get_credentials_for_presentation_request_merged(self, mock_load):
+        def row(cred_id, **attrs):
+            tags = {
+                "schema_id": "schema-id",
+                "cred_def_id": "cred-def-id",
+                "rev_reg_id": "None",
+                "cred_rev_id": "None",
+            }
+            for attr, value in attrs.items():
+                tags[f"attr::{attr}::value"] = value
+            entry = mock.MagicMock(tags=tags)
+            entry.name = cred_id
+            return entry
+
+        rows = [
+            row("cred-1", name="Alice", age="30"),
+            row("cred-2", name="Bob"),
+            row("cred-3", age="40"),
+            row("cred-4", name="Carol", age="50"),
+        ]
+
+        async def scan_rows():
+            for entry in rows:
+                yield entry
+
+        self.profile.store = mock.Mock()
+        self.profile.store.scan = mock.Mock(return_value=scan_rows())
+        restrictions = [{"cred_def_id": "cred-def-id"}]
+        pres_req = {
+            "requested_attributes": {
+                "name_uuid": {"name": "name", "restrictions": restrictions},
+            },
+            "requested_predicates": {
+                "age_uuid": {
+                    "name": "age",
+                    "p_type": ">=",
+                    "p_value": 18,
+                    "restrictions": restrictions,
+                },
+            },
+        }
+
+        result = await self.holder.get_credentials_for_presentation_request_by_referent(
+            pres_req, None, start=0, count=2
+        )
+
+        # one scan for both referents, no credentials parsed
+        self.profile.store.scan.assert_called_once()
+        mock_load.assert_not_called()
+        assert [
+            (cred["cred_info"]["referent"], sorted(cred["presentation_referents"]))
+            for cred in result
+        ] == [
+            ("cred-1", ["age_uuid", "name_uuid"]),
+            ("cred-2", ["name_uuid"]),
+            ("cred-3", ["age_uuid"]),
+        ]
+        assert result[0]["cred_info"] == {
+            "referent": "cred-1",
+            "schema_id": "schema-id",
+            "cred_def_id": "cred-def-id",
+            "rev_reg_id": None,
+            "cred_rev_id": None,
+            "attrs": {"name": "Alice", "age": "30"},
+        }
+
+        # paging applies per referent
+        self.profile.store.scan = mock.Mock(return_value=scan_rows())
+        result = await self.holder.get_credentials_for_presentation_request_by_referent(
+            pres_req, None, start=1, count=1
+        )
+        assert [
+            (cred["cred_info"]["referent"], cred["presentation_referents"])
+            for cred in result
+        ] == [("cred-2", ["name_uuid"]), ("cred-3", ["age_uuid"])]
+
     @mock.patch.object(InMemoryProfileSession, "handle")
     async def test_get_credential(self, mock_handle):
         mock_handle.fetch = mock.CoroutineMock(side_effect=[MockCredEntry(), None])
@@ -654,3 +734,118 @@ class TestAnonCredsHolder(IsolatedAsyncioTestCase):
                 rev_list={"accum": "1"},
                 tails_file_path="/tmp/some.tails",
             )
+
+    @mock.patch.object(CredentialRevocationState, "create")
+    async def test_create_revocation_state_cached(self, mock_create):
+        cache = RevocationStateCache()
+        self.profile.context.injector.bind_instance(RevocationStateCache, cache)
+        mock_create.side_effect = [
+            mock.MagicMock(to_json=mock.MagicMock(return_value="state-10")),
+            mock.MagicMock(to_json=mock.MagicMock(return_value="state-20")),
+        ]
+        rev_list_10 = {"revRegDefId": "rr-id", "timestamp": 10, "accum": "1"}
+        rev_list_20 = {"revRegDefId": "rr-id", "timestamp": 20, "accum": "2"}
+
+        for _ in range(2):
+            assert (
+                await self.holder.create_revocation_state(
+                    cred_rev_id="1",
+                    rev_reg_def={"def": 1},
+                    rev_list=rev_list_10,
+                    tails_file_path="/tmp/some.tails",
+                )
+                == "state-10"
+            )
+        mock_create.assert_called_once_with(
+            {"def": 1}, rev_list_10, 1, "/tmp/some.tails"
+        )
+
+        # newer revocation list: updated from the cached state
+        assert (
+            await self.holder.create_revocation_state(
+                cred_rev_id="1",
+                rev_reg_def={"def": 1},
+                rev_list=rev_list_20,
+                tails_file_path="/tmp/some.tails",
+            )
+            == "state-20"
+        )
+        mock_create.assert_called_with(
+            {"def": 1}, rev_list_20, 1, "/tmp/some.tails", "state-10", rev_list_10
+        )
+        assert cache.hot() == [("rr-id", 1)]
+
+    @mock.patch.object(CredentialRevocationState, "create")
+    async def test_create_revocation_state_update_x(self, mock_create):
+        cache = RevocationStateCache()
+        self.profile.context.injector.bind_instance(RevocationStateCache, cache)
+        cache.set("rr-id", 1, 10, "state-10", {"timestamp": 10})
+        mock_create.side_effect = [
+            AnoncredsError(AnoncredsErrorCode.UNEXPECTED, "test"),
+            mock.MagicMock(to_json=mock.MagicMock(return_value="state-20")),
+        ]
+        assert (
+            await self.holder.create_revocation_state(
+                cred_rev_id="1",
+                rev_reg_def={"def": 1},
+                rev_list={"revRegDefId": "rr-id", "timestamp": 20},
+                tails_file_path="/tmp/some.tails",
+            )
+            == "state-20"
+        )
+        assert mock_create.call_count == 2
+
+    async def test_refresh_revocation_states(self):
+        cache = RevocationStateCache()
+        self.profile.context.injector.bind_instance(RevocationStateCache, cache)
+        cache.set("rr-id", 1, 10, "state-10", {"timestamp": 10})
+        cache.set("rr-id", 3, 10, "state-10", {"timestamp": 10})
+        cache.set("rr-id-x", 2, 10, "state-10", {"timestamp": 10})
+        rev_reg_def = mock.MagicMock(serialize=mock.MagicMock(return_value={}))
+        fetched = []
+
+        async def get_rev_reg_def(_, rr_id):
+            fetched.append(rr_id)
+            if rr_id != "rr-id":
+                raise test_module.AnonCredsHolderError("not found")
+            return mock.MagicMock(revocation_registry=rev_reg_def)
+
+        registry = mock.MagicMock(
+            get_revocation_registry_definition=get_rev_reg_def,
+            get_revocation_list=mock.CoroutineMock(
+                return_value=mock.MagicMock(
+                    revocation_list=mock.MagicMock(
+                        serialize=mock.MagicMock(
+                            return_value={"revRegDefId": "rr-id", "timestamp": 20}
+                        )
+                    )
+                )
+            ),
+        )
+        self.profile.context.injector.bind_instance(
+            test_module.AnonCredsRegistry, registry
+        )
+        with mock.patch.object(
+            test_module.AnonCredsRevocation,
+            "get_or_fetch_local_tails_path",
+            mock.CoroutineMock(return_value="/tmp/some.tails"),
+        ), mock.patch.object(
+            self.holder,
+            "create_revocation_state",
+            mock.CoroutineMock(),
+        ) as mock_create_state, mock.patch.object(
+            test_module.LOGGER, "warning"
+        ) as mock_warning:
+            await self.holder.refresh_revocation_states()
+            assert sorted(fetched) == ["rr-id", "rr-id-x"]
+            registry.get_revocation_list.assert_called_once()
+            assert mock_create_state.call_count == 2
+            mock_create_state.assert_any_call(
+                "1", {}, {"revRegDefId": "rr-id", "timestamp": 20}, "/tmp/some.tails"
+            )
+            mock_warning.assert_called_once()
+
+            # the failing registry is backed off
+            fetched.clear()
+            await self.holder.refresh_revocation_states()
+            assert fetched == ["rr-id"]
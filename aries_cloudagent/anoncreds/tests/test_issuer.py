@@ -6,7 +6,9 @@ import pytest
 from anoncreds import (
     Credential,
     CredentialDefinition,
+    CredentialDefinitionPrivate,
     CredentialOffer,
+    KeyCorrectnessProof,
 )
 from aries_askar import AskarError, AskarErrorCode
 
@@ -29,6 +31,7 @@ from aries_cloudagent.anoncreds.models.anoncreds_schema import (
     SchemaResult,
     SchemaState,
 )
+from aries_cloudagent.anoncreds.object_cache import AnonCredsObjectCache
 from aries_cloudagent.askar.profile_anon import (
     AskarAnoncredsProfile,
 )
@@ -730,7 +733,7 @@ class TestAnonCredsIssuer(IsolatedAsyncioTestCase):
             assert mock_load.called
 
     @mock.patch.object(InMemoryProfileSession, "handle")
-    @mock.patch.object(CredentialDefinition, "load", return_value=MockCredDefEntry())
+    @mock.patch.object(KeyCorrectnessProof, "load", return_value=MockKeyProof())
     @mock.patch.object(CredentialOffer, "create", return_value=MockCredOffer())
     async def test_create_credential_offer_create(
         self, mock_create, mock_load, mock_session_handle
@@ -745,8 +748,32 @@ class TestAnonCredsIssuer(IsolatedAsyncioTestCase):
         assert result is not None
 
     @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(KeyCorrectnessProof, "load", return_value=MockKeyProof())
+    @mock.patch.object(CredentialOffer, "create", return_value=MockCredOffer())
+    async def test_create_credential_offer_cached(
+        self, mock_create, mock_load, mock_session_handle
+    ):
+        self.profile.context.injector.bind_instance(
+            AnonCredsObjectCache, AnonCredsObjectCache()
+        )
+        mock_session_handle.fetch = mock.CoroutineMock(
+            side_effect=[MockCredDefEntry(), MockKeyProof()]
+        )
+        await self.issuer.create_credential_offer("cred-def-id")
+        await self.issuer.create_credential_offer("cred-def-id")
+        assert mock_session_handle.fetch.call_count == 2
+        assert mock_load.call_count == 1
+        assert mock_create.call_args[0][:2] == ("schema-id", "cred-def-id")
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(CredentialDefinition, "load", return_value=mock.MagicMock())
+    @mock.patch.object(
+        CredentialDefinitionPrivate, "load", return_value=mock.MagicMock()
+    )
     @mock.patch.object(Credential, "create", return_value=MockCredential())
-    async def test_create_credential(self, mock_create, mock_session_handle):
+    async def test_create_credential(
+        self, mock_create, mock_load_private, mock_load, mock_session_handle
+    ):
         self.profile.inject = mock.Mock(
             return_value=mock.MagicMock(
                 get_schema=mock.CoroutineMock(return_value=MockSchemaResult())
@@ -762,3 +789,28 @@ class TestAnonCredsIssuer(IsolatedAsyncioTestCase):
         assert result is not None
         assert mock_session_handle.fetch.called
         assert mock_create.called
+        assert mock_create.call_args[0][:2] == (
+            mock_load.return_value,
+            mock_load_private.return_value,
+        )
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(CredentialDefinition, "load", return_value=mock.MagicMock())
+    @mock.patch.object(
+        CredentialDefinitionPrivate, "load", return_value=mock.MagicMock()
+    )
+    async def test_get_credential_definition_keys_cached(
+        self, mock_load_private, mock_load, mock_session_handle
+    ):
+        self.profile.context.injector.bind_instance(
+            AnonCredsObjectCache, AnonCredsObjectCache()
+        )
+        mock_session_handle.fetch = mock.CoroutineMock(return_value=MockCredDefEntry())
+        for _ in range(3):
+            keys = await self.issuer.get_credential_definition_keys("cred-def-id")
+            assert keys == (mock_load.return_value, mock_load_private.return_value)
+        assert mock_session_handle.fetch.call_count == 2
+
+        self.issuer.invalidate_objects("cred-def-id")
+        await self.issuer.get_credential_definition_keys("cred-def-id")
+        assert mock_session_handle.fetch.call_count == 4
@@ -0,0 +1,68 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ..object_cache import AnonCredsObjectCache
+
+
+class TestAnonCredsObjectCache(IsolatedAsyncioTestCase):
+    async def test_get_or_load(self):
+        cache = AnonCredsObjectCache()
+        load = mock.CoroutineMock(return_value=("loaded", 10))
+        assert await cache.get_or_load("category", "id", load) == "loaded"
+        assert await cache.get_or_load("category", "id", load) == "loaded"
+        assert load.call_count == 1
+        assert (cache.hits, cache.misses, cache.size) == (1, 1, 10)
+
+        # other categories are separate
+        assert await cache.get_or_load("other", "id", load) == "loaded"
+        assert load.call_count == 2
+
+    async def test_get_or_load_missing(self):
+        cache = AnonCredsObjectCache()
+        load = mock.CoroutineMock(return_value=None)
+        assert await cache.get_or_load("category", "id", load) is None
+        assert await cache.get_or_load("category", "id", load) is None
+        assert load.call_count == 2
+
+    async def test_invalidate(self):
+        cache = AnonCredsObjectCache()
+        cache.set("category", "id", "value", 10)
+        cache.set("other", "id", "value", 10)
+        cache.set("category", "id2", "value", 10)
+        cache.invalidate("id")
+        assert cache.get("category", "id") is None
+        assert cache.get("other", "id") is None
+        assert cache.get("category", "id2") == "value"
+        assert cache.size == 10
+
+        cache.clear()
+        assert cache.get("category", "id2") is None
+        assert cache.size == 0
+
+    async def test_invalidate_during_load(self):
+        cache = AnonCredsObjectCache()
+
+        async def load():
+            cache.invalidate("id")
+            return "stale", 10
+
+        assert await cache.get_or_load("category", "id", load) == "stale"
+        assert cache.get("category", "id") is None
+
+    async def test_bounded_size(self):
+        cache = AnonCredsObjectCache(max_size=25)
+        cache.set("category", "1", "one", 10)
+        cache.set("category", "2", "two", 10)
+        assert cache.get("category", "1") == "one"
+        cache.set("category", "3", "three", 10)
+        # least recently used is discarded
+        assert cache.get("category", "2") is None
+        assert cache.get("category", "1") == "one"
+        assert cache.get("category", "3") == "three"
+        assert cache.size == 20
+
+        # too large to cache
+        cache.set("category", "4", "four", 30)
+        assert cache.get("category", "4") is None
+        assert cache.size == 20
@@ -1,19 +1,17 @@
-import http
 import json
-import os
 from unittest import IsolatedAsyncioTestCase
 
 import pytest
 from anoncreds import (
     Credential,
     CredentialDefinition,
+    CredentialDefinitionPrivate,
     RevocationRegistryDefinition,
     RevocationRegistryDefinitionPrivate,
     RevocationStatusList,
     Schema,
 )
 from aries_askar import AskarError, AskarErrorCode
-from requests import RequestException, Session
 
 from aries_cloudagent.anoncreds.issuer import AnonCredsIssuer
 from aries_cloudagent.anoncreds.models.anoncreds_cred_def import CredDef
@@ -31,6 +29,7 @@ from aries_cloudagent.anoncreds.models.anoncreds_schema import (
     GetSchemaResult,
 )
 from aries_cloudagent.anoncreds.registry import AnonCredsRegistry
+from aries_cloudagent.anoncreds.revocation_index import RevRegIndexReservations
 from aries_cloudagent.anoncreds.tests.mock_objects import (
     MOCK_REV_REG_DEF,
 )
@@ -43,6 +42,9 @@ from aries_cloudagent.core.in_memory.profile import (
     InMemoryProfile,
     InMemoryProfileSession,
 )
+from aries_cloudagent.revocation.provisioner import RegistryProvisioner
+from aries_cloudagent.tails.cache import TailsFileCache
+from aries_cloudagent.tails.error import TailsDownloadError
 from aries_cloudagent.tests import mock
 
 from .. import revocation as test_module
@@ -792,54 +794,52 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.get_revocation_lists_with_pending_revocations()
 
-    @mock.patch.object(Session, "get")
-    @mock.patch.object(os, "remove")
-    async def test_retrieve_tails(self, mock_remove, mock_get):
-        class MockResponse:
-            def __init__(self, status=http.HTTPStatus.OK):
-                self.status_code = status
-
-            def iter_content(self, chunk_size: int = 1):
-                yield b"tails-hash"
-
-        mock_get.side_effect = [
-            MockResponse(),
-            MockResponse(),
-            RequestException(request=mock.AsyncMock(), response=mock.AsyncMock()),
-            MockResponse(status=http.HTTPStatus.BAD_REQUEST),
-        ]
+    async def test_retrieve_tails(self):
+        tails_cache = mock.MagicMock(
+            TailsFileCache,
+            fetch=mock.CoroutineMock(
+                side_effect=[
+                    "/tmp/tails/cache/tails-hash",
+                    TailsDownloadError("hash does not match"),
+                ]
+            ),
+        )
+        self.profile.context.injector.bind_instance(TailsFileCache, tails_cache)
 
         result = await self.revocation.retrieve_tails(rev_reg_def)
+        assert result == "/tmp/tails/cache/tails-hash"
+        tails_cache.fetch.assert_awaited_once_with(
+            rev_reg_def.value.tails_hash, rev_reg_def.value.tails_location
+        )
 
-        assert isinstance(result, str)
-        assert mock_get.call_count == 1
-
-        # tails hash does not match
-        with self.assertRaises(test_module.AnonCredsRevocationError):
-            await self.revocation.retrieve_tails(
-                RevRegDef(
-                    tag="tag",
-                    cred_def_id="CsQY9MGeD3CQP4EyuVFo5m:3:CL:14951:MYCO_Biomarker",
-                    value=RevRegDefValue(
-                        max_cred_num=100,
-                        public_keys={
-                            "accum_key": {"z": "1 0BB...386"},
-                        },
-                        tails_hash="not-correct-hash",
-                        tails_location="http://tails-server.com",
-                    ),
-                    issuer_id="CsQY9MGeD3CQP4EyuVFo5m",
-                    type="CL_ACCUM",
-                )
-            )
-            assert mock_remove.call_count == 1
-
-        # http request fails
+        # download fails
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.retrieve_tails(rev_reg_def)
 
-        # doesn't crash on non 200 response
-        await self.revocation.retrieve_tails(rev_reg_def)
+    async def test_get_or_fetch_local_tails_path(self):
+        tails_cache = mock.MagicMock(
+            TailsFileCache,
+            get_or_fetch=mock.CoroutineMock(
+                side_effect=[
+                    "/tmp/tails/cache/tails-hash",
+                    TailsDownloadError("hash does not match"),
+                ]
+            ),
+        )
+        self.profile.context.injector.bind_instance(TailsFileCache, tails_cache)
+
+        with mock.patch.object(
+            test_module.Path, "is_file", mock.Mock(side_effect=[True, False, False])
+        ):
+            result = await self.revocation.get_or_fetch_local_tails_path(rev_reg_def)
+            assert result == self.revocation.get_local_tails_path(rev_reg_def)
+            tails_cache.get_or_fetch.assert_not_called()
+
+            result = await self.revocation.get_or_fetch_local_tails_path(rev_reg_def)
+            assert result == "/tmp/tails/cache/tails-hash"
+
+            with self.assertRaises(test_module.AnonCredsRevocationError):
+                await self.revocation.get_or_fetch_local_tails_path(rev_reg_def)
 
     def test_generate_public_tails_uri(self):
         self.revocation.generate_public_tails_uri(rev_reg_def)
@@ -854,7 +854,8 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.AnonCredsRevocationError):
             self.revocation.generate_public_tails_uri(rev_reg_def)
 
-    async def test_upload_tails_file(self):
+    @mock.patch.object(test_module.Path, "is_file", return_value=True)
+    async def test_upload_tails_file(self, _):
         self.profile.inject_or = mock.Mock(
             return_value=mock.MagicMock(
                 upload_tails_file=mock.CoroutineMock(
@@ -881,38 +882,123 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             await self.revocation.upload_tails_file(rev_reg_def)
 
     @mock.patch.object(InMemoryProfileSession, "handle")
-    @mock.patch.object(
-        test_module.AnonCredsRevocation, "set_active_registry", return_value=None
-    )
     @mock.patch.object(
         test_module.AnonCredsRevocation,
         "create_and_register_revocation_registry_definition",
         return_value="backup",
     )
-    async def test_handle_full_registry(
-        self, mock_create_and_register, mock_set_active_registry, mock_handle
-    ):
+    async def test_handle_full_registry(self, mock_create_and_register, mock_handle):
         mock_handle.fetch = mock.CoroutineMock(return_value=MockRevRegDefEntry())
         mock_handle.fetch_all = mock.CoroutineMock(
-            return_value=[
-                MockRevRegDefEntry(),
-                MockRevRegDefEntry(),
+            side_effect=[
+                [MockRevRegDefEntry("backup")],
+                [MockRevRegDefEntry("backup")],
+                [],
             ]
         )
         mock_handle.replace = mock.CoroutineMock(return_value=None)
+        self.revocation.release_reserved_indexes = mock.CoroutineMock()
 
         await self.revocation.handle_full_registry("test-rev-reg-def-id")
-        assert mock_create_and_register.called
-        assert mock_set_active_registry.called
-        assert mock_handle.fetch.call_count == 2
-        assert mock_handle.fetch_all.called
-        assert mock_handle.replace.called
+        self.revocation.release_reserved_indexes.assert_awaited_once_with(
+            "test-rev-reg-def-id"
+        )
+        assert mock_handle.replace.call_count == 2
+        full, active = mock_handle.replace.call_args_list
+        assert full.args[3]["active"] == json.dumps(False)
+        assert full.args[3]["state"] == RevRegDefState.STATE_FULL
+        assert active.args[1] == "backup"
+        assert active.args[3]["active"] == json.dumps(True)
+        mock_create_and_register.assert_called_once()
+        assert mock_create_and_register.call_args.kwargs["cred_def_id"] == (
+            MockRevRegDefEntry.value_json["credDefId"]
+        )
 
         # no backup registry available
         mock_handle.fetch_all = mock.CoroutineMock(return_value=[])
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.handle_full_registry("test-rev-reg-def-id")
 
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(
+        test_module.AnonCredsRevocation,
+        "create_and_register_revocation_registry_definition",
+        return_value="backup",
+    )
+    async def test_handle_full_registry_provisioner(
+        self, mock_create_and_register, mock_handle
+    ):
+        provisioner = RegistryProvisioner(standby=3)
+        self.profile.context.injector.bind_instance(RegistryProvisioner, provisioner)
+        mock_handle.fetch = mock.CoroutineMock(return_value=MockRevRegDefEntry())
+        mock_handle.fetch_all = mock.CoroutineMock(
+            side_effect=[
+                [MockRevRegDefEntry("backup")],
+                [MockRevRegDefEntry("backup")],
+                [MockRevRegDefEntry("standby")],
+            ]
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+
+        await self.revocation.handle_full_registry("test-rev-reg-def-id")
+        # switched over without waiting for new registries
+        assert mock_handle.replace.call_count == 2
+        mock_create_and_register.assert_not_called()
+
+        await provisioner.stop()
+        assert mock_create_and_register.call_count == 2
+
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(
+        test_module.AnonCredsRevocation,
+        "create_and_register_revocation_registry_definition",
+        return_value="backup",
+    )
+    async def test_provision_standby_registries(
+        self, mock_create_and_register, mock_handle
+    ):
+        mock_handle.fetch_all = mock.CoroutineMock(
+            side_effect=[[MockRevRegDefEntry("active")], []]
+        )
+        assert await self.revocation.provision_standby_registries("cred-def-id") == 1
+        mock_create_and_register.assert_called_once()
+
+        # standby registry in creation
+        mock_create_and_register.reset_mock()
+        mock_handle.fetch_all = mock.CoroutineMock(
+            side_effect=[
+                [MockRevRegDefEntry("active")],
+                [MockRevRegDefEntry("standby")],
+            ]
+        )
+        assert await self.revocation.provision_standby_registries("cred-def-id") == 0
+        mock_create_and_register.assert_not_called()
+
+        # no active registry
+        mock_handle.fetch_all = mock.CoroutineMock(side_effect=[[], []])
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await self.revocation.provision_standby_registries("cred-def-id")
+
+    async def test_check_fill_level(self):
+        self.revocation.provision_standby_registries = mock.CoroutineMock(
+            return_value=1
+        )
+        # no provisioner
+        self.revocation._check_fill_level("cred-def-id", "rev-reg-id", 90, 100)
+
+        provisioner = RegistryProvisioner(watermark=80)
+        self.profile.context.injector.bind_instance(RegistryProvisioner, provisioner)
+        self.revocation._check_fill_level("cred-def-id", "rev-reg-id", 79, 100)
+        await provisioner.stop()
+        self.revocation.provision_standby_registries.assert_not_called()
+
+        self.revocation._check_fill_level("cred-def-id", "rev-reg-id", 80, 100)
+        self.revocation._check_fill_level("cred-def-id", "rev-reg-id", 81, 100)
+        await provisioner.stop()
+        self.revocation.provision_standby_registries.assert_awaited_once_with(
+            "cred-def-id"
+        )
+
     @mock.patch.object(InMemoryProfileSession, "handle")
     async def test_decommission_registry(self, mock_handle):
         mock_handle.fetch_all = mock.CoroutineMock(
@@ -1005,9 +1091,13 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             await self.revocation.get_or_create_active_registry("test-rev-reg-def-id")
 
     @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(CredentialDefinition, "load", return_value=mock.MagicMock())
+    @mock.patch.object(
+        CredentialDefinitionPrivate, "load", return_value=mock.MagicMock()
+    )
     @mock.patch.object(Credential, "create", return_value=mock.MagicMock())
     async def test_create_credential_private_no_rev_reg_or_tails(
-        self, mock_create, mock_handle
+        self, mock_create, mock_load_private, mock_load, mock_handle
     ):
         mock_handle.fetch = mock.CoroutineMock(side_effect=[MockEntry(), MockEntry()])
         await self.revocation._create_credential(
@@ -1061,13 +1151,27 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             )
 
     @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(CredentialDefinition, "load", return_value=mock.MagicMock())
+    @mock.patch.object(
+        CredentialDefinitionPrivate, "load", return_value=mock.MagicMock()
+    )
     @mock.patch.object(
         RevocationRegistryDefinition, "load", return_value=rev_reg_def.value
     )
+    @mock.patch.object(
+        RevocationRegistryDefinitionPrivate, "load", return_value=mock.MagicMock()
+    )
     @mock.patch("aries_cloudagent.anoncreds.revocation.CredentialRevocationConfig")
     @mock.patch.object(Credential, "create", return_value=mock.MagicMock())
     async def test_create_credential_private_with_rev_reg_and_tails(
-        self, mock_create, mock_config, mock_load_rev_reg_def, mock_handle
+        self,
+        mock_create,
+        mock_config,
+        mock_load_rev_key,
+        mock_load_rev_reg_def,
+        mock_load_private,
+        mock_load,
+        mock_handle,
     ):
         async def call_test_func():
             await self.revocation._create_credential(
@@ -1090,62 +1194,111 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
 
         # missing rev list
         mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), None, MockEntry(), MockEntry()]
+            side_effect=[MockEntry(), MockEntry(), MockEntry(), MockEntry(), None, None]
         )
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await call_test_func()
         # missing rev def
         mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), MockEntry(), None, MockEntry()]
+            side_effect=[MockEntry(), MockEntry(), None, MockEntry()]
         )
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await call_test_func()
         # missing rev key
         mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), MockEntry(), MockEntry(), None]
+            side_effect=[MockEntry(), MockEntry(), MockEntry(), None]
         )
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await call_test_func()
 
-        # valid
+        # valid, index counter taken from the rev list
+        mock_handle.insert = mock.CoroutineMock(return_value=None)
         mock_handle.replace = mock.CoroutineMock(return_value=None)
+        rev_list_entry = MockEntry(
+            value_json={
+                "rev_list": rev_list.serialize(),
+                "next_index": 1,
+            }
+        )
         mock_handle.fetch = mock.CoroutineMock(
             side_effect=[
                 MockEntry(),
                 MockEntry(),
-                MockEntry(
-                    value_json={
-                        "rev_list": rev_list.serialize(),
-                        "next_index": 0,
-                    }
-                ),
                 MockEntry(raw_value=rev_reg_def.serialize()),
                 MockEntry(),
+                None,
+                rev_list_entry,
+                rev_list_entry,
             ]
         )
         await call_test_func()
         assert mock_create.called
-        assert mock_handle.replace.called
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.insert.call_args.kwargs["value_json"] == {
+            "next_index": 2,
+            "free": [],
+        }
+        assert not mock_handle.replace.called
+        assert mock_config.call_args.args[3] == 1
+        assert mock_handle.fetch.call_count == 7
+
+        # valid, separate index counter
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[
+                MockEntry(),
+                MockEntry(),
+                MockEntry(raw_value=rev_reg_def.serialize()),
+                MockEntry(),
+                MockEntry(value_json={"next_index": 5, "free": [[3, 4]]}),
+                rev_list_entry,
+            ]
+        )
+        await call_test_func()
+        assert mock_handle.replace.call_args.kwargs["value_json"] == {
+            "next_index": 5,
+            "free": [],
+        }
+        assert mock_config.call_args.args[3] == 3
 
         # revocation registry is full
         mock_handle.fetch = mock.CoroutineMock(
             side_effect=[
                 MockEntry(),
                 MockEntry(),
-                MockEntry(
-                    value_json={
-                        "rev_list": rev_list.serialize(),
-                        "next_index": 101,
-                    }
-                ),
                 MockEntry(raw_value=rev_reg_def.serialize()),
                 MockEntry(),
+                MockEntry(value_json={"next_index": 101}),
             ]
         )
-        with self.assertRaises(test_module.AnonCredsRevocationError):
+        with self.assertRaises(test_module.AnonCredsRevocationRegistryFullError):
             await call_test_func()
 
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    async def test_release_reserved_indexes(self, mock_handle):
+        reservations = RevRegIndexReservations(block_size=5)
+        self.profile.context.injector.bind_instance(
+            RevRegIndexReservations, reservations
+        )
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[MockEntry(value_json={"next_index": 1})]
+        )
+        mock_handle.replace = mock.CoroutineMock(return_value=None)
+        assert await self.revocation._take_index("test-rev-reg-def-id", 100) == 1
+        assert mock_handle.replace.call_args.kwargs["value_json"] == {
+            "next_index": 6,
+            "free": [],
+        }
+        assert await self.revocation._take_index("test-rev-reg-def-id", 100) == 2
+
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[MockEntry(value_json={"next_index": 8, "free": []})]
+        )
+        await self.revocation.release_reserved_indexes()
+        assert mock_handle.replace.call_args.kwargs["value_json"] == {
+            "next_index": 8,
+            "free": [[3, 6]],
+        }
+        assert reservations.release() == {}
+
     @mock.patch.object(
         AnonCredsIssuer, "cred_def_supports_revocation", return_value=True
     )
@@ -1199,6 +1352,100 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         assert isinstance(result, tuple)
         assert mock_supports_revocation.call_count == 1
 
+    @mock.patch.object(InMemoryProfileSession, "handle")
+    @mock.patch.object(AnonCredsIssuer, "load_object")
+    @mock.patch.object(AnonCredsIssuer, "get_credential_definition_keys")
+    @mock.patch.object(AnonCredsIssuer, "cred_def_supports_revocation")
+    @mock.patch.object(test_module, "_create_credentials")
+    async def test_create_credentials(
+        self,
+        mock_create,
+        mock_supports_revocation,
+        mock_get_keys,
+        mock_load_object,
+        mock_handle,
+    ):
+        self.profile.inject = mock.Mock(
+            return_value=mock.MagicMock(
+                get_schema=mock.CoroutineMock(
+                    return_value=GetSchemaResult(
+                        schema_id="CsQY9MGeD3CQP4EyuVFo5m:2:MYCO Biomarker:0.0.3",
+                        schema=AnonCredsSchema(
+                            issuer_id="CsQY9MGeD3CQP4EyuVFo5m",
+                            name="MYCO Biomarker:0.0.3",
+                            version="1.0",
+                            attr_names=["attr1", "attr2"],
+                        ),
+                        schema_metadata={},
+                        resolution_metadata={},
+                    )
+                )
+            )
+        )
+        mock_get_keys.return_value = (mock.MagicMock(), mock.MagicMock())
+        mock_create.side_effect = lambda chunk, *args: [
+            (json.dumps({"index": index}), None) for *_, index in chunk
+        ]
+        mock_handle.fetch = mock.CoroutineMock(
+            return_value=MockEntry(value_json={"rev_list": rev_list.serialize()})
+        )
+        self.revocation.get_or_create_active_registry = mock.CoroutineMock(
+            return_value=RevRegDefResult(
+                job_id="test-job-id",
+                revocation_registry_definition_state=RevRegDefState(
+                    state=RevRegDefState.STATE_FINISHED,
+                    revocation_registry_definition_id="active-reg-reg",
+                    revocation_registry_definition=rev_reg_def,
+                ),
+                registration_metadata={},
+                revocation_registry_definition_metadata={},
+            )
+        )
+        self.revocation.handle_full_registry = mock.CoroutineMock()
+        offer = {
+            "schema_id": "CsQY9MGeD3CQP4EyuVFo5m:2:MYCO Biomarker:0.0.3",
+            "cred_def_id": "CsQY9MGeD3CQP4EyuVFo5m:3:CL:14951:MYCO_Biomarker",
+        }
+        values = {"attr1": "value1", "attr2": "value2"}
+        credentials = [(offer, {}, values)] * 3
+
+        # registry fills up after two credentials, the third uses the next one
+        mock_supports_revocation.return_value = True
+        self.revocation.reserve_indexes = mock.CoroutineMock(
+            side_effect=[[(99, 101)], [(1, 2)]]
+        )
+        result = await self.revocation.create_credentials(credentials)
+        assert result == [
+            ('{"index": 99}', "99", "active-reg-reg"),
+            ('{"index": 100}', "100", "active-reg-reg"),
+            ('{"index": 1}', "1", "active-reg-reg"),
+        ]
+        assert self.revocation.reserve_indexes.call_args_list[0].args[2] == 3
+        assert self.revocation.reserve_indexes.call_args_list[1].args[2] == 1
+        self.revocation.handle_full_registry.assert_called_once_with("active-reg-reg")
+
+        # non-revocable
+        mock_supports_revocation.return_value = False
+        result = await self.revocation.create_credentials(credentials[:2])
+        assert result == [('{"index": null}', None, None)] * 2
+
+        # error creating a credential
+        mock_create.side_effect = lambda chunk, *args: [(None, "bad")] * len(chunk)
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await self.revocation.create_credentials(credentials)
+
+        # missing attribute value
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await self.revocation.create_credentials([(offer, {}, {"attr1": "value1"})])
+
+        # mixed credential definitions
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await self.revocation.create_credentials(
+                [(offer, {}, values), ({**offer, "cred_def_id": "other"}, {}, values)]
+            )
+
+        assert await self.revocation.create_credentials([]) == []
+
     @mock.patch.object(InMemoryProfileSession, "handle")
     @mock.patch.object(RevList, "to_native")
     @mock.patch.object(RevList, "from_native", return_value=None)
@@ -1271,6 +1518,8 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 MockEntry(),
                 # cred def
                 MockEntry(),
+                # rev list index, kept in the rev list entry
+                None,
                 # updated rev list entry
                 MockEntry(
                     value_json={
@@ -1288,7 +1537,7 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             revoc_reg_id="test-rev-reg-id",
         )
 
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.fetch.call_count == 6
         assert mock_handle.replace.called
         assert mock_rev_list_from_native.called
         assert mock_rev_list_to_native.called
@@ -0,0 +1,89 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from ..revocation_index import (
+    RevRegIndexReservations,
+    index_handed_out,
+    return_index_ranges,
+    take_index_ranges,
+)
+
+
+class TestIndexRanges(IsolatedAsyncioTestCase):
+    async def test_take(self):
+        info = {"next_index": 1}
+        assert take_index_ranges(info, 10, 100) == [(1, 11)]
+        assert info == {"next_index": 11, "free": []}
+
+    async def test_take_free_first(self):
+        info = {"next_index": 20, "free": [[3, 5], [8, 9]]}
+        assert take_index_ranges(info, 4, 100) == [(3, 5), (8, 9), (20, 21)]
+        assert info == {"next_index": 21, "free": []}
+
+        info = {"next_index": 20, "free": [[3, 10]]}
+        assert take_index_ranges(info, 4, 100) == [(3, 7)]
+        assert info == {"next_index": 20, "free": [[7, 10]]}
+
+    async def test_take_full(self):
+        info = {"next_index": 95}
+        assert take_index_ranges(info, 10, 100) == [(95, 101)]
+        assert take_index_ranges(info, 10, 100) == []
+        assert info["next_index"] == 101
+
+    async def test_return(self):
+        info = {"next_index": 21, "free": [[3, 5]]}
+        return_index_ranges(info, [(5, 7), (15, 21)])
+        assert info == {"next_index": 15, "free": [[3, 7]]}
+
+        return_index_ranges(info, [(7, 15)])
+        assert info == {"next_index": 3, "free": []}
+
+        info = {"next_index": 21}
+        return_index_ranges(info, [(10, 12)])
+        assert info == {"next_index": 21, "free": [[10, 12]]}
+
+    async def test_handed_out(self):
+        info = {"next_index": 21, "free": [[3, 5]]}
+        assert [
+            index for index in range(1, 23) if not index_handed_out(info, index)
+        ] == [
+            3,
+            4,
+            21,
+            22,
+        ]
+        assert index_handed_out({"next_index": 21}, 20)
+
+
+class TestRevRegIndexReservations(IsolatedAsyncioTestCase):
+    async def test_take_blocks(self):
+        reservations = RevRegIndexReservations(block_size=5)
+        info = {"next_index": 1}
+        calls = 0
+
+        async def reserve(count):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return take_index_ranges(info, count, 12)
+
+        indexes = await asyncio.gather(
+            *(reservations.take("rr", reserve) for _ in range(14))
+        )
+        assert sorted(indexes[:12]) == list(range(1, 13))
+        assert indexes[12:] == [None, None]
+        # 3 blocks, then the registry is full
+        assert calls == 5
+
+    async def test_release(self):
+        reservations = RevRegIndexReservations(block_size=5)
+        info = {"next_index": 1}
+
+        async def reserve(count):
+            return take_index_ranges(info, count, 100)
+
+        assert await reservations.take("rr1", reserve) == 1
+        assert await reservations.take("rr2", reserve) == 6
+        assert reservations.release("rr1") == {"rr1": [(2, 6)]}
+        assert reservations.release() == {"rr2": [(7, 11)]}
+        assert reservations.release() == {}
@@ -248,3 +248,16 @@ class TestAnonCredsRevocationSetup(IsolatedAsyncioTestCase):
         await self.revocation_setup.on_rev_reg_def(self.profile, event)
         assert not mock_upload.called
         assert not mock_register.called
+
+    @mock.patch.object(AnonCredsRevocation, "release_reserved_indexes")
+    async def test_on_shutdown_releases_reserved_indexes(self, mock_release):
+        sub_profile = InMemoryProfile.test_profile(
+            settings={"wallet-type": "askar-anoncreds"},
+            profile_class=AskarAnoncredsProfile,
+        )
+        self.profile.context.injector.bind_instance(
+            test_module.BaseMultitenantManager,
+            mock.MagicMock(open_profiles=[sub_profile, InMemoryProfile.test_profile()]),
+        )
+        await self.revocation_setup.on_shutdown(self.profile, mock.MagicMock())
+        assert mock_release.call_count == 2
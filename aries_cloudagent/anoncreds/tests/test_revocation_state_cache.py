@@ -0,0 +1,81 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from .. import revocation_state_cache as test_module
+from ..revocation_state_cache import RevocationStateCache
+
+RR_ID = "rev-reg-def-id"
+
+
+class TestRevocationStateCache(IsolatedAsyncioTestCase):
+    async def test_get_set(self):
+        cache = RevocationStateCache()
+        assert cache.get(RR_ID, 1, 10) is None
+        cache.set(RR_ID, 1, 10, "state-10", {"timestamp": 10})
+        assert cache.get(RR_ID, 1, 10) == "state-10"
+        assert cache.get(RR_ID, 2, 10) is None
+        assert cache.get(RR_ID, 1, 20) is None
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    async def test_base(self):
+        cache = RevocationStateCache()
+        assert cache.base(RR_ID, 1, 10) is None
+        cache.set(RR_ID, 1, 10, "state-10", {"timestamp": 10})
+        cache.set(RR_ID, 1, 30, "state-30", {"timestamp": 30})
+        assert cache.base(RR_ID, 1, 10) is None
+        assert cache.base(RR_ID, 1, 20) == ("state-10", {"timestamp": 10})
+        assert cache.base(RR_ID, 1, 40) == ("state-30", {"timestamp": 30})
+
+    async def test_limits(self):
+        cache = RevocationStateCache(max_credentials=2, states_per_credential=2)
+        for stamp in (10, 20, 30):
+            cache.set(RR_ID, 1, stamp, f"state-{stamp}", {"timestamp": stamp})
+        assert cache.get(RR_ID, 1, 10) is None
+        assert cache.get(RR_ID, 1, 30) == "state-30"
+        assert sorted(cache._lists) == [(RR_ID, 20), (RR_ID, 30)]
+
+        cache.set(RR_ID, 2, 30, "state-30", {"timestamp": 30})
+        cache.set("other", 1, 5, "state-5", {"timestamp": 5})
+        assert cache.hot() == [("other", 1), (RR_ID, 2)]
+        assert cache.hot(1) == [("other", 1)]
+        assert sorted(cache._lists) == [("other", 5), (RR_ID, 30)]
+
+        cache.clear()
+        assert not cache.hot()
+
+    async def test_refresh(self):
+        cache = RevocationStateCache()
+        refresh = mock.CoroutineMock()
+        cache.schedule_refresh(0.01, refresh)
+        cache.schedule_refresh(0.01, refresh)
+        await asyncio.sleep(0.05)
+        assert refresh.call_count >= 2
+        cache.stop()
+        count = refresh.call_count
+        await asyncio.sleep(0.03)
+        assert refresh.call_count == count
+
+        # not scheduled without an interval
+        cache.schedule_refresh(None, refresh)
+        assert not cache._timer
+
+    async def test_refresh_backoff(self):
+        cache = RevocationStateCache()
+        assert cache.refresh_due("rr-id")
+        cache.refresh_failed("rr-id")
+        assert not cache.refresh_due("rr-id")
+        assert cache.refresh_due("rr-id")
+        cache.refresh_failed("rr-id")
+        assert [cache.refresh_due("rr-id") for _ in range(4)] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        for _ in range(10):
+            cache.refresh_failed("rr-id")
+        assert cache._backoff["rr-id"][1] == test_module.MAX_REFRESH_BACKOFF
+        cache.refresh_succeeded("rr-id")
+        assert cache.refresh_due("rr-id")
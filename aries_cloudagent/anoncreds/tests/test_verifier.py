@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from unittest import IsolatedAsyncioTestCase
 
@@ -585,10 +586,118 @@ class TestAnonCredsVerifier(IsolatedAsyncioTestCase):
                     "timestamp": 1234567890,
                 }
             ]
+            * 2
+            + [
+                {
+                    "schema_id": "schema-id",
+                    "cred_def_id": "cred-def-id",
+                    "rev_reg_id": "rev-reg-id",
+                    "timestamp": 1234567891,
+                }
+            ]
         )
 
         assert isinstance(result, tuple)
         assert len(result) == 4
+        (schemas, cred_defs, rev_reg_defs, rev_lists) = result
+        assert list(schemas) == ["schema-id"]
+        assert list(cred_defs) == ["cred-def-id"]
+        assert list(rev_reg_defs) == ["rev-reg-id"]
+        assert list(rev_lists["rev-reg-id"]) == [1234567890, 1234567891]
+
+        # each distinct artifact is fetched once
+        registry = self.profile.inject.return_value
+        assert registry.get_schema.call_count == 1
+        assert registry.get_credential_definition.call_count == 1
+        assert registry.get_revocation_registry_definition.call_count == 1
+        assert registry.get_revocation_list.call_count == 2
+        # nothing is kept on the verifier between calls
+        assert not hasattr(self.verifier, "timings")
+
+        # fetched cred defs are reused for the timestamp checks
+        await self.verifier.check_timestamps(
+            self.profile,
+            MOCK_PRES_REQ,
+            {
+                **MOCK_PRES,
+                "identifiers": [
+                    {**ident, "cred_def_id": "cred-def-id"}
+                    for ident in MOCK_PRES["identifiers"]
+                ],
+            },
+            MOCK_REV_REG_DEFS,
+            cred_defs,
+        )
+        assert registry.get_credential_definition.call_count == 1
+
+    async def test_process_pres_identifiers_bounded(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_schema(profile, schema_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock.MagicMock(
+                schema=mock.MagicMock(serialize=mock.MagicMock(return_value=schema_id))
+            )
+
+        self.profile.inject = mock.Mock(
+            return_value=mock.MagicMock(
+                get_schema=get_schema,
+                get_credential_definition=mock.CoroutineMock(),
+            )
+        )
+        (schemas, _, _, _) = await self.verifier.process_pres_identifiers(
+            [
+                {"schema_id": f"schema-{i}", "cred_def_id": "cred-def-id"}
+                for i in range(20)
+            ]
+        )
+        assert schemas == {f"schema-{i}": f"schema-{i}" for i in range(20)}
+        assert 1 < max_in_flight <= test_module.MAX_CONCURRENT_FETCHES
+
+    async def test_check_timestamps_bounded(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_credential_definition(profile, cred_def_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return GetCredDefResult(
+                credential_definition_id=cred_def_id,
+                credential_definition=CredDef(
+                    issuer_id="did:indy:sovrin:SGrjRL82Y9ZZbzhUDXokvQ",
+                    schema_id="schema-id",
+                    tag="tag",
+                    type="CL",
+                    value=CredDefValue(
+                        primary=CredDefValuePrimary("n", "s", {}, "rctxt", "z")
+                    ),
+                ),
+                credential_definition_metadata={},
+                resolution_metadata={},
+            )
+
+        self.profile.inject = mock.Mock(
+            return_value=mock.MagicMock(
+                get_credential_definition=get_credential_definition
+            )
+        )
+        mock_pres = deepcopy(MOCK_PRES)
+        mock_pres["identifiers"] += [
+            {**mock_pres["identifiers"][0], "cred_def_id": f"cred-def-{i}"}
+            for i in range(20)
+        ]
+        await self.verifier.check_timestamps(
+            self.profile, MOCK_PRES_REQ, mock_pres, MOCK_REV_REG_DEFS
+        )
+        assert 1 < max_in_flight <= test_module.MAX_CONCURRENT_FETCHES
 
     async def test_verify_presentation(self):
         self.profile.inject = mock.Mock(
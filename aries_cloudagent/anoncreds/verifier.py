@@ -2,20 +2,25 @@
 
 import asyncio
 import logging
+from contextlib import contextmanager
 from enum import Enum
-from time import time
-from typing import List, Mapping, Tuple
+from time import perf_counter, time
+from typing import Dict, List, Mapping, Tuple
 
 from anoncreds import AnoncredsError, Presentation
 
 from ..core.profile import Profile
 from ..indy.models.xform import indy_proof_req2non_revoc_intervals
 from ..messaging.util import canon, encode
+from ..utils.stats import Collector
 from .models.anoncreds_cred_def import GetCredDefResult
 from .registry import AnonCredsRegistry
 
 LOGGER = logging.getLogger(__name__)
 
+# maximum number of concurrent registry requests per presentation
+MAX_CONCURRENT_FETCHES = 8
+
 
 class PresVerifyMsg(str, Enum):
     """Credential verification codes."""
@@ -39,6 +44,26 @@ class AnonCredsVerifier:
 
         """
         self.profile = profile
+        self._fetch_limit = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    @contextmanager
+    def _timed(self, phase: str, timings: Dict[str, float]):
+        """Record the duration of a verification phase in the timings of a call."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            timings[phase] = timings.get(phase, 0.0) + duration
+            collector = self.profile.inject_or(Collector)
+            if collector:
+                collector.log(f"{self.__class__.__name__}.{phase}", duration, start)
+
+    async def _fetch(self, profile: Profile, method: str, *args):
+        """Call a registry method, bounding the number of concurrent requests."""
+        anoncreds_registry = profile.inject(AnonCredsRegistry)
+        async with self._fetch_limit:
+            return await getattr(anoncreds_registry, method)(profile, *args)
 
     def non_revoc_intervals(self, pres_req: dict, pres: dict, cred_defs: dict) -> list:
         """Remove superfluous non-revocation intervals in presentation request.
@@ -107,6 +132,7 @@ class AnonCredsVerifier:
         pres_req: Mapping,
         pres: Mapping,
         rev_reg_defs: Mapping,
+        cred_defs: Mapping = None,
     ) -> list:
         """Check for suspicious, missing, and superfluous timestamps.
 
@@ -118,6 +144,7 @@ class AnonCredsVerifier:
             pres_req: indy proof request
             pres: indy proof request
             rev_reg_defs: rev reg defs by rev reg id, augmented with transaction times
+            cred_defs: cred defs by cred def id, already fetched; others are fetched
         """
         msgs = []
         now = int(time())
@@ -125,17 +152,36 @@ class AnonCredsVerifier:
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
 
         # timestamp for irrevocable credential
-        cred_defs: List[GetCredDefResult] = []
+        revocable = {
+            cred_def_id: bool(cred_def["value"].get("revocation"))
+            for cred_def_id, cred_def in (cred_defs or {}).items()
+        }
+        missing = list(
+            dict.fromkeys(
+                ident["cred_def_id"]
+                for ident in pres["identifiers"]
+                if ident["cred_def_id"] not in revocable
+            )
+        )
+        if missing:
+            cred_def_results: List[GetCredDefResult] = await asyncio.gather(
+                *(
+                    self._fetch(profile, "get_credential_definition", cred_def_id)
+                    for cred_def_id in missing
+                )
+            )
+            for cred_def_id, cred_def_result in zip(missing, cred_def_results):
+                revocable[cred_def_id] = bool(
+                    cred_def_result.credential_definition.value.revocation
+                )
+        # whether the credential of each sub-proof is revocable
+        sub_proof_revocable: List[bool] = []
         for index, ident in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            anoncreds_registry = profile.inject(AnonCredsRegistry)
-            cred_def_result = await anoncreds_registry.get_credential_definition(
-                profile, cred_def_id
-            )
-            cred_defs.append(cred_def_result)
+            sub_proof_revocable.append(revocable[cred_def_id])
             if ident.get("timestamp"):
-                if not cred_def_result.credential_definition.value.revocation:
+                if not revocable[cred_def_id]:
                     raise ValueError(
                         f"Timestamp in presentation identifier #{index} "
                         f"for irrevocable cred def id {cred_def_id}"
@@ -174,7 +220,7 @@ class AnonCredsVerifier:
             if "name" in req_attr:
                 if uuid in revealed_attrs:
                     index = revealed_attrs[uuid]["sub_proof_index"]
-                    if cred_defs[index].credential_definition.value.revocation:
+                    if sub_proof_revocable[index]:
                         timestamp = pres["identifiers"][index].get("timestamp")
                         if (timestamp is not None) ^ bool(
                             non_revoc_intervals.get(uuid)
@@ -221,7 +267,7 @@ class AnonCredsVerifier:
                 ):
                     raise ValueError(f"Missing requested attribute group {uuid}")
                 index = group_spec["sub_proof_index"]
-                if cred_defs[index].credential_definition.value.revocation:
+                if sub_proof_revocable[index]:
                     timestamp = pres["identifiers"][index].get("timestamp")
                     if (timestamp is not None) ^ bool(non_revoc_intervals.get(uuid)):
                         raise ValueError(
@@ -251,7 +297,7 @@ class AnonCredsVerifier:
                     f"Presentation predicates mismatch requested predicate {uuid}"
                 )
             index = pred_spec["sub_proof_index"]
-            if cred_defs[index].credential_definition.value.revocation:
+            if sub_proof_revocable[index]:
                 timestamp = pres["identifiers"][index].get("timestamp")
                 if (timestamp is not None) ^ bool(non_revoc_intervals.get(uuid)):
                     raise ValueError(
@@ -377,57 +423,76 @@ class AnonCredsVerifier:
         self,
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
-        """Return schemas, cred_defs, rev_reg_defs, rev_lists."""
-        schema_ids = []
-        cred_def_ids = []
+        """Return schemas, cred_defs, rev_reg_defs, rev_lists.
 
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_lists = {}
-
-        for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
+        Each distinct artifact is fetched once, with the fetches running
+        concurrently up to a bounded number at a time.
+        """
+        schema_ids = list(dict.fromkeys(ident["schema_id"] for ident in identifiers))
+        cred_def_ids = list(
+            dict.fromkeys(ident["cred_def_id"] for ident in identifiers)
+        )
+        rev_reg_ids = list(
+            dict.fromkeys(
+                ident["rev_reg_id"] for ident in identifiers if ident.get("rev_reg_id")
+            )
+        )
+        rev_list_keys = list(
+            dict.fromkeys(
+                (ident["rev_reg_id"], ident["timestamp"])
+                for ident in identifiers
+                if ident.get("rev_reg_id") and ident.get("timestamp")
+            )
+        )
 
-            anoncreds_registry = self.profile.inject(AnonCredsRegistry)
-            # Build schemas for anoncreds
-            if identifier["schema_id"] not in schemas:
-                schemas[identifier["schema_id"]] = (
-                    await anoncreds_registry.get_schema(
-                        self.profile, identifier["schema_id"]
+        timings = {}
+        with self._timed("fetch", timings):
+            results = await asyncio.gather(
+                *(
+                    self._fetch(self.profile, "get_schema", schema_id)
+                    for schema_id in schema_ids
+                ),
+                *(
+                    self._fetch(self.profile, "get_credential_definition", cred_def_id)
+                    for cred_def_id in cred_def_ids
+                ),
+                *(
+                    self._fetch(
+                        self.profile, "get_revocation_registry_definition", rev_reg_id
                     )
-                ).schema.serialize()
-            if identifier["cred_def_id"] not in cred_defs:
-                cred_defs[identifier["cred_def_id"]] = (
-                    await anoncreds_registry.get_credential_definition(
-                        self.profile, identifier["cred_def_id"]
+                    for rev_reg_id in rev_reg_ids
+                ),
+                *(
+                    self._fetch(
+                        self.profile, "get_revocation_list", rev_reg_id, timestamp
                     )
-                ).credential_definition.serialize()
-
-            if identifier.get("rev_reg_id"):
-                if identifier["rev_reg_id"] not in rev_reg_defs:
-                    rev_reg_defs[identifier["rev_reg_id"]] = (
-                        await anoncreds_registry.get_revocation_registry_definition(
-                            self.profile, identifier["rev_reg_id"]
-                        )
-                    ).revocation_registry.serialize()
+                    for rev_reg_id, timestamp in rev_list_keys
+                ),
+            )
+        LOGGER.debug(
+            "Fetched %d presentation artifacts in %.1fms",
+            len(results),
+            timings["fetch"] * 1000,
+        )
 
-                if identifier.get("timestamp"):
-                    rev_lists.setdefault(identifier["rev_reg_id"], {})
+        results = iter(results)
+        schemas = {
+            schema_id: next(results).schema.serialize() for schema_id in schema_ids
+        }
+        cred_defs = {
+            cred_def_id: next(results).credential_definition.serialize()
+            for cred_def_id in cred_def_ids
+        }
+        rev_reg_defs = {
+            rev_reg_id: next(results).revocation_registry.serialize()
+            for rev_reg_id in rev_reg_ids
+        }
+        rev_lists = {}
+        for rev_reg_id, timestamp in rev_list_keys:
+            rev_lists.setdefault(rev_reg_id, {})[timestamp] = next(
+                results
+            ).revocation_list.serialize()
 
-                    if (
-                        identifier["timestamp"]
-                        not in rev_lists[identifier["rev_reg_id"]]
-                    ):
-                        result = await anoncreds_registry.get_revocation_list(
-                            self.profile,
-                            identifier["rev_reg_id"],
-                            identifier["timestamp"],
-                        )
-                        rev_lists[identifier["rev_reg_id"]][
-                            identifier["timestamp"]
-                        ] = result.revocation_list.serialize()
         return (
             schemas,
             cred_defs,
@@ -456,12 +521,18 @@ class AnonCredsVerifier:
         """
 
         msgs = []
+        timings = {}
         try:
-            msgs += self.non_revoc_intervals(pres_req, pres, credential_definitions)
-            msgs += await self.check_timestamps(
-                self.profile, pres_req, pres, rev_reg_defs
-            )
-            msgs += await self.pre_verify(pres_req, pres)
+            with self._timed("check", timings):
+                msgs += self.non_revoc_intervals(pres_req, pres, credential_definitions)
+                msgs += await self.check_timestamps(
+                    self.profile,
+                    pres_req,
+                    pres,
+                    rev_reg_defs,
+                    credential_definitions,
+                )
+                msgs += await self.pre_verify(pres_req, pres)
         except ValueError as err:
             s = str(err)
             msgs.append(f"{PresVerifyMsg.PRES_VALUE_ERROR.value}::{s}")
@@ -472,20 +543,21 @@ class AnonCredsVerifier:
             return (False, msgs)
 
         try:
-            presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
-                presentation.verify,
-                pres_req,
-                schemas,
-                credential_definitions,
-                rev_reg_defs,
-                [
-                    rev_list
-                    for timestamp_to_list in rev_lists.values()
-                    for rev_list in timestamp_to_list.values()
-                ],
-            )
+            with self._timed("verify", timings):
+                presentation = Presentation.load(pres)
+                verified = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    presentation.verify,
+                    pres_req,
+                    schemas,
+                    credential_definitions,
+                    rev_reg_defs,
+                    [
+                        rev_list
+                        for timestamp_to_list in rev_lists.values()
+                        for rev_list in timestamp_to_list.values()
+                    ],
+                )
         except AnoncredsError as err:
             s = str(err)
             msgs.append(f"{PresVerifyMsg.PRES_VERIFY_ERROR.value}::{s}")
@@ -495,4 +567,12 @@ class AnonCredsVerifier:
             )
             verified = False
 
+        LOGGER.debug(
+            "Presentation on nonce=%s verified in %s",
+            pres_req.get("nonce"),
+            ", ".join(
+                f"{phase}: {duration * 1000:.1f}ms"
+                for phase, duration in timings.items()
+            ),
+        )
         return (verified, msgs)
@@ -77,6 +77,9 @@ class AskarProfile(Profile):
             keepalive = int(self.settings.get("ledger.keepalive", 5))
             read_only = bool(self.settings.get("ledger.read_only", False))
             socks_proxy = self.settings.get("ledger.socks_proxy")
+            max_concurrent_requests = self.settings.get(
+                "ledger.max_concurrent_requests"
+            )
             if read_only:
                 LOGGER.error("Note: setting ledger to read-only mode")
             genesis_transactions = self.settings.get("ledger.genesis_transactions")
@@ -88,6 +91,7 @@ class AskarProfile(Profile):
                 genesis_transactions=genesis_transactions,
                 read_only=read_only,
                 socks_proxy=socks_proxy,
+                max_concurrent_requests=max_concurrent_requests,
             )
 
     def bind_providers(self):
@@ -143,6 +147,9 @@ class AskarProfile(Profile):
                         ),
                         read_only=write_ledger_config.get("read_only"),
                         socks_proxy=write_ledger_config.get("socks_proxy"),
+                        max_concurrent_requests=self.settings.get(
+                            "ledger.max_concurrent_requests"
+                        ),
                     ),
                     ref(self),
                 ),
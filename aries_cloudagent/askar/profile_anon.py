@@ -11,6 +11,9 @@ from weakref import ref
 
 from aries_askar import AskarError, Session, Store
 
+from ..anoncreds.object_cache import AnonCredsObjectCache
+from ..anoncreds.revocation_index import RevRegIndexReservations
+from ..anoncreds.revocation_state_cache import RevocationStateCache
 from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..config.provider import ClassProvider
@@ -77,6 +80,9 @@ class AskarAnoncredsProfile(Profile):
             keepalive = int(self.settings.get("ledger.keepalive", 5))
             read_only = bool(self.settings.get("ledger.read_only", False))
             socks_proxy = self.settings.get("ledger.socks_proxy")
+            max_concurrent_requests = self.settings.get(
+                "ledger.max_concurrent_requests"
+            )
             if read_only:
                 LOGGER.error("Note: setting ledger to read-only mode")
             genesis_transactions = self.settings.get("ledger.genesis_transactions")
@@ -88,6 +94,7 @@ class AskarAnoncredsProfile(Profile):
                 genesis_transactions=genesis_transactions,
                 read_only=read_only,
                 socks_proxy=socks_proxy,
+                max_concurrent_requests=max_concurrent_requests,
             )
 
     def bind_providers(self):
@@ -120,6 +127,9 @@ class AskarAnoncredsProfile(Profile):
                 "aries_cloudagent.indy.credx.issuer.IndyCredxIssuer", ref(self)
             ),
         )
+        injector.bind_instance(AnonCredsObjectCache, AnonCredsObjectCache())
+        injector.bind_instance(RevRegIndexReservations, RevRegIndexReservations())
+        injector.bind_instance(RevocationStateCache, RevocationStateCache())
         if (
             self.settings.get("ledger.ledger_config_list")
             and len(self.settings.get("ledger.ledger_config_list")) >= 1
@@ -142,6 +152,9 @@ class AskarAnoncredsProfile(Profile):
                         ),
                         read_only=write_ledger_config.get("read_only"),
                         socks_proxy=write_ledger_config.get("socks_proxy"),
+                        max_concurrent_requests=self.settings.get(
+                            "ledger.max_concurrent_requests"
+                        ),
                     ),
                     ref(self),
                 ),
@@ -162,6 +175,17 @@ class AskarAnoncredsProfile(Profile):
                 BaseLedger, ClassProvider(IndyVdrLedger, self.ledger_pool, ref(self))
             )
 
+    def start_revocation_state_refresh(self):
+        """Refresh the cached revocation states in the background, if configured."""
+        interval = self.settings.get_int("anoncreds.revocation_state_refresh_interval")
+        revocation_state_cache = self._context.inject_or(RevocationStateCache)
+        if interval and revocation_state_cache:
+            from ..anoncreds.holder import AnonCredsHolder
+
+            revocation_state_cache.schedule_refresh(
+                interval, AnonCredsHolder(self).refresh_revocation_states
+            )
+
     def session(
         self, context: InjectionContext = None
     ) -> "AskarAnoncredsProfileSession":
@@ -180,6 +204,9 @@ class AskarAnoncredsProfile(Profile):
 
     async def close(self):
         """Close the profile instance."""
+        revocation_state_cache = self._context.inject_or(RevocationStateCache)
+        if revocation_state_cache:
+            revocation_state_cache.stop()
         if self.opened:
             await self.opened.close()
             self.opened = None
@@ -282,7 +309,9 @@ class AskarAnonProfileManager(ProfileManager):
         """Provision a new instance of a profile."""
         store_config = AskarStoreConfig(config)
         opened = await store_config.open_store(provision=True)
-        return AskarAnoncredsProfile(opened, context)
+        profile = AskarAnoncredsProfile(opened, context)
+        profile.start_revocation_state_refresh()
+        return profile
 
     async def open(
         self, context: InjectionContext, config: Mapping[str, Any] = None
@@ -290,7 +319,9 @@ class AskarAnonProfileManager(ProfileManager):
         """Open an instance of an existing profile."""
         store_config = AskarStoreConfig(config)
         opened = await store_config.open_store(provision=False)
-        return AskarAnoncredsProfile(opened, context)
+        profile = AskarAnoncredsProfile(opened, context)
+        profile.start_revocation_state_refresh()
+        return profile
 
     @classmethod
     async def generate_store_key(self, seed: str = None) -> str:
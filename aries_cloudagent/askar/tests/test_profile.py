@@ -3,7 +3,9 @@ import pytest
 
 from unittest import mock
 
+from ...anoncreds.revocation_state_cache import RevocationStateCache
 from ...askar.profile import AskarProfile
+from ...askar.profile_anon import AskarAnoncredsProfile
 from ...config.injection_context import InjectionContext
 from ...ledger.base import BaseLedger
 
@@ -121,3 +123,23 @@ async def test_profile_manager_store():
 
         assert sessionProfile._opener == askar_profile_session
         askar_profile.store.session.assert_called_once_with(profile)
+
+
+@pytest.mark.asyncio
+async def test_anoncreds_profile_revocation_state_refresh(open_store):
+    context = InjectionContext(
+        settings={"anoncreds.revocation_state_refresh_interval": 60}
+    )
+    askar_profile = AskarAnoncredsProfile(open_store, context=context)
+    askar_profile.start_revocation_state_refresh()
+
+    cache = askar_profile.inject(RevocationStateCache)
+    assert cache._timer
+    open_store.close = mock.AsyncMock()
+    await askar_profile.close()
+    assert not cache._timer
+
+    # not started without an interval
+    askar_profile = AskarAnoncredsProfile(open_store)
+    askar_profile.start_revocation_state_refresh()
+    assert not askar_profile.inject(RevocationStateCache)._timer
@@ -648,6 +648,17 @@ class GeneralGroup(ArgumentGroup):
             env_var="ACAPY_UNIVERSAL_RESOLVER_BEARER_TOKEN",
             help="Bearer token if universal resolver instance requires authentication.",
         ),
+        parser.add_argument(
+            "--process-pool-max-workers",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_PROCESS_POOL_MAX_WORKERS",
+            help=(
+                "Sets the number of worker processes used for CPU-bound batch "
+                "operations such as bulk credential issuance. Defaults to the "
+                "number of processors; 0 runs these operations in threads instead."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -705,6 +716,9 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_bearer_token:
             settings["resolver.universal.token"] = args.universal_resolver_bearer_token
 
+        if args.process_pool_max_workers is not None:
+            settings["process_pool.max_workers"] = args.process_pool_max_workers
+
         return settings
 
 
@@ -733,6 +747,134 @@ class RevocationGroup(ArgumentGroup):
                 "tails server base url."
             ),
         )
+        parser.add_argument(
+            "--tails-cache-max-size",
+            type=ByteSize(),
+            metavar="<size>",
+            env_var="ACAPY_TAILS_CACHE_MAX_SIZE",
+            help=(
+                "Sets the maximum total size of tails files downloaded from "
+                "tails servers and kept locally (e.g. '4G'); the least recently used "
+                "files are removed beyond this size. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--tails-server-max-concurrent-uploads",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_TAILS_SERVER_MAX_CONCURRENT_UPLOADS",
+            help=(
+                "Sets the maximum number of tails files uploaded to the tails "
+                "server at the same time. Default: 4."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-max-concurrent-publish",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_MAX_CONCURRENT_PUBLISH",
+            help=(
+                "Sets the maximum number of revocation registries whose pending "
+                "revocations are published to the ledger at the same time. Default: 4."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-publish-max-pending",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_PUBLISH_MAX_PENDING",
+            help=(
+                "Publish the pending revocations of a revocation registry in the "
+                "background once this many are pending on it."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-publish-interval",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_REVOCATION_PUBLISH_INTERVAL",
+            help=(
+                "Publish the pending revocations of a revocation registry in the "
+                "background at most this many seconds after the first is left "
+                "pending on it."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-standby-registries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_STANDBY_REGISTRIES",
+            help=(
+                "Sets the number of standby revocation registries kept ready per "
+                "credential definition, to take over once the active registry "
+                "fills. They are created in the background. Default: 1."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-provision-watermark",
+            type=BoundedInt(min=1, max=100),
+            metavar="<percent>",
+            env_var="ACAPY_REVOCATION_PROVISION_WATERMARK",
+            help=(
+                "Replenish the standby revocation registries of a credential "
+                "definition once its active registry is filled to this percentage. "
+                "Default: when the active registry is full."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-state-refresh-interval",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_REVOCATION_STATE_REFRESH_INTERVAL",
+            help=(
+                "As a holder of anoncreds credentials, refresh the cached revocation "
+                "states of the most recently presented credentials against the "
+                "latest revocation lists at this interval, in seconds. Default: no "
+                "background refresh."
+            ),
+        )
+        parser.add_argument(
+            "--status-list-base-url",
+            type=str,
+            metavar="<url>",
+            env_var="ACAPY_STATUS_LIST_BASE_URL",
+            help=(
+                "Enables StatusList2021 credential status for LD proof credentials. "
+                "Status list credentials are referenced at this base URL followed "
+                "by the status list identifier."
+            ),
+        )
+        parser.add_argument(
+            "--status-list-publish-dir",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_STATUS_LIST_PUBLISH_DIR",
+            help=(
+                "Write each signed status list credential to this directory, named "
+                "by the status list identifier, to be served at the status list "
+                "base URL."
+            ),
+        )
+        parser.add_argument(
+            "--status-list-size",
+            type=BoundedInt(min=8),
+            metavar="<bits>",
+            env_var="ACAPY_STATUS_LIST_SIZE",
+            help=(
+                "Sets the number of entries of new status lists. Default: 131072, "
+                "the minimum recommended for herd privacy."
+            ),
+        )
+        parser.add_argument(
+            "--status-list-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_STATUS_LIST_CACHE_TTL",
+            help=(
+                "As a verifier, use fetched status lists for this many seconds "
+                "before fetching them again. Default: 300."
+            ),
+        )
         parser.add_argument(
             "--notify-revocation",
             action="store_true",
@@ -771,6 +913,42 @@ class RevocationGroup(ArgumentGroup):
             settings["tails_server_upload_url"] = args.tails_server_base_url
         if args.tails_server_upload_url:
             settings["tails_server_upload_url"] = args.tails_server_upload_url
+        if args.tails_cache_max_size:
+            settings["tails_cache.max_size"] = args.tails_cache_max_size
+        if args.tails_server_max_concurrent_uploads:
+            settings["tails_server.max_concurrent_uploads"] = (
+                args.tails_server_max_concurrent_uploads
+            )
+        if args.revocation_max_concurrent_publish:
+            settings["revocation.max_concurrent_publish"] = (
+                args.revocation_max_concurrent_publish
+            )
+        if args.revocation_publish_max_pending:
+            settings["revocation.publish_max_pending"] = (
+                args.revocation_publish_max_pending
+            )
+        if args.revocation_publish_interval:
+            settings["revocation.publish_interval"] = args.revocation_publish_interval
+        if args.revocation_standby_registries:
+            settings["revocation.standby_registries"] = (
+                args.revocation_standby_registries
+            )
+        if args.revocation_provision_watermark:
+            settings["revocation.provision_watermark"] = (
+                args.revocation_provision_watermark
+            )
+        if args.revocation_state_refresh_interval:
+            settings["anoncreds.revocation_state_refresh_interval"] = (
+                args.revocation_state_refresh_interval
+            )
+        if args.status_list_base_url:
+            settings["vc.status_list.base_url"] = args.status_list_base_url
+        if args.status_list_publish_dir:
+            settings["vc.status_list.publish_dir"] = args.status_list_publish_dir
+        if args.status_list_size:
+            settings["vc.status_list.size"] = args.status_list_size
+        if args.status_list_cache_ttl is not None:
+            settings["vc.status_list.cache_ttl"] = args.status_list_cache_ttl
         if args.notify_revocation:
             settings["revocation.notify"] = args.notify_revocation
         if args.monitor_revocation_notification:
@@ -859,6 +1037,38 @@ class LedgerGroup(ArgumentGroup):
             env_var="ACAPY_LEDGER_KEEP_ALIVE",
             help="Specifies how many seconds to keep the ledger open. Default: 5",
         )
+        parser.add_argument(
+            "--ledger-max-concurrent-requests",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_LEDGER_MAX_CONCURRENT_REQUESTS",
+            help=(
+                "Limits the number of requests in flight to each ledger pool at once; "
+                "further requests wait for a free slot. Identical read requests "
+                "are always coalesced. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--ledger-artifact-cache",
+            action="store_true",
+            env_var="ACAPY_LEDGER_ARTIFACT_CACHE",
+            help=(
+                "Persist immutable ledger artifacts (schemas, credential definitions "
+                "and revocation registry definitions) to disk under the aca-py home "
+                "directory, so they are not fetched again after a restart. "
+                "Default: false."
+            ),
+        )
+        parser.add_argument(
+            "--ledger-revocation-delta-cache",
+            action="store_true",
+            env_var="ACAPY_LEDGER_REVOCATION_DELTA_CACHE",
+            help=(
+                "Keep the revocation registry states seen on the ledger in memory and "
+                "answer revocation registry delta lookups from them, fetching only "
+                "entries newer than the latest known state. Default: false."
+            ),
+        )
         parser.add_argument(
             "--ledger-socks-proxy",
             type=str,
@@ -961,6 +1171,14 @@ class LedgerGroup(ArgumentGroup):
                 settings["ledger.keepalive"] = args.ledger_keepalive
             if args.ledger_socks_proxy:
                 settings["ledger.socks_proxy"] = args.ledger_socks_proxy
+            if args.ledger_max_concurrent_requests:
+                settings["ledger.max_concurrent_requests"] = (
+                    args.ledger_max_concurrent_requests
+                )
+            if args.ledger_artifact_cache:
+                settings["ledger.artifact_cache"] = True
+            if args.ledger_revocation_delta_cache:
+                settings["ledger.revocation_delta_cache"] = True
             if args.accept_taa:
                 settings["ledger.taa_acceptance_mechanism"] = args.accept_taa[0]
                 settings["ledger.taa_acceptance_version"] = args.accept_taa[1]
@@ -13,10 +13,15 @@ from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..resolver.did_resolver import DIDResolver
+from ..revocation.provisioner import RegistryProvisioner
+from ..revocation.publisher import PendingRevocationPublisher
 from ..tails.base import BaseTailsServer
+from ..tails.cache import TailsFileCache
+from ..utils.process_pool import ProcessPool
 from ..transport.wire_format import BaseWireFormat
 from ..utils.dependencies import is_indy_sdk_module_installed
 from ..utils.stats import Collector
+from ..vc.status_list.cache import StatusListCache
 from ..wallet.default_verification_key_strategy import (
     BaseVerificationKeyStrategy,
     DefaultVerificationKeyStrategy,
@@ -56,6 +61,31 @@ class DefaultContextBuilder(ContextBuilder):
         # Global did resolver
         context.injector.bind_instance(DIDResolver, DIDResolver([]))
         context.injector.bind_instance(AnonCredsRegistry, AnonCredsRegistry())
+        context.injector.bind_instance(
+            TailsFileCache,
+            TailsFileCache(max_size=context.settings.get("tails_cache.max_size")),
+        )
+        context.injector.bind_instance(
+            ProcessPool,
+            ProcessPool(max_workers=context.settings.get("process_pool.max_workers")),
+        )
+        publisher = PendingRevocationPublisher(
+            max_pending=context.settings.get_int("revocation.publish_max_pending"),
+            interval=context.settings.get_int("revocation.publish_interval"),
+        )
+        if publisher.enabled:
+            context.injector.bind_instance(PendingRevocationPublisher, publisher)
+        context.injector.bind_instance(
+            RegistryProvisioner,
+            RegistryProvisioner(
+                standby=context.settings.get_int("revocation.standby_registries"),
+                watermark=context.settings.get_int("revocation.provision_watermark"),
+            ),
+        )
+        context.injector.bind_instance(
+            StatusListCache,
+            StatusListCache(ttl=context.settings.get_int("vc.status_list.cache_ttl")),
+        )
         context.injector.bind_instance(DIDMethods, DIDMethods())
         context.injector.bind_instance(KeyTypes, KeyTypes())
         context.injector.bind_instance(
@@ -88,15 +118,19 @@ class DefaultContextBuilder(ContextBuilder):
         if wallet_type == "askar-anoncreds":
             context.injector.bind_provider(
                 BaseTailsServer,
-                ClassProvider(
-                    "aries_cloudagent.tails.anoncreds_tails_server.AnonCredsTailsServer",
+                CachedProvider(
+                    ClassProvider(
+                        "aries_cloudagent.tails.anoncreds_tails_server.AnonCredsTailsServer",
+                    )
                 ),
             )
         else:
             context.injector.bind_provider(
                 BaseTailsServer,
-                ClassProvider(
-                    "aries_cloudagent.tails.indy_tails_server.IndyTailsServer",
+                CachedProvider(
+                    ClassProvider(
+                        "aries_cloudagent.tails.indy_tails_server.IndyTailsServer",
+                    )
                 ),
             )
 
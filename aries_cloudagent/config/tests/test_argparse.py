@@ -269,6 +269,28 @@ class TestArgParse(IsolatedAsyncioTestCase):
         assert settings.get("external_plugins") == ["foo"]
         assert settings.get("storage_type") == "bar"
 
+    async def test_process_pool_max_workers(self):
+        """Test process pool worker count argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        settings = group.get_settings(parser.parse_args(["--endpoint", "localhost"]))
+        assert "process_pool.max_workers" not in settings
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--process-pool-max-workers", "2"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("process_pool.max_workers") == 2
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--process-pool-max-workers", "0"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("process_pool.max_workers") == 0
+
     async def test_plugin_config_file(self):
         """Test file argument parsing."""
 
@@ -60,6 +60,8 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..revocation.provisioner import RegistryProvisioner
+from ..revocation.publisher import PendingRevocationPublisher
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
 from ..storage.record import StorageRecord
@@ -71,6 +73,7 @@ from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboun
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
+from ..utils.process_pool import ProcessPool
 from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
@@ -531,6 +534,13 @@ class Conductor:
         if self.root_profile:
             await self.root_profile.notify(SHUTDOWN_EVENT_TOPIC, {})
 
+        publisher = self.context.inject_or(PendingRevocationPublisher)
+        if publisher:
+            await publisher.stop()
+        provisioner = self.context.inject_or(RegistryProvisioner)
+        if provisioner:
+            await provisioner.stop()
+
         shutdown = TaskQueue()
         if self.dispatcher:
             shutdown.run(self.dispatcher.complete())
@@ -552,6 +562,10 @@ class Conductor:
 
         await shutdown.complete(timeout)
 
+        process_pool = self.context.inject_or(ProcessPool)
+        if process_pool:
+            await process_pool.stop()
+
     def inbound_message_router(
         self,
         profile: Profile,
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 
-from typing import Sequence, Tuple
+from typing import Optional, Sequence, Tuple
 
 from aries_askar import AskarError
 
@@ -21,6 +21,7 @@ from indy_credx import (
 )
 
 from ...askar.profile import AskarProfile
+from ...utils.process_pool import ProcessPool
 
 from ..issuer import (
     IndyIssuer,
@@ -43,6 +44,43 @@ CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
 
 
+def _create_credentials(
+    credentials: Sequence[Tuple[dict, dict, dict, Optional[int]]],
+    cred_def: bytes,
+    cred_def_private: bytes,
+    revocation: Optional[Tuple[bytes, bytes, bytes, Sequence[int]]],
+) -> Sequence[Tuple[Optional[str], Optional[str]]]:
+    """Create credentials, in a worker process.
+
+    Returns the credential JSON or an error message for each credential.
+    """
+    results = []
+    try:
+        cred_def = CredentialDefinition.load(cred_def)
+        if revocation:
+            rev_reg_def, rev_key, rev_reg, used_ids = revocation
+            rev_reg_def = RevocationRegistryDefinition.load(rev_reg_def)
+    except CredxError as err:
+        return [(None, str(err))] * len(credentials)
+    for offer, request, values, rev_reg_index in credentials:
+        revoc = (
+            CredentialRevocationConfig(
+                rev_reg_def, rev_key, rev_reg, rev_reg_index, used_ids
+            )
+            if revocation
+            else None
+        )
+        try:
+            credential, _, _ = Credential.create(
+                cred_def, cred_def_private, offer, request, values, None, revoc
+            )
+        except CredxError as err:
+            results.append((None, str(err)))
+        else:
+            results.append((credential.to_json(), None))
+    return results
+
+
 class IndyCredxIssuer(IndyIssuer):
     """Indy-Credx issuer class."""
 
@@ -354,6 +392,155 @@ class IndyCredxIssuer(IndyIssuer):
 
         return credential.to_json(), credential_revocation_id
 
+    async def create_credentials(
+        self,
+        schema: dict,
+        credentials: Sequence[Tuple[dict, dict, dict]],
+        revoc_reg_id: str = None,
+        tails_file_path: str = None,
+    ) -> Sequence[Tuple[str, str]]:
+        """Create a batch of credentials for the same credential definition.
+
+        The credential definition and revocation registry are loaded once and
+        the revocation indexes for the batch are allocated in one transaction.
+        The credentials are created in parallel in the process pool.
+
+        Args:
+            schema: Schema to create credentials for
+            credentials: The credential offer, credential request and credential
+                values of each credential to create
+            revoc_reg_id: ID of the revocation registry
+            tails_file_path: The location of the tails file
+
+        Returns:
+            A tuple of created credential and revocation id for each credential
+            created, in order. If the revocation registry fills up, fewer
+            credentials than requested are created.
+
+        """
+        if not credentials:
+            return []
+        credential_definition_id = credentials[0][0]["cred_def_id"]
+        if any(
+            offer["cred_def_id"] != credential_definition_id
+            for offer, _, _ in credentials
+        ):
+            raise IndyIssuerError(
+                "All credentials in a batch must use the same credential definition"
+            )
+        try:
+            async with self._profile.session() as session:
+                cred_def = await session.handle.fetch(
+                    CATEGORY_CRED_DEF, credential_definition_id
+                )
+                cred_def_private = await session.handle.fetch(
+                    CATEGORY_CRED_DEF_PRIVATE, credential_definition_id
+                )
+        except AskarError as err:
+            raise IndyIssuerError("Error retrieving credential definition") from err
+        if not cred_def or not cred_def_private:
+            raise IndyIssuerError(
+                "Credential definition not found for credential issuance"
+            )
+
+        all_raw_values = []
+        for _, _, credential_values in credentials:
+            raw_values = {}
+            for attribute in schema["attrNames"]:
+                try:
+                    raw_values[attribute] = str(credential_values[attribute])
+                except KeyError:
+                    raise IndyIssuerError(
+                        "Provided credential values are missing a value "
+                        f"for the schema attribute '{attribute}'"
+                    )
+            all_raw_values.append(raw_values)
+
+        revocation = None
+        rev_reg_indexes = [None] * len(credentials)
+        if revoc_reg_id:
+            try:
+                async with self._profile.transaction() as txn:
+                    rev_reg = await txn.handle.fetch(CATEGORY_REV_REG, revoc_reg_id)
+                    rev_reg_info = await txn.handle.fetch(
+                        CATEGORY_REV_REG_INFO, revoc_reg_id, for_update=True
+                    )
+                    rev_reg_def = await txn.handle.fetch(
+                        CATEGORY_REV_REG_DEF, revoc_reg_id
+                    )
+                    rev_key = await txn.handle.fetch(
+                        CATEGORY_REV_REG_DEF_PRIVATE, revoc_reg_id
+                    )
+                    if not rev_reg:
+                        raise IndyIssuerError("Revocation registry not found")
+                    if not rev_reg_info:
+                        raise IndyIssuerError("Revocation registry metadata not found")
+                    if not rev_reg_def:
+                        raise IndyIssuerError(
+                            "Revocation registry definition not found"
+                        )
+                    if not rev_key:
+                        raise IndyIssuerError(
+                            "Revocation registry definition private data not found"
+                        )
+                    # NOTE: as for single credentials, the indexes are allocated
+                    # ahead of time and skipped if something goes wrong later.
+                    rev_info = rev_reg_info.value_json
+                    try:
+                        max_cred_num = RevocationRegistryDefinition.load(
+                            rev_reg_def.raw_value
+                        ).max_cred_num
+                    except CredxError as err:
+                        raise IndyIssuerError(
+                            "Error loading revocation registry definition"
+                        ) from err
+                    first_index = rev_info["curr_id"] + 1
+                    count = min(len(credentials), max_cred_num - rev_info["curr_id"])
+                    if count <= 0:
+                        raise IndyIssuerRevocationRegistryFullError(
+                            "Revocation registry is full"
+                        )
+                    rev_info["curr_id"] += count
+                    await txn.handle.replace(
+                        CATEGORY_REV_REG_INFO, revoc_reg_id, value_json=rev_info
+                    )
+                    await txn.commit()
+            except AskarError as err:
+                raise IndyIssuerError(
+                    "Error updating revocation registry index"
+                ) from err
+
+            credentials = credentials[:count]
+            rev_reg_indexes = list(range(first_index, first_index + count))
+            revocation = (
+                bytes(rev_reg_def.raw_value),
+                bytes(rev_key.raw_value),
+                bytes(rev_reg.raw_value),
+                rev_info.get("used_ids") or [],
+            )
+
+        pool = self._profile.inject_or(ProcessPool) or ProcessPool(max_workers=0)
+        results = await pool.run_chunked(
+            _create_credentials,
+            [
+                (offer, request, raw_values, rev_reg_index)
+                for (offer, request, _), raw_values, rev_reg_index in zip(
+                    credentials, all_raw_values, rev_reg_indexes
+                )
+            ],
+            bytes(cred_def.raw_value),
+            bytes(cred_def_private.raw_value),
+            revocation,
+        )
+        for _, error in results:
+            if error:
+                raise IndyIssuerError(f"Error creating credential: {error}")
+
+        return [
+            (credential_json, str(rev_reg_index) if rev_reg_index else None)
+            for (credential_json, _), rev_reg_index in zip(results, rev_reg_indexes)
+        ]
+
     async def revoke_credentials(
         self,
         cred_def_id: str,
@@ -11,6 +11,7 @@ from ....ledger.base import BaseLedger
 from ....ledger.multiple_ledger.ledger_requests_executor import (
     IndyLedgerRequestsExecutor,
 )
+from ....utils.process_pool import ProcessPool
 
 from .. import issuer, holder, verifier
 
@@ -338,3 +339,79 @@ class TestIndyCredxIssuance(IsolatedAsyncioTestCase):
         )
 
         await self.holder.delete_credential(cred_id)
+
+    async def test_issue_batch(self):
+        (s_id, schema_json) = await self.issuer.create_schema(
+            TEST_DID,
+            SCHEMA_NAME,
+            SCHEMA_VERSION,
+            ["name", "moniker"],
+        )
+        schema = json.loads(schema_json)
+        schema["seqNo"] = SCHEMA_TXN
+        (
+            cd_id,
+            cred_def_json,
+        ) = await self.issuer.create_and_store_credential_definition(
+            TEST_DID, schema, support_revocation=True
+        )
+        cred_def = json.loads(cred_def_json)
+
+        pool = ProcessPool(max_workers=2)
+        self.issuer_profile.context.injector.bind_instance(ProcessPool, pool)
+        self.addCleanup(pool.shutdown)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (
+                reg_id,
+                reg_def_json,
+                _,
+            ) = await self.issuer.create_and_store_revocation_registry(
+                TEST_DID, cd_id, "CL_ACCUM", "0", 2, tmp_path
+            )
+            reg_def = json.loads(reg_def_json)
+            tails_path = reg_def["value"]["tailsLocation"]
+
+            credentials = []
+            metas = []
+            for name in ("ONE", "TWO", "THREE"):
+                cred_offer = json.loads(
+                    await self.issuer.create_credential_offer(cd_id)
+                )
+                (
+                    cred_req_json,
+                    cred_req_meta_json,
+                ) = await self.holder.create_credential_request(
+                    cred_offer, cred_def, TEST_DID
+                )
+                credentials.append(
+                    (
+                        cred_offer,
+                        json.loads(cred_req_json),
+                        {"name": name, "moniker": "MONIKER"},
+                    )
+                )
+                metas.append(json.loads(cred_req_meta_json))
+
+            # the registry only has room for two
+            created = await self.issuer.create_credentials(
+                schema, credentials, reg_id, tails_path
+            )
+            assert [cred_rev_id for _, cred_rev_id in created] == ["1", "2"]
+
+            for (cred_json, _), meta in zip(created, metas):
+                cred_id = await self.holder.store_credential(
+                    cred_def, json.loads(cred_json), meta, rev_reg_def=reg_def
+                )
+                assert json.loads(await self.holder.get_credential(cred_id))
+
+            with self.assertRaises(issuer.IndyIssuerRevocationRegistryFullError):
+                await self.issuer.create_credentials(
+                    schema, credentials[2:], reg_id, tails_path
+                )
+
+        with self.assertRaises(issuer.IndyIssuerError):
+            await self.issuer.create_credentials(
+                schema,
+                [(credentials[0][0], credentials[0][1], {"name": "NAME"})],
+            )
@@ -135,6 +135,47 @@ class IndyIssuer(ABC, metaclass=ABCMeta):
 
         """
 
+    async def create_credentials(
+        self,
+        schema: dict,
+        credentials: Sequence[Tuple[dict, dict, dict]],
+        revoc_reg_id: str = None,
+        tails_file_path: str = None,
+    ) -> Sequence[Tuple[str, str]]:
+        """Create a batch of credentials for the same credential definition.
+
+        Args:
+            schema: Schema to create credentials for
+            credentials: The credential offer, credential request and credential
+                values of each credential to create
+            revoc_reg_id: ID of the revocation registry
+            tails_file_path: The location of the tails file
+
+        Returns:
+            A tuple of created credential and revocation id for each credential
+            created, in order. If the revocation registry fills up, fewer
+            credentials than requested are created.
+
+        """
+        results = []
+        for credential_offer, credential_request, credential_values in credentials:
+            try:
+                results.append(
+                    await self.create_credential(
+                        schema,
+                        credential_offer,
+                        credential_request,
+                        credential_values,
+                        revoc_reg_id,
+                        tails_file_path,
+                    )
+                )
+            except IndyIssuerRevocationRegistryFullError:
+                if not results:
+                    raise
+                break
+        return results
+
     @abstractmethod
     async def revoke_credentials(
         self,
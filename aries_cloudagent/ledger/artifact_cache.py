@@ -0,0 +1,129 @@
+"""Persistent, content-addressed cache for immutable ledger artifacts."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence, Text, Union
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _digest(data: bytes) -> str:
+    """Obtain the hex-encoded SHA-256 digest of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_safe(path: Path, content: bytes):
+    """Atomically write to a file path."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp.write(content)
+        tmp_name = tmp.name
+    os.replace(tmp_name, path)
+
+
+class LedgerArtifactCache:
+    """On-disk cache for schemas, credential and revocation registry definitions.
+
+    These ledger objects are immutable once written, so entries never expire.
+    Values are stored once under the digest of their canonical serialization
+    (``objects/``) and any number of keys resolve to that digest (``refs/``),
+    allowing e.g. a schema to be found by its identifier or sequence number
+    while stored only once. Objects are verified against their digest when
+    read back; corrupt entries are discarded. File access is run in the
+    default executor, off the event loop.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the cache rooted at the given directory."""
+        self.path = Path(path)
+        self._objects = self.path.joinpath("objects")
+        self._refs = self.path.joinpath("refs")
+
+    def _ref_path(self, key: Text) -> Path:
+        return self._refs.joinpath(_digest(key.encode("utf-8")))
+
+    async def get(self, key: Text) -> Optional[dict]:
+        """Get an artifact from the cache.
+
+        Args:
+            key: the key to retrieve an artifact for
+
+        Returns:
+            The artifact found or `None`
+
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, self._get, key)
+
+    def _get(self, key: Text) -> Optional[dict]:
+        try:
+            digest = self._ref_path(key).read_text().strip()
+            content = self._objects.joinpath(digest).read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError:
+            LOGGER.exception("Error reading ledger artifact cache entry: %s", key)
+            return None
+
+        if _digest(content) != digest:
+            LOGGER.warning("Discarding corrupt ledger artifact cache entry: %s", key)
+            self._clear(key)
+            return None
+        return json.loads(content)
+
+    async def set(
+        self, keys: Union[Text, Sequence[Text]], value: dict
+    ) -> Optional[str]:
+        """Add an artifact to the cache under one or more keys.
+
+        Args:
+            keys: the key or keys for which to store the artifact
+            value: the artifact to store
+
+        Returns:
+            The content digest of the stored artifact, or `None` on failure
+
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None, self._set, keys, value
+        )
+
+    def _set(self, keys: Union[Text, Sequence[Text]], value: dict) -> Optional[str]:
+        content = json.dumps(value, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        digest = _digest(content)
+        try:
+            self._objects.mkdir(parents=True, exist_ok=True)
+            self._refs.mkdir(parents=True, exist_ok=True)
+            obj_path = self._objects.joinpath(digest)
+            if not obj_path.exists():
+                _write_safe(obj_path, content)
+            for key in [keys] if isinstance(keys, Text) else keys:
+                _write_safe(self._ref_path(key), digest.encode("ascii"))
+        except OSError:
+            LOGGER.exception("Error writing ledger artifact cache entry")
+            return None
+        return digest
+
+    async def clear(self, key: Text):
+        """Remove the reference for a key, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await asyncio.get_event_loop().run_in_executor(None, self._clear, key)
+
+    def _clear(self, key: Text):
+        try:
+            self._ref_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(path={})>".format(self.__class__.__name__, self.path)
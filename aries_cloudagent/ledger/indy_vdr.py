@@ -7,11 +7,12 @@ import logging
 import os
 import os.path
 import tempfile
+from copy import deepcopy
 from datetime import date, datetime, timezone
 from io import StringIO
 from pathlib import Path
 from time import time
-from typing import List, Optional, Tuple, Union
+from typing import Awaitable, Callable, List, Optional, Tuple, Union
 
 from indy_vdr import Pool, Request, VdrError, ledger, open_pool
 
@@ -24,6 +25,7 @@ from ..utils.env import storage_path
 from ..wallet.base import BaseWallet, DIDInfo
 from ..wallet.did_posture import DIDPosture
 from ..wallet.error import WalletNotFoundError
+from .artifact_cache import LedgerArtifactCache
 from .base import BaseLedger, Role
 from .endpoint_type import EndpointType
 from .error import (
@@ -33,10 +35,25 @@ from .error import (
     LedgerError,
     LedgerTransactionError,
 )
+from .rev_reg_delta_cache import RevRegDeltaCache
 from .util import TAA_ACCEPTED_RECORD_TYPE
 
 LOGGER = logging.getLogger(__name__)
 
+# Ledger transaction types of read requests, which may be coalesced
+READ_TXN_TYPES = {
+    "3",  # GET_TXN
+    "6",  # GET_TXN_AUTHR_AGRMT
+    "7",  # GET_TXN_AUTHR_AGRMT_AML
+    "104",  # GET_ATTR
+    "105",  # GET_NYM
+    "107",  # GET_SCHEMA
+    "108",  # GET_CLAIM_DEF
+    "115",  # GET_REVOC_REG_DEF
+    "116",  # GET_REVOC_REG
+    "117",  # GET_REVOC_REG_DELTA
+}
+
 
 def _normalize_txns(txns: str) -> str:
     """Normalize a set of genesis transactions."""
@@ -76,6 +93,7 @@ class IndyVdrLedgerPool:
         genesis_transactions: str = None,
         read_only: bool = False,
         socks_proxy: str = None,
+        max_concurrent_requests: int = None,
     ):
         """Initialize an IndyLedger instance.
 
@@ -87,6 +105,7 @@ class IndyVdrLedgerPool:
             genesis_transactions: The ledger genesis transaction as a string
             read_only: Prevent any ledger write operations
             socks_proxy: Specifies socks proxy for ZMQ to connect to ledger pool
+            max_concurrent_requests: Limit on requests in flight to the pool
         """
         self.ref_count = 0
         self.ref_lock = asyncio.Lock()
@@ -103,6 +122,16 @@ class IndyVdrLedgerPool:
         self.taa_cache: str = None
         self.read_only: bool = read_only
         self.socks_proxy: str = socks_proxy
+        self.artifact_cache_cache: LedgerArtifactCache = None
+        self.submit_limit = (
+            asyncio.Semaphore(max_concurrent_requests)
+            if max_concurrent_requests
+            else None
+        )
+        self.pending_reads = {}
+        self.rev_reg_delta_cache = RevRegDeltaCache()
+        self.requests_submitted = 0
+        self.reads_coalesced = 0
 
     @property
     def cfg_path(self) -> Path:
@@ -118,6 +147,15 @@ class IndyVdrLedgerPool:
             self.genesis_hash_cache = _hash_txns(self.genesis_txns)
         return self.genesis_hash_cache
 
+    @property
+    def artifact_cache(self) -> LedgerArtifactCache:
+        """Get the persistent cache of immutable artifacts for this pool."""
+        if not self.artifact_cache_cache:
+            self.artifact_cache_cache = LedgerArtifactCache(
+                self.cfg_path.joinpath(self.name, f"artifacts-{self.genesis_hash}")
+            )
+        return self.artifact_cache_cache
+
     @property
     def genesis_txns(self) -> str:
         """Get the configured genesis transactions."""
@@ -216,6 +254,35 @@ class IndyVdrLedgerPool:
                 self.close_task = None
                 raise LedgerError("Exception when closing pool ledger") from exc
 
+    async def submit_request(self, request: Request) -> dict:
+        """Submit a request to the pool, bounded by the concurrency limit."""
+        if self.submit_limit:
+            async with self.submit_limit:
+                self.requests_submitted += 1
+                return await self.handle.submit_request(request)
+        self.requests_submitted += 1
+        return await self.handle.submit_request(request)
+
+    async def coalesce_read(
+        self, key: str, submit: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """Share the result of an in-flight read request with identical callers.
+
+        Args:
+            key: Identifies the read operation, independent of signer and request ID
+            submit: Produces the response when no identical request is in flight
+
+        """
+        pending = self.pending_reads.get(key)
+        if pending:
+            self.reads_coalesced += 1
+        else:
+            pending = asyncio.ensure_future(submit())
+            self.pending_reads[key] = pending
+            pending.add_done_callback(lambda _: self.pending_reads.pop(key, None))
+        # each caller gets its own copy, as response parsers may mutate it
+        return deepcopy(await asyncio.shield(pending))
+
     async def context_open(self):
         """Open the ledger if necessary and increase the number of active references."""
         async with self.ref_lock:
@@ -280,6 +347,20 @@ class IndyVdrLedger(BaseLedger):
         """Accessor for the ledger read-only flag."""
         return self.pool.read_only
 
+    @property
+    def artifact_cache(self) -> Optional[LedgerArtifactCache]:
+        """Accessor for the persistent artifact cache, if enabled."""
+        if self.profile.settings.get("ledger.artifact_cache"):
+            return self.pool.artifact_cache
+        return None
+
+    @property
+    def rev_reg_delta_cache(self) -> Optional[RevRegDeltaCache]:
+        """Accessor for the revocation registry state cache, if enabled."""
+        if self.profile.settings.get("ledger.revocation_delta_cache"):
+            return self.pool.rev_reg_delta_cache
+        return None
+
     async def is_ledger_read_only(self) -> bool:
         """Check if ledger is read-only including TAA."""
         if self.read_only:
@@ -318,6 +399,9 @@ class IndyVdrLedger(BaseLedger):
     ) -> dict:
         """Sign and submit request to ledger.
 
+        Identical read requests already in flight to the pool are not sent
+        again; their response is shared instead.
+
         Args:
             request_json: The json string to submit
             sign: whether or not to sign the request
@@ -336,6 +420,30 @@ class IndyVdrLedger(BaseLedger):
         elif not isinstance(request, Request):
             raise BadLedgerRequestError("Expected str or Request")
 
+        if write_ledger:
+            operation = json.loads(request.body).get("operation") or {}
+            if operation.get("type") in READ_TXN_TYPES:
+                return await self.pool.coalesce_read(
+                    json.dumps(operation, sort_keys=True),
+                    lambda: self._sign_and_submit(
+                        request, sign, taa_accept, sign_did, write_ledger
+                    ),
+                )
+
+        return await self._sign_and_submit(
+            request, sign, taa_accept, sign_did, write_ledger
+        )
+
+    async def _sign_and_submit(
+        self,
+        request: Request,
+        sign: bool = None,
+        taa_accept: bool = None,
+        sign_did: DIDInfo = sentinel,
+        write_ledger: bool = True,
+    ) -> dict:
+        """Sign and submit a prepared request to the ledger."""
+
         if sign is None or sign:
             if sign_did is sentinel:
                 sign_did = await self.get_wallet_public_did()
@@ -367,7 +475,7 @@ class IndyVdrLedger(BaseLedger):
             return json.loads(request.body)
 
         try:
-            request_result = await self.pool.handle.submit_request(request)
+            request_result = await self.pool.submit_request(request)
         except VdrError as err:
             raise LedgerTransactionError("Ledger request error") from err
 
@@ -445,6 +553,18 @@ class IndyVdrLedger(BaseLedger):
             if result:
                 return result
 
+        artifact_cache = self.artifact_cache
+        if artifact_cache:
+            result = await artifact_cache.get(f"schema::{schema_id}")
+            if result:
+                if self.pool.cache:
+                    await self.pool.cache.set(
+                        [f"schema::{result['id']}", f"schema::{result['seqNo']}"],
+                        result,
+                        self.pool.cache_duration,
+                    )
+                return result
+
         if schema_id.isdigit():
             return await self.fetch_schema_by_seq_no(int(schema_id))
         else:
@@ -493,6 +613,10 @@ class IndyVdrLedger(BaseLedger):
                 schema_data,
                 self.pool.cache_duration,
             )
+        if self.artifact_cache:
+            await self.artifact_cache.set(
+                [f"schema::{schema_id}", f"schema::{schema_seqno}"], schema_data
+            )
 
         return schema_data
 
@@ -562,14 +686,28 @@ class IndyVdrLedger(BaseLedger):
                 if entry.result:
                     result = entry.result
                 else:
-                    result = await self.fetch_credential_definition(
+                    result = await self._get_cred_def_persistent(
                         credential_definition_id
                     )
                     if result:
                         await entry.set_result(result, self.pool.cache_duration)
                 return result
 
-        return await self.fetch_credential_definition(credential_definition_id)
+        return await self._get_cred_def_persistent(credential_definition_id)
+
+    async def _get_cred_def_persistent(self, credential_definition_id: str) -> dict:
+        """Get a credential definition from the artifact cache or the ledger."""
+        artifact_cache = self.artifact_cache
+        if not artifact_cache:
+            return await self.fetch_credential_definition(credential_definition_id)
+
+        cache_key = f"credential_definition::{credential_definition_id}"
+        result = await artifact_cache.get(cache_key)
+        if not result:
+            result = await self.fetch_credential_definition(credential_definition_id)
+            if result:
+                await artifact_cache.set(cache_key, result)
+        return result
 
     async def fetch_credential_definition(self, credential_definition_id: str) -> dict:
         """Get a credential definition from the ledger by id.
@@ -1017,6 +1155,12 @@ class IndyVdrLedger(BaseLedger):
 
     async def get_revoc_reg_def(self, revoc_reg_id: str) -> dict:
         """Get revocation registry definition by ID."""
+        artifact_cache = self.artifact_cache
+        if artifact_cache:
+            revoc_reg_def = await artifact_cache.get(f"revoc_reg_def::{revoc_reg_id}")
+            if revoc_reg_def:
+                return revoc_reg_def
+
         public_info = await self.get_wallet_public_did()
         try:
             fetch_req = ledger.build_get_revoc_reg_def_request(
@@ -1036,6 +1180,8 @@ class IndyVdrLedger(BaseLedger):
             raise LedgerError(
                 "ID of revocation registry response does not match requested ID"
             )
+        if artifact_cache:
+            await artifact_cache.set(f"revoc_reg_def::{revoc_reg_id}", revoc_reg_def)
         return revoc_reg_def
 
     async def get_revoc_reg_entry(
@@ -1069,6 +1215,9 @@ class IndyVdrLedger(BaseLedger):
     ) -> Tuple[dict, int]:
         """Look up a revocation registry delta by ID.
 
+        When the revocation delta cache is enabled, the delta is computed from
+        locally known registry states, fetching only newer entries as needed.
+
         :param revoc_reg_id revocation registry id
         :param timestamp_from from time. a total number of seconds from Unix Epoch
         :param timestamp_to to time. a total number of seconds from Unix Epoch
@@ -1077,6 +1226,34 @@ class IndyVdrLedger(BaseLedger):
         """
         if timestamp_to is None:
             timestamp_to = int(time())
+        rev_reg_delta_cache = self.rev_reg_delta_cache
+        if rev_reg_delta_cache:
+            delta_value, delta_timestamp = await rev_reg_delta_cache.get_delta(
+                self.fetch_revoc_reg_delta,
+                revoc_reg_id,
+                timestamp_from or 0,
+                timestamp_to,
+            )
+        else:
+            delta_value, delta_timestamp, _ = await self.fetch_revoc_reg_delta(
+                revoc_reg_id, timestamp_from, timestamp_to
+            )
+        if delta_value is None:
+            # no entries yet: nothing issued or revoked, and no accumulator
+            delta_value = {"issued": [], "revoked": []}
+        return {"ver": "1.0", "value": delta_value}, delta_timestamp
+
+    async def fetch_revoc_reg_delta(
+        self, revoc_reg_id: str, timestamp_from: int, timestamp_to: int
+    ) -> Tuple[Optional[dict], Optional[int], Optional[int]]:
+        """Fetch a revocation registry delta value from the ledger.
+
+        Returns:
+            The delta value and timestamp, both None if the registry has no
+            entries up to the end time, and the time of the ledger state the
+            reply reflects, if known
+
+        """
         public_info = await self.get_wallet_public_did()
         try:
             fetch_req = ledger.build_get_revoc_reg_delta_request(
@@ -1091,7 +1268,19 @@ class IndyVdrLedger(BaseLedger):
                 f"get_revoc_reg_delta failed for revoc_reg_id='{revoc_reg_id}'"
             ) from err
 
+        if response["data"]["revocRegDefId"] != revoc_reg_id:
+            raise LedgerError(
+                "ID of revocation registry response does not match requested ID"
+            )
+        ledger_time = (
+            (response.get("state_proof") or {})
+            .get("multi_signature", {})
+            .get("value", {})
+            .get("timestamp")
+        )
         response_value = response["data"]["value"]
+        if not response_value.get("accum_to"):
+            return None, None, ledger_time
         delta_value = {
             "accum": response_value["accum_to"]["value"]["accum"],
             "issued": response_value.get("issued", []),
@@ -1100,14 +1289,9 @@ class IndyVdrLedger(BaseLedger):
         accum_from = response_value.get("accum_from")
         if accum_from:
             delta_value["prev_accum"] = accum_from["value"]["accum"]
-        reg_delta = {"ver": "1.0", "value": delta_value}
         # question - why not response["to"] ?
         delta_timestamp = response_value["accum_to"]["txnTime"]
-        if response["data"]["revocRegDefId"] != revoc_reg_id:
-            raise LedgerError(
-                "ID of revocation registry response does not match requested ID"
-            )
-        return reg_delta, delta_timestamp
+        return delta_value, delta_timestamp, ledger_time
 
     async def send_revoc_reg_def(
         self,
@@ -141,6 +141,9 @@ class MultiIndyLedgerManagerProvider(BaseProvider):
                             genesis_transactions=genesis_transactions,
                             read_only=read_only,
                             socks_proxy=socks_proxy,
+                            max_concurrent_requests=settings.get_value(
+                                "ledger.max_concurrent_requests"
+                            ),
                         )
                         ledger_instance = ledger_class(
                             pool=ledger_pool,
@@ -0,0 +1,223 @@
+"""Local cache of revocation registry states for computing deltas."""
+
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+# Fetches a raw delta value from the ledger: (rev reg id, from, to) -> (value, txn
+# time, ledger time), the value and txn time being None if the registry has no
+# entries up to the given time, and the ledger time being the time of the ledger
+# state the reply reflects, if known
+DeltaFetcher = Callable[
+    [str, int, int], Awaitable[Tuple[Optional[dict], Optional[int], Optional[int]]]
+]
+
+
+class RevRegState:
+    """The accumulated state of a revocation registry at a ledger transaction."""
+
+    def __init__(
+        self,
+        txn_time: int,
+        accum: str,
+        issued: Sequence[int],
+        revoked: Sequence[int],
+        valid_to: int = None,
+    ):
+        """Initialize the state.
+
+        Args:
+            txn_time: The time of the registry entry transaction producing the state
+            accum: The accumulator value
+            issued: Indexes explicitly issued as of this state
+            revoked: Indexes revoked as of this state
+            valid_to: The latest time known to still have this state
+        """
+        self.txn_time = txn_time
+        self.accum = accum
+        self.issued = frozenset(issued)
+        self.revoked = frozenset(revoked)
+        self.valid_to = max(valid_to or txn_time, txn_time)
+
+    def apply(self, delta: dict, txn_time: int) -> "RevRegState":
+        """Produce the state resulting from applying a delta value to this one."""
+        issued = set(delta.get("issued") or [])
+        revoked = set(delta.get("revoked") or [])
+        return RevRegState(
+            txn_time,
+            delta["accum"],
+            (self.issued - revoked) | issued,
+            (self.revoked - issued) | revoked,
+        )
+
+    def delta_from(self, prior: Optional["RevRegState"]) -> dict:
+        """Express this state as a delta value relative to a prior state."""
+        if not prior:
+            return {
+                "accum": self.accum,
+                "issued": sorted(self.issued),
+                "revoked": sorted(self.revoked),
+            }
+        return {
+            "accum": self.accum,
+            "issued": sorted(
+                (self.issued - prior.issued) | (prior.revoked - self.revoked)
+            ),
+            "revoked": sorted(self.revoked - prior.revoked),
+            "prev_accum": prior.accum,
+        }
+
+
+class RevRegStateIndex:
+    """Known states of a single revocation registry, indexed by time."""
+
+    def __init__(self, max_states: int):
+        """Initialize the index."""
+        self.max_states = max_states
+        self._times: List[int] = []
+        self._states: List[RevRegState] = []
+
+    @property
+    def latest(self) -> Optional[RevRegState]:
+        """Accessor for the most recent known state."""
+        return self._states[-1] if self._states else None
+
+    def lookup(self, timestamp: int) -> Optional[RevRegState]:
+        """Find the state known to be current at a given time, if any."""
+        pos = bisect_right(self._times, timestamp)
+        if pos and self._states[pos - 1].valid_to >= timestamp:
+            return self._states[pos - 1]
+        return None
+
+    def add(self, state: RevRegState, seen_at: int) -> RevRegState:
+        """Record a state, observed to be current at the given time."""
+        pos = bisect_right(self._times, state.txn_time)
+        if pos and self._times[pos - 1] == state.txn_time:
+            found = self._states[pos - 1]
+            found.valid_to = max(found.valid_to, seen_at)
+            return found
+        state.valid_to = max(state.valid_to, seen_at)
+        self._times.insert(pos, state.txn_time)
+        self._states.insert(pos, state)
+        if len(self._states) > self.max_states:
+            # keep the latest state, which incremental fetches build on
+            del self._times[0]
+            del self._states[0]
+        return state
+
+
+class RevRegDeltaCache:
+    """Per-registry cache of revocation states, answering delta queries locally.
+
+    A query for the state at time `to` is answered without a ledger read when a
+    known state covers that time. Otherwise only the entries written since the
+    latest known state are fetched and merged into it. Deltas between two times
+    are computed from the two corresponding states.
+    """
+
+    def __init__(self, max_registries: int = 256, max_states: int = 64):
+        """Initialize the cache.
+
+        Args:
+            max_registries: The number of registries to keep, least recently used
+                are discarded first
+            max_states: The number of states to keep per registry
+        """
+        self.max_registries = max_registries
+        self.max_states = max_states
+        self._registries: OrderedDict[str, RevRegStateIndex] = OrderedDict()
+        self.ledger_reads = 0
+
+    def _index(self, rev_reg_id: str) -> RevRegStateIndex:
+        index = self._registries.get(rev_reg_id)
+        if index:
+            self._registries.move_to_end(rev_reg_id)
+        else:
+            index = RevRegStateIndex(self.max_states)
+            self._registries[rev_reg_id] = index
+            if len(self._registries) > self.max_registries:
+                self._registries.popitem(last=False)
+        return index
+
+    async def _fetch(
+        self, fetch: DeltaFetcher, rev_reg_id: str, timestamp_from: int, to: int
+    ) -> Tuple[Optional[dict], Optional[int], int]:
+        """Fetch a delta value, with the latest time its state is known to hold.
+
+        A state is only known to hold up to the time of the ledger state the
+        reply reflects, or failing that the local time, even if later requested.
+        """
+        self.ledger_reads += 1
+        delta, txn_time, ledger_time = await fetch(rev_reg_id, timestamp_from, to)
+        seen_at = min(to, ledger_time or int(time.time()))
+        return delta, txn_time, seen_at
+
+    async def state_at(
+        self, fetch: DeltaFetcher, rev_reg_id: str, timestamp: int
+    ) -> Optional[RevRegState]:
+        """Obtain the state of a registry at a given time, if it has any entries."""
+        index = self._index(rev_reg_id)
+        state = index.lookup(timestamp)
+        if state:
+            return state
+
+        latest = index.latest
+        if latest and timestamp > latest.valid_to:
+            # incremental: only entries since the latest known state
+            delta, txn_time, seen_at = await self._fetch(
+                fetch, rev_reg_id, latest.txn_time, timestamp
+            )
+            if txn_time == latest.txn_time:
+                return index.add(latest, seen_at)
+            if delta and delta.get("prev_accum") == latest.accum:
+                return index.add(latest.apply(delta, txn_time), seen_at)
+
+        delta, txn_time, seen_at = await self._fetch(fetch, rev_reg_id, 0, timestamp)
+        if not delta:
+            return None
+        return index.add(
+            RevRegState(
+                txn_time,
+                delta["accum"],
+                delta.get("issued") or [],
+                delta.get("revoked") or [],
+            ),
+            seen_at,
+        )
+
+    async def get_delta(
+        self,
+        fetch: DeltaFetcher,
+        rev_reg_id: str,
+        timestamp_from: int,
+        timestamp_to: int,
+    ) -> Tuple[dict, int]:
+        """Compute a revocation registry delta value for an interval.
+
+        Args:
+            fetch: Fetches a delta value directly from the ledger
+            rev_reg_id: The revocation registry identifier
+            timestamp_from: The start of the interval, or 0 for the full state
+            timestamp_to: The end of the interval
+
+        Returns:
+            The delta value and the time of the latest entry it reflects, or
+            (None, None) if the registry has no entries up to the end time
+
+        """
+        state_to = await self.state_at(fetch, rev_reg_id, timestamp_to)
+        if not state_to:
+            return None, None
+        state_from = None
+        if timestamp_from:
+            state_from = self._index(rev_reg_id).lookup(timestamp_from)
+            if not state_from and timestamp_from >= state_to.txn_time:
+                state_from = state_to
+            if not state_from:
+                state_from = await self.state_at(fetch, rev_reg_id, timestamp_from)
+        return state_to.delta_from(state_from), state_to.txn_time
+
+    def clear(self, rev_reg_id: str):
+        """Forget all states of a registry."""
+        self._registries.pop(rev_reg_id, None)
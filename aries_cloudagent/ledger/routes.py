@@ -23,10 +23,16 @@ from ..messaging.valid import (
     ENDPOINT_TYPE_EXAMPLE,
     ENDPOINT_TYPE_VALIDATE,
     ENDPOINT_VALIDATE,
+    INDY_CRED_DEF_ID_EXAMPLE,
+    INDY_CRED_DEF_ID_VALIDATE,
     INDY_DID_EXAMPLE,
     INDY_DID_VALIDATE,
     INDY_RAW_PUBLIC_KEY_EXAMPLE,
     INDY_RAW_PUBLIC_KEY_VALIDATE,
+    INDY_REV_REG_ID_EXAMPLE,
+    INDY_REV_REG_ID_VALIDATE,
+    INDY_SCHEMA_ID_EXAMPLE,
+    INDY_SCHEMA_ID_VALIDATE,
     INT_EPOCH_EXAMPLE,
     INT_EPOCH_VALIDATE,
     UUID4_EXAMPLE,
@@ -254,6 +260,48 @@ class WriteLedgerRequestSchema(OpenAPISchema):
     ledger_id = fields.Str(required=True)
 
 
+class ArtifactCacheWarmRequestSchema(OpenAPISchema):
+    """Request schema for warming the ledger artifact cache."""
+
+    schema_ids = fields.List(
+        fields.Str(
+            validate=INDY_SCHEMA_ID_VALIDATE,
+            metadata={"example": INDY_SCHEMA_ID_EXAMPLE},
+        ),
+        required=False,
+        metadata={"description": "Schema identifiers to fetch"},
+    )
+    cred_def_ids = fields.List(
+        fields.Str(
+            validate=INDY_CRED_DEF_ID_VALIDATE,
+            metadata={"example": INDY_CRED_DEF_ID_EXAMPLE},
+        ),
+        required=False,
+        metadata={"description": "Credential definition identifiers to fetch"},
+    )
+    rev_reg_def_ids = fields.List(
+        fields.Str(
+            validate=INDY_REV_REG_ID_VALIDATE,
+            metadata={"example": INDY_REV_REG_ID_EXAMPLE},
+        ),
+        required=False,
+        metadata={"description": "Revocation registry identifiers to fetch"},
+    )
+
+
+class ArtifactCacheWarmResultSchema(OpenAPISchema):
+    """Result schema for warming the ledger artifact cache."""
+
+    cached = fields.List(
+        fields.Str(),
+        metadata={"description": "Identifiers of artifacts now in the cache"},
+    )
+    not_found = fields.List(
+        fields.Str(),
+        metadata={"description": "Identifiers of artifacts not found on the ledger"},
+    )
+
+
 @docs(
     tags=["ledger"],
     summary="Send a NYM registration to the ledger.",
@@ -691,6 +739,49 @@ async def ledger_accept_taa(request: web.BaseRequest):
     return web.json_response({})
 
 
+@docs(tags=["ledger"], summary="Pre-fetch immutable artifacts into the ledger caches")
+@request_schema(ArtifactCacheWarmRequestSchema())
+@response_schema(ArtifactCacheWarmResultSchema(), 200, description="")
+async def ledger_warm_artifact_cache(request: web.BaseRequest):
+    """Request handler for warming the ledger artifact cache.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The identifiers cached and not found
+
+    """
+    context: AdminRequestContext = request["context"]
+    async with context.profile.session() as session:
+        ledger = session.inject_or(BaseLedger)
+        if not ledger:
+            reason = "No Indy ledger available"
+            if not session.settings.get_value("wallet.type"):
+                reason += ": missing wallet-type?"
+            raise web.HTTPForbidden(reason=reason)
+
+    body = await request.json()
+    cached = []
+    not_found = []
+    async with ledger:
+        try:
+            for getter, ids in (
+                (ledger.get_schema, body.get("schema_ids") or []),
+                (ledger.get_credential_definition, body.get("cred_def_ids") or []),
+                (ledger.get_revoc_reg_def, body.get("rev_reg_def_ids") or []),
+            ):
+                for artifact_id in ids:
+                    if await getter(artifact_id):
+                        cached.append(artifact_id)
+                    else:
+                        not_found.append(artifact_id)
+        except LedgerError as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+    return web.json_response({"cached": cached, "not_found": not_found})
+
+
 @docs(tags=["ledger"], summary="Fetch list of available write ledgers")
 @response_schema(ConfigurableWriteLedgersSchema, 200, description="")
 async def get_write_ledgers(request: web.BaseRequest):
@@ -826,6 +917,7 @@ async def register(app: web.Application):
             web.get("/ledger/did-endpoint", get_did_endpoint, allow_head=False),
             web.get("/ledger/taa", ledger_get_taa, allow_head=False),
             web.post("/ledger/taa/accept", ledger_accept_taa),
+            web.post("/ledger/artifact-cache/warm", ledger_warm_artifact_cache),
             web.get("/ledger/get-write-ledger", get_write_ledger, allow_head=False),
             web.put("/ledger/{ledger_id}/set-write-ledger", set_write_ledger),
             web.get(
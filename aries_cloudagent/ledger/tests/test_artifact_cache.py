@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from ..artifact_cache import LedgerArtifactCache
+
+
+SCHEMA = {
+    "ver": "1.0",
+    "id": "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1",
+    "name": "schema_name",
+    "version": "9.1",
+    "attrNames": ["a", "b"],
+    "seqNo": 99,
+}
+
+
+@pytest.mark.asyncio
+async def test_set_get(tmp_path: Path):
+    cache = LedgerArtifactCache(tmp_path)
+    assert await cache.get("schema::99") is None
+
+    digest = await cache.set([f"schema::{SCHEMA['id']}", "schema::99"], SCHEMA)
+    assert digest
+    assert await cache.get("schema::99") == SCHEMA
+    assert await cache.get(f"schema::{SCHEMA['id']}") == SCHEMA
+
+    # stored once, content-addressed
+    assert [p.name for p in tmp_path.joinpath("objects").iterdir()] == [digest]
+    assert await cache.set("other", dict(reversed(list(SCHEMA.items())))) == digest
+
+
+@pytest.mark.asyncio
+async def test_persists_across_instances(tmp_path: Path):
+    await LedgerArtifactCache(tmp_path).set("schema::99", SCHEMA)
+    assert await LedgerArtifactCache(tmp_path).get("schema::99") == SCHEMA
+
+
+@pytest.mark.asyncio
+async def test_corrupt_entry_discarded(tmp_path: Path):
+    cache = LedgerArtifactCache(tmp_path)
+    digest = await cache.set("schema::99", SCHEMA)
+    tmp_path.joinpath("objects", digest).write_text('{"tampered": true}')
+    assert await cache.get("schema::99") is None
+    assert await cache.get("schema::99") is None
+
+
+@pytest.mark.asyncio
+async def test_clear(tmp_path: Path):
+    cache = LedgerArtifactCache(tmp_path)
+    await cache.set("schema::99", SCHEMA)
+    await cache.clear("schema::99")
+    await cache.clear("schema::99")
+    assert await cache.get("schema::99") is None
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import indy_vdr
@@ -15,6 +16,7 @@ from ...wallet.did_info import DIDInfo
 from ...wallet.did_method import SOV, DIDMethod, DIDMethods, HolderDefinedDid
 from ...wallet.did_posture import DIDPosture
 from ...wallet.key_type import ED25519
+from ..artifact_cache import LedgerArtifactCache
 from ..endpoint_type import EndpointType
 from ..indy_vdr import (
     BadLedgerRequestError,
@@ -103,6 +105,96 @@ class TestIndyVdrLedger:
             result = await ledger._submit(test_msg)
             ledger.pool_handle.submit_request.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_submit_coalesce_reads(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        async def submit_request(request):
+            await asyncio.sleep(0.01)
+            return {
+                "seqNo": 99,
+                "dest": "55GkHamhTU1ZbTbV2ab9DE",
+                "data": {
+                    "name": "schema_name",
+                    "version": "9.1",
+                    "attr_names": ["a", "b"],
+                },
+            }
+
+        async with ledger:
+            ledger.pool_handle.submit_request.side_effect = submit_request
+            results = await asyncio.gather(
+                *(
+                    ledger.fetch_schema_by_id(
+                        "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1"
+                    )
+                    for _ in range(50)
+                ),
+                ledger.fetch_schema_by_id("55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.2"),
+            )
+            assert all(result == results[0] for result in results[:50])
+            assert results[0] is not results[1]
+            assert ledger.pool_handle.submit_request.await_count == 2
+            assert ledger.pool.requests_submitted == 2
+            assert ledger.pool.reads_coalesced == 49
+            assert not ledger.pool.pending_reads
+
+    @pytest.mark.asyncio
+    async def test_submit_coalesce_reads_x(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        async with ledger:
+            ledger.pool_handle.submit_request.side_effect = VdrError(99, "bad")
+            results = await asyncio.gather(
+                *(ledger.get_key_for_did("55GkHamhTU1ZbTbV2ab9DE") for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, LedgerTransactionError) for result in results)
+            ledger.pool_handle.submit_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_read_copies(self):
+        pool = IndyVdrLedgerPool("test-ledger")
+
+        async def submit():
+            await asyncio.sleep(0.01)
+            return {"data": {"attr_names": ["a", "b"]}}
+
+        async def read_and_mutate():
+            result = await pool.coalesce_read("key", submit)
+            result["data"]["attr_names"].append("c")
+            return result
+
+        results = await asyncio.gather(
+            read_and_mutate(), *(pool.coalesce_read("key", submit) for _ in range(2))
+        )
+        assert results[0]["data"]["attr_names"] == ["a", "b", "c"]
+        assert all(result["data"]["attr_names"] == ["a", "b"] for result in results[1:])
+        assert results[1] is not results[2]
+        assert pool.reads_coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_concurrency_limit(self):
+        pool = IndyVdrLedgerPool("test-ledger", max_concurrent_requests=2)
+        pool.handle = mock.MagicMock(indy_vdr.Pool)
+        active = 0
+        peak = 0
+
+        async def submit_request(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {}
+
+        pool.handle.submit_request.side_effect = submit_request
+        await asyncio.gather(*(pool.submit_request(None) for _ in range(10)))
+        assert peak == 2
+        assert pool.requests_submitted == 10
+
     @pytest.mark.asyncio
     async def test_fetch_txn_author_agreement(
         self,
@@ -921,6 +1013,52 @@ class TestIndyVdrLedger:
             assert result["id"] == reg_id
             assert result["txnTime"] == 1234567890
 
+    @pytest.mark.asyncio
+    async def test_get_artifacts_persistent_cache(
+        self,
+        ledger: IndyVdrLedger,
+        tmp_path,
+    ):
+        ledger.profile.settings["ledger.artifact_cache"] = True
+        ledger.pool.artifact_cache_cache = LedgerArtifactCache(tmp_path)
+        schema_id = "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1"
+        cred_def_id = "55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag"
+        reg_id = (
+            "55GkHamhTU1ZbTbV2ab9DE:4:55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag:CL_ACCUM:0"
+        )
+        async with ledger:
+            ledger.pool_handle.submit_request.side_effect = [
+                {
+                    "seqNo": 99,
+                    "dest": "55GkHamhTU1ZbTbV2ab9DE",
+                    "data": {
+                        "name": "schema_name",
+                        "version": "9.1",
+                        "attr_names": ["a", "b"],
+                    },
+                },
+                {
+                    "ref": 99,
+                    "signature_type": "CL",
+                    "tag": "tag",
+                    "origin": "55GkHamhTU1ZbTbV2ab9DE",
+                    "data": {"cred": "def"},
+                },
+                {"data": {"id": reg_id}, "txnTime": 1234567890},
+            ]
+            schema = await ledger.get_schema(schema_id)
+            cred_def = await ledger.get_credential_definition(cred_def_id)
+            rev_reg_def = await ledger.get_revoc_reg_def(reg_id)
+            assert ledger.pool_handle.submit_request.await_count == 3
+
+            # simulate a restart: only the disk cache remains
+            ledger.pool.artifact_cache_cache = LedgerArtifactCache(tmp_path)
+            assert await ledger.get_schema(schema_id) == schema
+            assert await ledger.get_schema("99") == schema
+            assert await ledger.get_credential_definition(cred_def_id) == cred_def
+            assert await ledger.get_revoc_reg_def(reg_id) == rev_reg_def
+            assert ledger.pool_handle.submit_request.await_count == 3
+
     @pytest.mark.asyncio
     async def test_get_revoc_reg_entry(
         self,
@@ -972,6 +1110,74 @@ class TestIndyVdrLedger:
                 1234567890,
             )
 
+    @pytest.mark.asyncio
+    async def test_get_revoc_reg_delta_cached(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        ledger.profile.settings["ledger.revocation_delta_cache"] = True
+        async with ledger:
+            reg_id = (
+                "55GkHamhTU1ZbTbV2ab9DE:4:55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag:CL_ACCUM:0"
+            )
+            ledger.pool_handle.submit_request.return_value = {
+                "data": {
+                    "value": {
+                        "accum_to": {
+                            "value": {"accum": "ACCUM"},
+                            "txnTime": 1234567890,
+                        },
+                        "issued": [1, 2],
+                        "revoked": [3, 4],
+                    },
+                    "revocRegDefId": reg_id,
+                },
+            }
+            for _ in range(3):
+                result = await ledger.get_revoc_reg_delta(reg_id, 0, 1234567899)
+                assert result == (
+                    {
+                        "ver": "1.0",
+                        "value": {
+                            "accum": "ACCUM",
+                            "issued": [1, 2],
+                            "revoked": [3, 4],
+                        },
+                    },
+                    1234567890,
+                )
+            result = await ledger.get_revoc_reg_delta(reg_id, 1234567895, 1234567899)
+            assert result == (
+                {
+                    "ver": "1.0",
+                    "value": {
+                        "accum": "ACCUM",
+                        "issued": [],
+                        "revoked": [],
+                        "prev_accum": "ACCUM",
+                    },
+                },
+                1234567890,
+            )
+            ledger.pool_handle.submit_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_revoc_reg_delta_not_found(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        async with ledger:
+            reg_id = (
+                "55GkHamhTU1ZbTbV2ab9DE:4:55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag:CL_ACCUM:0"
+            )
+            ledger.pool_handle.submit_request.return_value = {
+                "data": {"value": {}, "revocRegDefId": reg_id},
+            }
+            assert await ledger.get_revoc_reg_delta(reg_id) == (
+                {"ver": "1.0", "value": {"issued": [], "revoked": []}},
+                None,
+            )
+
     @pytest.mark.asyncio
     async def test_send_revoc_reg_def(
         self,
@@ -0,0 +1,155 @@
+import time
+
+import pytest
+
+from ..rev_reg_delta_cache import RevRegDeltaCache
+
+REV_REG_ID = "55GkHamhTU1ZbTbV2ab9DE:4:55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag:CL_ACCUM:0"
+
+
+class MockLedger:
+    """Computes delta values the way the ledger does from a list of entries."""
+
+    def __init__(self, entries):
+        # entries: [(txn_time, revoked indexes, issued indexes)]
+        self.entries = entries
+        self.requests = []
+        self.accum_prefix = "accum"
+        self.ledger_time = None
+
+    def state(self, timestamp):
+        issued, revoked, found = set(), set(), None
+        for txn_time, rev, iss in self.entries:
+            if txn_time > timestamp:
+                break
+            revoked = (revoked - set(iss)) | set(rev)
+            issued = (issued - set(rev)) | set(iss)
+            found = txn_time
+        return found, issued, revoked
+
+    async def fetch(self, rev_reg_id, timestamp_from, timestamp_to):
+        assert rev_reg_id == REV_REG_ID
+        self.requests.append((timestamp_from, timestamp_to))
+        to_time, issued_to, revoked_to = self.state(timestamp_to)
+        if not to_time:
+            return None, None, self.ledger_time
+        value = {"accum": f"{self.accum_prefix}-{to_time}"}
+        from_time = timestamp_from and self.state(timestamp_from)[0]
+        if from_time:
+            _, issued_from, revoked_from = self.state(timestamp_from)
+            value["prev_accum"] = f"{self.accum_prefix}-{from_time}"
+            value["issued"] = sorted(
+                (issued_to - issued_from) | (revoked_from - revoked_to)
+            )
+            value["revoked"] = sorted(revoked_to - revoked_from)
+        else:
+            value["issued"] = sorted(issued_to)
+            value["revoked"] = sorted(revoked_to)
+        return value, to_time, self.ledger_time
+
+
+@pytest.fixture()
+def ledger():
+    return MockLedger([(100, [], []), (200, [1, 2], []), (300, [3], [1])])
+
+
+@pytest.mark.asyncio
+async def test_full_state_repeat(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    for _ in range(5):
+        assert await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 250) == (
+            {"accum": "accum-200", "issued": [], "revoked": [1, 2]},
+            200,
+        )
+    assert ledger.requests == [(0, 250)]
+    assert cache.ledger_reads == 1
+
+    # covered by the known state, no ledger read
+    assert (await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 220))[1] == 200
+    assert len(ledger.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_incremental(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 250)
+    result = await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 400)
+    assert result == (await ledger.fetch(REV_REG_ID, 0, 400))[:2]
+    # only entries since the latest cached state were fetched
+    assert ledger.requests[1] == (200, 400)
+
+    ledger.requests.clear()
+    assert (await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 240))[1] == 200
+    assert (await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 350))[1] == 300
+    assert not ledger.requests
+
+    # no new entries: state validity is extended
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 500)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 450)
+    assert ledger.requests == [(300, 500)]
+
+
+@pytest.mark.asyncio
+async def test_interval(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    for interval in [(150, 350), (250, 350), (310, 350), (50, 350), (150, 250)]:
+        expected = (await ledger.fetch(REV_REG_ID, *interval))[:2]
+        assert await cache.get_delta(ledger.fetch, REV_REG_ID, *interval) == expected
+
+
+@pytest.mark.asyncio
+async def test_incremental_mismatch_refetch(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 250)
+    ledger.accum_prefix = "other"  # ledger disagrees with cached state
+    ledger.requests.clear()
+    result = await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 400)
+    assert ledger.requests == [(200, 400), (0, 400)]
+    assert result == (await ledger.fetch(REV_REG_ID, 0, 400))[:2]
+
+
+@pytest.mark.asyncio
+async def test_future_end_time(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    ledger.ledger_time = 350
+    assert (await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 1000))[1] == 300
+
+    # revoked after the ledger time of the reply: the cached state is not reused
+    ledger.entries.append((400, [2], []))
+    ledger.ledger_time = 450
+    assert await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 1000) == (
+        {"accum": "accum-400", "issued": [1], "revoked": [2, 3]},
+        400,
+    )
+    assert ledger.requests == [(0, 1000), (300, 1000)]
+
+
+@pytest.mark.asyncio
+async def test_future_end_time_local_clock(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    future = int(time.time()) + 3600
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, future)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, future)
+    # without a ledger time, the state is only known up to the local time
+    assert len(ledger.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_not_found(ledger: MockLedger):
+    cache = RevRegDeltaCache()
+    assert await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 50) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_bounds(ledger: MockLedger):
+    cache = RevRegDeltaCache(max_registries=1, max_states=2)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 150)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 250)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 350)
+    ledger.requests.clear()
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 150)
+    assert ledger.requests == [(0, 150)]
+
+    cache.clear(REV_REG_ID)
+    await cache.get_delta(ledger.fetch, REV_REG_ID, 0, 350)
+    assert ledger.requests[-1] == (0, 350)
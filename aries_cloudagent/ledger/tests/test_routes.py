@@ -78,6 +78,9 @@ class TestLedgerRoutes(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.web.HTTPForbidden):
             await test_module.ledger_get_taa(self.request)
 
+        with self.assertRaises(test_module.web.HTTPForbidden):
+            await test_module.ledger_warm_artifact_cache(self.request)
+
     async def test_get_verkey_a(self):
         self.profile.context.injector.bind_instance(
             IndyLedgerRequestsExecutor,
@@ -700,6 +703,40 @@ class TestLedgerRoutes(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.ledger_get_taa(self.request)
 
+    async def test_warm_artifact_cache(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={
+                "schema_ids": ["schema-id"],
+                "cred_def_ids": ["cred-def-id", "missing-cred-def-id"],
+                "rev_reg_def_ids": ["rev-reg-id"],
+            }
+        )
+        self.ledger.get_schema.return_value = {"id": "schema-id"}
+        self.ledger.get_credential_definition.side_effect = [
+            {"id": "cred-def-id"},
+            None,
+        ]
+        self.ledger.get_revoc_reg_def.return_value = {"id": "rev-reg-id"}
+
+        with mock.patch.object(
+            test_module.web, "json_response", mock.Mock()
+        ) as json_response:
+            result = await test_module.ledger_warm_artifact_cache(self.request)
+            json_response.assert_called_once_with(
+                {
+                    "cached": ["schema-id", "cred-def-id", "rev-reg-id"],
+                    "not_found": ["missing-cred-def-id"],
+                }
+            )
+            assert result is json_response.return_value
+
+    async def test_warm_artifact_cache_x(self):
+        self.request.json = mock.CoroutineMock(return_value={"schema_ids": ["x"]})
+        self.ledger.get_schema.side_effect = test_module.LedgerError()
+
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.ledger_warm_artifact_cache(self.request)
+
     async def test_taa_accept_not_required(self):
         self.request.json = mock.CoroutineMock(
             return_value={
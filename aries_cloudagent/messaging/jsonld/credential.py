@@ -4,6 +4,7 @@ import json
 
 from ...did.did_key import DIDKey
 from ...vc.ld_proofs import DocumentLoader
+from ...vc.ld_proofs.document_loader import run_jsonld
 from ...wallet.base import BaseWallet
 from ...wallet.key_type import ED25519
 from ...wallet.util import b64_to_bytes, b64_to_str, bytes_to_b64, str_to_b64
@@ -86,7 +87,8 @@ async def sign_credential(session, credential, signature_options, verkey):
     """Sign Credential."""
 
     document_loader = session.profile.inject_or(DocumentLoader)
-    framed, verify_data_hex_string = create_verify_data(
+    framed, verify_data_hex_string = await run_jsonld(
+        create_verify_data,
         credential,
         signature_options,
         document_loader,
@@ -100,7 +102,8 @@ async def verify_credential(session, doc, verkey):
     """Verify credential."""
 
     document_loader = session.profile.inject_or(DocumentLoader)
-    framed, verify_data_hex_string = create_verify_data(
+    framed, verify_data_hex_string = await run_jsonld(
+        create_verify_data,
         doc,
         doc["proof"],
         document_loader,
@@ -665,9 +665,11 @@ class CredentialManager:
                     # unlucky, another instance filled the registry first
                     continue
 
-                if revocable and rev_reg.max_creds <= int(cred_rev_id):
+                if revocable:
                     revoc = IndyRevocation(self._profile)
-                    await revoc.handle_full_registry(rev_reg_id)
+                    revoc.check_fill_level(issuer_rev_reg, int(cred_rev_id))
+                    if rev_reg.max_creds <= int(cred_rev_id):
+                        await revoc.handle_full_registry(rev_reg_id)
                     del revoc
 
                 credential_ser = json.loads(credential_json)
@@ -824,7 +826,7 @@ class CredentialManager:
 
         if revoc_reg_def:
             revoc_reg = RevocationRegistry.from_definition(revoc_reg_def, True)
-            await revoc_reg.get_or_fetch_local_tails_path()
+            await revoc_reg.get_or_fetch_local_tails_path(self._profile)
         try:
             credential_id = await holder.store_credential(
                 credential_definition,
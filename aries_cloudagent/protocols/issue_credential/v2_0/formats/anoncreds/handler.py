@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Mapping, Tuple
+from typing import Mapping, Sequence, Tuple
 
 from marshmallow import RAISE
 
@@ -348,33 +348,90 @@ class AnonCredsCredFormatHandler(V20CredFormatHandler):
 
         result = self.get_format_data(CRED_20_ISSUE, json.loads(cred_json))
 
-        async with self._profile.transaction() as txn:
-            detail_record = V20CredExRecordIndy(
-                cred_ex_id=cred_ex_record.cred_ex_id,
-                rev_reg_id=rev_reg_def_id,
-                cred_rev_id=cred_rev_id,
+        await self._save_issued(
+            [(cred_ex_record.cred_ex_id, rev_reg_def_id, cred_rev_id)]
+        )
+
+        return result
+
+    async def issue_credentials(
+        self, cred_ex_records: Sequence[V20CredExRecord], retries: int = 5
+    ) -> Sequence[CredFormatAttachment]:
+        """Issue a batch of anoncreds credentials.
+
+        Credentials for the same credential definition are created together.
+        """
+        by_cred_def = {}
+        for pos, cred_ex_record in enumerate(cred_ex_records):
+            await self._check_uniqueness(cred_ex_record.cred_ex_id)
+            cred_offer = cred_ex_record.cred_offer.attachment(
+                AnonCredsCredFormatHandler.format
+            )
+            cred_request = cred_ex_record.cred_request.attachment(
+                AnonCredsCredFormatHandler.format
+            )
+            cred_values = cred_ex_record.cred_offer.credential_preview.attr_dict(
+                decode=False
+            )
+            by_cred_def.setdefault(cred_offer["cred_def_id"], []).append(
+                (pos, (cred_offer, cred_request, cred_values))
+            )
+
+        revocation = AnonCredsRevocation(self.profile)
+        results = [None] * len(cred_ex_records)
+        issued = []
+        for pending in by_cred_def.values():
+            created = await revocation.create_credentials(
+                [credential for _, credential in pending], retries=retries
             )
-            await detail_record.save(txn, reason="v2.0 issue credential")
+            for (pos, _), (cred_json, cred_rev_id, rev_reg_def_id) in zip(
+                pending, created
+            ):
+                results[pos] = self.get_format_data(
+                    CRED_20_ISSUE, json.loads(cred_json)
+                )
+                issued.append(
+                    (cred_ex_records[pos].cred_ex_id, rev_reg_def_id, cred_rev_id)
+                )
+
+        await self._save_issued(issued)
+
+        return results
+
+    async def _save_issued(self, issued: Sequence[Tuple[str, str, str]]):
+        """Save the details of issued credentials.
+
+        Args:
+            issued: The credential exchange id, revocation registry definition id
+                and credential revocation id of each credential issued
 
-            if cred_rev_id:
-                issuer_cr_rec = IssuerCredRevRecord(
-                    state=IssuerCredRevRecord.STATE_ISSUED,
-                    cred_ex_id=cred_ex_record.cred_ex_id,
-                    cred_ex_version=IssuerCredRevRecord.VERSION_2,
+        """
+        async with self._profile.transaction() as txn:
+            for cred_ex_id, rev_reg_def_id, cred_rev_id in issued:
+                detail_record = V20CredExRecordIndy(
+                    cred_ex_id=cred_ex_id,
                     rev_reg_id=rev_reg_def_id,
                     cred_rev_id=cred_rev_id,
                 )
-                await issuer_cr_rec.save(
-                    txn,
-                    reason=(
-                        "Created issuer cred rev record for "
-                        f"rev reg id {rev_reg_def_id}, index {cred_rev_id}"
-                    ),
-                )
+                await detail_record.save(txn, reason="v2.0 issue credential")
+
+                if cred_rev_id:
+                    issuer_cr_rec = IssuerCredRevRecord(
+                        state=IssuerCredRevRecord.STATE_ISSUED,
+                        cred_ex_id=cred_ex_id,
+                        cred_ex_version=IssuerCredRevRecord.VERSION_2,
+                        rev_reg_id=rev_reg_def_id,
+                        cred_rev_id=cred_rev_id,
+                    )
+                    await issuer_cr_rec.save(
+                        txn,
+                        reason=(
+                            "Created issuer cred rev record for "
+                            f"rev reg id {rev_reg_def_id}, index {cred_rev_id}"
+                        ),
+                    )
             await txn.commit()
 
-        return result
-
     async def receive_credential(
         self, cred_ex_record: V20CredExRecord, cred_issue_message: V20CredIssue
     ) -> None:
@@ -3,7 +3,7 @@
 from abc import ABC, abstractclassmethod, abstractmethod
 import logging
 
-from typing import Mapping, Tuple
+from typing import Mapping, Sequence, Tuple
 
 from .....core.error import BaseError
 from .....core.profile import Profile
@@ -114,6 +114,19 @@ class V20CredFormatHandler(ABC):
     ) -> CredFormatAttachment:
         """Create format specific issue credential attachment data."""
 
+    async def issue_credentials(
+        self, cred_ex_records: Sequence[V20CredExRecord], retries: int = 5
+    ) -> Sequence[CredFormatAttachment]:
+        """Create format specific issue credential attachment data for a batch.
+
+        Formats able to create credentials more efficiently in bulk override
+        this; by default each credential is issued in turn.
+        """
+        return [
+            await self.issue_credential(cred_ex_record, retries=retries)
+            for cred_ex_record in cred_ex_records
+        ]
+
     @abstractmethod
     async def receive_credential(
         self, cred_ex_record: V20CredExRecord, cred_issue_message: V20CredIssue
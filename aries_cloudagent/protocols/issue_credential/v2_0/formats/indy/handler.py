@@ -4,7 +4,7 @@ import logging
 
 from marshmallow import RAISE
 import json
-from typing import Mapping, Tuple
+from typing import Mapping, Sequence, Tuple
 import asyncio
 
 from ......cache.base import BaseCache
@@ -443,9 +443,11 @@ class IndyCredFormatHandler(V20CredFormatHandler):
                 # unlucky, another instance filled the registry first
                 continue
 
-            if revocable and rev_reg.max_creds <= int(cred_rev_id):
+            if revocable:
                 revoc = IndyRevocation(self.profile)
-                await revoc.handle_full_registry(rev_reg_id)
+                revoc.check_fill_level(issuer_rev_reg, int(cred_rev_id))
+                if rev_reg.max_creds <= int(cred_rev_id):
+                    await revoc.handle_full_registry(rev_reg_id)
                 del revoc
 
             result = self.get_format_data(CRED_20_ISSUE, json.loads(cred_json))
@@ -456,33 +458,156 @@ class IndyCredFormatHandler(V20CredFormatHandler):
                 f"Cred def '{cred_def_id}' has no active revocation registry"
             )
 
-        async with self._profile.transaction() as txn:
-            detail_record = V20CredExRecordIndy(
-                cred_ex_id=cred_ex_record.cred_ex_id,
-                rev_reg_id=rev_reg_id,
-                cred_rev_id=cred_rev_id,
+        await self._save_issued([(cred_ex_record.cred_ex_id, rev_reg_id, cred_rev_id)])
+
+        return result
+
+    async def issue_credentials(
+        self, cred_ex_records: Sequence[V20CredExRecord], retries: int = 5
+    ) -> Sequence[CredFormatAttachment]:
+        """Issue a batch of indy credentials.
+
+        Credentials for the same credential definition are created together,
+        with the ledger lookups and revocation registry updates done once.
+        """
+        # Temporary shim while the new anoncreds library integration is in progress
+        if self.anoncreds_handler:
+            return await self.anoncreds_handler.issue_credentials(
+                cred_ex_records, retries
+            )
+
+        by_cred_def = {}
+        for pos, cred_ex_record in enumerate(cred_ex_records):
+            await self._check_uniqueness(cred_ex_record.cred_ex_id)
+            cred_offer = cred_ex_record.cred_offer.attachment(
+                IndyCredFormatHandler.format
             )
-            await detail_record.save(txn, reason="v2.0 issue credential")
+            cred_request = cred_ex_record.cred_request.attachment(
+                IndyCredFormatHandler.format
+            )
+            cred_values = cred_ex_record.cred_offer.credential_preview.attr_dict(
+                decode=False
+            )
+            by_cred_def.setdefault(cred_offer["cred_def_id"], []).append(
+                (pos, (cred_offer, cred_request, cred_values))
+            )
+
+        issuer = self.profile.inject(IndyIssuer)
+        multitenant_mgr = self.profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            ledger_exec_inst = IndyLedgerRequestsExecutor(self.profile)
+        else:
+            ledger_exec_inst = self.profile.inject(IndyLedgerRequestsExecutor)
 
-            if revocable and cred_rev_id:
-                issuer_cr_rec = IssuerCredRevRecord(
-                    state=IssuerCredRevRecord.STATE_ISSUED,
-                    cred_ex_id=cred_ex_record.cred_ex_id,
-                    cred_ex_version=IssuerCredRevRecord.VERSION_2,
+        results = [None] * len(cred_ex_records)
+        issued = []
+        for cred_def_id, pending in by_cred_def.items():
+            schema_id = pending[0][1][0]["schema_id"]
+            ledger = (
+                await ledger_exec_inst.get_ledger_for_identifier(
+                    schema_id,
+                    txn_record_type=GET_SCHEMA,
+                )
+            )[1]
+            async with ledger:
+                schema = await ledger.get_schema(schema_id)
+                cred_def = await ledger.get_credential_definition(cred_def_id)
+            revocable = cred_def["value"].get("revocation")
+
+            attempt = 0
+            while pending:
+                if attempt >= max(retries, 1):
+                    raise V20CredFormatError(
+                        f"Cred def '{cred_def_id}' has no active revocation registry"
+                    )
+                if attempt > 0:
+                    LOGGER.info(
+                        "Waiting 2s before retrying credential issuance "
+                        "for cred def '%s'",
+                        cred_def_id,
+                    )
+                    await asyncio.sleep(2)
+
+                if revocable:
+                    revoc = IndyRevocation(self.profile)
+                    registry_info = await revoc.get_or_create_active_registry(
+                        cred_def_id
+                    )
+                    if not registry_info:
+                        attempt += 1
+                        continue
+                    issuer_rev_reg, rev_reg = registry_info
+                    rev_reg_id = issuer_rev_reg.revoc_reg_id
+                    tails_path = rev_reg.tails_local_path
+                else:
+                    rev_reg_id = None
+                    tails_path = None
+
+                try:
+                    created = await issuer.create_credentials(
+                        schema,
+                        [credential for _, credential in pending],
+                        rev_reg_id,
+                        tails_path,
+                    )
+                except IndyIssuerRevocationRegistryFullError:
+                    # unlucky, another instance filled the registry first
+                    attempt += 1
+                    continue
+
+                for (pos, _), (cred_json, cred_rev_id) in zip(pending, created):
+                    results[pos] = self.get_format_data(
+                        CRED_20_ISSUE, json.loads(cred_json)
+                    )
+                    issued.append(
+                        (cred_ex_records[pos].cred_ex_id, rev_reg_id, cred_rev_id)
+                    )
+                pending = pending[len(created) :]
+
+                if revocable:
+                    last_index = max(int(cred_rev_id) for _, cred_rev_id in created)
+                    revoc.check_fill_level(issuer_rev_reg, last_index)
+                    if rev_reg.max_creds <= last_index:
+                        await revoc.handle_full_registry(rev_reg_id)
+
+        await self._save_issued(issued)
+
+        return results
+
+    async def _save_issued(self, issued: Sequence[Tuple[str, str, str]]):
+        """Save the details of issued credentials.
+
+        Args:
+            issued: The credential exchange id, revocation registry id and
+                credential revocation id of each credential issued
+
+        """
+        async with self._profile.transaction() as txn:
+            for cred_ex_id, rev_reg_id, cred_rev_id in issued:
+                detail_record = V20CredExRecordIndy(
+                    cred_ex_id=cred_ex_id,
                     rev_reg_id=rev_reg_id,
                     cred_rev_id=cred_rev_id,
                 )
-                await issuer_cr_rec.save(
-                    txn,
-                    reason=(
-                        "Created issuer cred rev record for "
-                        f"rev reg id {rev_reg_id}, index {cred_rev_id}"
-                    ),
-                )
+                await detail_record.save(txn, reason="v2.0 issue credential")
+
+                if rev_reg_id and cred_rev_id:
+                    issuer_cr_rec = IssuerCredRevRecord(
+                        state=IssuerCredRevRecord.STATE_ISSUED,
+                        cred_ex_id=cred_ex_id,
+                        cred_ex_version=IssuerCredRevRecord.VERSION_2,
+                        rev_reg_id=rev_reg_id,
+                        cred_rev_id=cred_rev_id,
+                    )
+                    await issuer_cr_rec.save(
+                        txn,
+                        reason=(
+                            "Created issuer cred rev record for "
+                            f"rev reg id {rev_reg_id}, index {cred_rev_id}"
+                        ),
+                    )
             await txn.commit()
 
-        return result
-
     async def receive_credential(
         self, cred_ex_record: V20CredExRecord, cred_issue_message: V20CredIssue
     ) -> None:
@@ -528,7 +653,7 @@ class IndyCredFormatHandler(V20CredFormatHandler):
 
         if rev_reg_def:
             rev_reg = RevocationRegistry.from_definition(rev_reg_def, True)
-            await rev_reg.get_or_fetch_local_tails_path()
+            await rev_reg.get_or_fetch_local_tails_path(self.profile)
         try:
             detail_record = await self.get_detail_record(cred_ex_record.cred_ex_id)
             if detail_record is None:
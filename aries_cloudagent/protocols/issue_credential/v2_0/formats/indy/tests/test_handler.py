@@ -757,6 +757,94 @@ class TestV20IndyCredFormatHandler(IsolatedAsyncioTestCase):
             # assert data is encoded as base64
             assert attachment.data.base64
 
+    async def test_issue_credentials_revocable(self):
+        attr_values = {
+            "legalName": "value",
+            "jurisdictionId": "value",
+            "incorporationDate": "value",
+        }
+        cred_preview = V20CredPreview(
+            attributes=[
+                V20CredAttrSpec(name=k, value=v) for (k, v) in attr_values.items()
+            ]
+        )
+        cred_offer = V20CredOffer(
+            credential_preview=cred_preview,
+            formats=[
+                V20CredFormat(
+                    attach_id="0",
+                    format_=ATTACHMENT_FORMAT[CRED_20_OFFER][
+                        V20CredFormat.Format.INDY.api
+                    ],
+                )
+            ],
+            offers_attach=[AttachDecorator.data_base64(INDY_OFFER, ident="0")],
+        )
+        cred_request = V20CredRequest(
+            formats=[
+                V20CredFormat(
+                    attach_id="0",
+                    format_=ATTACHMENT_FORMAT[CRED_20_REQUEST][
+                        V20CredFormat.Format.INDY.api
+                    ],
+                )
+            ],
+            requests_attach=[AttachDecorator.data_base64(INDY_CRED_REQ, ident="0")],
+        )
+        cred_ex_records = [
+            V20CredExRecord(
+                cred_ex_id=f"dummy-cxid-{i}",
+                cred_offer=cred_offer.serialize(),
+                cred_request=cred_request.serialize(),
+                initiator=V20CredExRecord.INITIATOR_SELF,
+                role=V20CredExRecord.ROLE_ISSUER,
+                state=V20CredExRecord.STATE_REQUEST_RECEIVED,
+            )
+            for i in range(3)
+        ]
+
+        # the active registry only has room for two
+        self.issuer.create_credentials = mock.CoroutineMock(
+            side_effect=[
+                [(json.dumps(INDY_CRED), "1"), (json.dumps(INDY_CRED), "2")],
+                [(json.dumps(INDY_CRED), "1")],
+            ]
+        )
+
+        with mock.patch.object(test_module, "IndyRevocation", autospec=True) as revoc:
+            revoc.return_value.get_or_create_active_registry = mock.CoroutineMock(
+                return_value=(
+                    mock.MagicMock(  # active_rev_reg_rec
+                        revoc_reg_id=REV_REG_ID,
+                    ),
+                    mock.MagicMock(  # rev_reg
+                        tails_local_path="dummy-path",
+                        max_creds=2,
+                    ),
+                )
+            )
+            revoc.return_value.handle_full_registry = mock.CoroutineMock()
+
+            results = await self.handler.issue_credentials(cred_ex_records, retries=1)
+
+            assert self.issuer.create_credentials.call_count == 2
+            assert self.issuer.create_credentials.call_args_list[0].args == (
+                SCHEMA,
+                [(INDY_OFFER, INDY_CRED_REQ, attr_values)] * 3,
+                REV_REG_ID,
+                "dummy-path",
+            )
+            assert len(self.issuer.create_credentials.call_args_list[1].args[1]) == 1
+            revoc.return_value.handle_full_registry.assert_called_once_with(REV_REG_ID)
+
+        assert len(results) == 3
+        for cred_format, attachment in results:
+            assert cred_format.attach_id == self.handler.format.api
+            assert attachment.content == INDY_CRED
+        detail = await self.handler.get_detail_record("dummy-cxid-2")
+        assert detail.rev_reg_id == REV_REG_ID
+        assert detail.cred_rev_id == "1"
+
     async def test_issue_credential_non_revocable(self):
         CRED_DEF_NR = deepcopy(CRED_DEF)
         CRED_DEF_NR["value"]["revocation"] = None
@@ -11,6 +11,7 @@ from ......messaging.decorators.attach_decorator import AttachDecorator
 from ......storage.vc_holder.base import VCHolder
 from ......storage.vc_holder.vc_record import VCRecord
 from ......vc.ld_proofs import DocumentLoader
+from ......vc.ld_proofs.document_loader import run_jsonld
 from ......vc.ld_proofs.check import get_properties_without_context
 from ......vc.ld_proofs.error import LinkedDataProofException
 from ......vc.vc_ld import VerifiableCredential, VerifiableCredentialSchema
@@ -392,7 +393,9 @@ class LDProofCredFormatHandler(V20CredFormatHandler):
 
         # Saving expanded type as a cred_tag
         document_loader = self.profile.inject(DocumentLoader)
-        expanded = jsonld.expand(cred_dict, options={"documentLoader": document_loader})
+        expanded = await run_jsonld(
+            jsonld.expand, cred_dict, options={"documentLoader": document_loader}
+        )
         types = JsonLdProcessor.get_values(
             expanded[0],
             "@type",
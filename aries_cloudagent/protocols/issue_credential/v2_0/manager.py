@@ -2,12 +2,13 @@
 
 import logging
 
-from typing import Mapping, Optional, Tuple
+from typing import Mapping, Optional, Sequence, Tuple
 
 from ....connections.models.conn_record import ConnRecord
 from ....core.oob_processor import OobRecord
 from ....core.error import BaseError
 from ....core.profile import Profile
+from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.responder import BaseResponder
 from ....storage.error import StorageError, StorageNotFoundError
 
@@ -482,6 +483,75 @@ class V20CredManager:
 
         """
 
+        self.check_issuable(cred_ex_record)
+
+        # Format specific issue_credential handler
+        issue_formats = []
+        for format in cred_ex_record.cred_request.formats:
+            cred_format = V20CredFormat.Format.get(format.format)
+
+            if cred_format:
+                issue_formats.append(
+                    await cred_format.handler(self.profile).issue_credential(
+                        cred_ex_record
+                    )
+                )
+
+        return await self._record_issued(cred_ex_record, issue_formats, comment)
+
+    async def issue_credentials(
+        self,
+        cred_ex_records: Sequence[V20CredExRecord],
+        *,
+        comment: str = None,
+    ) -> Sequence[Tuple[V20CredExRecord, V20CredIssue]]:
+        """Issue a batch of credentials.
+
+        The credentials of each format are issued together by the format
+        handler, which lets formats share the issuance work across the batch.
+
+        Args:
+            cred_ex_records: credential exchange records for which to issue
+                credentials
+            comment: optional human-readable comment pertaining to credential issue
+
+        Returns:
+            Updated credential exchange record and credential issue message for
+            each record, in order
+
+        """
+        for cred_ex_record in cred_ex_records:
+            self.check_issuable(cred_ex_record)
+
+        by_format = {}
+        for pos, cred_ex_record in enumerate(cred_ex_records):
+            for format in cred_ex_record.cred_request.formats:
+                cred_format = V20CredFormat.Format.get(format.format)
+                if cred_format:
+                    by_format.setdefault(cred_format, []).append(pos)
+
+        # Format specific issue_credentials handler
+        issue_formats = [[] for _ in cred_ex_records]
+        for cred_format, positions in by_format.items():
+            attachments = await cred_format.handler(self.profile).issue_credentials(
+                [cred_ex_records[pos] for pos in positions]
+            )
+            for pos, attachment in zip(positions, attachments):
+                issue_formats[pos].append(attachment)
+
+        return [
+            await self._record_issued(cred_ex_record, formats, comment)
+            for cred_ex_record, formats in zip(cred_ex_records, issue_formats)
+        ]
+
+    def check_issuable(self, cred_ex_record: V20CredExRecord):
+        """Check that a credential can be issued for a credential exchange.
+
+        Raises:
+            V20CredManagerError: If the exchange is not awaiting a credential, or
+                requests no supported credential format
+
+        """
         if cred_ex_record.state != V20CredExRecord.STATE_REQUEST_RECEIVED:
             raise V20CredManagerError(
                 f"Credential exchange {cred_ex_record.cred_ex_id} "
@@ -495,30 +565,30 @@ class V20CredManager:
                 f"cred ex record {cred_ex_record.cred_ex_id}"
             )
 
-        replacement_id = None
-        input_formats = cred_ex_record.cred_request.formats
-
-        if cred_ex_record.cred_offer:
-            cred_offer_message = cred_ex_record.cred_offer
-            replacement_id = cred_offer_message.replacement_id
-
-        # Format specific issue_credential handler
-        issue_formats = []
-        for format in input_formats:
-            cred_format = V20CredFormat.Format.get(format.format)
-
-            if cred_format:
-                issue_formats.append(
-                    await cred_format.handler(self.profile).issue_credential(
-                        cred_ex_record
-                    )
-                )
+        if not any(
+            V20CredFormat.Format.get(format.format)
+            for format in cred_ex_record.cred_request.formats
+        ):
+            raise V20CredManagerError(
+                "Unable to issue credential. No supported formats"
+            )
 
+    async def _record_issued(
+        self,
+        cred_ex_record: V20CredExRecord,
+        issue_formats: Sequence[Tuple[V20CredFormat, AttachDecorator]],
+        comment: str = None,
+    ) -> Tuple[V20CredExRecord, V20CredIssue]:
+        """Build the credential issue message and update the exchange record."""
         if len(issue_formats) == 0:
             raise V20CredManagerError(
                 "Unable to issue credential. No supported formats"
             )
 
+        replacement_id = None
+        if cred_ex_record.cred_offer:
+            replacement_id = cred_ex_record.cred_offer.replacement_id
+
         cred_issue_message = V20CredIssue(
             replacement_id=replacement_id,
             comment=comment,
@@ -17,6 +17,7 @@ from marshmallow import ValidationError, fields, validate, validates_schema
 from ....admin.request_context import AdminRequestContext
 from ....anoncreds.holder import AnonCredsHolderError
 from ....anoncreds.issuer import AnonCredsIssuerError
+from ....anoncreds.revocation import AnonCredsRevocationError
 from ....connections.models.conn_record import ConnRecord
 from ....core.profile import Profile
 from ....indy.holder import IndyHolderError
@@ -411,6 +412,46 @@ class V20CredIssueRequestSchema(OpenAPISchema):
     )
 
 
+class V20CredIssueBatchRequestSchema(OpenAPISchema):
+    """Request schema for issuing credentials for several exchanges at once."""
+
+    cred_ex_ids = fields.List(
+        fields.Str(validate=UUID4_VALIDATE, metadata={"example": UUID4_EXAMPLE}),
+        required=True,
+        validate=validate.Length(min=1),
+        metadata={"description": "Credential exchange identifiers"},
+    )
+    comment = fields.Str(
+        required=False,
+        allow_none=True,
+        metadata={"description": "Human-readable comment"},
+    )
+
+
+class V20CredIssueBatchOutcomeSchema(V20CredExRecordDetailSchema):
+    """Outcome of issuing the credential for one exchange in a batch."""
+
+    cred_ex_id = fields.Str(
+        metadata={
+            "description": "Credential exchange identifier",
+            "example": UUID4_EXAMPLE,
+        }
+    )
+    error = fields.Str(
+        required=False,
+        metadata={"description": "Reason the credential was not issued"},
+    )
+
+
+class V20CredIssueBatchResultSchema(OpenAPISchema):
+    """Result schema for issuing credentials for several exchanges at once."""
+
+    results = fields.List(
+        fields.Nested(V20CredIssueBatchOutcomeSchema),
+        metadata={"description": "Outcome for each credential exchange, in order"},
+    )
+
+
 class V20CredIssueProblemReportRequestSchema(OpenAPISchema):
     """Request schema for sending problem report."""
 
@@ -1486,6 +1527,121 @@ async def credential_exchange_issue(request: web.BaseRequest):
     return web.json_response(result)
 
 
+@docs(
+    tags=["issue-credential v2.0"],
+    summary="Send holders credentials for several exchanges at once",
+)
+@request_schema(V20CredIssueBatchRequestSchema())
+@response_schema(V20CredIssueBatchResultSchema(), 200, description="")
+async def credential_exchange_issue_batch(request: web.BaseRequest):
+    """Request handler for sending credentials for a batch of exchanges.
+
+    The credentials are created together, sharing the issuance work among
+    exchanges requesting the same formats. Exchanges that cannot be issued,
+    such as those not awaiting a credential, are reported individually and
+    left as they are. If creating the credentials of a group of exchanges
+    fails, only the exchanges of that group are abandoned.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The outcome for each credential exchange
+
+    """
+    r_time = get_timer()
+
+    context: AdminRequestContext = request["context"]
+    profile = context.profile
+    outbound_handler = request["outbound_message_router"]
+
+    body = await request.json()
+    cred_ex_ids = body.get("cred_ex_ids") or []
+    comment = body.get("comment")
+
+    cred_manager = V20CredManager(profile)
+    outcomes = {}
+    by_formats = {}
+    async with profile.session() as session:
+        for cred_ex_id in dict.fromkeys(cred_ex_ids):
+            try:
+                cred_ex_record = await V20CredExRecord.retrieve_by_id(
+                    session, cred_ex_id
+                )
+                cred_manager.check_issuable(cred_ex_record)
+                if cred_ex_record.connection_id:
+                    conn_record = await ConnRecord.retrieve_by_id(
+                        session, cred_ex_record.connection_id
+                    )
+                    if not conn_record.is_ready:
+                        outcomes[cred_ex_id] = {
+                            "error": (
+                                f"Connection {cred_ex_record.connection_id} "
+                                "not ready"
+                            )
+                        }
+                        continue
+            except (StorageError, V20CredManagerError) as err:
+                outcomes[cred_ex_id] = {"error": err.roll_up}
+                continue
+            formats = tuple(
+                sorted(format.format for format in cred_ex_record.cred_request.formats)
+            )
+            by_formats.setdefault(formats, []).append(cred_ex_record)
+
+    issued = []
+    for cred_ex_records in by_formats.values():
+        try:
+            issued.extend(
+                await cred_manager.issue_credentials(cred_ex_records, comment=comment)
+            )
+        except (
+            BaseModelError,
+            AnonCredsIssuerError,
+            AnonCredsRevocationError,
+            IndyIssuerError,
+            LedgerError,
+            StorageError,
+            V20CredFormatError,
+            V20CredManagerError,
+        ) as err:
+            LOGGER.exception("Error preparing issued credentials")
+            for cred_ex_record in cred_ex_records:
+                async with profile.session() as session:
+                    await cred_ex_record.save_error_state(session, reason=err.roll_up)
+                await outbound_handler(
+                    problem_report_for_record(
+                        cred_ex_record, ProblemReportReason.ISSUANCE_ABANDONED.value
+                    ),
+                    connection_id=cred_ex_record.connection_id,
+                )
+                outcomes[cred_ex_record.cred_ex_id] = {"error": err.roll_up}
+
+    for cred_ex_record, cred_issue_message in issued:
+        details = await _get_attached_credentials(profile, cred_ex_record)
+        outcomes[cred_ex_record.cred_ex_id] = _format_result_with_details(
+            cred_ex_record, details
+        )
+        await outbound_handler(
+            cred_issue_message, connection_id=cred_ex_record.connection_id
+        )
+        trace_event(
+            context.settings,
+            cred_issue_message,
+            outcome="credential_exchange_issue_batch.END",
+            perf_counter=r_time,
+        )
+
+    return web.json_response(
+        {
+            "results": [
+                {"cred_ex_id": cred_ex_id, **outcomes[cred_ex_id]}
+                for cred_ex_id in dict.fromkeys(cred_ex_ids)
+            ]
+        }
+    )
+
+
 @docs(
     tags=["issue-credential v2.0"],
     summary="Store a received credential",
@@ -1700,6 +1856,10 @@ async def register(app: web.Application):
                 "/issue-credential-2.0/records/{cred_ex_id}/issue",
                 credential_exchange_issue,
             ),
+            web.post(
+                "/issue-credential-2.0/records/issue-batch",
+                credential_exchange_issue_batch,
+            ),
             web.post(
                 "/issue-credential-2.0/records/{cred_ex_id}/store",
                 credential_exchange_store,
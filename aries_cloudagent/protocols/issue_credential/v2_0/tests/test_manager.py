@@ -1157,6 +1157,106 @@ class TestV20CredManager(IsolatedAsyncioTestCase):
             await self.manager.issue_credential(stored_cx_rec)
         assert " state " in str(context.exception)
 
+    async def test_issue_credentials(self):
+        cred_request = V20CredRequest(
+            formats=[
+                V20CredFormat(
+                    attach_id="0",
+                    format_=ATTACHMENT_FORMAT[CRED_20_REQUEST][
+                        V20CredFormat.Format.INDY.api
+                    ],
+                )
+            ],
+            requests_attach=[AttachDecorator.data_base64(INDY_CRED_REQ, ident="0")],
+        )
+        stored_cx_recs = [
+            V20CredExRecord(
+                cred_ex_id=f"dummy-cxid-{i}",
+                connection_id="test_conn_id",
+                cred_request=cred_request,
+                initiator=V20CredExRecord.INITIATOR_SELF,
+                role=V20CredExRecord.ROLE_ISSUER,
+                state=V20CredExRecord.STATE_REQUEST_RECEIVED,
+                thread_id=f"thread-id-{i}",
+            )
+            for i in range(2)
+        ]
+
+        with mock.patch.object(
+            V20CredExRecord, "save", autospec=True
+        ) as mock_save, mock.patch.object(
+            V20CredFormat.Format, "handler"
+        ) as mock_handler:
+            mock_handler.return_value.issue_credentials = mock.CoroutineMock(
+                return_value=[
+                    (
+                        V20CredFormat(
+                            attach_id=V20CredFormat.Format.INDY.api,
+                            format_=ATTACHMENT_FORMAT[CRED_20_ISSUE][
+                                V20CredFormat.Format.INDY.api
+                            ],
+                        ),
+                        AttachDecorator.data_base64(
+                            INDY_CRED, ident=V20CredFormat.Format.INDY.api
+                        ),
+                    )
+                ]
+                * 2
+            )
+            issued = await self.manager.issue_credentials(
+                stored_cx_recs, comment="comment"
+            )
+
+            assert mock_save.call_count == 2
+            mock_handler.return_value.issue_credentials.assert_called_once_with(
+                stored_cx_recs
+            )
+            for i, (ret_cx_rec, ret_cred_issue) in enumerate(issued):
+                assert ret_cx_rec is stored_cx_recs[i]
+                assert ret_cx_rec.state == V20CredExRecord.STATE_ISSUED
+                assert ret_cred_issue.attachment() == INDY_CRED
+                assert ret_cred_issue._thread_id == f"thread-id-{i}"
+
+    async def test_issue_credentials_x_bad_state(self):
+        cred_request = V20CredRequest(
+            formats=[
+                V20CredFormat(
+                    attach_id="0",
+                    format_=ATTACHMENT_FORMAT[CRED_20_REQUEST][
+                        V20CredFormat.Format.INDY.api
+                    ],
+                )
+            ],
+            requests_attach=[AttachDecorator.data_base64(INDY_CRED_REQ, ident="0")],
+        )
+        stored_cx_recs = [
+            V20CredExRecord(
+                cred_request=cred_request,
+                state=V20CredExRecord.STATE_REQUEST_RECEIVED,
+            ),
+            V20CredExRecord(state=V20CredExRecord.STATE_PROPOSAL_SENT),
+        ]
+
+        with mock.patch.object(V20CredFormat.Format, "handler") as mock_handler:
+            with self.assertRaises(V20CredManagerError) as context:
+                await self.manager.issue_credentials(stored_cx_recs)
+            assert " state " in str(context.exception)
+            mock_handler.assert_not_called()
+
+    async def test_check_issuable_x_no_supported_formats(self):
+        cred_request = V20CredRequest(
+            formats=[V20CredFormat(attach_id="0", format_="unknown/format@v1.0")],
+            requests_attach=[AttachDecorator.data_base64({}, ident="0")],
+        )
+        with self.assertRaises(V20CredManagerError) as context:
+            self.manager.check_issuable(
+                V20CredExRecord(
+                    cred_request=cred_request,
+                    state=V20CredExRecord.STATE_REQUEST_RECEIVED,
+                )
+            )
+        assert "No supported formats" in str(context.exception)
+
     async def test_receive_cred(self):
         connection_id = "test_conn_id"
 
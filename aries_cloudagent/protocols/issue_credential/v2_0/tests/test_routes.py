@@ -1217,6 +1217,162 @@ class TestV20CredRoutes(IsolatedAsyncioTestCase):
                 }
             )
 
+    async def test_credential_exchange_issue_batch(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={"cred_ex_ids": ["a", "b", "c", "a", "d"], "comment": "hi"}
+        )
+
+        with mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, mock.patch.object(
+            test_module, "V20CredManager", autospec=True
+        ) as mock_cred_mgr, mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec_cls, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response, mock.patch.object(
+            V20CredFormat.Format, "handler"
+        ) as mock_handler:
+            cx_recs = {
+                ident: mock.MagicMock(
+                    cred_ex_id=ident,
+                    connection_id=f"conn-{ident}",
+                    save_error_state=mock.CoroutineMock(),
+                )
+                for ident in ("a", "c", "d")
+            }
+
+            def check_issuable(cred_ex_record):
+                if cred_ex_record.cred_ex_id == "d":
+                    raise test_module.V20CredManagerError("done state")
+
+            async def retrieve(session, ident):
+                if ident not in cx_recs:
+                    raise test_module.StorageNotFoundError("not found")
+                return cx_recs[ident]
+
+            async def retrieve_conn(session, conn_id):
+                return mock.MagicMock(is_ready=conn_id == "conn-a")
+
+            mock_cx_rec_cls.retrieve_by_id = mock.CoroutineMock(side_effect=retrieve)
+            mock_conn_rec.retrieve_by_id = mock.CoroutineMock(side_effect=retrieve_conn)
+            mock_handler.return_value.get_detail_record = mock.CoroutineMock(
+                return_value=None
+            )
+            mock_cred_mgr.return_value.check_issuable = mock.MagicMock(
+                side_effect=check_issuable
+            )
+            mock_cred_mgr.return_value.issue_credentials = mock.CoroutineMock(
+                return_value=[(cx_recs["a"], mock.MagicMock())]
+            )
+
+            await test_module.credential_exchange_issue_batch(self.request)
+
+            mock_cred_mgr.return_value.issue_credentials.assert_called_once_with(
+                [cx_recs["a"]], comment="hi"
+            )
+            self.request["outbound_message_router"].assert_called_once()
+            results = mock_response.call_args.args[0]["results"]
+            assert [result["cred_ex_id"] for result in results] == [
+                "a",
+                "b",
+                "c",
+                "d",
+            ]
+            assert results[0]["cred_ex_record"] == cx_recs["a"].serialize.return_value
+            assert "error" not in results[0]
+            assert "not found" in results[1]["error"]
+            assert "not ready" in results[2]["error"]
+            assert "done state" in results[3]["error"]
+            # exchanges that cannot be issued are left as they are
+            cx_recs["d"].save_error_state.assert_not_called()
+
+    async def test_credential_exchange_issue_batch_x(self):
+        self.request.json = mock.CoroutineMock(return_value={"cred_ex_ids": ["a"]})
+
+        with mock.patch.object(
+            test_module, "V20CredManager", autospec=True
+        ) as mock_cred_mgr, mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec_cls, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_cx_rec = mock.MagicMock(
+                cred_ex_id="a",
+                connection_id=None,
+                save_error_state=mock.CoroutineMock(),
+            )
+            mock_cx_rec_cls.retrieve_by_id = mock.CoroutineMock(
+                return_value=mock_cx_rec
+            )
+            mock_cred_mgr.return_value.issue_credentials = mock.CoroutineMock(
+                side_effect=test_module.V20CredManagerError("boom")
+            )
+
+            await test_module.credential_exchange_issue_batch(self.request)
+
+            mock_cx_rec.save_error_state.assert_called_once()
+            self.request["outbound_message_router"].assert_called_once()
+            mock_response.assert_called_once_with(
+                {"results": [{"cred_ex_id": "a", "error": "boom."}]}
+            )
+
+    async def test_credential_exchange_issue_batch_x_format_group(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={"cred_ex_ids": ["a", "b", "c"]}
+        )
+
+        with mock.patch.object(
+            test_module, "V20CredManager", autospec=True
+        ) as mock_cred_mgr, mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec_cls, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response, mock.patch.object(
+            V20CredFormat.Format, "handler"
+        ) as mock_handler:
+            cx_recs = {
+                ident: mock.MagicMock(
+                    cred_ex_id=ident,
+                    connection_id=None,
+                    cred_request=mock.MagicMock(
+                        formats=[
+                            mock.MagicMock(
+                                format="ld_proof" if ident == "b" else "indy"
+                            )
+                        ]
+                    ),
+                    save_error_state=mock.CoroutineMock(),
+                )
+                for ident in ("a", "b", "c")
+            }
+
+            async def retrieve(session, ident):
+                return cx_recs[ident]
+
+            async def issue_credentials(cred_ex_records, comment=None):
+                if cred_ex_records == [cx_recs["b"]]:
+                    raise test_module.V20CredFormatError("boom")
+                return [(rec, mock.MagicMock()) for rec in cred_ex_records]
+
+            mock_cx_rec_cls.retrieve_by_id = mock.CoroutineMock(side_effect=retrieve)
+            mock_handler.return_value.get_detail_record = mock.CoroutineMock(
+                return_value=None
+            )
+            mock_cred_mgr.return_value.issue_credentials = mock.CoroutineMock(
+                side_effect=issue_credentials
+            )
+
+            await test_module.credential_exchange_issue_batch(self.request)
+
+            # one issuance per group of exchanges requesting the same formats
+            assert mock_cred_mgr.return_value.issue_credentials.await_count == 2
+            cx_recs["a"].save_error_state.assert_not_called()
+            cx_recs["b"].save_error_state.assert_called_once()
+            cx_recs["c"].save_error_state.assert_not_called()
+            results = mock_response.call_args.args[0]["results"]
+            assert ["error" in result for result in results] == [False, True, False]
+
     async def test_credential_exchange_issue_bad_cred_ex_id(self):
         self.request.json = mock.CoroutineMock()
         self.request.match_info = {"cred_ex_id": "dummy"}
@@ -15,7 +15,9 @@ import logging
 from datetime import datetime
 from dateutil.parser import parse as dateutil_parser
 from dateutil.parser import ParserError
-from jsonpath_ng import parse
+from functools import lru_cache
+from jsonpath_ng import JSONPath, parse
+from jsonpath_ng.jsonpath import DatumInContext
 from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
 from typing import Sequence, Optional, Tuple, Union, Dict, List
@@ -68,6 +70,28 @@ LIST_INDEX_PATTERN = re.compile(r"\[(\W+)\]|\[(\d+)\]")
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> JSONPath:
+    """Parse a JSONPath expression, reusing the parsed expressions of past calls.
+
+    Parsing builds the parser tables anew each time, which is far costlier
+    than matching the parsed expression against a credential.
+    """
+    return parse(path)
+
+
+@lru_cache(maxsize=1024)
+def _timezone_aware_datetime(datetime_str: str) -> datetime:
+    """Convert string with PYTZ timezone to datetime, caching filter bounds."""
+    if PYTZ_TIMEZONE_PATTERN.search(datetime_str):
+        result = PYTZ_TIMEZONE_PATTERN.search(datetime_str).group(1)
+        datetime_str = datetime_str.replace(result, "")
+        return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
+    else:
+        utc = pytz.UTC
+        return dateutil_parser(datetime_str).replace(tzinfo=utc)
+
+
 class DIFPresExchError(BaseError):
     """Base class for DIF Presentation Exchange related errors."""
 
@@ -112,6 +136,8 @@ class DIFPresExchHandler:
             self.proof_type = proof_type
         self.is_holder = False
         self.reveal_doc_frame = reveal_doc
+        # matches of field paths, per credential dict and path
+        self._field_index: Dict[int, Tuple[dict, Dict[str, List[DatumInContext]]]] = {}
 
     async def _get_issue_suite(
         self,
@@ -367,6 +393,7 @@ class DIFPresExchHandler:
         document_loader = self.profile.inject(DocumentLoader)
 
         result = []
+        is_holder_field_ids = self.field_ids_for_is_holder(constraints)
         for credential in credentials:
             if constraints.subject_issuer == "required" and not self.subject_is_issuer(
                 credential=credential
@@ -374,7 +401,6 @@ class DIFPresExchHandler:
                 continue
 
             applicable = False
-            is_holder_field_ids = self.field_ids_for_is_holder(constraints)
             for field in constraints._fields:
                 applicable = await self.filter_by_field(field, credential)
                 # all fields in the constraint should be satisfied
@@ -482,6 +508,8 @@ class DIFPresExchHandler:
         if isinstance(schemas, dict):
             schemas = [schemas]
         schema_ids = [schema.get("id") for schema in schemas]
+        # the dict may have been updated since its fields were indexed
+        self._field_index.pop(id(cred_dict), None)
         document_loader = self.profile.inject(DocumentLoader)
         expanded = jsonld.expand(cred_dict, options={"documentLoader": document_loader})
         types = JsonLdProcessor.get_values(
@@ -513,8 +541,7 @@ class DIFPresExchHandler:
             unflatten_dict = {}
             for field in constraints._fields:
                 for path in field.paths:
-                    jsonpath = parse(path)
-                    match = jsonpath.find(credential_dict)
+                    match = self.find_field(credential_dict, path)
                     if len(match) == 0:
                         continue
                     for match_item in match:
@@ -558,6 +585,29 @@ class DIFPresExchHandler:
         new_credential.update(unflatten(unflatten_dict))
         return new_credential
 
+    def find_field(self, credential_dict: dict, path: str) -> List[DatumInContext]:
+        """Find the matches of a field path in a credential.
+
+        The matches are indexed per credential, so that credentials evaluated
+        against several descriptors or requirements match each path once.
+
+        Args:
+            credential_dict: credential to match the path in
+            path: JSONPath expression of the field
+        Return:
+            List of matches
+
+        """
+        entry = self._field_index.get(id(credential_dict))
+        if entry is None or entry[0] is not credential_dict:
+            entry = (credential_dict, {})
+            self._field_index[id(credential_dict)] = entry
+        match = entry[1].get(path)
+        if match is None:
+            match = compile_path(path).find(credential_dict)
+            entry[1][path] = match
+        return match
+
     async def filter_by_field(self, field: DIFField, credential: VCRecord) -> bool:
         """Apply filter on VCRecord.
 
@@ -578,8 +628,7 @@ class DIFPresExchHandler:
                     "is not currently supported"
                 )
             try:
-                jsonpath = parse(path)
-                match = jsonpath.find(credential_dict)
+                match = self.find_field(credential_dict, path)
             except KeyError:
                 continue
             if len(match) == 0:
@@ -613,13 +662,7 @@ class DIFPresExchHandler:
 
     def string_to_timezone_aware_datetime(self, datetime_str: str) -> datetime:
         """Convert string with PYTZ timezone to datetime for comparison."""
-        if PYTZ_TIMEZONE_PATTERN.search(datetime_str):
-            result = PYTZ_TIMEZONE_PATTERN.search(datetime_str).group(1)
-            datetime_str = datetime_str.replace(result, "")
-            return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
-        else:
-            utc = pytz.UTC
-            return dateutil_parser(datetime_str).replace(tzinfo=utc)
+        return _timezone_aware_datetime(datetime_str)
 
     def validate_patch(self, to_check: any, _filter: Filter) -> bool:
         """Apply filter on match_value.
@@ -1394,7 +1437,7 @@ class DIFPresExchHandler:
             constraint = inp_desc_id_contraint_map.get(desc_map_item_id)
             schema_filter = inp_desc_id_schemas_map.get(desc_map_item_id)
             desc_map_item_path = desc_map_item.get("path")
-            jsonpath = parse(desc_map_item_path)
+            jsonpath = compile_path(desc_map_item_path)
             match = jsonpath.find(pres)
             if len(match) == 0:
                 raise DIFPresExchError(
@@ -1433,7 +1476,7 @@ class DIFPresExchHandler:
         """Return field_paths that are applicable to oneof_filter."""
         applied_field_paths = []
         for path in field_paths:
-            jsonpath = parse(path)
+            jsonpath = compile_path(path)
             match = jsonpath.find(cred_dict)
             if len(match) > 0:
                 applied_field_paths.append(path)
@@ -1558,7 +1601,7 @@ class DIFPresExchHandler:
                 return path
             split_by_index = re.split(r"\[(\d+)\]", to_check, 1)
             if len(split_by_index) > 1:
-                jsonpath = parse(split_by_index[0])
+                jsonpath = compile_path(split_by_index[0])
                 match = jsonpath.find(cred_dict)
                 if len(match) > 0:
                     if isinstance(match[0].value, dict):
@@ -1570,7 +1613,7 @@ class DIFPresExchHandler:
 
     def nested_get(self, input_dict: dict, path: str) -> Union[Dict, List]:
         """Return dict or list from nested dict given list of nested_key."""
-        jsonpath = parse(path)
+        jsonpath = compile_path(path)
         match = jsonpath.find(input_dict)
         if len(match) > 1:
             return_list = []
@@ -42,6 +42,7 @@ from ..pres_exch import (
 from ..pres_exch_handler import (
     DIFPresExchHandler,
     DIFPresExchError,
+    compile_path,
 )
 
 from .test_data import (
@@ -3729,6 +3730,51 @@ class TestPresExchHandler:
             field = DIFField.deserialize({"path": ["$.credentialSubject.test"]})
             assert await dif_pres_exch_handler.filter_by_field(field, vc_record_cred)
 
+    @pytest.mark.asyncio
+    async def test_filter_by_field_indexed(self, profile):
+        dif_pres_exch_handler = DIFPresExchHandler(profile)
+        cred_dict = {
+            "@context": [],
+            "issuer": "did:example:issuer",
+            "credentialSubject": {"givenName": "Alice", "age": 21},
+        }
+        credential = VCRecord(
+            contexts=[],
+            expanded_types=[],
+            issuer_id="did:example:issuer",
+            subject_ids=[],
+            proof_types=[],
+            schema_ids=[],
+            cred_value=cred_dict,
+        )
+        fields = [
+            DIFField.deserialize(
+                {
+                    "path": ["$.credentialSubject.age"],
+                    "filter": {"type": "number", "minimum": minimum},
+                }
+            )
+            for minimum in (18, 30)
+        ]
+        assert compile_path("$.credentialSubject.age") is compile_path(
+            "$.credentialSubject.age"
+        )
+        with mock.patch.object(
+            test_module, "compile_path", wraps=compile_path
+        ) as mock_compile:
+            assert await dif_pres_exch_handler.filter_by_field(fields[0], credential)
+            assert not await dif_pres_exch_handler.filter_by_field(
+                fields[1], credential
+            )
+        # the path is matched once per credential
+        mock_compile.assert_called_once_with("$.credentialSubject.age")
+
+        # a credential updated in place is matched again
+        cred_dict["credentialSubject"]["age"] = 31
+        with mock.patch.object(test_module.jsonld, "expand", mock.MagicMock()):
+            dif_pres_exch_handler.create_vcrecord(cred_dict)
+        assert await dif_pres_exch_handler.filter_by_field(fields[1], credential)
+
     def test_string_to_timezone_aware_datetime(self, profile):
         dif_pres_exch_handler = DIFPresExchHandler(
             profile, proof_type=BbsBlsSignature2020.signature_type
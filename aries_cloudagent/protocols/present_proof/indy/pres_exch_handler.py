@@ -179,7 +179,9 @@ class IndyPresExchHandler:
             if rev_reg_id not in revocation_states:
                 revocation_states[rev_reg_id] = {}
             rev_reg = revocation_registries[rev_reg_id]
-            tails_local_path = await rev_reg.get_or_fetch_local_tails_path()
+            tails_local_path = await rev_reg.get_or_fetch_local_tails_path(
+                self._profile
+            )
             try:
                 revocation_states[rev_reg_id][delta_timestamp] = json.loads(
                     await holder.create_revocation_state(
@@ -331,8 +331,6 @@ class AnonCredsPresExchangeHandler(V20PresFormatHandler):
             rev_lists,
         ) = await verifier.process_pres_identifiers(indy_proof["identifiers"])
 
-        verifier = AnonCredsVerifier(self._profile)
-
         (verified, verified_msgs) = await verifier.verify_presentation(
             indy_proof_request,
             indy_proof,
@@ -21,7 +21,11 @@ from ......vc.vc_ld.manager import VcLdpManager
 from ......vc.vc_ld.models.options import LDProofVCOptions
 from ......vc.vc_ld.models.presentation import VerifiablePresentation
 from .....problem_report.v1_0.message import ProblemReport
-from ....dif.pres_exch import PresentationDefinition, SchemaInputDescriptor
+from ....dif.pres_exch import (
+    Constraints,
+    PresentationDefinition,
+    SchemaInputDescriptor,
+)
 from ....dif.pres_exch_handler import DIFPresExchError, DIFPresExchHandler
 from ....dif.pres_proposal_schema import DIFProofProposalSchema
 from ....dif.pres_request_schema import DIFPresSpecSchema, DIFProofRequestSchema
@@ -40,6 +44,9 @@ from ..handler import V20PresFormatHandler, V20PresFormatHandlerError
 
 LOGGER = logging.getLogger(__name__)
 
+# paths of constraint fields matching the issuer id tag of credentials
+ISSUER_FIELD_PATHS = {"$.issuer", "$.issuer.id"}
+
 
 class DIFPresFormatHandler(V20PresFormatHandler):
     """DIF presentation format handler."""
@@ -184,6 +191,9 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                 )
                 uri_list = []
                 one_of_uri_groups = []
+                issuer_id_filter = self.retrieve_issuer_id_from_constraints(
+                    input_descriptor.constraint
+                )
                 if input_descriptor.schemas:
                     if input_descriptor.schemas.oneof_filter:
                         one_of_uri_groups = (
@@ -297,7 +307,9 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                     cred_group_record_ids = set()
                     for uri_group in one_of_uri_groups:
                         search = holder.search_credentials(
-                            proof_types=proof_type, pd_uri_list=uri_group
+                            proof_types=proof_type,
+                            pd_uri_list=uri_group,
+                            issuer_id=issuer_id_filter,
                         )
                         max_results = 1000
                         cred_group = await search.fetch(max_results)
@@ -311,7 +323,9 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                         records = records + cred_group_vcrecord_list
                 else:
                     search = holder.search_credentials(
-                        proof_types=proof_type, pd_uri_list=uri_list
+                        proof_types=proof_type,
+                        pd_uri_list=uri_list,
+                        issuer_id=issuer_id_filter,
                     )
                     # Defaults to page_size but would like to include all
                     # For now, setting to 1000
@@ -401,6 +415,40 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                 group_schema_uri_list.append(uri_list)
         return group_schema_uri_list
 
+    def retrieve_issuer_id_from_constraints(
+        self, constraints: Optional[Constraints]
+    ) -> Optional[str]:
+        """Retrieve the issuer a descriptor requires, to search credentials by.
+
+        Only a field matching the issuer alone, against a constant, restricts
+        the applicable credentials to those with the issuer id tag.
+        """
+        for field in (constraints and constraints._fields) or []:
+            _filter = field._filter
+            if (
+                field.paths
+                and set(field.paths) <= ISSUER_FIELD_PATHS
+                and _filter
+                and isinstance(_filter.const, str)
+                and not _filter._not
+                and _filter._type in (None, "string")
+                and all(
+                    value is None
+                    for value in (
+                        _filter.pattern,
+                        _filter.minimum,
+                        _filter.maximum,
+                        _filter.min_length,
+                        _filter.max_length,
+                        _filter.exclusive_min,
+                        _filter.exclusive_max,
+                        _filter.enums,
+                    )
+                )
+            ):
+                return _filter.const
+        return None
+
     async def receive_pres(self, message: V20Pres, pres_ex_record: V20PresExRecord):
         """Receive a presentation, from message in context on manager creation."""
         dif_handler = DIFPresExchHandler(self._profile)
@@ -15,7 +15,7 @@ from .......vc.tests.document_loader import custom_document_loader
 from .......vc.vc_ld.manager import VcLdpManager
 from .......vc.vc_ld.validation_result import PresentationVerificationResult
 from .......wallet.base import BaseWallet
-from .....dif.pres_exch import SchemaInputDescriptor
+from .....dif.pres_exch import Constraints, SchemaInputDescriptor
 from .....dif.pres_exch_handler import DIFPresExchError, DIFPresExchHandler
 from .....dif.tests.test_data import (
     EXPANDED_CRED_FHIR_TYPE_1,
@@ -1507,6 +1507,38 @@ class TestDIFFormatHandler(IsolatedAsyncioTestCase):
         )
         assert test_one_of_uri_groups == [["test123", "test321"]]
 
+    async def test_retrieve_issuer_id_from_constraints(self):
+        def _constraints(*fields):
+            return Constraints.deserialize({"fields": list(fields)})
+
+        issuer_field = {
+            "path": ["$.issuer.id", "$.issuer"],
+            "filter": {"type": "string", "const": "did:example:issuer"},
+        }
+        assert (
+            self.handler.retrieve_issuer_id_from_constraints(
+                _constraints({"path": ["$.credentialSubject.id"]}, issuer_field)
+            )
+            == "did:example:issuer"
+        )
+        # fields also matching other paths or values do not restrict the issuer
+        for field in (
+            {**issuer_field, "path": ["$.issuer", "$.vc.issuer"]},
+            {
+                **issuer_field,
+                "filter": {"not": {"type": "string", "const": "did:example:issuer"}},
+            },
+            {
+                **issuer_field,
+                "filter": {**issuer_field["filter"], "pattern": "did:example:.*"},
+            },
+            {"path": ["$.issuer"]},
+        ):
+            assert not self.handler.retrieve_issuer_id_from_constraints(
+                _constraints(field)
+            )
+        assert not self.handler.retrieve_issuer_id_from_constraints(None)
+
     async def test_verify_received_pres_a(self):
         dif_pres = V20Pres(
             formats=[
@@ -26,6 +26,7 @@ from .error import (
 )
 from .models.issuer_rev_reg_record import IssuerRevRegRecord
 from .models.revocation_registry import RevocationRegistry
+from .provisioner import DEFAULT_STANDBY_REGISTRIES, RegistryProvisioner
 from .util import notify_revocation_reg_init_event
 
 LOGGER = logging.getLogger(__name__)
@@ -110,8 +111,92 @@ class IndyRevocation:
         return record
 
     async def handle_full_registry(self, revoc_reg_id: str):
-        """Update the registry status and start the next registry generation."""
-        await self._set_registry_status(revoc_reg_id, IssuerRevRegRecord.STATE_FULL)
+        """Mark a registry as full and replenish the standby registries.
+
+        Issuance continues from the oldest of the other active registries. The
+        standby registries are replenished in the background when a registry
+        provisioner is configured.
+        """
+        async with self._profile.transaction() as txn:
+            registry = await IssuerRevRegRecord.retrieve_by_revoc_reg_id(
+                txn, revoc_reg_id, for_update=True
+            )
+            if registry.state == IssuerRevRegRecord.STATE_FULL:
+                return
+            await registry.set_state(txn, IssuerRevRegRecord.STATE_FULL)
+            await txn.commit()
+
+        provisioner = self._profile.inject_or(RegistryProvisioner)
+        if provisioner:
+            self._provision_in_background(provisioner, registry)
+        else:
+            await self.provision_standby_registries(
+                registry.cred_def_id, registry.max_cred_num, registry.revoc_def_type
+            )
+
+    async def provision_standby_registries(
+        self,
+        cred_def_id: str,
+        max_cred_num: int = None,
+        revoc_def_type: str = None,
+    ) -> int:
+        """Create the missing standby registries of a credential definition.
+
+        Standby registries are active registries besides the one issuing, ready
+        to take over once it fills. Registries in creation count towards them.
+
+        Args:
+            cred_def_id: ID of the base credential definition
+            max_cred_num: The maximum credential number of new registries
+            revoc_def_type: The revocation registry type of new registries
+
+        Returns:
+            The number of registries created
+
+        """
+        provisioner = self._profile.inject_or(RegistryProvisioner)
+        standby = provisioner.standby if provisioner else DEFAULT_STANDBY_REGISTRIES
+        async with self._profile.session() as session:
+            registries = await IssuerRevRegRecord.query_by_cred_def_id(
+                session, cred_def_id
+            )
+        usable = [
+            rec
+            for rec in registries
+            if rec.state not in IssuerRevRegRecord.TERMINAL_STATES
+        ]
+        missing = standby + 1 - len(usable)
+        for _ in range(missing):
+            await self.init_issuer_registry(cred_def_id, max_cred_num, revoc_def_type)
+        return max(missing, 0)
+
+    def _provision_in_background(
+        self,
+        provisioner: RegistryProvisioner,
+        registry: IssuerRevRegRecord,
+        filled: bool = False,
+    ):
+        provisioner.provision(
+            self._profile,
+            registry.cred_def_id,
+            lambda: self.provision_standby_registries(
+                registry.cred_def_id, registry.max_cred_num, registry.revoc_def_type
+            ),
+            registry.revoc_reg_id if filled else None,
+        )
+
+    def check_fill_level(self, registry: IssuerRevRegRecord, issued: int):
+        """Replenish the standby registries once a registry reaches the watermark.
+
+        Args:
+            registry: The registry issuing credentials
+            issued: The number of credentials issued from the registry
+        """
+        provisioner = self._profile.inject_or(RegistryProvisioner)
+        if provisioner and provisioner.filled(
+            registry.revoc_reg_id, issued, registry.max_cred_num
+        ):
+            self._provision_in_background(provisioner, registry, filled=True)
 
     async def decommission_registry(self, cred_def_id: str):
         """Decommission post-init registries and start the next registry generation."""
@@ -234,7 +319,7 @@ class IndyRevocation:
                 cred_def_id
             )
             rev_reg = active_rev_reg_rec.get_registry()
-            await rev_reg.get_or_fetch_local_tails_path()
+            await rev_reg.get_or_fetch_local_tails_path(self._profile)
             return active_rev_reg_rec, rev_reg
         except StorageNotFoundError:
             pass
@@ -1,5 +1,6 @@
 """Classes to manage credential revocation."""
 
+import asyncio
 import json
 import logging
 from typing import Mapping, Optional, Sequence, Text, Tuple
@@ -21,9 +22,13 @@ from ..storage.error import StorageNotFoundError
 from .indy import IndyRevocation
 from .models.issuer_cred_rev_record import IssuerCredRevRecord
 from .models.issuer_rev_reg_record import IssuerRevRegRecord
+from .publisher import PendingRevocationPublisher, publish_lock
 from .util import notify_pending_cleared_event, notify_revocation_published_event
 
 
+DEFAULT_MAX_CONCURRENT_PUBLISH = 4
+
+
 class RevocationManagerError(BaseError):
     """Revocation manager error."""
 
@@ -135,56 +140,64 @@ class RevocationManager:
 
         if publish:
             rev_reg = await revoc.get_ledger_registry(rev_reg_id)
-            await rev_reg.get_or_fetch_local_tails_path()
-            # pick up pending revocations on input revocation registry
-            crids = (issuer_rr_rec.pending_pub or []) + [cred_rev_id]
-            (delta_json, _) = await issuer.revoke_credentials(
-                issuer_rr_rec.cred_def_id,
-                issuer_rr_rec.revoc_reg_id,
-                issuer_rr_rec.tails_local_path,
-                crids,
-            )
-            async with self._profile.transaction() as txn:
-                issuer_rr_upd = await IssuerRevRegRecord.retrieve_by_id(
-                    txn, issuer_rr_rec.record_id, for_update=True
+            await rev_reg.get_or_fetch_local_tails_path(self._profile)
+            async with publish_lock(self._profile, rev_reg_id):
+                # another publication may have taken some while waiting for the lock
+                issuer_rr_rec = await self._retrieve_for_publish(issuer_rr_rec)
+                # pick up pending revocations on input revocation registry
+                crids = (issuer_rr_rec.pending_pub or []) + [cred_rev_id]
+                (delta_json, _) = await issuer.revoke_credentials(
+                    issuer_rr_rec.cred_def_id,
+                    issuer_rr_rec.revoc_reg_id,
+                    issuer_rr_rec.tails_local_path,
+                    crids,
                 )
-                if delta_json:
-                    issuer_rr_upd.revoc_reg_entry = json.loads(delta_json)
-                await issuer_rr_upd.clear_pending(txn, crids)
-                await txn.commit()
-            await self.set_cred_revoked_state(rev_reg_id, crids)
-            if delta_json:
-                if write_ledger:
-                    rev_entry_resp = await issuer_rr_upd.send_entry(self._profile)
-                    await notify_revocation_published_event(
-                        self._profile, rev_reg_id, [cred_rev_id]
+                async with self._profile.transaction() as txn:
+                    issuer_rr_upd = await IssuerRevRegRecord.retrieve_by_id(
+                        txn, issuer_rr_rec.record_id, for_update=True
                     )
-                    return rev_entry_resp
-                else:
-                    async with self._profile.session() as session:
-                        try:
-                            connection_record = await ConnRecord.retrieve_by_id(
-                                session, endorser_conn_id
-                            )
-                        except StorageNotFoundError:
-                            raise RevocationManagerError(
-                                "No endorser connection record found "
-                                f"for id: {endorser_conn_id}"
+                    if delta_json:
+                        issuer_rr_upd.revoc_reg_entry = json.loads(delta_json)
+                    await issuer_rr_upd.clear_pending(txn, crids)
+                    await txn.commit()
+                await self.set_cred_revoked_state(rev_reg_id, crids)
+                if delta_json:
+                    if write_ledger:
+                        rev_entry_resp = await issuer_rr_upd.send_entry(self._profile)
+                        await notify_revocation_published_event(
+                            self._profile, rev_reg_id, [cred_rev_id]
+                        )
+                        return rev_entry_resp
+                    else:
+                        async with self._profile.session() as session:
+                            try:
+                                connection_record = await ConnRecord.retrieve_by_id(
+                                    session, endorser_conn_id
+                                )
+                            except StorageNotFoundError:
+                                raise RevocationManagerError(
+                                    "No endorser connection record found "
+                                    f"for id: {endorser_conn_id}"
+                                )
+                            endorser_info = await connection_record.metadata_get(
+                                session, "endorser_info"
                             )
-                        endorser_info = await connection_record.metadata_get(
-                            session, "endorser_info"
+                        endorser_did = endorser_info["endorser_did"]
+                        rev_entry_resp = await issuer_rr_upd.send_entry(
+                            self._profile,
+                            write_ledger=write_ledger,
+                            endorser_did=endorser_did,
                         )
-                    endorser_did = endorser_info["endorser_did"]
-                    rev_entry_resp = await issuer_rr_upd.send_entry(
-                        self._profile,
-                        write_ledger=write_ledger,
-                        endorser_did=endorser_did,
-                    )
-                    return rev_entry_resp
+                        return rev_entry_resp
         else:
             async with self._profile.transaction() as txn:
                 await issuer_rr_rec.mark_pending(txn, cred_rev_id)
                 await txn.commit()
+            publisher = self._profile.inject_or(PendingRevocationPublisher)
+            if publisher:
+                publisher.pending(
+                    self._profile, rev_reg_id, len(issuer_rr_rec.pending_pub)
+                )
             return None
 
     async def update_rev_reg_revoked_state(
@@ -209,12 +222,199 @@ class RevocationManager:
             genesis_transactions,
         )
 
+    async def revoke_credentials(
+        self,
+        revocations: Sequence[Mapping[str, str]],
+        publish: bool = False,
+        notify: bool = False,
+        notify_version: str = None,
+        comment: str = None,
+        endorser_conn_id: str = None,
+        write_ledger: bool = True,
+    ) -> Tuple[Sequence[dict], Sequence[dict]]:
+        """Revoke many credentials, grouped by revocation registry.
+
+        The credentials of each revocation registry are marked pending together
+        or, when publishing, revoked with a single accumulator update along with
+        any revocations already pending against the registry.
+
+        Args:
+            revocations: the credentials to revoke, each identified by its
+                rev_reg_id and cred_rev_id or by its cred_ex_id; each may also
+                carry the connection_id and thread_id for its notification
+            publish: whether to publish the resulting revocation registry deltas
+            notify: whether to notify the credential recipients
+            notify_version: the version of the revocation notifications to send
+            comment: a comment to include in the revocation notifications
+            endorser_conn_id: connection identifier for endorser connection to use
+            write_ledger: whether to write the revocation registry entries to the
+                ledger, rather than prepare them for endorsement
+
+        Returns:
+            The outcome for each credential, in order, and the responses from
+            sending each revocation registry entry
+
+        """
+        outcomes = []
+        for item in revocations:
+            outcome = {
+                key: item[key]
+                for key in ("rev_reg_id", "cred_rev_id", "cred_ex_id")
+                if item.get(key)
+            }
+            outcomes.append(outcome)
+
+        cred_ex_ids = [o["cred_ex_id"] for o in outcomes if "cred_ex_id" in o]
+        if cred_ex_ids:
+            async with self._profile.session() as session:
+                recs = await IssuerCredRevRecord.query(
+                    session, {"cred_ex_id": {"$in": cred_ex_ids}}
+                )
+            by_cred_ex_id = {rec.cred_ex_id: rec for rec in recs}
+            for outcome in outcomes:
+                if "cred_ex_id" not in outcome:
+                    continue
+                rec = by_cred_ex_id.get(outcome["cred_ex_id"])
+                if rec:
+                    outcome["rev_reg_id"] = rec.rev_reg_id
+                    outcome["cred_rev_id"] = rec.cred_rev_id
+                else:
+                    outcome["error"] = (
+                        "No issuer credential revocation record found for "
+                        f"credential exchange id {outcome['cred_ex_id']}"
+                    )
+
+        groups = {}
+        for index, outcome in enumerate(outcomes):
+            if "error" not in outcome:
+                groups.setdefault(outcome["rev_reg_id"], []).append(index)
+        if not groups:
+            return outcomes, []
+
+        endorser_did = None
+        if publish and not write_ledger:
+            endorser_did = await self._get_endorser_did(endorser_conn_id)
+
+        if notify:
+            async with self._profile.transaction() as txn:
+                for indexes in groups.values():
+                    for index in indexes:
+                        rev_reg_id = outcomes[index]["rev_reg_id"]
+                        cred_rev_id = outcomes[index]["cred_rev_id"]
+                        await RevNotificationRecord(
+                            rev_reg_id=rev_reg_id,
+                            cred_rev_id=cred_rev_id,
+                            thread_id=revocations[index].get("thread_id")
+                            or f"indy::{rev_reg_id}::{cred_rev_id}",
+                            connection_id=revocations[index].get("connection_id"),
+                            comment=comment,
+                            version=notify_version,
+                        ).save(txn, reason="New revocation notification")
+                await txn.commit()
+
+        limit = self._publish_limit()
+
+        async def revoke(rev_reg_id: str, crids: Sequence[str]):
+            async with limit:
+                return await self._revoke_registry(
+                    rev_reg_id, crids, publish, write_ledger, endorser_did
+                )
+
+        group_crids = {
+            rev_reg_id: sorted({outcomes[i]["cred_rev_id"] for i in indexes})
+            for rev_reg_id, indexes in groups.items()
+        }
+        results = await asyncio.gather(
+            *(revoke(rev_reg_id, crids) for rev_reg_id, crids in group_crids.items()),
+            return_exceptions=True,
+        )
+
+        rev_entry_resps = []
+        for (rev_reg_id, indexes), result in zip(groups.items(), results):
+            if isinstance(result, Exception):
+                if not isinstance(result, BaseError):
+                    raise result
+                self._logger.warning(
+                    "Failed to revoke %d credential(s) on registry %s: %s",
+                    len(group_crids[rev_reg_id]),
+                    rev_reg_id,
+                    result.roll_up,
+                )
+                for index in indexes:
+                    outcomes[index]["error"] = result.roll_up
+                continue
+            rev_entry_resp, revoked = result
+            revoked = set(revoked)
+            if rev_entry_resp:
+                rev_entry_resps.append(rev_entry_resp)
+            for index in indexes:
+                outcome = outcomes[index]
+                if outcome["cred_rev_id"] not in revoked:
+                    outcome["error"] = (
+                        f"Credential revocation id {outcome['cred_rev_id']} could "
+                        f"not be revoked on registry {rev_reg_id}"
+                    )
+                elif publish:
+                    outcome["state"] = IssuerCredRevRecord.STATE_REVOKED
+                else:
+                    outcome["state"] = "pending"
+
+        return outcomes, rev_entry_resps
+
+    async def _revoke_registry(
+        self,
+        rev_reg_id: str,
+        crids: Sequence[str],
+        publish: bool,
+        write_ledger: bool,
+        endorser_did: Optional[str],
+    ) -> Tuple[Optional[dict], Sequence[str]]:
+        """Revoke or mark pending many credentials of one revocation registry."""
+        revoc = IndyRevocation(self._profile)
+        issuer_rr_rec = await revoc.get_issuer_rev_reg_record(rev_reg_id)
+        if not issuer_rr_rec:
+            raise RevocationManagerError(
+                f"No revocation registry record found for id: {rev_reg_id}"
+            )
+
+        if not publish:
+            async with self._profile.transaction() as txn:
+                issuer_rr_upd = await IssuerRevRegRecord.retrieve_by_id(
+                    txn, issuer_rr_rec.record_id, for_update=True
+                )
+                await issuer_rr_upd.mark_pending_all(txn, crids)
+                await txn.commit()
+            publisher = self._profile.inject_or(PendingRevocationPublisher)
+            if publisher:
+                publisher.pending(
+                    self._profile, rev_reg_id, len(issuer_rr_upd.pending_pub)
+                )
+            return None, crids
+
+        rev_reg = await revoc.get_ledger_registry(rev_reg_id)
+        await rev_reg.get_or_fetch_local_tails_path(self._profile)
+        async with publish_lock(self._profile, rev_reg_id):
+            # another publication may have taken some while waiting for the lock
+            issuer_rr_rec = await self._retrieve_for_publish(issuer_rr_rec)
+            # pick up pending revocations on the revocation registry
+            rev_entry_resp, revoked = await self._publish_registry(
+                issuer_rr_rec,
+                set(issuer_rr_rec.pending_pub or ()).union(crids),
+                write_ledger,
+                endorser_did,
+            )
+        revoked = set(revoked)
+        revoked = [crid for crid in crids if crid in revoked]
+        if rev_entry_resp and write_ledger:
+            await notify_revocation_published_event(self._profile, rev_reg_id, revoked)
+        return rev_entry_resp, revoked
+
     async def publish_pending_revocations(
         self,
         rrid2crid: Mapping[Text, Sequence[Text]] = None,
         write_ledger: bool = True,
         connection_id: str = None,
-    ) -> Tuple[Optional[dict], Mapping[Text, Sequence[Text]]]:
+    ) -> Tuple[Optional[dict], Mapping[Text, Sequence[Text]], Mapping[Text, Text]]:
         """Publish pending revocations to the ledger.
 
         Args:
@@ -236,14 +436,20 @@ class RevocationManager:
                     - no pending revocations from any other revocation registries.
             connection_id: connection identifier for endorser connection to use
 
-        Returns: mapping from each revocation registry id to its cred rev ids published.
+        Revocation registries are published concurrently, up to the configured
+        maximum at a time. A failure on one registry does not stop the others;
+        it is reported in the result, and raised only when every registry failed.
+
+        Returns:
+            The response from sending the last registry entry, if any, the mapping
+            from each revocation registry id to its cred rev ids published, and the
+            mapping from each revocation registry id that failed to its error
+
         """
-        result = {}
-        issuer = self._profile.inject(IndyIssuer)
-        rev_entry_resp = None
         async with self._profile.session() as session:
             issuer_rr_recs = await IssuerRevRegRecord.query_by_pending(session)
 
+        pending = []
         for issuer_rr_rec in issuer_rr_recs:
             rrid = issuer_rr_rec.revoc_reg_id
             if rrid2crid:
@@ -256,48 +462,119 @@ class RevocationManager:
             if limit_crids:
                 crids = crids.intersection(limit_crids)
             if crids:
-                (delta_json, failed_crids) = await issuer.revoke_credentials(
-                    issuer_rr_rec.cred_def_id,
-                    issuer_rr_rec.revoc_reg_id,
-                    issuer_rr_rec.tails_local_path,
-                    crids,
+                pending.append((issuer_rr_rec, crids))
+        if not pending:
+            return None, {}, {}
+
+        endorser_did = None
+        if connection_id:
+            endorser_did = await self._get_endorser_did(connection_id)
+
+        limit = self._publish_limit()
+
+        async def publish(issuer_rr_rec: IssuerRevRegRecord, crids: set):
+            async with limit, publish_lock(self._profile, issuer_rr_rec.revoc_reg_id):
+                # another publication may have taken some while waiting for the lock
+                issuer_rr_rec = await self._retrieve_for_publish(issuer_rr_rec)
+                crids = crids.intersection(issuer_rr_rec.pending_pub or ())
+                if not crids:
+                    return None, []
+                return await self._publish_registry(
+                    issuer_rr_rec, crids, write_ledger, endorser_did
                 )
-                async with self._profile.transaction() as txn:
-                    issuer_rr_upd = await IssuerRevRegRecord.retrieve_by_id(
-                        txn, issuer_rr_rec.record_id, for_update=True
-                    )
-                    if delta_json:
-                        issuer_rr_upd.revoc_reg_entry = json.loads(delta_json)
-                    await issuer_rr_upd.clear_pending(txn, crids)
-                    await txn.commit()
-                await self.set_cred_revoked_state(issuer_rr_rec.revoc_reg_id, crids)
-                if delta_json:
-                    if connection_id:
-                        async with self._profile.session() as session:
-                            try:
-                                connection_record = await ConnRecord.retrieve_by_id(
-                                    session, connection_id
-                                )
-                            except StorageNotFoundError:
-                                raise RevocationManagerError(
-                                    "No endorser connection record found "
-                                    f"for id: {connection_id}"
-                                )
-                            endorser_info = await connection_record.metadata_get(
-                                session, "endorser_info"
-                            )
-                        endorser_did = endorser_info["endorser_did"]
-                        rev_entry_resp = await issuer_rr_upd.send_entry(
-                            self._profile,
-                            write_ledger=write_ledger,
-                            endorser_did=endorser_did,
-                        )
-                    else:
-                        rev_entry_resp = await issuer_rr_upd.send_entry(self._profile)
-                published = sorted(crid for crid in crids if crid not in failed_crids)
-                result[issuer_rr_rec.revoc_reg_id] = published
 
-        return rev_entry_resp, result
+        outcomes = await asyncio.gather(
+            *(publish(issuer_rr_rec, crids) for issuer_rr_rec, crids in pending),
+            return_exceptions=True,
+        )
+
+        result = {}
+        errors = {}
+        rev_entry_resp = None
+        for (issuer_rr_rec, crids), outcome in zip(pending, outcomes):
+            rrid = issuer_rr_rec.revoc_reg_id
+            if isinstance(outcome, Exception):
+                unexpected = not isinstance(outcome, BaseError)
+                errors[rrid] = str(outcome) if unexpected else outcome.roll_up
+                self._logger.warning(
+                    "Failed to publish %d pending revocation(s) on registry %s: %s",
+                    len(crids),
+                    rrid,
+                    errors[rrid],
+                    exc_info=outcome if unexpected else None,
+                )
+                continue
+            entry_resp, published = outcome
+            if entry_resp:
+                rev_entry_resp = entry_resp
+            self._logger.info(
+                "Published %d revocation(s) on registry %s", len(published), rrid
+            )
+            result[rrid] = published
+
+        if errors and len(errors) == len(pending):
+            raise RevocationManagerError(
+                "Failed to publish revocations: "
+                + "; ".join(f"{rrid}: {err}" for rrid, err in errors.items())
+            )
+
+        return rev_entry_resp, result, errors
+
+    async def _retrieve_for_publish(
+        self, issuer_rr_rec: IssuerRevRegRecord
+    ) -> IssuerRevRegRecord:
+        """Retrieve a revocation registry record again, holding its publish lock.
+
+        Publications of the registry waited on the lock may have published and
+        cleared pending revocations since the record was first retrieved.
+        """
+        async with self._profile.transaction() as txn:
+            return await IssuerRevRegRecord.retrieve_by_id(
+                txn, issuer_rr_rec.record_id, for_update=True
+            )
+
+    async def _publish_registry(
+        self,
+        issuer_rr_rec: IssuerRevRegRecord,
+        crids: set,
+        write_ledger: bool,
+        endorser_did: Optional[str],
+    ) -> Tuple[Optional[dict], Sequence[Text]]:
+        """Publish pending revocations of a single revocation registry.
+
+        Returns:
+            The response from sending the registry entry, if any, and the
+            credential revocation ids published
+
+        """
+        issuer = self._profile.inject(IndyIssuer)
+        (delta_json, failed_crids) = await issuer.revoke_credentials(
+            issuer_rr_rec.cred_def_id,
+            issuer_rr_rec.revoc_reg_id,
+            issuer_rr_rec.tails_local_path,
+            crids,
+        )
+        async with self._profile.transaction() as txn:
+            issuer_rr_upd = await IssuerRevRegRecord.retrieve_by_id(
+                txn, issuer_rr_rec.record_id, for_update=True
+            )
+            if delta_json:
+                issuer_rr_upd.revoc_reg_entry = json.loads(delta_json)
+            await issuer_rr_upd.clear_pending(txn, crids)
+            await txn.commit()
+        await self.set_cred_revoked_state(issuer_rr_rec.revoc_reg_id, crids)
+        rev_entry_resp = None
+        if delta_json:
+            if endorser_did:
+                rev_entry_resp = await issuer_rr_upd.send_entry(
+                    self._profile,
+                    write_ledger=write_ledger,
+                    endorser_did=endorser_did,
+                )
+            else:
+                rev_entry_resp = await issuer_rr_upd.send_entry(self._profile)
+        published = sorted(crid for crid in crids if crid not in failed_crids)
+        return rev_entry_resp, published
 
     async def clear_pending_revocations(
         self, purge: Mapping[Text, Sequence[Text]] = None
@@ -346,11 +623,36 @@ class RevocationManager:
 
         return result
 
+    def _publish_limit(self) -> asyncio.Semaphore:
+        """Create the semaphore bounding concurrent revocation registry updates."""
+        return asyncio.Semaphore(
+            self._profile.settings.get_int("revocation.max_concurrent_publish")
+            or DEFAULT_MAX_CONCURRENT_PUBLISH
+        )
+
+    async def _get_endorser_did(self, connection_id: str) -> str:
+        """Look up the DID of the endorser on an endorser connection."""
+        async with self._profile.session() as session:
+            try:
+                connection_record = await ConnRecord.retrieve_by_id(
+                    session, connection_id
+                )
+            except StorageNotFoundError:
+                raise RevocationManagerError(
+                    f"No endorser connection record found for id: {connection_id}"
+                )
+            endorser_info = await connection_record.metadata_get(
+                session, "endorser_info"
+            )
+        return endorser_info["endorser_did"]
+
     async def set_cred_revoked_state(
         self, rev_reg_id: str, cred_rev_ids: Sequence[str]
     ) -> None:
         """Update credentials state to credential_revoked.
 
+        The records of all the credentials are updated in a single transaction.
+
         Args:
             rev_reg_id: revocation registry ID
             cred_rev_ids: list of credential revocation IDs
@@ -359,23 +661,23 @@ class RevocationManager:
             None
 
         """
-        for cred_rev_id in cred_rev_ids:
-            cred_ex_id = None
+        if not cred_rev_ids:
+            return
 
-            try:
-                async with self._profile.transaction() as txn:
-                    rev_rec = await IssuerCredRevRecord.retrieve_by_ids(
-                        txn, rev_reg_id, cred_rev_id, for_update=True
-                    )
-                    cred_ex_id = rev_rec.cred_ex_id
-                    cred_ex_version = rev_rec.cred_ex_version
-                    rev_rec.state = IssuerCredRevRecord.STATE_REVOKED
-                    await rev_rec.save(txn, reason="revoke credential")
-                    await txn.commit()
-            except StorageNotFoundError:
-                continue
+        async with self._profile.transaction() as txn:
+            rev_recs = await IssuerCredRevRecord.query(
+                txn,
+                {
+                    "rev_reg_id": rev_reg_id,
+                    "cred_rev_id": {"$in": [str(crid) for crid in cred_rev_ids]},
+                },
+            )
+            for rev_rec in rev_recs:
+                rev_rec.state = IssuerCredRevRecord.STATE_REVOKED
+                await rev_rec.save(txn, reason="revoke credential")
 
-            async with self._profile.transaction() as txn:
+                cred_ex_id = rev_rec.cred_ex_id
+                cred_ex_version = rev_rec.cred_ex_version
                 if (
                     not cred_ex_version
                     or cred_ex_version == IssuerCredRevRecord.VERSION_1
@@ -388,7 +690,6 @@ class RevocationManager:
                             V10CredentialExchange.STATE_CREDENTIAL_REVOKED
                         )
                         await cred_ex_record.save(txn, reason="revoke credential")
-                        await txn.commit()
                         continue  # skip 2.0 record check
                     except StorageNotFoundError:
                         pass
@@ -403,6 +704,6 @@ class RevocationManager:
                         )
                         cred_ex_record.state = V20CredExRecord.STATE_CREDENTIAL_REVOKED
                         await cred_ex_record.save(txn, reason="revoke credential")
-                        await txn.commit()
                     except StorageNotFoundError:
                         pass
+            await txn.commit()
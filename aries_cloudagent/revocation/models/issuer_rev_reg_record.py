@@ -42,7 +42,7 @@ from ...messaging.valid import (
 )
 from ...tails.base import BaseTailsServer
 from ..error import RevocationError
-from ..recover import generate_ledger_rrrecovery_txn
+from ..recover import RevocationBitmap, generate_ledger_rrrecovery_txn
 from .issuer_cred_rev_record import IssuerCredRevRecord
 from .revocation_registry import RevocationRegistry
 
@@ -381,16 +381,20 @@ class IssuerRevRegRecord(BaseRecord):
         applied_txn = {}
         async with profile.session() as session:
             recs = await IssuerCredRevRecord.query_by_ids(
-                session, rev_reg_id=self.revoc_reg_id
+                session,
+                rev_reg_id=self.revoc_reg_id,
+                state=IssuerCredRevRecord.STATE_REVOKED,
             )
 
-        revoked_ids = []
-        for rec in recs:
-            if rec.state == IssuerCredRevRecord.STATE_REVOKED:
-                revoked_ids.append(int(rec.cred_rev_id))
-                if int(rec.cred_rev_id) not in rev_reg_delta["value"]["revoked"]:
-                    # await rec.set_state(session, IssuerCredRevRecord.STATE_ISSUED)
-                    rec_count += 1
+        revoked_ids = RevocationBitmap.from_indexes(
+            rec.cred_rev_id
+            for rec in recs
+            if rec.state == IssuerCredRevRecord.STATE_REVOKED
+        )
+        ledger_revoked_ids = RevocationBitmap.from_indexes(
+            rev_reg_delta["value"].get("revoked") or []
+        )
+        rec_count = len(revoked_ids - ledger_revoked_ids)
 
         LOGGER.debug(">>> fixed entry recs count = %s", rec_count)
         LOGGER.debug(
@@ -431,6 +435,10 @@ class IssuerRevRegRecord(BaseRecord):
                 revoked_ids,
                 cred_defn,
                 rev_reg_defn_private,
+                rev_reg_def=(
+                    self.revoc_reg_def.serialize() if self.revoc_reg_def else None
+                ),
+                ledger_delta=rev_reg_delta,
             )
             recovery_txn = json.loads(calculated_txn.to_json())
 
@@ -487,9 +495,24 @@ class IssuerRevRegRecord(BaseRecord):
             session: The profile session to use
             cred_rev_id: The credential revocation identifier for credential to revoke
         """
-        if cred_rev_id not in self.pending_pub:
-            self.pending_pub.append(cred_rev_id)
-            self.pending_pub.sort()
+        await self.mark_pending_all(session, [cred_rev_id])
+
+    async def mark_pending_all(
+        self, session: ProfileSession, cred_rev_ids: Sequence[str]
+    ) -> None:
+        """Mark many credential revocation ids as revoked pending publication.
+
+        Args:
+            session: The profile session to use
+            cred_rev_ids: The credential revocation identifiers for credentials
+                to revoke
+        """
+        pending = set(self.pending_pub)
+        for cred_rev_id in cred_rev_ids:
+            if cred_rev_id not in pending:
+                self.pending_pub.append(cred_rev_id)
+                pending.add(cred_rev_id)
+        self.pending_pub.sort()
 
         await self.save(session, reason="Marked pending revocation")
 
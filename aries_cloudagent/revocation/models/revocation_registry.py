@@ -1,21 +1,18 @@
 """Classes for managing a revocation registry."""
 
-import http
 import logging
-import os
 import re
 
 from os.path import join
 from pathlib import Path
+from typing import Optional
 
-from requests import Session
-from requests.exceptions import RequestException
-
+from ...core.profile import Profile
 from ...indy.util import indy_client_dir
+from ...tails.cache import TailsFileCache
+from ...tails.error import TailsDownloadError
 
 from ..error import RevocationError
-import hashlib
-import base58
 
 LOGGER = logging.getLogger(__name__)
 
@@ -155,7 +152,12 @@ class RevocationRegistry:
         tails_file_path = Path(self.get_receiving_tails_local_path())
         return tails_file_path.is_file()
 
-    async def retrieve_tails(self):
+    @staticmethod
+    def _tails_cache(profile: Optional[Profile]) -> TailsFileCache:
+        """Get the tails cache bound to a profile, sharing its downloads."""
+        return (profile and profile.inject_or(TailsFileCache)) or TailsFileCache()
+
+    async def retrieve_tails(self, profile: Profile = None):
         """Fetch the tails file from the public URI."""
         if not self._tails_public_uri:
             raise RevocationError("Tails file public URI is empty")
@@ -165,49 +167,32 @@ class RevocationRegistry:
             self.registry_id,
         )
 
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        file_hasher = hashlib.sha256()
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    # Should this directly raise an Error?
-                    if resp.status_code != http.HTTPStatus.OK:
-                        LOGGER.warning(
-                            f"Unexpected status code for tails file: {resp.status_code}"
-                        )
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
-
-        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-        if download_tails_hash != self.tails_hash:
-            try:
-                os.remove(tails_file_path)
-                tails_file_dir.rmdir()
-            except OSError as err:
-                LOGGER.warning(f"Could not delete invalid tails file: {err}")
-
-            raise RevocationError(
-                "The hash of the downloaded tails file does not match."
+        try:
+            self.tails_local_path = await self._tails_cache(profile).fetch(
+                self.tails_hash, self._tails_public_uri
             )
-
-        self.tails_local_path = str(tails_file_path)
+        except TailsDownloadError as err:
+            raise RevocationError(err.roll_up) from err
         return self.tails_local_path
 
-    async def get_or_fetch_local_tails_path(self):
-        """Get the local tails path, retrieving from the remote if necessary."""
+    async def get_or_fetch_local_tails_path(self, profile: Profile = None):
+        """Get the local tails path, retrieving from the remote if necessary.
+
+        Downloaded tails files are kept in the tails cache bound to the profile.
+        """
         tails_file_path = self.get_receiving_tails_local_path()
         if Path(tails_file_path).is_file():
             return tails_file_path
-        return await self.retrieve_tails()
+        if not self._tails_public_uri:
+            raise RevocationError("Tails file public URI is empty")
+
+        try:
+            self.tails_local_path = await self._tails_cache(profile).get_or_fetch(
+                self.tails_hash, self._tails_public_uri
+            )
+        except TailsDownloadError as err:
+            raise RevocationError(err.roll_up) from err
+        return self.tails_local_path
 
     def __repr__(self) -> str:
         """Return a human readable representation of this class."""
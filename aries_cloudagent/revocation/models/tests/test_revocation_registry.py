@@ -4,16 +4,15 @@ from copy import deepcopy
 from pathlib import Path
 from shutil import rmtree
 
-import base58
-
+from ....core.in_memory import InMemoryProfile
 from ....indy.util import indy_client_dir
+from ....tails.cache import TailsFileCache
+from ....tails.error import TailsDownloadError
 
 from ...error import RevocationError
 
 from ..revocation_registry import RevocationRegistry
 
-from .. import revocation_registry as test_module
-
 
 TEST_DID = "FkjWznKwA4N1JEp2iPiKPG"
 CRED_DEF_ID = f"{TEST_DID}:3:CL:12:tag1"
@@ -102,61 +101,54 @@ class TestRevocationRegistry(IsolatedAsyncioTestCase):
         rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
         rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
 
-        more_magic = mock.MagicMock()
-        with mock.patch.object(test_module, "Session", autospec=True) as mock_session:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
-
-            rmtree(TAILS_DIR, ignore_errors=True)
+        tails_cache = mock.MagicMock(
+            TailsFileCache,
+            fetch=mock.AsyncMock(
+                side_effect=[
+                    TailsDownloadError("Error retrieving tails file"),
+                    "/tmp/tails/cache/" + TAILS_HASH,
+                ]
+            ),
+        )
+        profile = InMemoryProfile.test_profile(bind={TailsFileCache: tails_cache})
+        with self.assertRaises(RevocationError) as x_retrieve:
+            await rev_reg.retrieve_tails(profile)
+            assert x_retrieve.message.contains("Error retrieving tails file")
 
-        more_magic = mock.MagicMock()
-        with mock.patch.object(test_module, "Session", autospec=True) as mock_session:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = mock.MagicMock(
-                return_value=mock.MagicMock(
-                    iter_content=mock.MagicMock(side_effect=[(b"abcd1234",), (b"",)])
-                )
-            )
+        assert await rev_reg.retrieve_tails(profile) == (
+            "/tmp/tails/cache/" + TAILS_HASH
+        )
+        assert rev_reg.tails_local_path == "/tmp/tails/cache/" + TAILS_HASH
+        tails_cache.fetch.assert_awaited_with(TAILS_HASH, "http://sample.ca:8088/path")
 
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = mock.MagicMock()
-        with mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, mock.patch.object(
-            base58, "b58encode", mock.MagicMock()
-        ) as mock_b58enc, mock.patch.object(
-            Path, "is_file", autospec=True
-        ) as mock_is_file:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = mock.MagicMock(
-                return_value=mock.MagicMock(
-                    iter_content=mock.MagicMock(side_effect=[(b"abcd1234",), (b"",)])
-                )
-            )
-            mock_is_file.return_value = False
+    async def test_get_or_fetch_local_tails_path(self):
+        rr_def_public = deepcopy(REV_REG_DEF)
+        rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
+        rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
 
-            mock_b58enc.return_value = mock.MagicMock(
-                decode=mock.MagicMock(return_value=TAILS_HASH)
+        tails_cache = mock.MagicMock(
+            TailsFileCache,
+            get_or_fetch=mock.AsyncMock(
+                side_effect=[
+                    TailsDownloadError("Error retrieving tails file"),
+                    "/tmp/tails/cache/" + TAILS_HASH,
+                ]
+            ),
+        )
+        profile = InMemoryProfile.test_profile(bind={TailsFileCache: tails_cache})
+        with self.assertRaises(RevocationError):
+            await rev_reg.get_or_fetch_local_tails_path(profile)
+
+        assert await rev_reg.get_or_fetch_local_tails_path(profile) == (
+            "/tmp/tails/cache/" + TAILS_HASH
+        )
+        with mock.patch.object(Path, "is_file", autospec=True) as mock_is_file:
+            mock_is_file.return_value = True
+            assert await rev_reg.get_or_fetch_local_tails_path(profile) == (
+                "/tmp/tails/cache/" + TAILS_HASH
             )
-            await rev_reg.get_or_fetch_local_tails_path()
+        assert tails_cache.get_or_fetch.await_count == 2
 
-            rmtree(TAILS_DIR, ignore_errors=True)
+        rev_reg = RevocationRegistry.from_definition(REV_REG_DEF, public_def=False)
+        with self.assertRaises(RevocationError):
+            await rev_reg.get_or_fetch_local_tails_path(profile)
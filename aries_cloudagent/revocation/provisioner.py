@@ -0,0 +1,122 @@
+"""Background provisioning of standby revocation registries."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ..core.profile import Profile
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STANDBY_REGISTRIES = 1
+
+# Creates the missing standby registries of a credential definition, returning
+# the number of registries created
+Provision = Callable[[], Awaitable[int]]
+
+
+class RegistryProvisioner:
+    """Keep standby revocation registries ready ahead of need.
+
+    Creating a revocation registry generates its tails file, uploads it and
+    writes the definition and initial entry to the ledger, which takes far
+    longer than issuing a credential. Registries are therefore created in the
+    background, up to a number of standby registries per credential definition
+    that are ready to take over from the active registry. The standby registries
+    are replenished once the active registry fills, and optionally earlier, once
+    it is filled up to a watermark, so that switching registries never waits
+    for a registry to be created.
+    """
+
+    def __init__(
+        self,
+        standby: int = DEFAULT_STANDBY_REGISTRIES,
+        watermark: Optional[int] = None,
+    ):
+        """Initialize the provisioner.
+
+        Args:
+            standby: The number of standby registries to keep per credential
+                definition
+            watermark: The fill level of the active registry, in percent, at
+                which standby registries are replenished; None to wait until
+                the active registry is full
+        """
+        self.standby = max(standby or DEFAULT_STANDBY_REGISTRIES, 1)
+        self.watermark = watermark
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._filling: Set[str] = set()
+
+    def filled(self, rev_reg_id: str, issued: int, max_cred_num: int) -> bool:
+        """Check whether a registry has reached the watermark for the first time.
+
+        Args:
+            rev_reg_id: The revocation registry identifier
+            issued: The number of credentials issued from the registry
+            max_cred_num: The maximum credential number of the registry
+
+        Returns:
+            True once per registry, when the watermark is reached
+
+        """
+        if not self.watermark or issued * 100 < max_cred_num * self.watermark:
+            return False
+        if rev_reg_id in self._filling:
+            return False
+        self._filling.add(rev_reg_id)
+        return True
+
+    def provision(
+        self,
+        profile: Profile,
+        cred_def_id: str,
+        provision: Provision,
+        rev_reg_id: Optional[str] = None,
+    ):
+        """Replenish the standby registries of a credential definition.
+
+        Provisioning runs in the background; nothing is done if it is already
+        in progress for the credential definition.
+
+        Args:
+            profile: The profile holding the credential definition
+            cred_def_id: The credential definition identifier
+            provision: Creates the missing standby registries
+            rev_reg_id: The registry found filled to the watermark, if any, to
+                check again should provisioning fail
+        """
+        key = (profile.name, cred_def_id)
+        if key in self._tasks:
+            return
+        task = asyncio.ensure_future(
+            self._provision(cred_def_id, provision, rev_reg_id)
+        )
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    async def _provision(
+        self, cred_def_id: str, provision: Provision, rev_reg_id: Optional[str]
+    ):
+        created = None
+        try:
+            created = await provision()
+        except Exception:
+            LOGGER.exception(
+                "Error provisioning standby revocation registries for cred def %s",
+                cred_def_id,
+            )
+            return
+        finally:
+            if created is None and rev_reg_id:
+                self._filling.discard(rev_reg_id)
+        if created:
+            LOGGER.info(
+                "Provisioned %d standby revocation registries for cred def %s",
+                created,
+                cred_def_id,
+            )
+
+    async def stop(self):
+        """Wait for provisioning in progress to complete."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
@@ -0,0 +1,128 @@
+"""Background publication of pending revocations."""
+
+import asyncio
+import logging
+from typing import Dict, Set
+
+from ..core.error import BaseError
+from ..core.profile import Profile
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PendingRevocationPublisher:
+    """Publish pending revocations without waiting for an admin request.
+
+    A revocation registry is published as soon as the number of revocations
+    pending on it reaches the maximum, or once the interval has passed since
+    the first revocation was left pending on it, whichever comes first.
+    """
+
+    def __init__(self, max_pending: int = 0, interval: float = 0):
+        """Initialize the publisher.
+
+        Args:
+            max_pending: The number of pending revocations triggering publication
+                of a registry, 0 for no limit
+            interval: The longest time a revocation is left pending in seconds,
+                0 for no limit
+        """
+        self.max_pending = max_pending or 0
+        self.interval = interval or 0
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Accessor for whether any publication threshold is configured."""
+        return bool(self.max_pending or self.interval)
+
+    def pending(self, profile: Profile, rev_reg_id: str, count: int):
+        """Record that revocations are pending publication on a registry.
+
+        Args:
+            profile: The profile holding the revocation registry
+            rev_reg_id: The revocation registry identifier
+            count: The number of revocations now pending on the registry
+        """
+        if not self.enabled or profile.settings.get_value("endorser.author"):
+            # authors publish through their endorser, via the admin API
+            return
+        if self.max_pending and count >= self.max_pending:
+            self._schedule(profile, rev_reg_id, 0)
+        elif self.interval and rev_reg_id not in self._timers:
+            self._schedule(profile, rev_reg_id, self.interval)
+
+    def lock(self, rev_reg_id: str) -> asyncio.Lock:
+        """Return the lock serializing publication of a revocation registry."""
+        return self._locks.setdefault(rev_reg_id, asyncio.Lock())
+
+    def _schedule(self, profile: Profile, rev_reg_id: str, delay: float):
+        timer = self._timers.pop(rev_reg_id, None)
+        if timer:
+            timer.cancel()
+        self._timers[rev_reg_id] = asyncio.get_event_loop().call_later(
+            delay, self._start, profile, rev_reg_id
+        )
+
+    def _start(self, profile: Profile, rev_reg_id: str):
+        self._timers.pop(rev_reg_id, None)
+        task = asyncio.ensure_future(self.publish(profile, rev_reg_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def publish(self, profile: Profile, rev_reg_id: str):
+        """Publish all revocations pending on a registry.
+
+        The revocation manager takes the registry lock, shared with publication
+        through the admin API.
+        """
+        try:
+            if profile.settings.get("wallet.type") == "askar-anoncreds":
+                from ..revocation_anoncreds.manager import RevocationManager
+
+                result, _ = await RevocationManager(
+                    profile
+                ).publish_pending_revocations({rev_reg_id: []})
+            else:
+                from .manager import RevocationManager
+
+                _, result, _ = await RevocationManager(
+                    profile
+                ).publish_pending_revocations({rev_reg_id: []})
+        except Exception as err:
+            # with a single registry, a failure is raised rather than reported
+            LOGGER.warning(
+                "Background publication of pending revocations on registry %s "
+                "failed: %s",
+                rev_reg_id,
+                err.roll_up if isinstance(err, BaseError) else err,
+                exc_info=not isinstance(err, BaseError),
+            )
+            return
+        if result.get(rev_reg_id):
+            LOGGER.debug(
+                "Published %d pending revocation(s) on registry %s in the background",
+                len(result[rev_reg_id]),
+                rev_reg_id,
+            )
+
+    async def stop(self):
+        """Cancel scheduled publications and wait for those in progress."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def publish_lock(profile: Profile, rev_reg_id: str) -> asyncio.Lock:
+    """Return the lock serializing publication of a revocation registry.
+
+    Publication through the admin API and in the background take the same lock,
+    so a registry is never published twice at once. Without a background
+    publisher there is nothing to serialize with, and a fresh lock is returned.
+    """
+    publisher = profile.inject_or(PendingRevocationPublisher)
+    return publisher.lock(rev_reg_id) if publisher else asyncio.Lock()
@@ -5,6 +5,7 @@ import importlib
 import logging
 import tempfile
 import time
+from typing import Iterable, Iterator, List
 
 import aiohttp
 import base58
@@ -28,6 +29,69 @@ class RevocRecoveryException(Exception):
     """Raise exception generating the recovery transaction."""
 
 
+class RevocationBitmap:
+    """Set of revoked credential indexes, held as a bit array.
+
+    Bit `i` is set when index `i` is revoked. Comparing the revocation state of
+    large registries then takes a few bitwise operations over whole words,
+    rather than hashing every index into sets.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0):
+        """Initialize the bitmap from its integer representation."""
+        self.bits = bits
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int]) -> "RevocationBitmap":
+        """Build a bitmap from credential revocation indexes."""
+        indexes = [int(index) for index in indexes]
+        if not indexes:
+            return cls()
+        buf = bytearray((max(indexes) >> 3) + 1)
+        for index in indexes:
+            buf[index >> 3] |= 1 << (index & 7)
+        return cls(int.from_bytes(buf, "little"))
+
+    def __sub__(self, other: "RevocationBitmap") -> "RevocationBitmap":
+        """Indexes revoked in this bitmap but not the other."""
+        return RevocationBitmap(self.bits & ~other.bits)
+
+    def __or__(self, other: "RevocationBitmap") -> "RevocationBitmap":
+        """Indexes revoked in either bitmap."""
+        return RevocationBitmap(self.bits | other.bits)
+
+    def __contains__(self, index: int) -> bool:
+        """Check whether an index is revoked."""
+        return index >= 0 and bool(self.bits >> index & 1)
+
+    def __len__(self) -> int:
+        """Count the revoked indexes."""
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        """Check whether any index is revoked."""
+        return bool(self.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the revoked indexes in ascending order."""
+        data = self.bits.to_bytes((self.bits.bit_length() + 7) >> 3, "little")
+        for pos, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                yield (pos << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def indexes(self) -> List[int]:
+        """Get the revoked indexes in ascending order."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return f"<RevocationBitmap(count={len(self)})>"
+
+
 async def fetch_txns(genesis_txns, registry_id):
     """Fetch tails file and revocation registry information."""
 
@@ -79,30 +143,54 @@ async def fetch_txns(genesis_txns, registry_id):
     delta = credx_module.RevocationRegistryDelta.load(accum_to)
     registry = credx_module.RevocationRegistry.load(accum_to)
     LOGGER.debug("Ledger registry state: %s", registry.to_json())
-    revoked = set(result["data"]["value"]["revoked"])
+    revoked = RevocationBitmap.from_indexes(result["data"]["value"]["revoked"])
     LOGGER.debug("Ledger revoked indexes: %s", revoked)
 
     return defn, registry, delta, revoked, tails_temp
 
 
 async def generate_ledger_rrrecovery_txn(
-    genesis_txns, registry_id, set_revoked, cred_def, rev_reg_def_private
+    genesis_txns,
+    registry_id,
+    set_revoked,
+    cred_def,
+    rev_reg_def_private,
+    *,
+    rev_reg_def: dict = None,
+    ledger_delta: dict = None,
 ):
-    """Generate a new ledger accum entry, based on wallet vs ledger revocation state."""
+    """Generate a new ledger accum entry, based on wallet vs ledger revocation state.
+
+    When the revocation registry definition and the current ledger delta are
+    already known, they are used directly instead of being fetched again from
+    the ledger along with the tails file.
+    """
 
     new_delta = None
 
-    ledger_data = await fetch_txns(genesis_txns, registry_id)
-    if not ledger_data:
-        return new_delta
-    defn, registry, delta, prev_revoked, tails_temp = ledger_data
+    if rev_reg_def and ledger_delta:
+        credx_module = importlib.import_module("indy_credx")
+        defn = credx_module.RevocationRegistryDefinition.load(rev_reg_def)
+        registry = credx_module.RevocationRegistry.load(
+            {"ver": "1.0", "value": {"accum": ledger_delta["value"]["accum"]}}
+        )
+        prev_revoked = RevocationBitmap.from_indexes(
+            ledger_delta["value"].get("revoked") or []
+        )
+    else:
+        ledger_data = await fetch_txns(genesis_txns, registry_id)
+        if not ledger_data:
+            return new_delta
+        defn, registry, delta, prev_revoked, tails_temp = ledger_data
+        LOGGER.debug("tails_temp: %s", tails_temp.name)
 
-    set_revoked = set(set_revoked)
+    if not isinstance(set_revoked, RevocationBitmap):
+        set_revoked = RevocationBitmap.from_indexes(set_revoked)
     mismatch = prev_revoked - set_revoked
     if mismatch:
         LOGGER.warning(
             "Credential index(es) revoked on the ledger, but not in wallet: %s",
-            mismatch,
+            mismatch.indexes(),
         )
 
     updates = set_revoked - prev_revoked
@@ -111,10 +199,9 @@ async def generate_ledger_rrrecovery_txn(
     else:
         LOGGER.debug("New revoked indexes: %s", updates)
 
-        LOGGER.debug("tails_temp: %s", tails_temp.name)
         update_registry = registry.copy()
         new_delta = update_registry.update(
-            cred_def, defn, rev_reg_def_private, [], updates
+            cred_def, defn, rev_reg_def_private, [], updates.indexes()
         )
 
         LOGGER.debug("New delta:")
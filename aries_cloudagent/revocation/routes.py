@@ -270,6 +270,131 @@ class RevokeRequestSchema(CredRevRecordQueryStringSchema):
     )
 
 
+class RevokeBatchItemSchema(CredRevRecordQueryStringSchema):
+    """Credential to revoke in a batch revocation request."""
+
+    connection_id = fields.Str(
+        required=False,
+        validate=UUID4_VALIDATE,
+        metadata={
+            "description": (
+                "Connection ID to which the revocation notification will be sent;"
+                " required if notify is true"
+            ),
+            "example": UUID4_EXAMPLE,
+        },
+    )
+    thread_id = fields.Str(
+        required=False,
+        metadata={
+            "description": (
+                "Thread ID of the credential exchange message thread resulting in the"
+                " credential now being revoked"
+            )
+        },
+    )
+
+
+class RevokeBatchRequestSchema(OpenAPISchema):
+    """Request schema for batch revocation."""
+
+    @validates_schema
+    def validate_fields(self, data, **kwargs):
+        """Validate fields - each connection_id must be present if notify."""
+        if data.get("notify") and not all(
+            item.get("connection_id") for item in data.get("revocations", [])
+        ):
+            raise ValidationError(
+                "Each revocation must specify connection_id if notify is true"
+            )
+
+    revocations = fields.List(
+        fields.Nested(RevokeBatchItemSchema()),
+        required=True,
+        validate=validate.Length(min=1),
+        metadata={"description": "Credentials to revoke"},
+    )
+    publish = fields.Boolean(
+        required=False,
+        metadata={
+            "description": (
+                "(True) publish revocations to ledger immediately, with one update"
+                " per revocation registry, or (default, False) mark them pending"
+            )
+        },
+    )
+    notify = fields.Boolean(
+        required=False,
+        metadata={"description": "Send notifications to the credential recipients"},
+    )
+    notify_version = fields.String(
+        validate=validate.OneOf(["v1_0", "v2_0"]),
+        required=False,
+        metadata={
+            "description": (
+                "Specify which version of the revocation notification should be sent"
+            )
+        },
+    )
+    comment = fields.Str(
+        required=False,
+        metadata={
+            "description": "Optional comment to include in revocation notifications"
+        },
+    )
+
+
+class RevokeBatchOutcomeSchema(OpenAPISchema):
+    """Outcome of revoking a credential in a batch."""
+
+    rev_reg_id = fields.Str(
+        required=False,
+        metadata={
+            "description": "Revocation registry identifier",
+            "example": INDY_REV_REG_ID_EXAMPLE,
+        },
+    )
+    cred_rev_id = fields.Str(
+        required=False,
+        metadata={
+            "description": "Credential revocation identifier",
+            "example": INDY_CRED_REV_ID_EXAMPLE,
+        },
+    )
+    cred_ex_id = fields.Str(
+        required=False,
+        metadata={
+            "description": "Credential exchange identifier",
+            "example": UUID4_EXAMPLE,
+        },
+    )
+    state = fields.Str(
+        required=False,
+        metadata={
+            "description": "Revocation state, if successful",
+            "example": "revoked",
+        },
+    )
+    error = fields.Str(
+        required=False,
+        metadata={"description": "Error message, if unsuccessful"},
+    )
+
+
+class RevokeBatchResultSchema(OpenAPISchema):
+    """Result schema for batch revocation."""
+
+    results = fields.List(
+        fields.Nested(RevokeBatchOutcomeSchema()),
+        metadata={"description": "Outcome of each revocation, in request order"},
+    )
+    txns = fields.List(
+        fields.Nested(TransactionRecordSchema()),
+        required=False,
+        metadata={"description": "Revocation registry entry transactions to endorse"},
+    )
+
+
 class PublishRevocationsSchemaAnoncreds(OpenAPISchema):
     """Request and result schema for revocation publication API call."""
 
@@ -304,6 +429,15 @@ class TxnOrPublishRevocationsResultSchema(OpenAPISchema):
             "description": "Revocation registry revocations transaction to endorse"
         },
     )
+    errors = fields.Dict(
+        required=False,
+        keys=fields.Str(metadata={"example": INDY_REV_REG_ID_EXAMPLE}),
+        values=fields.Str(metadata={"description": "Error publishing the registry"}),
+        metadata={
+            "description": "Errors by revocation registry id, for registries that "
+            "failed to publish while others succeeded"
+        },
+    )
 
 
 class ClearPendingRevocationsRequestSchema(OpenAPISchema):
@@ -612,6 +746,103 @@ async def revoke(request: web.BaseRequest):
     return web.json_response({})
 
 
+@docs(tags=["revocation"], summary="Revoke many issued credentials")
+@request_schema(RevokeBatchRequestSchema())
+@querystring_schema(CreateRevRegTxnForEndorserOptionSchema())
+@querystring_schema(RevRegConnIdMatchInfoSchema())
+@response_schema(RevokeBatchResultSchema(), 200, description="")
+async def revoke_batch(request: web.BaseRequest):
+    """Request handler for revoking many credentials.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The outcome of each revocation.
+
+    """
+    context: AdminRequestContext = request["context"]
+    profile = context.profile
+
+    is_anoncreds_profile_raise_web_exception(profile)
+
+    body = await request.json()
+    notify = body.get("notify", context.settings.get("revocation.notify")) or False
+    notify_version = body.get("notify_version", "v1_0")
+    create_transaction_for_endorser = json.loads(
+        request.query.get("create_transaction_for_endorser", "false")
+    )
+    endorser_conn_id = request.query.get("conn_id")
+    rev_manager = RevocationManager(profile)
+    outbound_handler = request["outbound_message_router"]
+    write_ledger = not create_transaction_for_endorser
+
+    if is_author_role(profile):
+        write_ledger = False
+        create_transaction_for_endorser = True
+        if not endorser_conn_id:
+            endorser_conn_id = await get_endorser_connection_id(profile)
+            if not endorser_conn_id:
+                raise web.HTTPBadRequest(reason="No endorser connection found")
+    if notify and not all(
+        item.get("connection_id") for item in body.get("revocations", [])
+    ):
+        raise web.HTTPBadRequest(
+            reason="connection_id must be set for each revocation when notify is true"
+        )
+
+    try:
+        results, rev_entry_resps = await rev_manager.revoke_credentials(
+            body["revocations"],
+            publish=body.get("publish", False),
+            notify=notify,
+            notify_version=notify_version,
+            comment=body.get("comment"),
+            endorser_conn_id=endorser_conn_id,
+            write_ledger=write_ledger,
+        )
+    except (
+        RevocationManagerError,
+        RevocationError,
+        StorageError,
+        IndyIssuerError,
+        LedgerError,
+    ) as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+    if create_transaction_for_endorser and rev_entry_resps:
+        transaction_mgr = TransactionManager(profile)
+        txns = []
+        for rev_entry_resp in rev_entry_resps:
+            try:
+                transaction = await transaction_mgr.create_record(
+                    messages_attach=rev_entry_resp["result"],
+                    connection_id=endorser_conn_id,
+                )
+            except StorageError as err:
+                raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+            # if auto-request, send the request to the endorser
+            if context.settings.get_value("endorser.auto_request"):
+                try:
+                    (
+                        transaction,
+                        transaction_request,
+                    ) = await transaction_mgr.create_request(
+                        transaction=transaction,
+                    )
+                except (StorageError, TransactionManagerError) as err:
+                    raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+                await outbound_handler(
+                    transaction_request, connection_id=endorser_conn_id
+                )
+            txns.append(transaction.serialize())
+
+        return web.json_response({"results": results, "txns": txns})
+    return web.json_response({"results": results})
+
+
 @docs(tags=["revocation"], summary="Publish pending revocations to ledger")
 @request_schema(PublishRevocationsSchemaAnoncreds())
 @querystring_schema(CreateRevRegTxnForEndorserOptionSchema())
@@ -649,12 +880,18 @@ async def publish_revocations(request: web.BaseRequest):
         if not endorser_conn_id:
             raise web.HTTPBadRequest(reason="No endorser connection found")
     try:
-        rev_reg_resp, result = await rev_manager.publish_pending_revocations(
+        rev_reg_resp, result, errors = await rev_manager.publish_pending_revocations(
             rrid2crid=rrid2crid,
             write_ledger=write_ledger,
             connection_id=endorser_conn_id,
         )
-    except (RevocationError, StorageError, IndyIssuerError, LedgerError) as err:
+    except (
+        RevocationError,
+        RevocationManagerError,
+        StorageError,
+        IndyIssuerError,
+        LedgerError,
+    ) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     if create_transaction_for_endorser and rev_reg_resp:
@@ -680,8 +917,12 @@ async def publish_revocations(request: web.BaseRequest):
 
             await outbound_handler(transaction_request, connection_id=endorser_conn_id)
 
-        return web.json_response({"txn": transaction.serialize()})
-    return web.json_response({"rrid2crid": result})
+        response = {"txn": transaction.serialize()}
+    else:
+        response = {"rrid2crid": result}
+    if errors:
+        response["errors"] = errors
+    return web.json_response(response)
 
 
 @docs(tags=["revocation"], summary="Clear pending revocations")
@@ -1796,6 +2037,7 @@ async def register(app: web.Application):
     app.add_routes(
         [
             web.post("/revocation/revoke", revoke),
+            web.post("/revocation/revoke-batch", revoke_batch),
             web.post("/revocation/publish-revocations", publish_revocations),
             web.post(
                 "/revocation/clear-pending-revocations",
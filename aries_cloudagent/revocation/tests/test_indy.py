@@ -17,6 +17,7 @@ from ..error import (
 from ..indy import IndyRevocation
 from ..models.issuer_rev_reg_record import DEFAULT_REGISTRY_SIZE, IssuerRevRegRecord
 from ..models.revocation_registry import RevocationRegistry
+from ..provisioner import RegistryProvisioner
 
 
 class TestIndyRevocation(IsolatedAsyncioTestCase):
@@ -114,6 +115,53 @@ class TestIndyRevocation(IsolatedAsyncioTestCase):
         with self.assertRaises(StorageNotFoundError) as x_init:
             await self.revoc.get_active_issuer_rev_reg_record(CRED_DEF_ID)
 
+    async def test_handle_full_registry(self):
+        CRED_DEF_ID = f"{self.test_did}:3:CL:1234:default"
+        recs = [await self.revoc.init_issuer_registry(CRED_DEF_ID) for _ in range(2)]
+        async with self.profile.session() as session:
+            for rec in recs:
+                await rec.set_state(session, IssuerRevRegRecord.STATE_ACTIVE)
+
+        # replenished inline without a provisioner
+        await self.revoc.handle_full_registry(recs[0].revoc_reg_id)
+        states = sorted(rec.state for rec in await self.revoc.list_issuer_registries())
+        assert states == [
+            IssuerRevRegRecord.STATE_ACTIVE,
+            IssuerRevRegRecord.STATE_FULL,
+            IssuerRevRegRecord.STATE_INIT,
+        ]
+        assert recs[1] == await self.revoc.get_active_issuer_rev_reg_record(CRED_DEF_ID)
+
+        # already full
+        await self.revoc.handle_full_registry(recs[0].revoc_reg_id)
+        assert len(await self.revoc.list_issuer_registries()) == 3
+
+        provisioner = RegistryProvisioner(standby=2)
+        self.context.injector.bind_instance(RegistryProvisioner, provisioner)
+        await self.revoc.handle_full_registry(recs[1].revoc_reg_id)
+        await provisioner.stop()
+        states = [rec.state for rec in await self.revoc.list_issuer_registries()]
+        assert states.count(IssuerRevRegRecord.STATE_FULL) == 2
+        assert states.count(IssuerRevRegRecord.STATE_INIT) == 3
+
+    async def test_check_fill_level(self):
+        CRED_DEF_ID = f"{self.test_did}:3:CL:1234:default"
+        rec = await self.revoc.init_issuer_registry(CRED_DEF_ID, max_cred_num=10)
+
+        # no provisioner
+        self.revoc.check_fill_level(rec, 10)
+        assert len(await self.revoc.list_issuer_registries()) == 1
+
+        provisioner = RegistryProvisioner(watermark=50)
+        self.context.injector.bind_instance(RegistryProvisioner, provisioner)
+        self.revoc.check_fill_level(rec, 4)
+        await provisioner.stop()
+        assert len(await self.revoc.list_issuer_registries()) == 1
+
+        self.revoc.check_fill_level(rec, 5)
+        await provisioner.stop()
+        assert len(await self.revoc.list_issuer_registries()) == 2
+
     async def test_init_issuer_registry_no_revocation(self):
         CRED_DEF_ID = f"{self.test_did}:3:CL:1234:default"
 
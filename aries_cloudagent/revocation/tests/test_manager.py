@@ -1,3 +1,4 @@
+import asyncio
 import json
 from unittest import IsolatedAsyncioTestCase
 
@@ -8,13 +9,14 @@ from aries_cloudagent.tests import mock
 
 from ...connections.models.conn_record import ConnRecord
 from ...core.in_memory import InMemoryProfile
-from ...indy.issuer import IndyIssuer
+from ...indy.issuer import IndyIssuer, IndyIssuerError
 from ...protocols.issue_credential.v1_0.models.credential_exchange import (
     V10CredentialExchange,
 )
 from ...protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
 from .. import manager as test_module
 from ..manager import RevocationManager, RevocationManagerError
+from ..publisher import PendingRevocationPublisher
 
 TEST_DID = "LjgpST2rjsoxYegQDRm7EL"
 SCHEMA_NAME = "bc-reg"
@@ -93,6 +95,58 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             ["2", "1"],
         )
 
+    async def test_revoke_credential_publish_locked(self):
+        publisher = PendingRevocationPublisher(max_pending=10)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        mock_issuer_rev_reg_record = mock.MagicMock(
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            send_entry=mock.CoroutineMock(),
+            clear_pending=mock.CoroutineMock(),
+            pending_pub=["2"],
+        )
+        # as left by the publication holding the lock
+        published_rec = mock.MagicMock(
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            send_entry=mock.CoroutineMock(),
+            clear_pending=mock.CoroutineMock(),
+            pending_pub=[],
+        )
+        issuer = mock.MagicMock(IndyIssuer, autospec=True)
+        issuer.revoke_credentials = mock.CoroutineMock(return_value=(None, []))
+        self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+
+        with mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc, mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(return_value=published_rec),
+        ):
+            revoc.return_value.get_issuer_rev_reg_record = mock.CoroutineMock(
+                return_value=mock_issuer_rev_reg_record
+            )
+            revoc.return_value.get_ledger_registry = mock.CoroutineMock(
+                return_value=mock.MagicMock(
+                    get_or_fetch_local_tails_path=mock.CoroutineMock()
+                )
+            )
+
+            async with publisher.lock(REV_REG_ID):
+                task = asyncio.ensure_future(
+                    self.manager.revoke_credential(REV_REG_ID, "1", publish=True)
+                )
+                await asyncio.sleep(0.01)
+                issuer.revoke_credentials.assert_not_called()
+            await task
+
+        issuer.revoke_credentials.assert_awaited_once_with(
+            published_rec.cred_def_id, REV_REG_ID, TAILS_LOCAL, ["1"]
+        )
+
     async def test_revoke_credential_publish_endorser(self):
         conn_record = ConnRecord(
             their_label="Hello",
@@ -381,10 +435,11 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(IndyIssuer, issuer)
             manager = RevocationManager(self.profile)
-            _, result = await manager.publish_pending_revocations(
+            _, result, errors = await manager.publish_pending_revocations(
                 rrid2crid={REV_REG_ID: "2"}, connection_id=conn_id
             )
             assert result == {REV_REG_ID: ["2"]}
+            assert not errors
             mock_issuer_rev_reg_records[0].clear_pending.assert_called_once()
             mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
 
@@ -490,8 +545,9 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(IndyIssuer, issuer)
 
-            _, result = await self.manager.publish_pending_revocations()
+            _, result, errors = await self.manager.publish_pending_revocations()
             assert result == {REV_REG_ID: ["1", "2"]}
+            assert not errors
             mock_issuer_rev_reg_record.clear_pending.assert_called_once()
 
     async def test_publish_pending_revocations_1_rev_reg_all(self):
@@ -549,7 +605,7 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(IndyIssuer, issuer)
 
-            _, result = await self.manager.publish_pending_revocations(
+            _, result, errors = await self.manager.publish_pending_revocations(
                 {REV_REG_ID: None}
             )
             assert result == {REV_REG_ID: ["1", "2"]}
@@ -611,13 +667,347 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(IndyIssuer, issuer)
 
-            _, result = await self.manager.publish_pending_revocations(
+            _, result, errors = await self.manager.publish_pending_revocations(
                 {REV_REG_ID: "2"}
             )
             assert result == {REV_REG_ID: ["2"]}
+            assert not errors
             mock_issuer_rev_reg_records[0].clear_pending.assert_called_once()
             mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
 
+    async def test_publish_pending_revocations_concurrent_x(self):
+        delta = {
+            "ver": "1.0",
+            "value": {"prevAccum": "1 ...", "accum": "21 ...", "issued": [1, 2, 3]},
+        }
+        rrids = [f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag{i}" for i in range(6)]
+        mock_issuer_rev_reg_records = [
+            mock.MagicMock(
+                record_id=i,
+                revoc_reg_id=rrid,
+                tails_local_path=TAILS_LOCAL,
+                pending_pub=["1", "2"],
+                send_entry=mock.CoroutineMock(),
+                clear_pending=mock.CoroutineMock(),
+            )
+            for i, rrid in enumerate(rrids)
+        ]
+        active = 0
+        max_active = 0
+
+        async def revoke_credentials(cred_def_id, rrid, tails_path, crids):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if rrid == rrids[1]:
+                raise IndyIssuerError("tails file missing")
+            return json.dumps(delta), []
+
+        self.profile.settings["revocation.max_concurrent_publish"] = 2
+        with mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_pending",
+            mock.CoroutineMock(return_value=mock_issuer_rev_reg_records),
+        ), mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(
+                side_effect=lambda _, id, **args: mock_issuer_rev_reg_records[id]
+            ),
+        ):
+            issuer = mock.MagicMock(IndyIssuer, autospec=True)
+            issuer.revoke_credentials = revoke_credentials
+            self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+
+            _, result, errors = await self.manager.publish_pending_revocations()
+            assert list(errors) == [rrids[1]]
+            assert "tails file missing" in errors[rrids[1]]
+            assert set(result) == set(rrids) - {rrids[1]}
+
+        assert max_active == 2
+        for i, rec in enumerate(mock_issuer_rev_reg_records):
+            if i == 1:
+                rec.send_entry.assert_not_called()
+            else:
+                rec.send_entry.assert_called_once()
+
+    async def test_publish_pending_revocations_all_x(self):
+        mock_issuer_rev_reg_record = mock.MagicMock(
+            record_id=0,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            pending_pub=["1", "2"],
+            send_entry=mock.CoroutineMock(),
+            clear_pending=mock.CoroutineMock(),
+        )
+        with mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_pending",
+            mock.CoroutineMock(return_value=[mock_issuer_rev_reg_record]),
+        ), mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(return_value=mock_issuer_rev_reg_record),
+        ):
+            issuer = mock.MagicMock(IndyIssuer, autospec=True)
+            issuer.revoke_credentials = mock.CoroutineMock(
+                side_effect=IndyIssuerError("tails file missing")
+            )
+            self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+
+            with self.assertRaises(RevocationManagerError) as context:
+                await self.manager.publish_pending_revocations()
+            assert REV_REG_ID in str(context.exception)
+            mock_issuer_rev_reg_record.send_entry.assert_not_called()
+
+    async def test_publish_pending_revocations_locked(self):
+        publisher = PendingRevocationPublisher(max_pending=10)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        mock_issuer_rev_reg_record = mock.MagicMock(
+            record_id=0,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            pending_pub=["1", "2"],
+            send_entry=mock.CoroutineMock(),
+        )
+        with mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_pending",
+            mock.CoroutineMock(return_value=[mock_issuer_rev_reg_record]),
+        ), mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(return_value=mock_issuer_rev_reg_record),
+        ):
+            issuer = mock.MagicMock(IndyIssuer, autospec=True)
+            issuer.revoke_credentials = mock.CoroutineMock(
+                return_value=(json.dumps({"ver": "1.0", "value": {}}), [])
+            )
+            self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+
+            async with publisher.lock(REV_REG_ID):
+                task = asyncio.ensure_future(self.manager.publish_pending_revocations())
+                await asyncio.sleep(0.01)
+                issuer.revoke_credentials.assert_not_called()
+                # published in the meantime by the lock holder
+                mock_issuer_rev_reg_record.pending_pub = []
+            _, result, errors = await task
+
+        issuer.revoke_credentials.assert_not_called()
+        assert result == {REV_REG_ID: []}
+        assert not errors
+
+    async def test_revoke_credential_pending_publisher(self):
+        mock_issuer_rev_reg_record = mock.MagicMock(
+            mark_pending=mock.CoroutineMock(), pending_pub=["1", "2"]
+        )
+        publisher = mock.MagicMock(PendingRevocationPublisher, autospec=True)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        self.profile.context.injector.bind_instance(
+            IndyIssuer, mock.MagicMock(IndyIssuer, autospec=True)
+        )
+        with mock.patch.object(
+            test_module.IndyRevocation,
+            "get_issuer_rev_reg_record",
+            mock.CoroutineMock(return_value=mock_issuer_rev_reg_record),
+        ):
+            await self.manager.revoke_credential(REV_REG_ID, "2", publish=False)
+
+        mock_issuer_rev_reg_record.mark_pending.assert_called_once()
+        publisher.pending.assert_called_once_with(self.profile, REV_REG_ID, 2)
+
+    async def test_revoke_credentials_pending(self):
+        rr_ids = [REV_REG_ID, f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag2"]
+        async with self.profile.session() as session:
+            rr_recs = []
+            for rr_id in rr_ids:
+                rr_rec = test_module.IssuerRevRegRecord(
+                    cred_def_id=CRED_DEF_ID,
+                    revoc_reg_id=rr_id,
+                    pending_pub=["1"],
+                )
+                await rr_rec.save(session)
+                rr_recs.append(rr_rec)
+            await IssuerCredRevRecord(
+                cred_ex_id="dummy-cxid",
+                rev_reg_id=rr_ids[1],
+                cred_rev_id="5",
+            ).save(session)
+
+        with mock.patch.object(
+            test_module.IndyRevocation,
+            "get_issuer_rev_reg_record",
+            mock.CoroutineMock(side_effect=lambda rr_id: rr_recs[rr_ids.index(rr_id)]),
+        ):
+            outcomes, rev_entry_resps = await self.manager.revoke_credentials(
+                [
+                    {"rev_reg_id": rr_ids[0], "cred_rev_id": "2"},
+                    {"rev_reg_id": rr_ids[0], "cred_rev_id": "3"},
+                    {"cred_ex_id": "dummy-cxid"},
+                    {"cred_ex_id": "no-such-cxid"},
+                ]
+            )
+
+        assert rev_entry_resps == []
+        assert [o.get("state") for o in outcomes] == [
+            "pending",
+            "pending",
+            "pending",
+            None,
+        ]
+        assert outcomes[2]["rev_reg_id"] == rr_ids[1]
+        assert outcomes[2]["cred_rev_id"] == "5"
+        assert "no-such-cxid" in outcomes[3]["error"]
+        async with self.profile.session() as session:
+            for rr_rec, pending in zip(rr_recs, (["1", "2", "3"], ["1", "5"])):
+                rr_rec = await test_module.IssuerRevRegRecord.retrieve_by_id(
+                    session, rr_rec.record_id
+                )
+                assert rr_rec.pending_pub == pending
+
+    async def test_revoke_credentials_publish(self):
+        rr_ids = [REV_REG_ID, f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag2"]
+        mock_issuer_rev_reg_records = [
+            mock.MagicMock(
+                record_id=i,
+                revoc_reg_id=rr_id,
+                tails_local_path=TAILS_LOCAL,
+                pending_pub=["1"],
+                send_entry=mock.CoroutineMock(return_value={"result": "..."}),
+                clear_pending=mock.CoroutineMock(),
+            )
+            for i, rr_id in enumerate(rr_ids)
+        ]
+        issuer = mock.MagicMock(IndyIssuer, autospec=True)
+        issuer.revoke_credentials = mock.CoroutineMock(
+            side_effect=[
+                (json.dumps({"ver": "1.0", "value": {"accum": "21 ..."}}), ["3"]),
+                IndyIssuerError("tails file missing"),
+            ]
+        )
+        self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+        self.profile.settings["revocation.max_concurrent_publish"] = 1
+
+        with mock.patch.object(
+            test_module.IndyRevocation,
+            "get_issuer_rev_reg_record",
+            mock.CoroutineMock(
+                side_effect=lambda rr_id: mock_issuer_rev_reg_records[
+                    rr_ids.index(rr_id)
+                ]
+            ),
+        ), mock.patch.object(
+            test_module.IndyRevocation,
+            "get_ledger_registry",
+            mock.CoroutineMock(
+                return_value=mock.MagicMock(
+                    get_or_fetch_local_tails_path=mock.CoroutineMock()
+                )
+            ),
+        ), mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(
+                side_effect=lambda _, id, **args: mock_issuer_rev_reg_records[id]
+            ),
+        ), mock.patch.object(
+            self.manager, "set_cred_revoked_state", mock.CoroutineMock()
+        ) as mock_set_state, mock.patch.object(
+            test_module, "notify_revocation_published_event", mock.CoroutineMock()
+        ) as mock_notify:
+            outcomes, rev_entry_resps = await self.manager.revoke_credentials(
+                [
+                    {"rev_reg_id": rr_ids[0], "cred_rev_id": "2"},
+                    {"rev_reg_id": rr_ids[0], "cred_rev_id": "3"},
+                    {"rev_reg_id": rr_ids[1], "cred_rev_id": "2"},
+                ],
+                publish=True,
+            )
+
+        # one accumulator update per registry, including those already pending
+        assert issuer.revoke_credentials.call_count == 2
+        assert issuer.revoke_credentials.call_args_list[0].args[3] == {
+            "1",
+            "2",
+            "3",
+        }
+        mock_set_state.assert_called_once_with(rr_ids[0], {"1", "2", "3"})
+        mock_notify.assert_called_once_with(self.profile, rr_ids[0], ["2"])
+        assert rev_entry_resps == [{"result": "..."}]
+        assert outcomes[0]["state"] == "revoked"
+        assert "could not be revoked" in outcomes[1]["error"]
+        assert "tails file missing" in outcomes[2]["error"]
+
+    async def test_revoke_credentials_publish_locked(self):
+        publisher = PendingRevocationPublisher(max_pending=10)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        mock_issuer_rev_reg_record = mock.MagicMock(
+            record_id=0,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            pending_pub=["1"],
+            send_entry=mock.CoroutineMock(return_value={"result": "..."}),
+            clear_pending=mock.CoroutineMock(),
+        )
+        # as left by the publication holding the lock
+        published_rec = mock.MagicMock(
+            record_id=0,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path=TAILS_LOCAL,
+            pending_pub=[],
+            send_entry=mock.CoroutineMock(return_value={"result": "..."}),
+            clear_pending=mock.CoroutineMock(),
+        )
+        issuer = mock.MagicMock(IndyIssuer, autospec=True)
+        issuer.revoke_credentials = mock.CoroutineMock(
+            return_value=(json.dumps({"ver": "1.0", "value": {"accum": "21 ..."}}), [])
+        )
+        self.profile.context.injector.bind_instance(IndyIssuer, issuer)
+
+        with mock.patch.object(
+            test_module.IndyRevocation,
+            "get_issuer_rev_reg_record",
+            mock.CoroutineMock(return_value=mock_issuer_rev_reg_record),
+        ), mock.patch.object(
+            test_module.IndyRevocation,
+            "get_ledger_registry",
+            mock.CoroutineMock(
+                return_value=mock.MagicMock(
+                    get_or_fetch_local_tails_path=mock.CoroutineMock()
+                )
+            ),
+        ), mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "retrieve_by_id",
+            mock.CoroutineMock(return_value=published_rec),
+        ) as mock_retrieve, mock.patch.object(
+            self.manager, "set_cred_revoked_state", mock.CoroutineMock()
+        ), mock.patch.object(
+            test_module, "notify_revocation_published_event", mock.CoroutineMock()
+        ):
+            async with publisher.lock(REV_REG_ID):
+                task = asyncio.ensure_future(
+                    self.manager.revoke_credentials(
+                        [{"rev_reg_id": REV_REG_ID, "cred_rev_id": "2"}],
+                        publish=True,
+                    )
+                )
+                await asyncio.sleep(0.01)
+                issuer.revoke_credentials.assert_not_called()
+            outcomes, _ = await task
+
+        assert mock_retrieve.call_args_list[0].kwargs == {"for_update": True}
+        assert issuer.revoke_credentials.call_args.args[3] == {"2"}
+        assert outcomes[0]["state"] == "revoked"
+
     async def test_clear_pending(self):
         mock_issuer_rev_reg_records = [
             mock.MagicMock(
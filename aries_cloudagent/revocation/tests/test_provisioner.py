@@ -0,0 +1,61 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ...core.in_memory import InMemoryProfile
+from .. import provisioner as test_module
+from ..provisioner import RegistryProvisioner
+
+CRED_DEF_ID = "LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1"
+REV_REG_ID = "LjgpST2rjsoxYegQDRm7EL:4:LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1:CL_ACCUM:0"
+
+
+class TestRegistryProvisioner(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile()
+
+    async def test_filled(self):
+        provisioner = RegistryProvisioner()
+        assert provisioner.standby == 1
+        assert not provisioner.filled(REV_REG_ID, 100, 100)
+
+        provisioner = RegistryProvisioner(standby=2, watermark=75)
+        assert not provisioner.filled(REV_REG_ID, 74, 100)
+        assert provisioner.filled(REV_REG_ID, 75, 100)
+        # once per registry
+        assert not provisioner.filled(REV_REG_ID, 76, 100)
+        assert provisioner.filled("other-rev-reg-id", 4, 4)
+
+    async def test_provision(self):
+        provisioner = RegistryProvisioner()
+        provision = mock.CoroutineMock(return_value=1)
+        provisioner.provision(self.profile, CRED_DEF_ID, provision)
+        # already in progress
+        provisioner.provision(self.profile, CRED_DEF_ID, provision)
+        await provisioner.stop()
+        provision.assert_awaited_once_with()
+        assert not provisioner._tasks
+
+        provisioner.provision(self.profile, CRED_DEF_ID, provision)
+        await provisioner.stop()
+        assert provision.await_count == 2
+
+    async def test_provision_x(self):
+        provisioner = RegistryProvisioner(watermark=75)
+        assert provisioner.filled(REV_REG_ID, 75, 100)
+        provision = mock.CoroutineMock(side_effect=ValueError("ledger down"))
+        with mock.patch.object(test_module.LOGGER, "exception") as mock_log:
+            provisioner.provision(self.profile, CRED_DEF_ID, provision, REV_REG_ID)
+            await provisioner.stop()
+        mock_log.assert_called_once()
+        assert not provisioner._tasks
+        # checked again after the failure
+        assert provisioner.filled(REV_REG_ID, 76, 100)
+
+    async def test_provision_filled(self):
+        provisioner = RegistryProvisioner(watermark=75)
+        assert provisioner.filled(REV_REG_ID, 75, 100)
+        provision = mock.CoroutineMock(return_value=1)
+        provisioner.provision(self.profile, CRED_DEF_ID, provision, REV_REG_ID)
+        await provisioner.stop()
+        assert not provisioner.filled(REV_REG_ID, 76, 100)
@@ -0,0 +1,107 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ...core.in_memory import InMemoryProfile
+from .. import manager as manager_module
+from .. import publisher as publisher_module
+from ...revocation_anoncreds import manager as anoncreds_manager_module
+from ..publisher import PendingRevocationPublisher, publish_lock
+
+REV_REG_ID = "LjgpST2rjsoxYegQDRm7EL:4:LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1:CL_ACCUM:0"
+
+
+class TestPendingRevocationPublisher(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile()
+
+    async def test_disabled(self):
+        publisher = PendingRevocationPublisher()
+        assert not publisher.enabled
+        publisher.pending(self.profile, REV_REG_ID, 100)
+        assert not publisher._timers
+
+    async def test_max_pending(self):
+        publisher = PendingRevocationPublisher(max_pending=3, interval=3600)
+        with mock.patch.object(
+            manager_module.RevocationManager,
+            "publish_pending_revocations",
+            mock.CoroutineMock(return_value=(None, {REV_REG_ID: ["1", "2", "3"]}, {})),
+        ) as mock_publish:
+            publisher.pending(self.profile, REV_REG_ID, 1)
+            publisher.pending(self.profile, REV_REG_ID, 2)
+            assert REV_REG_ID in publisher._timers
+            mock_publish.assert_not_called()
+
+            publisher.pending(self.profile, REV_REG_ID, 3)
+            await asyncio.sleep(0.01)
+            await publisher.stop()
+            mock_publish.assert_called_once_with({REV_REG_ID: []})
+        assert not publisher._timers
+
+    async def test_interval(self):
+        publisher = PendingRevocationPublisher(interval=0.01)
+        with mock.patch.object(
+            manager_module.RevocationManager,
+            "publish_pending_revocations",
+            mock.CoroutineMock(
+                side_effect=manager_module.RevocationManagerError("ledger down")
+            ),
+        ) as mock_publish:
+            publisher.pending(self.profile, REV_REG_ID, 1)
+            publisher.pending(self.profile, REV_REG_ID, 2)
+            await asyncio.sleep(0.05)
+            await publisher.stop()
+            mock_publish.assert_called_once_with({REV_REG_ID: []})
+
+    async def test_anoncreds(self):
+        self.profile.settings["wallet.type"] = "askar-anoncreds"
+        publisher = PendingRevocationPublisher(max_pending=1)
+        with mock.patch.object(
+            anoncreds_manager_module.RevocationManager,
+            "publish_pending_revocations",
+            mock.CoroutineMock(return_value=({REV_REG_ID: ["1"]}, {})),
+        ) as mock_publish:
+            publisher.pending(self.profile, REV_REG_ID, 1)
+            await asyncio.sleep(0.01)
+            await publisher.stop()
+            mock_publish.assert_called_once_with({REV_REG_ID: []})
+
+    async def test_publish_lock(self):
+        assert publish_lock(self.profile, REV_REG_ID) is not publish_lock(
+            self.profile, REV_REG_ID
+        )
+        publisher = PendingRevocationPublisher(max_pending=1)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        assert publish_lock(self.profile, REV_REG_ID) is publisher.lock(REV_REG_ID)
+
+    async def test_publish_x_unexpected(self):
+        publisher = PendingRevocationPublisher(max_pending=1)
+        with mock.patch.object(
+            manager_module.RevocationManager,
+            "publish_pending_revocations",
+            mock.CoroutineMock(side_effect=ValueError("bad delta")),
+        ), mock.patch.object(publisher_module, "LOGGER") as mock_logger:
+            await publisher.publish(self.profile, REV_REG_ID)
+            mock_logger.warning.assert_called_once()
+
+    async def test_author_skipped(self):
+        self.profile.settings["endorser.author"] = True
+        publisher = PendingRevocationPublisher(max_pending=1)
+        publisher.pending(self.profile, REV_REG_ID, 1)
+        assert not publisher._timers
+
+    async def test_stop_cancels(self):
+        publisher = PendingRevocationPublisher(interval=3600)
+        with mock.patch.object(
+            manager_module.RevocationManager,
+            "publish_pending_revocations",
+            mock.CoroutineMock(),
+        ) as mock_publish:
+            publisher.pending(self.profile, REV_REG_ID, 1)
+            await publisher.stop()
+            mock_publish.assert_not_called()
+        assert not publisher._timers
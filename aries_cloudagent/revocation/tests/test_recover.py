@@ -0,0 +1,103 @@
+import random
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from aries_cloudagent.tests import mock
+
+from .. import recover as test_module
+from ..recover import RevocationBitmap, generate_ledger_rrrecovery_txn
+
+TEST_DID = "LjgpST2rjsoxYegQDRm7EL"
+
+
+class TestRevocationBitmap(IsolatedAsyncioTestCase):
+    def test_bitmap(self):
+        bitmap = RevocationBitmap.from_indexes(["3", 1, 17, 8, 1])
+        assert len(bitmap) == 4
+        assert bitmap.indexes() == [1, 3, 8, 17]
+        assert 17 in bitmap
+        assert 2 not in bitmap
+        assert -1 not in bitmap
+        assert not RevocationBitmap.from_indexes([])
+        assert RevocationBitmap.from_indexes([]).indexes() == []
+
+        other = RevocationBitmap.from_indexes([3, 4, 17])
+        assert (bitmap - other).indexes() == [1, 8]
+        assert (other - bitmap).indexes() == [4]
+        assert (bitmap | other).indexes() == [1, 3, 4, 8, 17]
+
+    def test_bitmap_large_registry(self):
+        rng = random.Random(0)
+        max_cred_num = 32768
+        wallet = set(rng.sample(range(1, max_cred_num + 1), 20000))
+        ledger = set(rng.sample(sorted(wallet), 15000)) | {1, max_cred_num}
+
+        wallet_bits = RevocationBitmap.from_indexes(wallet)
+        ledger_bits = RevocationBitmap.from_indexes(ledger)
+        assert len(wallet_bits) == len(wallet)
+        assert (wallet_bits - ledger_bits).indexes() == sorted(wallet - ledger)
+        assert (ledger_bits - wallet_bits).indexes() == sorted(ledger - wallet)
+
+
+class TestGenerateRecoveryTxn(IsolatedAsyncioTestCase):
+    async def test_generate_from_known_state(self):
+        credx = pytest.importorskip("indy_credx")
+        schema = credx.Schema.create(TEST_DID, "schema", "1.0", ["name"])
+        cred_def, cred_def_private, _ = credx.CredentialDefinition.create(
+            TEST_DID, schema, "CL", "tag", support_revocation=True
+        )
+        with tempfile.TemporaryDirectory() as tails_dir:
+            (
+                rev_reg_def,
+                rev_reg_def_private,
+                rev_reg,
+                _,
+            ) = credx.RevocationRegistryDefinition.create(
+                TEST_DID,
+                cred_def,
+                "0",
+                "CL_ACCUM",
+                100,
+                tails_dir_path=tails_dir,
+            )
+
+            with mock.patch.object(test_module, "fetch_txns") as mock_fetch:
+                delta = await generate_ledger_rrrecovery_txn(
+                    None,
+                    rev_reg_def.id,
+                    [1, 2, 3],
+                    cred_def,
+                    rev_reg_def_private,
+                    rev_reg_def=rev_reg_def.to_dict(),
+                    ledger_delta={
+                        "ver": "1.0",
+                        "value": {
+                            "accum": rev_reg.to_dict()["value"]["accum"],
+                            "revoked": [1],
+                        },
+                    },
+                )
+                mock_fetch.assert_not_called()
+
+                assert sorted(delta.to_dict()["value"]["revoked"]) == [2, 3]
+
+                assert (
+                    await generate_ledger_rrrecovery_txn(
+                        None,
+                        rev_reg_def.id,
+                        [1],
+                        cred_def,
+                        rev_reg_def_private,
+                        rev_reg_def=rev_reg_def.to_dict(),
+                        ledger_delta={
+                            "ver": "1.0",
+                            "value": {
+                                "accum": rev_reg.to_dict()["value"]["accum"],
+                                "revoked": [1, 5],
+                            },
+                        },
+                    )
+                    is None
+                )
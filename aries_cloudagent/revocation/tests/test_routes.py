@@ -111,6 +111,98 @@ class TestRevocationRoutes(IsolatedAsyncioTestCase):
 
             mock_response.assert_called_once_with({})
 
+    async def test_revoke_batch(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={
+                "revocations": [
+                    {"rev_reg_id": "rr_id", "cred_rev_id": "23"},
+                    {"cred_ex_id": "dummy-cxid"},
+                ],
+                "publish": True,
+            }
+        )
+        results = [
+            {"rev_reg_id": "rr_id", "cred_rev_id": "23", "state": "revoked"},
+            {"cred_ex_id": "dummy-cxid", "error": "not found"},
+        ]
+
+        with mock.patch.object(
+            test_module, "RevocationManager", autospec=True
+        ) as mock_mgr, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_mgr.return_value.revoke_credentials = mock.CoroutineMock(
+                return_value=(results, [{"result": "..."}])
+            )
+
+            await test_module.revoke_batch(self.request)
+
+            assert mock_mgr.return_value.revoke_credentials.call_args.kwargs["publish"]
+            mock_response.assert_called_once_with({"results": results})
+
+    async def test_revoke_batch_endorser(self):
+        self.author_request.json = mock.CoroutineMock(
+            return_value={
+                "revocations": [{"rev_reg_id": "rr_id", "cred_rev_id": "23"}],
+                "publish": True,
+            }
+        )
+
+        with mock.patch.object(
+            test_module, "RevocationManager", autospec=True
+        ) as mock_mgr, mock.patch.object(
+            test_module,
+            "get_endorser_connection_id",
+            mock.CoroutineMock(return_value="dummy-conn-id"),
+        ), mock.patch.object(
+            test_module, "TransactionManager", autospec=True
+        ) as mock_txn_mgr, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_mgr.return_value.revoke_credentials = mock.CoroutineMock(
+                return_value=([], [{"result": "a"}, {"result": "b"}])
+            )
+            mock_txn_mgr.return_value.create_record = mock.CoroutineMock(
+                return_value=mock.MagicMock(
+                    serialize=mock.MagicMock(return_value={"txn": "..."})
+                )
+            )
+
+            await test_module.revoke_batch(self.author_request)
+
+            kwargs = mock_mgr.return_value.revoke_credentials.call_args.kwargs
+            assert not kwargs["write_ledger"]
+            assert kwargs["endorser_conn_id"] == "dummy-conn-id"
+            assert mock_txn_mgr.return_value.create_record.call_count == 2
+            mock_response.assert_called_once_with(
+                {"results": [], "txns": [{"txn": "..."}, {"txn": "..."}]}
+            )
+
+    async def test_revoke_batch_x(self):
+        self.request.json = mock.CoroutineMock(
+            return_value={
+                "revocations": [{"rev_reg_id": "rr_id", "cred_rev_id": "23"}],
+                "notify": True,
+            }
+        )
+
+        with self.assertRaises(HTTPBadRequest):
+            await test_module.revoke_batch(self.request)
+
+        self.request.json = mock.CoroutineMock(
+            return_value={
+                "revocations": [{"rev_reg_id": "rr_id", "cred_rev_id": "23"}],
+            }
+        )
+        with mock.patch.object(
+            test_module, "RevocationManager", autospec=True
+        ) as mock_mgr:
+            mock_mgr.return_value.revoke_credentials = mock.CoroutineMock(
+                side_effect=test_module.RevocationManagerError()
+            )
+            with self.assertRaises(HTTPBadRequest):
+                await test_module.revoke_batch(self.request)
+
     async def test_revoke_endorser_no_conn_id_by_cred_ex_id(self):
         self.author_request.json = mock.CoroutineMock(
             return_value={
@@ -279,7 +371,7 @@ class TestRevocationRoutes(IsolatedAsyncioTestCase):
         ) as mock_response:
             pub_pending = mock.CoroutineMock()
             mock_mgr.return_value.publish_pending_revocations = mock.CoroutineMock(
-                return_value=({}, pub_pending.return_value)
+                return_value=({}, pub_pending.return_value, {})
             )
 
             await test_module.publish_revocations(self.request)
@@ -288,6 +380,24 @@ class TestRevocationRoutes(IsolatedAsyncioTestCase):
                 {"rrid2crid": pub_pending.return_value}
             )
 
+    async def test_publish_revocations_partial(self):
+        self.request.json = mock.CoroutineMock()
+
+        with mock.patch.object(
+            test_module, "RevocationManager", autospec=True
+        ) as mock_mgr, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_mgr.return_value.publish_pending_revocations = mock.CoroutineMock(
+                return_value=({}, {"rrid": ["1"]}, {"other": "ledger down"})
+            )
+
+            await test_module.publish_revocations(self.request)
+
+            mock_response.assert_called_once_with(
+                {"rrid2crid": {"rrid": ["1"]}, "errors": {"other": "ledger down"}}
+            )
+
     async def test_publish_revocations_x(self):
         self.request.json = mock.CoroutineMock()
 
@@ -314,7 +424,7 @@ class TestRevocationRoutes(IsolatedAsyncioTestCase):
         ) as mock_response:
             pub_pending = mock.CoroutineMock()
             mock_mgr.return_value.publish_pending_revocations = mock.CoroutineMock(
-                return_value=({}, pub_pending.return_value)
+                return_value=({}, pub_pending.return_value, {})
             )
 
             await test_module.publish_revocations(self.author_request)
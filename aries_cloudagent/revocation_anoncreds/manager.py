@@ -1,5 +1,6 @@
 """Classes to manage credential revocation."""
 
+import asyncio
 import logging
 from typing import Mapping, Optional, Sequence, Text, Tuple
 
@@ -14,6 +15,8 @@ from ..protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRec
 from ..protocols.revocation_notification.v1_0.models.rev_notification_record import (
     RevNotificationRecord,
 )
+from ..revocation.manager import DEFAULT_MAX_CONCURRENT_PUBLISH
+from ..revocation.publisher import PendingRevocationPublisher, publish_lock
 from ..revocation.util import (
     notify_pending_cleared_event,
 )
@@ -114,23 +117,31 @@ class RevocationManager:
 
         if publish:
             await revoc.get_or_fetch_local_tails_path(rev_reg_def)
-            result = await revoc.revoke_pending_credentials(
-                rev_reg_id,
-                additional_crids=[int(cred_rev_id)],
-            )
-
-            if result.curr and result.revoked:
-                await self.set_cred_revoked_state(rev_reg_id, result.revoked)
-                await revoc.update_revocation_list(
+            async with publish_lock(self._profile, rev_reg_id):
+                result = await revoc.revoke_pending_credentials(
                     rev_reg_id,
-                    result.prev,
-                    result.curr,
-                    result.revoked,
-                    options=options,
+                    additional_crids=[int(cred_rev_id)],
                 )
 
+                if result.curr and result.revoked:
+                    await self.set_cred_revoked_state(rev_reg_id, result.revoked)
+                    await revoc.update_revocation_list(
+                        rev_reg_id,
+                        result.prev,
+                        result.curr,
+                        result.revoked,
+                        options=options,
+                    )
+
         else:
             await revoc.mark_pending_revocations(rev_reg_id, int(cred_rev_id))
+            publisher = self._profile.inject_or(PendingRevocationPublisher)
+            if publisher:
+                publisher.pending(
+                    self._profile,
+                    rev_reg_id,
+                    len(await revoc.get_pending_revocations(rev_reg_id)),
+                )
         if notify:
             thread_id = thread_id or f"indy::{rev_reg_id}::{cred_rev_id}"
             rev_notify_rec = RevNotificationRecord(
@@ -188,7 +199,7 @@ class RevocationManager:
         self,
         rrid2crid: Optional[Mapping[Text, Sequence[Text]]] = None,
         options: Optional[dict] = None,
-    ) -> Mapping[Text, Sequence[Text]]:
+    ) -> Tuple[Mapping[Text, Sequence[Text]], Mapping[Text, Text]]:
         """Publish pending revocations to the ledger.
 
         Args:
@@ -209,32 +220,78 @@ class RevocationManager:
                     - pending ["1", "2"] from revocation registry tagged 1
                     - no pending revocations from any other revocation registries.
 
-        Returns: mapping from each revocation registry id to its cred rev ids published.
+        Revocation registries are published concurrently, up to the configured
+        maximum at a time. A failure on one registry does not stop the others;
+        it is reported in the result, and raised only when every registry failed.
+
+        Returns:
+            The mapping from each revocation registry id to its cred rev ids
+            published, and the mapping from each revocation registry id that
+            failed to its error
+
         """
         options = options or {}
         published_crids = {}
         revoc = AnonCredsRevocation(self._profile)
 
         rev_reg_def_ids = await revoc.get_revocation_lists_with_pending_revocations()
+        pending = []
         for rrid in rev_reg_def_ids:
             if rrid2crid:
                 if rrid not in rrid2crid:
                     continue
-                limit_crids = [int(crid) for crid in rrid2crid[rrid]]
+                limit_crids = [int(crid) for crid in rrid2crid[rrid] or ()] or None
             else:
                 limit_crids = None
+            pending.append((rrid, limit_crids))
 
-            result = await revoc.revoke_pending_credentials(
-                rrid, limit_crids=limit_crids
-            )
-            if result.curr and result.revoked:
-                await self.set_cred_revoked_state(rrid, result.revoked)
-                await revoc.update_revocation_list(
-                    rrid, result.prev, result.curr, result.revoked, options
+        limit = asyncio.Semaphore(
+            self._profile.settings.get_int("revocation.max_concurrent_publish")
+            or DEFAULT_MAX_CONCURRENT_PUBLISH
+        )
+
+        async def publish(rrid: str, limit_crids: Optional[Sequence[int]]):
+            async with limit, publish_lock(self._profile, rrid):
+                result = await revoc.revoke_pending_credentials(
+                    rrid, limit_crids=limit_crids
                 )
-                published_crids[rrid] = sorted(result.revoked)
+                if result.curr and result.revoked:
+                    await self.set_cred_revoked_state(rrid, result.revoked)
+                    await revoc.update_revocation_list(
+                        rrid, result.prev, result.curr, result.revoked, options
+                    )
+                    return sorted(result.revoked)
+                return None
+
+        outcomes = await asyncio.gather(
+            *(publish(rrid, limit_crids) for rrid, limit_crids in pending),
+            return_exceptions=True,
+        )
+
+        errors = {}
+        for (rrid, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                unexpected = not isinstance(outcome, BaseError)
+                errors[rrid] = str(outcome) if unexpected else outcome.roll_up
+                self._logger.warning(
+                    "Failed to publish pending revocations on registry %s: %s",
+                    rrid,
+                    errors[rrid],
+                    exc_info=outcome if unexpected else None,
+                )
+            elif outcome:
+                self._logger.info(
+                    "Published %d revocation(s) on registry %s", len(outcome), rrid
+                )
+                published_crids[rrid] = outcome
+
+        if errors and len(errors) == len(pending):
+            raise RevocationManagerError(
+                "Failed to publish revocations: "
+                + "; ".join(f"{rrid}: {err}" for rrid, err in errors.items())
+            )
 
-        return published_crids
+        return published_crids, errors
 
     async def clear_pending_revocations(
         self, purge: Mapping[Text, Sequence[Text]] = None
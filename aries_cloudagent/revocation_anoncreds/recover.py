@@ -9,6 +9,7 @@ import time
 import aiohttp
 import base58
 
+from ..revocation.recover import RevocationBitmap
 
 LOGGER = logging.getLogger(__name__)
 
@@ -81,30 +82,54 @@ async def fetch_txns(genesis_txns, registry_id):
     delta = credx_module.RevocationRegistryDelta.load(accum_to)
     registry = credx_module.RevocationRegistry.load(accum_to)
     LOGGER.debug("Ledger registry state: %s", registry.to_json())
-    revoked = set(result["data"]["value"]["revoked"])
+    revoked = RevocationBitmap.from_indexes(result["data"]["value"]["revoked"])
     LOGGER.debug("Ledger revoked indexes: %s", revoked)
 
     return defn, registry, delta, revoked, tails_temp
 
 
 async def generate_ledger_rrrecovery_txn(
-    genesis_txns, registry_id, set_revoked, cred_def, rev_reg_def_private
+    genesis_txns,
+    registry_id,
+    set_revoked,
+    cred_def,
+    rev_reg_def_private,
+    *,
+    rev_reg_def: dict = None,
+    ledger_delta: dict = None,
 ):
-    """Generate a new ledger accum entry, based on wallet vs ledger revocation state."""
+    """Generate a new ledger accum entry, based on wallet vs ledger revocation state.
+
+    When the revocation registry definition and the current ledger delta are
+    already known, they are used directly instead of being fetched again from
+    the ledger along with the tails file.
+    """
 
     new_delta = None
 
-    ledger_data = await fetch_txns(genesis_txns, registry_id)
-    if not ledger_data:
-        return new_delta
-    defn, registry, delta, prev_revoked, tails_temp = ledger_data
+    if rev_reg_def and ledger_delta:
+        credx_module = importlib.import_module("indy_credx")
+        defn = credx_module.RevocationRegistryDefinition.load(rev_reg_def)
+        registry = credx_module.RevocationRegistry.load(
+            {"ver": "1.0", "value": {"accum": ledger_delta["value"]["accum"]}}
+        )
+        prev_revoked = RevocationBitmap.from_indexes(
+            ledger_delta["value"].get("revoked") or []
+        )
+    else:
+        ledger_data = await fetch_txns(genesis_txns, registry_id)
+        if not ledger_data:
+            return new_delta
+        defn, registry, delta, prev_revoked, tails_temp = ledger_data
+        LOGGER.debug("tails_temp: %s", tails_temp.name)
 
-    set_revoked = set(set_revoked)
+    if not isinstance(set_revoked, RevocationBitmap):
+        set_revoked = RevocationBitmap.from_indexes(set_revoked)
     mismatch = prev_revoked - set_revoked
     if mismatch:
         LOGGER.warning(
             "Credential index(es) revoked on the ledger, but not in wallet: %s",
-            mismatch,
+            mismatch.indexes(),
         )
 
     updates = set_revoked - prev_revoked
@@ -113,10 +138,9 @@ async def generate_ledger_rrrecovery_txn(
     else:
         LOGGER.debug("New revoked indexes: %s", updates)
 
-        LOGGER.debug("tails_temp: %s", tails_temp.name)
         update_registry = registry.copy()
         new_delta = update_registry.update(
-            cred_def, defn, rev_reg_def_private, [], updates
+            cred_def, defn, rev_reg_def_private, [], updates.indexes()
         )
 
         LOGGER.debug("New delta:")
@@ -423,6 +423,15 @@ class PublishRevocationsResultSchema(OpenAPISchema):
         ),
         metadata={"description": "Credential revocation ids by revocation registry id"},
     )
+    errors = fields.Dict(
+        required=False,
+        keys=fields.Str(metadata={"example": INDY_REV_REG_ID_EXAMPLE}),
+        values=fields.Str(metadata={"description": "Error publishing the registry"}),
+        metadata={
+            "description": "Errors by revocation registry id, for registries that "
+            "failed to publish while others succeeded"
+        },
+    )
 
 
 class RevokeRequestSchemaAnoncreds(CredRevRecordQueryStringSchema):
@@ -578,10 +587,16 @@ async def publish_revocations(request: web.BaseRequest):
     rev_manager = RevocationManager(profile)
 
     try:
-        rev_reg_resp = await rev_manager.publish_pending_revocations(rrid2crid, options)
-        return web.json_response({"rrid2crid": rev_reg_resp})
+        rev_reg_resp, errors = await rev_manager.publish_pending_revocations(
+            rrid2crid, options
+        )
+        response = {"rrid2crid": rev_reg_resp}
+        if errors:
+            response["errors"] = errors
+        return web.json_response(response)
     except (
         RevocationError,
+        RevocationManagerError,
         StorageError,
         AnonCredsIssuerError,
         AnonCredsRevocationError,
@@ -14,6 +14,7 @@ from ...protocols.issue_credential.v1_0.models.credential_exchange import (
     V10CredentialExchange,
 )
 from ...protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
+from ...revocation.publisher import PendingRevocationPublisher
 
 
 from ..manager import RevocationManager, RevocationManagerError
@@ -169,6 +170,29 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
 
         issuer.revoke_credentials.assert_not_awaited()
 
+    async def test_revoke_credential_pend_publisher(self):
+        publisher = mock.MagicMock(PendingRevocationPublisher, autospec=True)
+        self.profile.context.injector.bind_instance(
+            PendingRevocationPublisher, publisher
+        )
+        with mock.patch.object(
+            test_module, "AnonCredsRevocation", autospec=True
+        ) as revoc:
+            revoc.return_value.get_created_revocation_registry_definition = (
+                mock.CoroutineMock(return_value=mock.MagicMock())
+            )
+            revoc.return_value.mark_pending_revocations = mock.CoroutineMock()
+            revoc.return_value.get_pending_revocations = mock.CoroutineMock(
+                return_value=[1, 2]
+            )
+
+            await self.manager.revoke_credential(REV_REG_ID, "2", publish=False)
+
+            revoc.return_value.mark_pending_revocations.assert_called_once_with(
+                REV_REG_ID, 2
+            )
+            publisher.pending.assert_called_once_with(self.profile, REV_REG_ID, 2)
+
     @pytest.mark.skip(reason="Anoncreds-break")
     async def test_publish_pending_revocations_basic(self):
         deltas = [
@@ -210,7 +234,7 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(AnonCredsIssuer, issuer)
 
-            result = await self.manager.publish_pending_revocations()
+            result, _ = await self.manager.publish_pending_revocations()
             assert result == {REV_REG_ID: ["1", "2"]}
             mock_issuer_rev_reg_record.clear_pending.assert_called_once()
 
@@ -268,7 +292,9 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(AnonCredsIssuer, issuer)
 
-            result = await self.manager.publish_pending_revocations({REV_REG_ID: None})
+            result, _ = await self.manager.publish_pending_revocations(
+                {REV_REG_ID: None}
+            )
             assert result == {REV_REG_ID: ["1", "2"]}
             mock_issuer_rev_reg_records[0].clear_pending.assert_called_once()
             mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
@@ -327,7 +353,9 @@ class TestRevocationManager(IsolatedAsyncioTestCase):
             )
             self.profile.context.injector.bind_instance(AnonCredsIssuer, issuer)
 
-            result = await self.manager.publish_pending_revocations({REV_REG_ID: "2"})
+            result, _ = await self.manager.publish_pending_revocations(
+                {REV_REG_ID: "2"}
+            )
             assert result == {REV_REG_ID: ["2"]}
             mock_issuer_rev_reg_records[0].clear_pending.assert_called_once()
             mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
@@ -147,13 +147,30 @@ class TestRevocationRoutes(IsolatedAsyncioTestCase):
         ) as mock_mgr, mock.patch.object(
             test_module.web, "json_response"
         ) as mock_response:
-            pub_pending = mock.CoroutineMock()
-            mock_mgr.return_value.publish_pending_revocations = pub_pending
+            mock_mgr.return_value.publish_pending_revocations = mock.CoroutineMock(
+                return_value=({"rrid": ["1"]}, {})
+            )
+
+            await test_module.publish_revocations(self.request)
+
+            mock_response.assert_called_once_with({"rrid2crid": {"rrid": ["1"]}})
+
+    async def test_publish_revocations_partial(self):
+        self.request.json = mock.CoroutineMock()
+
+        with mock.patch.object(
+            test_module, "RevocationManager", autospec=True
+        ) as mock_mgr, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_mgr.return_value.publish_pending_revocations = mock.CoroutineMock(
+                return_value=({"rrid": ["1"]}, {"other": "ledger down"})
+            )
 
             await test_module.publish_revocations(self.request)
 
             mock_response.assert_called_once_with(
-                {"rrid2crid": pub_pending.return_value}
+                {"rrid2crid": {"rrid": ["1"]}, "errors": {"other": "ledger down"}}
             )
 
     async def test_publish_revocations_x(self):
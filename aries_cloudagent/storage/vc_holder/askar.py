@@ -2,8 +2,6 @@
 
 import json
 
-from dateutil.parser import parse as dateutil_parser
-from dateutil.parser import ParserError
 from typing import Mapping, Sequence
 
 from ...askar.profile import AskarProfile
@@ -111,13 +109,9 @@ class AskarVCHolder(VCHolder):
 
         """
 
-        def _match_any(query: list, k, vals):
-            if vals is None:
-                pass
-            elif len(vals) > 1:
-                query.append({"$or": [{k: v for v in vals}]})
-            else:
-                query.append({k: vals[0]})
+        def _match_all(query: list, k, vals):
+            for val in vals or ():
+                query.append({k: val})
 
         def _make_custom_query(query):
             result = {}
@@ -131,11 +125,11 @@ class AskarVCHolder(VCHolder):
             return result
 
         query = []
-        _match_any(query, "context", contexts)
-        _match_any(query, "type", types)
-        _match_any(query, "schema", schema_ids)
-        _match_any(query, "subject", subject_ids)
-        _match_any(query, "proof_type", proof_types)
+        _match_all(query, "context", contexts)
+        _match_all(query, "type", types)
+        _match_all(query, "schema", schema_ids)
+        _match_all(query, "subject", subject_ids)
+        _match_all(query, "proof_type", proof_types)
         if issuer_id:
             query.append({"issuer_id": issuer_id})
         if given_id:
@@ -175,14 +169,7 @@ class AskarVCRecordSearch(VCRecordSearch):
         """
         rows = await self._search.fetch(max_count)
         records = [storage_to_vc_record(r) for r in rows]
-        try:
-            records.sort(
-                key=lambda v: dateutil_parser(v.cred_value.get("issuanceDate")),
-                reverse=True,
-            )
-            return records
-        except ParserError:
-            return records
+        return self.sort_by_issuance_date(records)
 
 
 def storage_to_vc_record(record: StorageRecord) -> VCRecord:
@@ -1,7 +1,11 @@
 """Abstract interfaces for VC holder implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Mapping, Sequence
+from datetime import datetime, timezone
+from typing import List, Mapping, Sequence
+
+from dateutil.parser import ParserError
+from dateutil.parser import parse as dateutil_parser
 
 from .vc_record import VCRecord
 
@@ -66,9 +70,13 @@ class VCHolder(ABC):
         proof_types: Sequence[str] = None,
         given_id: str = None,
         tag_query: Mapping = None,
+        pd_uri_list: Sequence[str] = None,
     ) -> "VCRecordSearch":
         """Start a new VC record search.
 
+        All filters are applied by the storage backend, so that only matching
+        records are fetched and converted.
+
         Args:
             contexts: An inclusive list of JSON-LD contexts to match
             types: An inclusive list of JSON-LD types to match
@@ -78,6 +86,7 @@ class VCHolder(ABC):
             proof_types: The signature suite types used for the proof objects.
             given_id: The given id of the credential
             tag_query: A tag filter clause
+            pd_uri_list: Schema URIs of an input descriptor, any of which to match
 
         """
 
@@ -110,6 +119,18 @@ class VCRecordSearch(ABC):
     async def close(self):
         """Dispose of the search query."""
 
+    @staticmethod
+    def sort_by_issuance_date(records: List[VCRecord]) -> List[VCRecord]:
+        """Sort VC records by issuance date, most recent first.
+
+        Records are left in storage order if any issuance date cannot be parsed.
+        """
+        try:
+            records.sort(key=_issuance_date, reverse=True)
+        except (ParserError, TypeError):
+            pass
+        return records
+
     def __aiter__(self):
         """Async iterator magic method."""
         return IterVCRecordSearch(self)
@@ -136,3 +157,18 @@ class IterVCRecordSearch:
             return self._buffer.pop(0)
         except IndexError:
             raise StopAsyncIteration
+
+
+def _issuance_date(record: VCRecord) -> datetime:
+    """Parse the issuance date of a VC record for sorting."""
+    value = record.cred_value.get("issuanceDate")
+    try:
+        # fromisoformat is an order of magnitude faster than dateutil
+        issued = datetime.fromisoformat(
+            value[:-1] + "+00:00" if value.endswith("Z") else value
+        )
+    except (AttributeError, ValueError):
+        issued = dateutil_parser(value)
+    if not issued.tzinfo:
+        issued = issued.replace(tzinfo=timezone.utc)
+    return issued
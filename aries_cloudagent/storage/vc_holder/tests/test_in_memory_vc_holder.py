@@ -1,5 +1,7 @@
 import pytest
 
+from uuid import uuid4
+
 from ....core.in_memory import InMemoryProfile
 from ...error import StorageDuplicateError, StorageNotFoundError
 
@@ -377,3 +379,43 @@ class TestInMemoryVCHolder:
         assert not rows
 
         await search.close()
+
+    async def test_search_match_all(self, holder: VCHolder, record: VCRecord):
+        await holder.store_credential(record)
+
+        rows = await holder.search_credentials(
+            contexts=[VC_CONTEXT, "https://www.w3.org/2018/credentials/examples/v1"],
+            types=[
+                VC_TYPE,
+                "https://example.org/examples#UniversityDegreeCredential",
+            ],
+        ).fetch()
+        assert rows == [record]
+
+        rows = await holder.search_credentials(types=[VC_TYPE, "other-type"]).fetch()
+        assert not rows
+
+        rows = await holder.search_credentials(
+            subject_ids=["other subject", VC_SUBJECT_ID]
+        ).fetch()
+        assert not rows
+
+    async def test_search_paged(self, holder: VCHolder, record: VCRecord):
+        for idx in range(5):
+            record.record_id = uuid4().hex
+            record.given_id = f"{VC_GIVEN_ID}/{idx}"
+            record.cred_value = {
+                **record.cred_value,
+                "issuanceDate": f"201{idx}-01-01T19:53:24Z",
+            }
+            await holder.store_credential(record)
+
+        search = holder.search_credentials(types=[VC_TYPE])
+        pages = [await search.fetch(2), await search.fetch(2), await search.fetch(2)]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        for page in pages:
+            dates = [row.cred_value["issuanceDate"] for row in page]
+            assert dates == sorted(dates, reverse=True)
+        assert len({row.given_id for page in pages for row in page}) == 5
+        assert not await search.fetch(2)
+        await search.close()
@@ -5,7 +5,6 @@ import logging
 from typing import Tuple
 
 from ..config.injection_context import InjectionContext
-from ..utils.http import put_file, PutError
 
 from .base import BaseTailsServer
 from .error import TailsServerNotConfiguredError
@@ -50,16 +49,12 @@ class AnonCredsTailsServer(BaseTailsServer):
 
         upload_url = tails_server_upload_url.rstrip("/") + f"/hash/{filename}"
 
-        try:
-            await put_file(
-                upload_url,
-                {"tails": tails_file_path},
-                {},
-                interval=interval,
-                backoff=backoff,
-                max_attempts=max_attempts,
-            )
-        except PutError as x_put:
-            return (False, x_put.message)
-
-        return True, upload_url
+        return await self._put_tails_file(
+            context,
+            upload_url,
+            tails_file_path,
+            {},
+            interval=interval,
+            backoff=backoff,
+            max_attempts=max_attempts,
+        )
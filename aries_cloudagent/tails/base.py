@@ -1,14 +1,25 @@
 """Tails server interface base class."""
 
+import asyncio
+import logging
+import os
+import time
 from abc import ABC, abstractmethod, ABCMeta
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..config.injection_context import InjectionContext
+from ..utils.http import put_file, PutError
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
 
 
 class BaseTailsServer(ABC, metaclass=ABCMeta):
     """Base class for tails server interface."""
 
+    _upload_limit: Optional[asyncio.Semaphore] = None
+
     @abstractmethod
     async def upload_tails_file(
         self,
@@ -34,3 +45,63 @@ class BaseTailsServer(ABC, metaclass=ABCMeta):
             file or error message if failed
 
         """
+
+    def upload_limit(self, context: InjectionContext) -> asyncio.Semaphore:
+        """Accessor for the semaphore bounding concurrent uploads."""
+        if not self._upload_limit:
+            self._upload_limit = asyncio.Semaphore(
+                context.settings.get_int("tails_server.max_concurrent_uploads")
+                or DEFAULT_MAX_CONCURRENT_UPLOADS
+            )
+        return self._upload_limit
+
+    async def _put_tails_file(
+        self,
+        context: InjectionContext,
+        upload_url: str,
+        tails_file_path: str,
+        extra_data: dict,
+        interval: float,
+        backoff: float,
+        max_attempts: int,
+    ) -> Tuple[bool, str]:
+        """Stream a tails file to the tails server, reporting progress."""
+        try:
+            total = os.path.getsize(tails_file_path)
+        except OSError:
+            total = 0
+        reported = 0
+
+        def progress(sent: int):
+            nonlocal reported
+            # log at most every 10% of the file
+            if total and (sent - reported) * 10 >= total:
+                reported = sent
+                LOGGER.debug(
+                    "Tails file upload to %s: %d of %d bytes", upload_url, sent, total
+                )
+
+        async with self.upload_limit(context):
+            start = time.perf_counter()
+            try:
+                await put_file(
+                    upload_url,
+                    {"tails": tails_file_path},
+                    extra_data,
+                    interval=interval,
+                    backoff=backoff,
+                    max_attempts=max_attempts,
+                    progress=progress,
+                )
+            except PutError as x_put:
+                return (False, x_put.message)
+            elapsed = time.perf_counter() - start
+
+        LOGGER.info(
+            "Uploaded tails file to %s: %d bytes in %.2fs (%.1f KiB/s)",
+            upload_url,
+            total,
+            elapsed,
+            total / 1024 / elapsed if elapsed else 0.0,
+        )
+        return True, upload_url
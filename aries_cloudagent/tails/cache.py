@@ -0,0 +1,220 @@
+"""Local cache of downloaded tails files."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Union
+
+import base58
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from ..indy.util import indy_client_dir
+from ..utils.repeat import RepeatSequence
+from .error import TailsDownloadError
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536  # should be multiple of 32 bytes for sha256
+# seconds a tails file is kept from eviction after its path was handed out
+DEFAULT_IN_USE_PERIOD = 300
+
+
+class TailsFileCache:
+    """Cache of tails files fetched from tails servers, keyed on tails hash.
+
+    Concurrent requests for the same tails file share a single download.
+    Downloads are streamed to disk and hashed as they arrive, resuming with
+    HTTP range requests after a failure. When a maximum size is configured,
+    the least recently used files are evicted once the total size exceeds it.
+    Files whose path was handed out recently are not evicted, as callers may
+    still be about to read them.
+    """
+
+    # in-flight downloads shared by all instances, keyed on destination path
+    _pending: Dict[str, asyncio.Future] = {}
+    # when the path of each file was last handed out, shared by all instances
+    _handed_out: Dict[str, float] = {}
+
+    def __init__(
+        self,
+        root: Union[str, Path] = None,
+        *,
+        max_size: int = 0,
+        max_attempts: int = 5,
+        interval: float = 1.0,
+        backoff: float = 0.25,
+        request_timeout: float = 30.0,
+        in_use_period: float = DEFAULT_IN_USE_PERIOD,
+    ):
+        """Initialize the cache.
+
+        Args:
+            root: The directory to store tails files in
+            max_size: The maximum total size of cached files in bytes, 0 for no limit
+            max_attempts: The maximum number of attempts per download
+            interval: The interval between retries, in seconds
+            backoff: The backoff interval, in seconds
+            request_timeout: The timeout waiting for data from the server, in seconds
+            in_use_period: The time a file is kept from eviction after its path
+                was handed out, in seconds
+        """
+        self.root = Path(root or indy_client_dir("tails", "cache"))
+        self.max_size = max_size or 0
+        self.max_attempts = max_attempts
+        self.interval = interval
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+        self.in_use_period = in_use_period
+
+    def path_for(self, tails_hash: str) -> Path:
+        """Get the cache path for a tails file."""
+        return self.root.joinpath(tails_hash)
+
+    async def get_or_fetch(
+        self, tails_hash: str, url: str, path: Union[str, Path] = None
+    ) -> str:
+        """Get the local path of a tails file, downloading it if necessary.
+
+        Args:
+            tails_hash: The base58-encoded SHA-256 hash of the tails file
+            url: The public location of the tails file
+            path: Download to this path instead of the cache directory
+
+        Returns:
+            The local path of the verified tails file
+
+        """
+        dest = Path(path) if path else self.path_for(tails_hash)
+        if dest.is_file():
+            self._touch(dest)
+            self._handed_out[str(dest)] = time.monotonic()
+            return str(dest)
+        return await self.fetch(tails_hash, url, dest)
+
+    async def fetch(self, tails_hash: str, url: str, dest: Path = None) -> str:
+        """Download a tails file, joining any download already in progress."""
+        dest = dest or self.path_for(tails_hash)
+        key = str(dest)
+        pending = self._pending.get(key)
+        if not pending:
+            pending = asyncio.ensure_future(self._download(tails_hash, url, dest))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        result = await asyncio.shield(pending)
+        self._handed_out[key] = time.monotonic()
+        if dest.parent == self.root:
+            self.evict(keep=dest)
+        return result
+
+    async def _download(self, tails_hash: str, url: str, dest: Path) -> str:
+        """Download a tails file with resumption and hash verification."""
+        LOGGER.info("Downloading the tails file with hash: %s", tails_hash)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        partial = dest.with_name(dest.name + ".part")
+
+        timeout = ClientTimeout(total=None, sock_read=self.request_timeout)
+        async with ClientSession(timeout=timeout, trust_env=True) as session:
+            async for attempt in RepeatSequence(
+                self.max_attempts, self.interval, self.backoff
+            ):
+                try:
+                    hasher = await self._download_attempt(session, url, partial)
+                    break
+                except (ClientError, asyncio.TimeoutError) as err:
+                    LOGGER.warning("Tails file download error: %s", err)
+                    if attempt.final:
+                        raise TailsDownloadError(
+                            f"Error retrieving tails file: {err}"
+                        ) from err
+
+        download_hash = base58.b58encode(hasher.digest()).decode("utf-8")
+        if download_hash != tails_hash:
+            try:
+                partial.unlink()
+            except OSError as err:
+                LOGGER.warning("Could not delete invalid tails file: %s", err)
+            raise TailsDownloadError(
+                "The hash of the downloaded tails file does not match."
+            )
+
+        os.replace(partial, dest)
+        return str(dest)
+
+    async def _download_attempt(self, session: ClientSession, url: str, partial: Path):
+        """Continue downloading to a partial file, returning the running hash."""
+        hasher = hashlib.sha256()
+        offset = 0
+        if partial.is_file():
+            with open(partial, "rb") as existing:
+                for buf in iter(lambda: existing.read(CHUNK_SIZE), b""):
+                    hasher.update(buf)
+                    offset += len(buf)
+
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        async with session.get(url, headers=headers) as response:
+            if response.status == 416 and offset:
+                # partial content is stale or complete; start again
+                partial.unlink()
+                raise ClientError("Requested range not satisfiable")
+            if response.status < 200 or response.status >= 300:
+                raise ClientError(
+                    f"Bad response from server: {response.status} - "
+                    f"{response.reason}"
+                )
+            if offset and response.status != 206:
+                # server ignored the range request
+                hasher = hashlib.sha256()
+                offset = 0
+            with open(partial, "ab" if offset else "wb") as tails_file:
+                async for buf in response.content.iter_chunked(CHUNK_SIZE):
+                    tails_file.write(buf)
+                    hasher.update(buf)
+        return hasher
+
+    def _touch(self, path: Path):
+        """Mark a cached file as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self, keep: Union[str, Path, None] = None):
+        """Remove the least recently used files beyond the maximum size."""
+        if not self.max_size:
+            return
+        keep = Path(keep) if keep else None
+        in_use_since = time.monotonic() - self.in_use_period
+        for key, handed_out in list(self._handed_out.items()):
+            if handed_out < in_use_since:
+                del self._handed_out[key]
+        entries = []
+        total = 0
+        try:
+            for entry in os.scandir(self.root):
+                if not entry.is_file() or entry.name.endswith(".part"):
+                    continue
+                stat = entry.stat()
+                total += stat.st_size
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        except FileNotFoundError:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            if (
+                path == keep
+                or str(path) in self._pending
+                or str(path) in self._handed_out
+            ):
+                continue
+            try:
+                path.unlink()
+                total -= size
+                LOGGER.debug("Evicted tails file from cache: %s", path.name)
+            except OSError as err:
+                LOGGER.warning("Could not evict tails file %s: %s", path, err)
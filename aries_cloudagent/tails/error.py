@@ -5,3 +5,7 @@ from ..core.error import BaseError
 
 class TailsServerNotConfiguredError(BaseError):
     """Error indicating the tails server plugin hasn't been configured."""
+
+
+class TailsDownloadError(BaseError):
+    """Error retrieving a tails file from a tails server."""
@@ -7,7 +7,6 @@ from typing import Tuple
 from ..config.injection_context import InjectionContext
 from ..ledger.base import BaseLedger
 from ..ledger.multiple_ledger.base_manager import BaseMultipleLedgerManager
-from ..utils.http import put_file, PutError
 
 from .base import BaseTailsServer
 from .error import TailsServerNotConfiguredError
@@ -69,16 +68,12 @@ class IndyTailsServer(BaseTailsServer):
 
         upload_url = tails_server_upload_url.rstrip("/") + f"/{filename}"
 
-        try:
-            await put_file(
-                upload_url,
-                {"tails": tails_file_path},
-                {"genesis": genesis_transactions},
-                interval=interval,
-                backoff=backoff,
-                max_attempts=max_attempts,
-            )
-        except PutError as x_put:
-            return (False, x_put.message)
-
-        return True, upload_url
+        return await self._put_tails_file(
+            context,
+            upload_url,
+            tails_file_path,
+            {"genesis": genesis_transactions},
+            interval=interval,
+            backoff=backoff,
+            max_attempts=max_attempts,
+        )
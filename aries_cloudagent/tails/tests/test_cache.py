@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+
+import base58
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase
+
+from ..cache import TailsFileCache
+from ..error import TailsDownloadError
+
+TAILS_DATA = os.urandom(300000)
+TAILS_HASH = base58.b58encode(hashlib.sha256(TAILS_DATA).digest()).decode("utf-8")
+
+
+class TestTailsFileCache(AioHTTPTestCase):
+    """Download tails files from a local stand-in tails server."""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.truncate = 0
+        self.accept_ranges = True
+        self.root = tempfile.mkdtemp()
+        await super().asyncSetUp()
+
+    async def asyncTearDown(self):
+        await super().asyncTearDown()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.get("/hash/{tails_hash}", self.tails_route)])
+        return app
+
+    async def tails_route(self, request: web.Request):
+        self.requests.append(request.headers.get("Range"))
+        offset = 0
+        if self.accept_ranges and request.http_range.start:
+            offset = request.http_range.start
+            if offset >= len(TAILS_DATA):
+                raise web.HTTPRequestRangeNotSatisfiable()
+        data = TAILS_DATA[offset:]
+        response = web.StreamResponse(status=206 if offset else 200)
+        response.content_length = len(data)
+        await response.prepare(request)
+        await asyncio.sleep(0.01)
+        if self.truncate:
+            self.truncate -= 1
+            await response.write(data[: len(data) // 2])
+            request.transport.close()
+            return response
+        await response.write(data)
+        return response
+
+    def url(self, tails_hash: str = TAILS_HASH) -> str:
+        return f"http://localhost:{self.server.port}/hash/{tails_hash}"
+
+    def cache(self, **kwargs) -> TailsFileCache:
+        return TailsFileCache(self.root, interval=0.01, **kwargs)
+
+    async def test_get_or_fetch(self):
+        cache = self.cache()
+        path = await cache.get_or_fetch(TAILS_HASH, self.url())
+        assert path == os.path.join(self.root, TAILS_HASH)
+        with open(path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_DATA
+        assert await cache.get_or_fetch(TAILS_HASH, self.url()) == path
+        assert self.requests == [None]
+
+    async def test_single_flight(self):
+        results = await asyncio.gather(
+            *(self.cache().get_or_fetch(TAILS_HASH, self.url()) for _ in range(10))
+        )
+        assert len(set(results)) == 1
+        assert len(self.requests) == 1
+
+    async def test_resume(self):
+        self.truncate = 1
+        path = await self.cache().get_or_fetch(TAILS_HASH, self.url())
+        with open(path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_DATA
+        assert len(self.requests) == 2
+        assert self.requests[1].startswith("bytes=")
+        assert self.requests[1] != "bytes=0-"
+
+    async def test_resume_range_ignored(self):
+        self.truncate = 1
+        self.accept_ranges = False
+        path = await self.cache().get_or_fetch(TAILS_HASH, self.url())
+        with open(path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_DATA
+        assert len(self.requests) == 2
+
+    async def test_hash_mismatch(self):
+        with self.assertRaises(TailsDownloadError):
+            await self.cache().get_or_fetch("not-the-hash", self.url())
+        assert not os.listdir(self.root)
+
+    async def test_download_fails(self):
+        self.truncate = 3
+        with self.assertRaises(TailsDownloadError):
+            await self.cache(max_attempts=3).get_or_fetch(TAILS_HASH, self.url())
+        assert not os.path.exists(os.path.join(self.root, TAILS_HASH))
+
+    async def test_evict_lru(self):
+        for name, mtime in (("old", 1000), ("newer", 2000)):
+            path = os.path.join(self.root, name)
+            with open(path, "wb") as tails_file:
+                tails_file.write(b"0" * 200000)
+            os.utime(path, (mtime, mtime))
+
+        cache = self.cache(max_size=len(TAILS_DATA) + 250000)
+        path = await cache.get_or_fetch(TAILS_HASH, self.url())
+        assert sorted(os.listdir(self.root)) == sorted(["newer", TAILS_HASH])
+
+        # the most recently fetched file is kept even when over the limit
+        cache.max_size = 1
+        cache.evict(keep=path)
+        assert os.listdir(self.root) == [TAILS_HASH]
+
+    async def test_evict_handed_out(self):
+        cache = self.cache(max_size=1)
+        path = await cache.get_or_fetch(TAILS_HASH, self.url())
+
+        # a file handed out recently may still be read
+        cache.evict()
+        assert os.listdir(self.root) == [TAILS_HASH]
+
+        cache.in_use_period = 0
+        cache.evict()
+        assert not os.path.exists(path)
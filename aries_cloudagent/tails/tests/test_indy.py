@@ -1,3 +1,5 @@
+import asyncio
+
 from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
 
@@ -6,6 +8,7 @@ from ...core.in_memory import InMemoryProfile
 from ...ledger.base import BaseLedger
 from ...ledger.multiple_ledger.base_manager import BaseMultipleLedgerManager
 
+from .. import base as base_module
 from .. import indy_tails_server as test_module
 
 TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
@@ -31,7 +34,7 @@ class TestIndyTailsServer(IsolatedAsyncioTestCase):
         indy_tails = test_module.IndyTailsServer()
 
         with mock.patch.object(
-            test_module, "put_file", mock.CoroutineMock()
+            base_module, "put_file", mock.CoroutineMock()
         ) as mock_put:
             mock_put.return_value = "tails-hash"
             (ok, text) = await indy_tails.upload_tails_file(
@@ -62,7 +65,7 @@ class TestIndyTailsServer(IsolatedAsyncioTestCase):
         indy_tails = test_module.IndyTailsServer()
 
         with mock.patch.object(
-            test_module, "put_file", mock.CoroutineMock()
+            base_module, "put_file", mock.CoroutineMock()
         ) as mock_put:
             mock_put.return_value = "tails-hash"
             (ok, text) = await indy_tails.upload_tails_file(
@@ -93,7 +96,7 @@ class TestIndyTailsServer(IsolatedAsyncioTestCase):
         indy_tails = test_module.IndyTailsServer()
 
         with mock.patch.object(
-            test_module, "put_file", mock.CoroutineMock()
+            base_module, "put_file", mock.CoroutineMock()
         ) as mock_put:
             mock_put.return_value = "tails-hash"
             (ok, text) = await indy_tails.upload_tails_file(
@@ -116,12 +119,45 @@ class TestIndyTailsServer(IsolatedAsyncioTestCase):
         indy_tails = test_module.IndyTailsServer()
 
         with mock.patch.object(
-            test_module, "put_file", mock.CoroutineMock()
+            base_module, "put_file", mock.CoroutineMock()
         ) as mock_put:
-            mock_put.side_effect = test_module.PutError("Server down for maintenance")
+            mock_put.side_effect = base_module.PutError("Server down for maintenance")
 
             (ok, text) = await indy_tails.upload_tails_file(
                 context, REV_REG_ID, "/tmp/dummy/path"
             )
             assert not ok
             assert text == "Server down for maintenance"
+
+    async def test_upload_files_bounded(self):
+        context = InjectionContext(
+            settings={
+                "ledger.genesis_transactions": "dummy",
+                "tails_server_upload_url": "http://1.2.3.4:8088",
+                "tails_server.max_concurrent_uploads": 2,
+            }
+        )
+        indy_tails = test_module.IndyTailsServer()
+        active = 0
+        max_active = 0
+
+        async def put_file(*args, **kwargs):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(active, max_active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        with mock.patch.object(base_module, "put_file", put_file):
+            results = await asyncio.gather(
+                *(
+                    indy_tails.upload_tails_file(
+                        context, f"{REV_REG_ID}{i}", "/tmp/dummy/path"
+                    )
+                    for i in range(5)
+                )
+            )
+        assert results == [
+            (True, f"http://1.2.3.4:8088/{REV_REG_ID}{i}") for i in range(5)
+        ]
+        assert max_active == 2
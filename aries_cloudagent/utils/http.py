@@ -1,8 +1,10 @@
 """HTTP utility methods."""
 
 import asyncio
+import io
 import logging
 import urllib.parse
+from typing import Callable
 
 from aiohttp import (
     BaseConnector,
@@ -29,6 +31,22 @@ class PutError(BaseError):
     """Error raised when an HTTP put fails."""
 
 
+class _ProgressReader(io.BufferedReader):
+    """File reader reporting the number of bytes read so far."""
+
+    def __init__(self, path: str, progress: Callable[[int], None] = None):
+        super().__init__(io.FileIO(path, "rb"))
+        self.progress = progress
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        buf = super().read(size)
+        self.bytes_read += len(buf)
+        if self.progress and buf:
+            self.progress(self.bytes_read)
+        return buf
+
+
 async def fetch_stream(
     url: str,
     *,
@@ -139,9 +157,12 @@ async def put_file(
     connector: BaseConnector = None,
     session: ClientSession = None,
     json: bool = False,
+    progress: Callable[[int], None] = None,
 ):
     """Put to HTTP server with automatic retries and timeouts.
 
+    The file is streamed from disk rather than read into memory.
+
     Args:
         url: the address to use
         file_data: dict with data key and path of file to upload
@@ -155,6 +176,8 @@ async def put_file(
         connector: an optional existing BaseConnector
         session: a shared ClientSession
         json: flag to parse the result as JSON
+        progress: called with the number of bytes of the file sent so far in
+            the current attempt
 
     """
     (data_key, file_path) = list(file_data.items())[0]
@@ -170,7 +193,7 @@ async def put_file(
                 async with attempt.timeout(request_timeout):
                     formdata = FormData()
                     try:
-                        fp = open(file_path, "rb")
+                        fp = _ProgressReader(file_path, progress)
                     except OSError as e:
                         raise PutError("Error opening file for upload") from e
                     if extra_data:
@@ -179,9 +202,12 @@ async def put_file(
                     formdata.add_field(
                         data_key, fp, content_type="application/octet-stream"
                     )
-                    response: ClientResponse = await session.put(
-                        url, data=formdata, allow_redirects=False
-                    )
+                    try:
+                        response: ClientResponse = await session.put(
+                            url, data=formdata, allow_redirects=False
+                        )
+                    finally:
+                        fp.close()
                     if (
                         # redirect codes
                         response.status in (301, 302, 303, 307, 308)
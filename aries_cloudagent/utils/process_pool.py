@@ -0,0 +1,101 @@
+"""Pool of worker processes for CPU-bound operations."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProcessPool:
+    """Run CPU-bound functions in worker processes, off the event loop.
+
+    The worker processes are started on first use. Functions and their
+    arguments must be picklable: module-level functions taking serialized
+    objects. With no workers configured, functions run in the default thread
+    executor instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the pool.
+
+        Args:
+            max_workers: The number of worker processes, defaulting to the number
+                of processors; 0 to run in threads instead
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Accessor for whether work is dispatched to worker processes."""
+        return self.max_workers != 0
+
+    @property
+    def size(self) -> int:
+        """Accessor for the number of workers in the pool."""
+        if not self.enabled:
+            return 1
+        return self.max_workers or multiprocessing.cpu_count()
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """Accessor for the process executor, starting it if necessary."""
+        if self.enabled and not self._executor:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.size,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            LOGGER.debug("Started process pool with %d workers", self.size)
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker process and wait for the result."""
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, func, *args
+        )
+
+    async def run_chunked(
+        self,
+        func: Callable[[Sequence], Sequence[T]],
+        items: Sequence,
+        *args: Any,
+    ) -> Sequence[T]:
+        """Process items in chunks spread across the workers.
+
+        Args:
+            func: Processes a chunk of items, returning one result per item; it
+                is called as `func(chunk, *args)`
+            items: The items to process
+            args: Further arguments passed with every chunk
+
+        Returns:
+            The results for all items, in order
+
+        """
+        if not items:
+            return []
+        size = -(-len(items) // self.size)
+        chunks = [items[pos : pos + size] for pos in range(0, len(items), size)]
+        results = await asyncio.gather(
+            *(self.run(func, chunk, *args) for chunk in chunks)
+        )
+        return [result for chunk in results for result in chunk]
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes.
+
+        Args:
+            wait: Whether to wait for the worker processes to exit
+        """
+        if self._executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    async def stop(self):
+        """Stop the worker processes, waiting for them off the event loop."""
+        await asyncio.get_event_loop().run_in_executor(None, self.shutdown)
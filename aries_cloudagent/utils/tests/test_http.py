@@ -139,6 +139,20 @@ class TestTransportUtils(AioHTTPTestCase):
         assert result == [True]
         assert self.succeed_calls == 1
 
+    async def test_put_file_progress(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        sent = []
+        with TempFile() as tails:
+            result = await put_file(
+                f"{server_addr}/succeed",
+                {"tails": tails},
+                {"genesis": "..."},
+                json=True,
+                progress=sent.append,
+            )
+        assert result == [True]
+        assert sent and sent[-1] == len(b"test")
+
     async def test_put_file_fail(self):
         server_addr = f"http://localhost:{self.server.port}"
         with TempFile() as tails:
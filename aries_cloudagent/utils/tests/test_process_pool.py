@@ -0,0 +1,38 @@
+from unittest import IsolatedAsyncioTestCase
+
+from ..process_pool import ProcessPool
+
+
+class TestProcessPool(IsolatedAsyncioTestCase):
+    async def test_threads(self):
+        pool = ProcessPool(max_workers=0)
+        assert not pool.enabled
+        assert pool.size == 1
+        assert pool.executor is None
+        assert await pool.run(sum, [1, 2, 3]) == 6
+        assert await pool.run_chunked(list, [1, 2, 3]) == [1, 2, 3]
+        assert await pool.run_chunked(list, []) == []
+        pool.shutdown()
+
+    async def test_processes(self):
+        pool = ProcessPool(max_workers=2)
+        assert pool.enabled
+        assert pool.size == 2
+        try:
+            assert await pool.run(sum, [1, 2, 3]) == 6
+            # chunks of four and three items
+            assert await pool.run_chunked(sorted, [3, 2, 1, 6, 5, 4, 7]) == [
+                1,
+                2,
+                3,
+                6,
+                4,
+                5,
+                7,
+            ]
+        finally:
+            await pool.stop()
+        assert pool._executor is None
+
+        # stopping a pool that never started
+        await ProcessPool(max_workers=2).stop()
@@ -1,4 +1,4 @@
-from .ld_proofs import sign, verify, derive
+from .ld_proofs import sign, sign_batch, verify, derive
 from .proof_set import ProofSet
 from .purposes import (
     _ProofPurpose as ProofPurpose,
@@ -30,6 +30,7 @@ from .check import get_properties_without_context
 
 __all__ = [
     "sign",
+    "sign_batch",
     "verify",
     "derive",
     "ProofSet",
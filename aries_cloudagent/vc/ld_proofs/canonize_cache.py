@@ -0,0 +1,119 @@
+"""Process-wide cache of canonized JSON-LD documents."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from .document_loader import DocumentLoader, DocumentLoaderMethod
+
+DEFAULT_MAX_DOCUMENTS = 64
+# seconds a canonized document is reused for, matching the document loader
+DEFAULT_DOCUMENT_TTL = 300
+
+
+class CanonizeCache:
+    """Bounded, expiring cache of canonized documents.
+
+    Deriving BBS+ proofs from a credential canonizes the whole credential each
+    time, although the holder derives from the same credential again and again.
+    Credentials usually refer to contexts other than those shipped with ACA-Py;
+    the DocumentLoader reuses these for a limited time, and so does this cache
+    with the canonized forms of documents processed through it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_DOCUMENTS,
+        ttl: int = DEFAULT_DOCUMENT_TTL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: The number of canonized forms to keep, the least
+                recently used are discarded first
+            ttl: The number of seconds a canonized form is reused for
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._expiry: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cacheable(input: dict, document_loader: DocumentLoaderMethod) -> bool:
+        """Check whether the canonized form of an input can be reused."""
+        return isinstance(document_loader, DocumentLoader)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a canonized form, if present and not expired."""
+        with self._lock:
+            if self._expiry.get(key, 0) <= time.monotonic():
+                self._entries.pop(key, None)
+                self._expiry.pop(key, None)
+            canonized = self._entries.get(key)
+            if canonized is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return canonized
+
+    def set(self, key: str, canonized: str):
+        """Add a canonized form to the cache."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = canonized
+            self._entries.move_to_end(key)
+            self._expiry[key] = time.monotonic() + self.ttl
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                del self._expiry[evicted]
+
+    def canonize(
+        self,
+        input: dict,
+        document_loader: DocumentLoaderMethod,
+        canonize: Callable[[], str],
+    ) -> str:
+        """Canonize a document, reusing an earlier result where possible.
+
+        Args:
+            input: The document
+            document_loader: The document loader used to canonize it
+            canonize: Canonizes the document
+
+        Returns:
+            The canonized document in N-Quads format
+
+        """
+        if not self.cacheable(input, document_loader):
+            return canonize()
+        key = json.dumps(input, sort_keys=True, separators=(",", ":"))
+        canonized = self.get(key)
+        if canonized is None:
+            canonized = canonize()
+            self.set(key, canonized)
+        return canonized
+
+    def clear(self):
+        """Discard all canonized forms."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(entries={}, hits={}, misses={})>".format(
+            self.__class__.__name__,
+            len(self._entries),
+            self.hits,
+            self.misses,
+        )
+
+
+DOCUMENT_CACHE = CanonizeCache()
@@ -1,16 +1,23 @@
 """Key pair based on base wallet interface."""
 
-from typing import List, Optional, Union
+import asyncio
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple, Union
 
 from ....core.profile import Profile
+from ....utils.process_pool import ProcessPool
 from ....wallet.base import BaseWallet
-from ....wallet.key_type import KeyType
+from ....wallet.bbs import BbsException, verify_signed_messages_bls12381g2
+from ....wallet.error import WalletError
+from ....wallet.key_type import BLS12381G2, KeyType
 from ....wallet.util import b58_to_bytes
 
 from ..error import LinkedDataProofException
 
 from .key_pair import KeyPair
 
+Message = Union[List[bytes], bytes]
+
 
 class WalletKeyPair(KeyPair):
     """Base wallet key pair."""
@@ -27,6 +34,8 @@ class WalletKeyPair(KeyPair):
         self.profile = profile
         self.key_type = key_type
         self.public_key_base58 = public_key_base58
+        self._deferred: Optional[List[Tuple[Message, asyncio.Future]]] = None
+        self._on_defer: Optional[Callable[[], None]] = None
 
     async def sign(self, message: Union[List[bytes], bytes]) -> bytes:
         """Sign message using wallet."""
@@ -34,6 +43,12 @@ class WalletKeyPair(KeyPair):
             raise LinkedDataProofException(
                 "Unable to sign message with WalletKey: No key to sign with"
             )
+        if self._deferred is not None:
+            future = asyncio.get_event_loop().create_future()
+            self._deferred.append((message, future))
+            if self._on_defer:
+                self._on_defer()
+            return await future
         async with self.profile.session() as session:
             wallet = session.inject(BaseWallet)
             return await wallet.sign_message(
@@ -41,6 +56,48 @@ class WalletKeyPair(KeyPair):
                 from_verkey=self.public_key_base58,
             )
 
+    @contextmanager
+    def deferred(self, on_defer: Callable[[], None] = None):
+        """Defer signatures, to be made in batches by `sign_deferred`.
+
+        Args:
+            on_defer: Called whenever a signature is deferred
+        """
+        self._deferred = []
+        self._on_defer = on_defer
+        try:
+            yield self
+        finally:
+            for _, future in self._deferred:
+                future.cancel()
+            self._deferred = None
+            self._on_defer = None
+
+    @property
+    def deferred_count(self) -> int:
+        """Accessor for the number of signatures deferred and not yet made."""
+        return len(self._deferred or ())
+
+    async def sign_deferred(self):
+        """Make the deferred signatures at once, in a single wallet session."""
+        pending = self._deferred or []
+        if not pending:
+            return
+        self._deferred = []
+        try:
+            async with self.profile.session() as session:
+                wallet = session.inject(BaseWallet)
+                signatures = await wallet.sign_messages(
+                    [message for message, _ in pending],
+                    from_verkey=self.public_key_base58,
+                )
+        except Exception as err:
+            for _, future in pending:
+                future.set_exception(err)
+            return
+        for (_, future), signature in zip(pending, signatures):
+            future.set_result(signature)
+
     async def verify(
         self, message: Union[List[bytes], bytes], signature: bytes
     ) -> bool:
@@ -50,6 +107,20 @@ class WalletKeyPair(KeyPair):
                 "Unable to verify message with key pair: No key to verify with"
             )
 
+        if self.key_type == BLS12381G2:
+            # BBS+ signatures are verified outside of the wallet, in the process
+            # pool: verifying many messages takes long
+            pool = self.profile.inject_or(ProcessPool) or ProcessPool(max_workers=0)
+            try:
+                return await pool.run(
+                    verify_signed_messages_bls12381g2,
+                    message if isinstance(message, list) else [message],
+                    signature,
+                    self.public_key,
+                )
+            except BbsException as err:
+                raise WalletError("Unable to verify message") from err
+
         async with self.profile.session() as session:
             wallet = session.inject(BaseWallet)
             return await wallet.verify_message(
@@ -2,8 +2,13 @@
 
 import asyncio
 import concurrent.futures
-
-from typing import Callable
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
 
 from pydid.did_url import DIDUrl
 from pyld.documentloader import requests
@@ -19,25 +24,98 @@ import nest_asyncio
 
 nest_asyncio.apply()
 
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_DOCUMENTS = 1024
+JSONLD_WORKERS = 1
+
+_JSONLD_EXECUTOR: Optional[concurrent.futures.Executor] = None
+_STATIC_DOCUMENTS: Optional[Dict[str, dict]] = None
+
+T = TypeVar("T")
+
+
+def _referenced_urls(value: Any, urls: Set[str] = None) -> Set[str]:
+    """Collect the contexts and verification methods a JSON-LD value refers to."""
+    urls = set() if urls is None else urls
+    if isinstance(value, list):
+        for item in value:
+            _referenced_urls(item, urls)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key in ("@context", "@import", "verificationMethod"):
+                for ref in item if isinstance(item, list) else [item]:
+                    if isinstance(ref, str) and ref.startswith(
+                        ("did:", "http://", "https://")
+                    ):
+                        urls.add(ref)
+            _referenced_urls(item, urls)
+    return urls
+
+
+def _static_documents(static_loader: StaticCacheJsonLdDownloader) -> Dict[str, dict]:
+    """Get the contexts shipped with ACA-Py, parsed and tagged as static.
+
+    PyLD keeps the contexts it resolves, and the active contexts processed from
+    them, in a process wide cache, but only shares those of remote documents
+    tagged as static across operations. The shipped contexts cannot change, so
+    they are tagged and parsed once, sparing each operation parsing and
+    processing them again.
+    """
+    global _STATIC_DOCUMENTS
+    if _STATIC_DOCUMENTS is None:
+        _STATIC_DOCUMENTS = {
+            url: {
+                **document,
+                "document": (
+                    json.loads(document["document"])
+                    if isinstance(document["document"], str)
+                    else document["document"]
+                ),
+                "tag": "static",
+            }
+            for url, document in static_loader.cache.items()
+        }
+    return _STATIC_DOCUMENTS
+
 
 class DocumentLoader:
-    """JSON-LD document loader."""
-
-    def __init__(self, profile: Profile, cache_ttl: int = 300) -> None:
+    """JSON-LD document loader.
+
+    JSON-LD processing is synchronous and CPU bound; run in a worker thread
+    through `run_jsonld`, it leaves the event loop free. Documents are then
+    loaded on the event loop on behalf of the worker thread, unless already
+    loaded: documents are kept in memory, and those a JSON-LD document refers to
+    can be prefetched concurrently before processing it.
+    """
+
+    def __init__(
+        self,
+        profile: Profile,
+        cache_ttl: int = 300,
+        max_documents: int = DEFAULT_MAX_DOCUMENTS,
+    ) -> None:
         """Initialize new DocumentLoader instance.
 
         Args:
             profile (Profile): The profile
             cache_ttl (int, optional): TTL for cached documents. Defaults to 300.
+            max_documents (int, optional): The number of loaded documents kept in
+                memory. Defaults to 1024.
 
         """
         self.profile = profile
         self.resolver = profile.inject(DIDResolver)
         self.cache = profile.inject_or(BaseCache)
         self.online_request_loader = requests.requests_document_loader()
-        self.requests_loader = StaticCacheJsonLdDownloader().load
+        self.static_loader = StaticCacheJsonLdDownloader()
+        self.requests_loader = self.static_loader.load
+        self.static_documents = _static_documents(self.static_loader)
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.cache_ttl = cache_ttl
+        self.max_documents = max_documents
+        self._documents: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
         self._event_loop = asyncio.get_event_loop()
 
     async def _load_did_document(self, did: str, options: dict):
@@ -70,7 +148,10 @@ class DocumentLoader:
         if url.startswith("did:"):
             document = await self._load_did_document(url, options)
         elif url.startswith("http://") or url.startswith("https://"):
-            document = self._load_http_document(url, options)
+            # remote documents are downloaded synchronously, off the event loop
+            document = await asyncio.get_event_loop().run_in_executor(
+                None, self._load_http_document, url, options
+            )
         else:
             raise LinkedDataProofException(
                 "Unrecognized url format. Must start with "
@@ -79,6 +160,38 @@ class DocumentLoader:
 
         return document
 
+    @staticmethod
+    def _loaded_key(url: str) -> str:
+        """Key loaded documents on the plain DID, shared by its DID URLs."""
+        if url.startswith("did:") and DIDUrl.is_valid(url):
+            return DIDUrl.parse(url).did
+        return url
+
+    def _get_loaded(self, url: str) -> Optional[dict]:
+        """Get a document from the static contexts or those loaded before."""
+        document = self.static_documents.get(url)
+        if document is not None:
+            return document
+        url = self._loaded_key(url)
+        with self._lock:
+            entry = self._documents.get(url)
+            if entry is None:
+                return None
+            expires, document = entry
+            if expires < time.monotonic():
+                del self._documents[url]
+                return None
+            self._documents.move_to_end(url)
+            return document
+
+    def _set_loaded(self, url: str, document: dict):
+        url = self._loaded_key(url)
+        with self._lock:
+            self._documents[url] = (time.monotonic() + self.cache_ttl, document)
+            self._documents.move_to_end(url)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
     async def load_document(self, url: str, options: dict):
         """Load JSON-LD document.
 
@@ -87,32 +200,123 @@ class DocumentLoader:
         Document loading is processed in separate thread to deal with
         async to sync transformation.
         """
+        document = self._get_loaded(url)
+        if document is not None:
+            return document
+
         cache_key = f"json_ld_document_resolver::{url}"
 
         # Try to get from cache
         if self.cache:
             document = await self.cache.get(cache_key)
-            if document:
-                return document
 
-        document = await self._load_async(url, options)
+        if not document:
+            document = await self._load_async(url, options)
 
-        # Cache document, if cache is available
-        if self.cache:
-            await self.cache.set(cache_key, document, self.cache_ttl)
+            # Cache document, if cache is available
+            if self.cache:
+                await self.cache.set(cache_key, document, self.cache_ttl)
 
+        self._set_loaded(url, document)
         return document
 
+    async def fetch_document(self, url: str, options: dict) -> dict:
+        """Load a JSON-LD document afresh.
+
+        The document is neither taken from nor kept with the loaded and cached
+        documents, for documents that change whose freshness is up to the caller.
+        """
+        return await self._load_async(url, options)
+
+    async def prefetch(self, *documents: dict):
+        """Load the documents JSON-LD documents refer to, concurrently.
+
+        The contexts of the documents, the contexts these import and the DID
+        documents of verification methods are loaded ahead of processing, so
+        processing finds them already loaded. Errors are left to processing.
+        """
+        urls = {self._loaded_key(url) for url in _referenced_urls(list(documents))}
+        seen = set()
+        while urls - seen:
+            pending = list(urls - seen)
+            seen.update(pending)
+            results = await asyncio.gather(
+                *(self.load_document(url, {}) for url in pending),
+                return_exceptions=True,
+            )
+            for url, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    LOGGER.debug(
+                        "Error prefetching JSON-LD document %s: %s", url, result
+                    )
+                elif url.startswith(("http://", "https://")):
+                    # contexts may import or scope further contexts
+                    urls.update(_referenced_urls(result.get("document")))
+
     def __call__(self, url: str, options: dict):
         """Load JSON-LD Document."""
+        document = self._get_loaded(url)
+        if document is not None:
+            return document
 
         loop = self._event_loop
         coroutine = self.load_document(url, options)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # called from a worker thread: load on the event loop, which is free
+            if loop.is_running():
+                return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+            return asyncio.run(coroutine)
+
+        # called on the event loop: it is blocked until the document is loaded
         document = loop.run_until_complete(coroutine)
 
         return document
 
 
+def _jsonld_executor() -> concurrent.futures.Executor:
+    global _JSONLD_EXECUTOR
+    if not _JSONLD_EXECUTOR:
+        _JSONLD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=JSONLD_WORKERS, thread_name_prefix="jsonld"
+        )
+    return _JSONLD_EXECUTOR
+
+
+async def run_jsonld(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run synchronous JSON-LD processing in a worker thread.
+
+    Processing runs in a single worker thread: PyLD keeps its processed
+    contexts in module level caches that are not thread safe, and being pure
+    Python, processing would not gain from more threads holding the GIL. Left
+    to a single thread, the event loop stays responsive meanwhile.
+
+    Args:
+        func: The processing function, such as canonicalization
+        args: Positional arguments for the function
+        kwargs: Keyword arguments for the function
+
+    Returns:
+        The result of the function
+
+    """
+    return await asyncio.get_event_loop().run_in_executor(
+        _jsonld_executor(), partial(func, *args, **kwargs)
+    )
+
+
+async def prefetch_documents(document_loader: "DocumentLoaderMethod", *documents):
+    """Prefetch the documents JSON-LD documents refer to, if the loader supports it."""
+    if isinstance(document_loader, DocumentLoader):
+        await document_loader.prefetch(*documents)
+
+
 DocumentLoaderMethod = Callable[[str, dict], dict]
 
-__all__ = ["DocumentLoaderMethod", "DocumentLoader"]
+__all__ = [
+    "DocumentLoaderMethod",
+    "DocumentLoader",
+    "prefetch_documents",
+    "run_jsonld",
+]
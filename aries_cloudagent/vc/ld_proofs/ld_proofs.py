@@ -1,6 +1,6 @@
 """Linked data proof signing and verification methods."""
 
-from typing import List
+from typing import List, Sequence
 
 from .document_loader import DocumentLoaderMethod
 from .proof_set import ProofSet
@@ -43,6 +43,41 @@ async def sign(
     )
 
 
+async def sign_batch(
+    *,
+    documents: Sequence[dict],
+    suite: LinkedDataProof,
+    purpose: ProofPurpose,
+    document_loader: DocumentLoaderMethod,
+) -> List[dict]:
+    """Cryptographically signs a batch of documents by adding a `proof` section.
+
+    Proofs are added based on the provided suite and proof purpose, with the
+    signatures made in batches where the suite supports it.
+
+    Args:
+        documents (Sequence[dict]): JSON-LD documents to be signed.
+        suite (LinkedDataProof): The linked data signature cryptographic suite
+            with which to sign the documents
+        purpose (ProofPurpose): A proof purpose instance that will match proofs to be
+            verified and ensure they were created according to the appropriate purpose.
+        document_loader (DocumentLoader): The document loader to use.
+
+    Raises:
+        LinkedDataProofException: When a jsonld url cannot be resolved, OR signing fails.
+
+    Returns:
+        List[dict]: Signed documents.
+
+    """
+    return await ProofSet.add_batch(
+        documents=documents,
+        suite=suite,
+        purpose=purpose,
+        document_loader=document_loader,
+    )
+
+
 async def verify(
     *,
     document: dict,
@@ -1,16 +1,21 @@
 """Class to represent a Linked Data proof set."""
 
-from typing import List, Union
+import asyncio
+from typing import List, Sequence, Union
 
 from pyld.jsonld import JsonLdProcessor
 
 from .constants import SECURITY_CONTEXT_URL
-from .document_loader import DocumentLoaderMethod
+from .crypto import _WalletKeyPair as WalletKeyPair
+from .document_loader import DocumentLoaderMethod, prefetch_documents
 from .error import LinkedDataProofException
 from .purposes.proof_purpose import ProofPurpose
 from .suites import _LinkedDataProof as LinkedDataProof
 from .validation_result import DocumentVerificationResult, ProofResult
 
+# number of signatures made at once when adding proofs to a batch of documents
+DEFAULT_SIGNATURE_BATCH = 256
+
 
 class ProofSet:
     """Class for managing proof sets on a JSON-LD document."""
@@ -48,6 +53,8 @@ class ProofSet:
         input = document.copy()
         input.pop("proof", None)
 
+        await prefetch_documents(document_loader, input)
+
         # create the new proof, suites MUST output a proof using security-v2 `@context`
         proof = await suite.create_proof(
             document=input, purpose=purpose, document_loader=document_loader
@@ -56,6 +63,79 @@ class ProofSet:
         JsonLdProcessor.add_value(document, "proof", proof)
         return document
 
+    @staticmethod
+    async def add_batch(
+        *,
+        documents: Sequence[dict],
+        suite: LinkedDataProof,
+        purpose: ProofPurpose,
+        document_loader: DocumentLoaderMethod,
+        max_signatures: int = DEFAULT_SIGNATURE_BATCH,
+    ) -> List[dict]:
+        """Add a Linked Data proof to each of a batch of documents.
+
+        The documents referred to by the batch are loaded once, and the proofs
+        created concurrently. With a wallet key pair, the signatures are then
+        made in batches, each in a single wallet session, rather than one at
+        a time.
+
+        Args:
+            documents (Sequence[dict]): JSON-LD documents to be signed.
+            suite (LinkedDataProof): A signature suite instance that will create the
+                proofs
+            purpose (ProofPurpose): A proof purpose instance that will augment the
+                proofs with information describing their intended purpose.
+            document_loader (DocumentLoader): Document loader to use.
+            max_signatures (int): The number of signatures made at once
+
+        Returns:
+            List[dict]: The signed documents, in order.
+
+        """
+        inputs = []
+        for document in documents:
+            input = document.copy()
+            input.pop("proof", None)
+            inputs.append(input)
+
+        await prefetch_documents(document_loader, *inputs)
+
+        async def _create_proof(input: dict):
+            return await suite.create_proof(
+                document=input, purpose=purpose, document_loader=document_loader
+            )
+
+        key_pair = getattr(suite, "key_pair", None)
+        if not isinstance(key_pair, WalletKeyPair):
+            proofs = await asyncio.gather(*(_create_proof(input) for input in inputs))
+        else:
+            signal = asyncio.Event()
+            with key_pair.deferred(on_defer=signal.set):
+                tasks = [
+                    asyncio.ensure_future(_create_proof(input)) for input in inputs
+                ]
+                for task in tasks:
+                    task.add_done_callback(lambda _: signal.set())
+                try:
+                    while pending := sum(not task.done() for task in tasks):
+                        # sign once the proofs still in progress all wait for their
+                        # signature, or enough of them do
+                        if key_pair.deferred_count >= min(
+                            pending, max(max_signatures, 1)
+                        ):
+                            await key_pair.sign_deferred()
+                        else:
+                            signal.clear()
+                            await signal.wait()
+                    proofs = [task.result() for task in tasks]
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+        for document, proof in zip(documents, proofs):
+            JsonLdProcessor.add_value(document, "proof", proof)
+        return list(documents)
+
     @staticmethod
     async def verify(
         *,
@@ -100,6 +180,8 @@ class ProofSet:
             proof_set = await ProofSet._get_proofs(document=input)
             input.pop("proof", None)
 
+            await prefetch_documents(document_loader, input, proof_set)
+
             results = await ProofSet._verify(
                 document=input,
                 suites=suites,
@@ -180,6 +262,8 @@ class ProofSet:
         )
         input.pop("proof", None)
 
+        await prefetch_documents(document_loader, input, proof_set, reveal_document)
+
         # Derive proof, remove context
         derived_proof = await suite.derive_proof(
             proof=proof_set[0],
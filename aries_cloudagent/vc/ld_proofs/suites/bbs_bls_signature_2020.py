@@ -7,7 +7,7 @@ from typing import List, Optional, Union
 from ....wallet.util import b64_to_bytes, bytes_to_b64
 
 from ..crypto import _KeyPair as KeyPair
-from ..document_loader import DocumentLoaderMethod
+from ..document_loader import DocumentLoaderMethod, run_jsonld
 from ..error import LinkedDataProofException
 from ..purposes import _ProofPurpose as ProofPurpose
 from ..validation_result import ProofResult
@@ -71,8 +71,11 @@ class BbsBlsSignature2020(BbsBlsSignature2020Base):
         proof = purpose.update(proof)
 
         # Create statements to sign
-        verify_data = self._create_verify_data(
-            proof=proof, document=document, document_loader=document_loader
+        verify_data = await run_jsonld(
+            self._create_verify_data,
+            proof=proof,
+            document=document,
+            document_loader=document_loader,
         )
 
         # Encode statements as bytes
@@ -94,16 +97,21 @@ class BbsBlsSignature2020(BbsBlsSignature2020Base):
         """Verify proof against document and proof purpose."""
         try:
             # Create statements to verify
-            verify_data = self._create_verify_data(
-                proof=proof, document=document, document_loader=document_loader
+            verify_data = await run_jsonld(
+                self._create_verify_data,
+                proof=proof,
+                document=document,
+                document_loader=document_loader,
             )
 
             # Encode statements as bytes
             verify_data = [item.encode("utf-8") for item in verify_data]
 
             # Fetch verification method
-            verification_method = self._get_verification_method(
-                proof=proof, document_loader=document_loader
+            verification_method = await run_jsonld(
+                self._get_verification_method,
+                proof=proof,
+                document_loader=document_loader,
             )
 
             # Verify signature on data
@@ -120,7 +128,8 @@ class BbsBlsSignature2020(BbsBlsSignature2020Base):
                 )
 
             # Ensure proof was performed for a valid purpose
-            purpose_result = purpose.validate(
+            purpose_result = await run_jsonld(
+                purpose.validate,
                 proof=proof,
                 document=document,
                 suite=self,
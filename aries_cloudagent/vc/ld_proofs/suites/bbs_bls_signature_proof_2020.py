@@ -2,40 +2,44 @@
 
 import re
 
+from contextlib import contextmanager
 from os import urandom
-from typing import List
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
 
 from pyld import jsonld
 
-from .bbs_bls_signature_2020_base import BbsBlsSignature2020Base
-
-if BbsBlsSignature2020Base.BBS_SUPPORTED:
-    from ursa_bbs_signatures import (
-        create_proof as bls_create_proof,
-        verify_proof as bls_verify_proof,
-        CreateProofRequest,
-        VerifyProofRequest,
-        get_total_message_count,
-        ProofMessage,
-        BlsKeyPair,
-        ProofMessageType,
-    )
-
+from ....core.profile import Profile
 from ....utils.dependencies import assert_ursa_bbs_signatures_installed
+from ....utils.process_pool import ProcessPool
+from ....utils.stats import Collector
+from ....wallet.bbs import (
+    BbsException,
+    create_proof_bls12381g2,
+    verify_proof_bls12381g2,
+)
 from ....wallet.util import b64_to_bytes, bytes_to_b64
 
-from ..crypto import _KeyPair as KeyPair
+from ..crypto import _KeyPair as KeyPair, _WalletKeyPair as WalletKeyPair
 from ..error import LinkedDataProofException
 from ..validation_result import ProofResult
-from ..document_loader import DocumentLoaderMethod
+from ..document_loader import DocumentLoaderMethod, run_jsonld
+from ..canonize_cache import DOCUMENT_CACHE
 from ..purposes import _ProofPurpose as ProofPurpose
 
+from .bbs_bls_signature_2020_base import BbsBlsSignature2020Base
 from .bbs_bls_signature_2020 import BbsBlsSignature2020
 from .linked_data_proof import DeriveProofResult
 
 
 class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
-    """BbsBlsSignatureProof2020 class."""
+    """BbsBlsSignatureProof2020 class.
+
+    JSON-LD processing runs in the JSON-LD worker thread, and deriving and
+    verifying the BBS+ proofs in the process pool of the profile, if any: both
+    take hundreds of milliseconds for credentials of many attributes. The time
+    spent in each phase is added up in `timings`.
+    """
 
     signature_type = "BbsBlsSignatureProof2020"
 
@@ -57,6 +61,34 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         )
         self.key_pair = key_pair
         self.mapped_derived_proof_type = "BbsBlsSignature2020"
+        self.timings: Dict[str, float] = {}
+
+    @property
+    def _profile(self) -> Optional[Profile]:
+        """Accessor for the profile of the key pair, if any."""
+        if isinstance(self.key_pair, WalletKeyPair):
+            return self.key_pair.profile
+        return None
+
+    @contextmanager
+    def _timed(self, phase: str):
+        """Record the duration of a derivation or verification phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self.timings[phase] = self.timings.get(phase, 0.0) + duration
+            collector = self._profile and self._profile.inject_or(Collector)
+            if collector:
+                collector.log(f"{self.__class__.__name__}.{phase}", duration, start)
+
+    async def _run_bbs(self, func, *args):
+        """Run a BBS+ operation in the process pool."""
+        pool = (self._profile and self._profile.inject_or(ProcessPool)) or ProcessPool(
+            max_workers=0
+        )
+        return await pool.run(func, *args)
 
     async def derive_proof(
         self,
@@ -80,22 +112,100 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         # Extract the BBS signature from the input proof
         signature = b64_to_bytes(proof["proofValue"])
 
-        # Initialize the BBS signature suite
-        # This is used for creating the input document verification data
-        # NOTE: both suite._create_verify_xxx_data and self._create_verify_xxx_data
-        # are used in this file. They have small changes in behavior
-        suite = BbsBlsSignature2020(key_pair=self.key_pair)
-
         # Initialize the derived proof
         derived_proof = self.proof.copy() if self.proof else {}
 
         # Ensure proof type is set
         derived_proof["type"] = self.signature_type
 
-        # Get the input document and proof statements
-        document_statements = suite._create_verify_document_data(
-            document=document, document_loader=document_loader
+        with self._timed("canonize"):
+            (
+                all_input_statements,
+                reveal_indices,
+                reveal_document_result,
+                verification_method,
+            ) = await run_jsonld(
+                self._create_derive_data,
+                proof=proof,
+                document=document,
+                reveal_document=reveal_document,
+                document_loader=document_loader,
+            )
+
+        # Create a nonce if one is not supplied
+        nonce = nonce or urandom(50)
+
+        derived_proof["nonce"] = bytes_to_b64(
+            nonce, urlsafe=False, pad=True, encoding="utf-8"
+        )
+
+        # Create key pair from public key in verification method
+        key_pair = self.key_pair.from_verification_method(verification_method)
+
+        # Compute the proof
+        # NOTE: we use plain strings here as input for the bbs lib.
+        # the MATTR lib uses bytes, but the wrapper expects strings
+        # it also works if we pass bytes as input
+        with self._timed("derive"):
+            try:
+                output_proof = await self._run_bbs(
+                    create_proof_bls12381g2,
+                    all_input_statements,
+                    reveal_indices,
+                    signature,
+                    key_pair.public_key,
+                    nonce,
+                )
+            except BbsException as err:
+                raise LinkedDataProofException(str(err)) from err
+
+        # Set the proof value on the derived proof
+        derived_proof["proofValue"] = bytes_to_b64(
+            output_proof, urlsafe=False, pad=True, encoding="utf-8"
+        )
+
+        # Set the relevant proof elements on the derived proof from the input proof
+        derived_proof["verificationMethod"] = proof["verificationMethod"]
+        derived_proof["proofPurpose"] = proof["proofPurpose"]
+        derived_proof["created"] = proof["created"]
+
+        return DeriveProofResult(
+            document={**reveal_document_result}, proof=derived_proof
         )
+
+    def _create_derive_data(
+        self,
+        *,
+        proof: dict,
+        document: dict,
+        reveal_document: dict,
+        document_loader: DocumentLoaderMethod,
+    ) -> Tuple[List[str], List[int], dict, dict]:
+        """Create the statements to derive a proof from.
+
+        Returns all the signed statements, the indexes of those to reveal, the
+        reveal document and the verification method of the proof.
+
+        """
+        # Initialize the BBS signature suite
+        # This is used for creating the input document verification data
+        # NOTE: both suite._create_verify_xxx_data and self._create_verify_xxx_data
+        # are used in this file. They have small changes in behavior
+        suite = BbsBlsSignature2020(key_pair=self.key_pair)
+
+        # Get the input document and proof statements; the canonized input
+        # document is reused across derivations from the same credential
+        document_statements = [
+            statement
+            for statement in DOCUMENT_CACHE.canonize(
+                document,
+                document_loader,
+                lambda: suite._canonize(
+                    input=document, document_loader=document_loader
+                ),
+            ).split("\n")
+            if statement
+        ]
         proof_statements = suite._create_verify_proof_data(
             proof=proof, document=document, document_loader=document_loader
         )
@@ -135,32 +245,23 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         proof_reveal_indices = list(range(number_of_proof_statements))
 
         # Reveal the statements indicated from the reveal document
-        document_reveal_indices = [
-            transformed_input_document_statements.index(reveal_statement)
-            + number_of_proof_statements
-            for reveal_statement in reveal_document_statements
-        ]
-
-        # Check there is not a mismatch
-        if len(document_reveal_indices) != len(reveal_document_statements):
+        statement_indices = {}
+        for index, statement in enumerate(transformed_input_document_statements):
+            statement_indices.setdefault(statement, index)
+        try:
+            document_reveal_indices = [
+                statement_indices[reveal_statement] + number_of_proof_statements
+                for reveal_statement in reveal_document_statements
+            ]
+        except KeyError as err:
             raise LinkedDataProofException(
                 "Some statements in the reveal document not found in original proof"
-            )
+            ) from err
 
         # Combine all indices to get the resulting list of revealed indices
         reveal_indices = [*proof_reveal_indices, *document_reveal_indices]
 
-        # Create a nonce if one is not supplied
-        nonce = nonce or urandom(50)
-
-        derived_proof["nonce"] = bytes_to_b64(
-            nonce, urlsafe=False, pad=True, encoding="utf-8"
-        )
-
         # Combine all the input statements that were originally signed
-        # NOTE: we use plain strings here as input for the bbs lib.
-        # the MATTR lib uses bytes, but the wrapper expects strings
-        # it also works if we pass bytes as input
         all_input_statements = [*proof_statements, *document_statements]
 
         # Fetch the verification method
@@ -168,53 +269,11 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
             proof=proof, document_loader=document_loader
         )
 
-        # Create key pair from public key in verification method
-        key_pair = self.key_pair.from_verification_method(verification_method)
-
-        # Get the proof messages (revealed or not)
-        proof_messages = []
-        for input_statement_index in range(len(all_input_statements)):
-            # if input statement index in revealed messages indexes use revealed type
-            # otherwise use blinding
-            proof_type = (
-                ProofMessageType.Revealed
-                if input_statement_index in reveal_indices
-                else ProofMessageType.HiddenProofSpecificBlinding
-            )
-            proof_messages.append(
-                ProofMessage(
-                    message=all_input_statements[input_statement_index],
-                    proof_type=proof_type,
-                )
-            )
-
-        # get bbs key from bls key pair
-        bbs_public_key = BlsKeyPair(public_key=key_pair.public_key).get_bbs_key(
-            len(all_input_statements)
-        )
-
-        # Compute the proof
-        proof_request = CreateProofRequest(
-            public_key=bbs_public_key,
-            messages=proof_messages,
-            signature=signature,
-            nonce=nonce,
-        )
-
-        output_proof = bls_create_proof(proof_request)
-
-        # Set the proof value on the derived proof
-        derived_proof["proofValue"] = bytes_to_b64(
-            output_proof, urlsafe=False, pad=True, encoding="utf-8"
-        )
-
-        # Set the relevant proof elements on the derived proof from the input proof
-        derived_proof["verificationMethod"] = proof["verificationMethod"]
-        derived_proof["proofPurpose"] = proof["proofPurpose"]
-        derived_proof["created"] = proof["created"]
-
-        return DeriveProofResult(
-            document={**reveal_document_result}, proof=derived_proof
+        return (
+            all_input_statements,
+            reveal_indices,
+            reveal_document_result,
+            verification_method,
         )
 
     async def verify_proof(
@@ -230,59 +289,36 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         try:
             proof["type"] = self.mapped_derived_proof_type
 
-            # Get the proof and document statements
-            proof_statements = self._create_verify_proof_data(
-                proof=proof, document=document, document_loader=document_loader
-            )
-            document_statements = self._create_verify_document_data(
-                document=document, document_loader=document_loader
-            )
-
-            # Transform the blank node identifier placeholders for the document statements
-            # back into actual blank node identifiers
-            transformed_document_statements = (
-                self._transform_placeholder_node_ids_into_blank_node_ids(
-                    document_statements
+            with self._timed("canonize"):
+                statements_to_verify, verification_method = await run_jsonld(
+                    self._create_verify_proof_statements,
+                    proof=proof,
+                    document=document,
+                    document_loader=document_loader,
                 )
-            )
-
-            # Combine all the statements to be verified
-            # NOTE: we use plain strings here as input for the bbs lib.
-            # the MATTR lib uses bytes, but the wrapper expects strings
-            # it also works if we pass bytes as input
-            statements_to_verify = [*proof_statements, *transformed_document_statements]
-
-            # Fetch the verification method
-            verification_method = self._get_verification_method(
-                proof=proof, document_loader=document_loader
-            )
 
             key_pair = self.key_pair.from_verification_method(verification_method)
-            proof_bytes = b64_to_bytes(proof["proofValue"])
-
-            total_message_count = get_total_message_count(proof_bytes)
-
-            # get bbs key from bls key pair
-            bbs_public_key = BlsKeyPair(public_key=key_pair.public_key).get_bbs_key(
-                total_message_count
-            )
 
             # verify dervied proof
-            verify_request = VerifyProofRequest(
-                public_key=bbs_public_key,
-                proof=proof_bytes,
-                messages=statements_to_verify,
-                nonce=b64_to_bytes(proof["nonce"]),
-            )
-
-            verified = bls_verify_proof(verify_request)
+            # NOTE: we use plain strings here as input for the bbs lib.
+            # the MATTR lib uses bytes, but the wrapper expects strings
+            # it also works if we pass bytes as input
+            with self._timed("verify"):
+                verified = await self._run_bbs(
+                    verify_proof_bls12381g2,
+                    statements_to_verify,
+                    b64_to_bytes(proof["proofValue"]),
+                    key_pair.public_key,
+                    b64_to_bytes(proof["nonce"]),
+                )
 
             if not verified:
                 raise LinkedDataProofException(
                     f"Invalid signature on document {document}"
                 )
 
-            purpose_result = purpose.validate(
+            purpose_result = await run_jsonld(
+                purpose.validate,
                 proof=proof,
                 document=document,
                 suite=self,
@@ -301,6 +337,37 @@ class BbsBlsSignatureProof2020(BbsBlsSignature2020Base):
         except Exception as err:
             return ProofResult(verified=False, error=err)
 
+    def _create_verify_proof_statements(
+        self, *, proof: dict, document: dict, document_loader: DocumentLoaderMethod
+    ) -> Tuple[List[str], dict]:
+        """Create the statements to verify and get the verification method."""
+        # Get the proof and document statements
+        proof_statements = self._create_verify_proof_data(
+            proof=proof, document=document, document_loader=document_loader
+        )
+        document_statements = self._create_verify_document_data(
+            document=document, document_loader=document_loader
+        )
+
+        # Transform the blank node identifier placeholders for the document statements
+        # back into actual blank node identifiers
+        transformed_document_statements = (
+            self._transform_placeholder_node_ids_into_blank_node_ids(
+                document_statements
+            )
+        )
+
+        # Fetch the verification method
+        verification_method = self._get_verification_method(
+            proof=proof, document_loader=document_loader
+        )
+
+        # Combine all the statements to be verified
+        return (
+            [*proof_statements, *transformed_document_statements],
+            verification_method,
+        )
+
     def _canonize_proof(
         self, *, proof: dict, document: dict, document_loader: DocumentLoaderMethod
     ):
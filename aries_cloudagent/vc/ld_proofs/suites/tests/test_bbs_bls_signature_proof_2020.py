@@ -6,6 +6,7 @@ from aries_cloudagent.wallet.key_type import BLS12381G2
 
 from .....core.in_memory import InMemoryProfile
 from .....did.did_key import DIDKey
+from .....utils.process_pool import ProcessPool
 from .....wallet.in_memory import InMemoryWallet
 from ....tests.document_loader import custom_document_loader
 from ....tests.data import (
@@ -59,6 +60,29 @@ class TestBbsBlsSignatureProof2020(IsolatedAsyncioTestCase):
 
         assert derived
 
+    async def test_derive_verify_process_pool(self):
+        pool = ProcessPool(max_workers=1)
+        self.profile.context.injector.bind_instance(ProcessPool, pool)
+        suite = BbsBlsSignatureProof2020(key_pair=self.key_pair)
+        try:
+            derived = await derive(
+                document=TEST_LD_DOCUMENT_SIGNED_BBS,
+                reveal_document=TEST_LD_DOCUMENT_REVEAL,
+                document_loader=custom_document_loader,
+                suite=suite,
+            )
+            result = await verify(
+                document=derived,
+                suites=[suite],
+                document_loader=custom_document_loader,
+                purpose=AssertionProofPurpose(),
+            )
+        finally:
+            pool.shutdown()
+
+        assert result.verified
+        assert set(suite.timings) == {"canonize", "derive", "verify"}
+
     async def test_verify_derived_x_bad_proof(self):
         result = await verify(
             document=TEST_LD_DOCUMENT_BAD_PARTIAL_PROOF_BBS,
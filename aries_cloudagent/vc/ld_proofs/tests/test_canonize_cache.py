@@ -0,0 +1,77 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ....core.in_memory import InMemoryProfile
+from ....resolver.default.key import KeyDIDResolver
+from ....resolver.did_resolver import DIDResolver
+from ..canonize_cache import CanonizeCache
+from ..constants import CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_ED25519_2020_URL
+from ..document_loader import DocumentLoader
+
+PROOF = {
+    "@context": [CREDENTIALS_CONTEXT_V1_URL, SECURITY_CONTEXT_ED25519_2020_URL],
+    "type": "Ed25519Signature2020",
+    "created": "2019-12-11T03:50:55Z",
+    "proofPurpose": "assertionMethod",
+    "verificationMethod": "did:key:z6Mkgg342Ycpuk263R9d8Aq6MUaxPn1DDeHyGo38EefXmgDL",
+}
+
+
+class TestCanonizeCache(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile(
+            bind={DIDResolver: DIDResolver([KeyDIDResolver()])}
+        )
+        self.loader = DocumentLoader(self.profile)
+        self.cache = CanonizeCache(max_entries=2, ttl=60)
+
+    def test_cacheable(self):
+        assert self.cache.cacheable(
+            {**PROOF, "@context": "https://example.org/context/v1"}, self.loader
+        )
+        assert not self.cache.cacheable(PROOF, mock.MagicMock())
+
+    def test_canonize(self):
+        canonize = mock.MagicMock(return_value="canonized")
+        assert self.cache.canonize(PROOF, self.loader, canonize) == "canonized"
+        # key order does not matter
+        reordered = dict(reversed(PROOF.items()))
+        assert self.cache.canonize(reordered, self.loader, canonize) == "canonized"
+        canonize.assert_called_once()
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+        # not cached with any other document loader
+        self.cache.canonize(PROOF, mock.MagicMock(), canonize)
+        assert canonize.call_count == 2
+
+    def test_static_documents_shared(self):
+        document = self.loader(CREDENTIALS_CONTEXT_V1_URL, {})
+        assert document["tag"] == "static"
+        assert isinstance(document["document"], dict)
+        assert DocumentLoader(self.profile)(CREDENTIALS_CONTEXT_V1_URL, {}) is document
+
+    def test_expiry(self):
+        canonize = mock.MagicMock(return_value="canonized")
+        with mock.patch("time.monotonic", return_value=1000.0):
+            self.cache.canonize(PROOF, self.loader, canonize)
+            self.cache.canonize(PROOF, self.loader, canonize)
+        assert canonize.call_count == 1
+        with mock.patch("time.monotonic", return_value=1060.0):
+            self.cache.canonize(PROOF, self.loader, canonize)
+        assert canonize.call_count == 2
+
+        self.cache.ttl = 0
+        self.cache.clear()
+        self.cache.canonize(PROOF, self.loader, canonize)
+        assert not self.cache._entries
+
+    def test_max_entries(self):
+        for created in ("2020", "2021", "2022"):
+            self.cache.canonize(
+                {**PROOF, "created": created}, self.loader, lambda: created
+            )
+        assert len(self.cache._entries) == len(self.cache._expiry) == 2
+
+        self.cache.clear()
+        assert not self.cache._entries and not self.cache._expiry
@@ -0,0 +1,112 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ....core.in_memory import InMemoryProfile
+from ....resolver.default.key import KeyDIDResolver
+from ....resolver.did_resolver import DIDResolver
+from ..constants import CREDENTIALS_CONTEXT_V1_URL
+from ..document_loader import (
+    DocumentLoader,
+    _referenced_urls,
+    prefetch_documents,
+    run_jsonld,
+)
+from ..error import LinkedDataProofException
+
+TEST_DID_KEY = "did:key:z6Mkgg342Ycpuk263R9d8Aq6MUaxPn1DDeHyGo38EefXmgDL"
+TEST_VERIFICATION_METHOD = (
+    TEST_DID_KEY + "#z6Mkgg342Ycpuk263R9d8Aq6MUaxPn1DDeHyGo38EefXmgDL"
+)
+TEST_CONTEXT_URL = "https://example.org/context/v1"
+TEST_IMPORTED_URL = "https://example.org/imported/v1"
+DOC = {
+    "@context": [CREDENTIALS_CONTEXT_V1_URL, TEST_CONTEXT_URL, {"ex": "urn:ex#"}],
+    "type": ["VerifiableCredential"],
+    "issuer": TEST_DID_KEY,
+    "proof": {"verificationMethod": TEST_VERIFICATION_METHOD},
+}
+
+
+def http_document(url: str, options: dict):
+    context = {"@context": {"@version": 1.1}}
+    if url == TEST_CONTEXT_URL:
+        context["@context"]["@import"] = TEST_IMPORTED_URL
+    return {"contextUrl": None, "documentUrl": url, "document": context}
+
+
+class TestDocumentLoader(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile(
+            bind={DIDResolver: DIDResolver([KeyDIDResolver()])}
+        )
+        self.loader = DocumentLoader(self.profile)
+        self.loader._load_http_document = mock.MagicMock(side_effect=http_document)
+
+    def test_referenced_urls(self):
+        assert _referenced_urls(DOC) == {
+            CREDENTIALS_CONTEXT_V1_URL,
+            TEST_CONTEXT_URL,
+            TEST_VERIFICATION_METHOD,
+        }
+        assert _referenced_urls({"@context": {"ex": "urn:ex#"}}) == set()
+
+    async def test_load_static(self):
+        document = self.loader(CREDENTIALS_CONTEXT_V1_URL, {})
+        assert document["documentUrl"] == CREDENTIALS_CONTEXT_V1_URL
+        self.loader._load_http_document.assert_not_called()
+
+    async def test_load_document_kept(self):
+        with mock.patch.object(
+            self.loader.resolver, "resolve", wraps=self.loader.resolver.resolve
+        ) as mock_resolve:
+            document = await self.loader.load_document(TEST_VERIFICATION_METHOD, {})
+            assert document["document"]["id"] == TEST_DID_KEY
+            assert self.loader(TEST_VERIFICATION_METHOD, {}) is document
+            # DID URLs share the document of the DID
+            assert self.loader(TEST_DID_KEY, {}) is document
+            mock_resolve.assert_called_once()
+
+        # expired
+        self.loader.cache_ttl = -1
+        await self.loader.load_document(TEST_CONTEXT_URL, {})
+        await self.loader.load_document(TEST_CONTEXT_URL, {})
+        assert self.loader._load_http_document.call_count == 2
+
+    async def test_fetch_document(self):
+        await self.loader.load_document(TEST_CONTEXT_URL, {})
+        document = await self.loader.fetch_document(TEST_CONTEXT_URL, {})
+        assert document["documentUrl"] == TEST_CONTEXT_URL
+        await self.loader.fetch_document(TEST_IMPORTED_URL, {})
+        # fetched each time, and not kept
+        assert self.loader._load_http_document.call_count == 3
+        assert list(self.loader._documents) == [TEST_CONTEXT_URL]
+
+    async def test_load_document_max_documents(self):
+        self.loader.max_documents = 1
+        await self.loader.load_document(TEST_CONTEXT_URL, {})
+        await self.loader.load_document(TEST_IMPORTED_URL, {})
+        assert list(self.loader._documents) == [TEST_IMPORTED_URL]
+
+    async def test_load_in_worker_thread(self):
+        document = await run_jsonld(self.loader, TEST_VERIFICATION_METHOD, {})
+        assert document["document"]["id"] == TEST_DID_KEY
+
+        with self.assertRaises(LinkedDataProofException):
+            await run_jsonld(self.loader, "urn:not:loadable", {})
+
+    async def test_prefetch(self):
+        await prefetch_documents(self.loader, {"@context": "urn:not:loadable"}, DOC)
+        assert set(self.loader._documents) == {
+            TEST_CONTEXT_URL,
+            TEST_IMPORTED_URL,
+            TEST_DID_KEY,
+        }
+
+        with mock.patch.object(self.loader, "load_document") as mock_load:
+            for url in list(self.loader._documents):
+                assert self.loader(url, {})
+            mock_load.assert_not_called()
+
+        # any other document loader
+        await prefetch_documents(mock.MagicMock(), DOC)
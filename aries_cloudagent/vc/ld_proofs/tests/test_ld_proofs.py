@@ -3,14 +3,19 @@ import pytest
 
 from datetime import datetime, timezone
 
+from aries_cloudagent.tests import mock
+
 
 from ....wallet.key_type import BLS12381G2, ED25519
 from ....did.did_key import DIDKey
+from ....wallet.base import BaseWallet
 from ....wallet.in_memory import InMemoryWallet
 from ....core.in_memory import InMemoryProfile
 
 from ...ld_proofs import (
     sign,
+    sign_batch,
+    ProofSet,
     Ed25519Signature2018,
     Ed25519Signature2020,
     WalletKeyPair,
@@ -36,6 +41,11 @@ from .test_doc import (
 )
 
 
+def _unsigned(document: dict) -> dict:
+    # signing adds the proof to the document in place
+    return {key: value for key, value in document.items() if key != "proof"}
+
+
 class TestLDProofs(IsolatedAsyncioTestCase):
     test_seed = "testseed000000000000000000000001"
 
@@ -102,6 +112,69 @@ class TestLDProofs(IsolatedAsyncioTestCase):
 
         assert signed == DOC_SIGNED_2020
 
+    async def test_sign_batch_Ed25519Signature2018(self):
+        suite = Ed25519Signature2018(
+            verification_method=self.ed25519_verification_method,
+            key_pair=WalletKeyPair(
+                profile=self.profile,
+                key_type=ED25519,
+                public_key_base58=self.ed25519_key_info.verkey,
+            ),
+            date=datetime(2019, 12, 11, 3, 50, 55, 0, timezone.utc),
+        )
+        signed = await sign_batch(
+            documents=[_unsigned(DOC_TEMPLATE) for _ in range(3)],
+            suite=suite,
+            purpose=AssertionProofPurpose(),
+            document_loader=custom_document_loader,
+        )
+
+        assert signed == [DOC_SIGNED] * 3
+
+    async def test_add_batch_signatures(self):
+        suite = Ed25519Signature2020(
+            verification_method=self.ed25519_verification_method,
+            key_pair=WalletKeyPair(
+                profile=self.profile,
+                key_type=ED25519,
+                public_key_base58=self.ed25519_key_info.verkey,
+            ),
+            date=datetime(2019, 12, 11, 3, 50, 55, 0, timezone.utc),
+        )
+        with mock.patch.object(
+            InMemoryWallet,
+            "sign_messages",
+            autospec=True,
+            side_effect=BaseWallet.sign_messages,
+        ) as sign_messages:
+            signed = await ProofSet.add_batch(
+                documents=[_unsigned(DOC_TEMPLATE_2020) for _ in range(5)],
+                suite=suite,
+                purpose=AssertionProofPurpose(),
+                document_loader=custom_document_loader,
+                max_signatures=2,
+            )
+
+        assert signed == [DOC_SIGNED_2020] * 5
+        assert [len(call.args[1]) for call in sign_messages.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert suite.key_pair.deferred_count == 0
+
+        # signing errors are raised
+        with mock.patch.object(
+            InMemoryWallet, "sign_messages", mock.CoroutineMock(side_effect=KeyError)
+        ):
+            with self.assertRaises(KeyError):
+                await ProofSet.add_batch(
+                    documents=[_unsigned(DOC_TEMPLATE_2020) for _ in range(2)],
+                    suite=suite,
+                    purpose=AssertionProofPurpose(),
+                    document_loader=custom_document_loader,
+                )
+
     async def test_verify_Ed25519Signature2018(self):
         # Verification requires lot less input parameters
         suite = Ed25519Signature2018(
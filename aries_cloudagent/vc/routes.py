@@ -1,16 +1,22 @@
 """VC-API Routes."""
 
+import json
+from typing import Optional, Sequence
+
 from aiohttp import web
-from aiohttp_apispec import docs, request_schema, response_schema
+from aiohttp_apispec import docs, match_info_schema, request_schema, response_schema
 from marshmallow.exceptions import ValidationError
 import uuid
 from ..admin.request_context import AdminRequestContext
+from ..messaging.models.base import BaseModelError
 from ..storage.error import StorageError, StorageNotFoundError, StorageDuplicateError
 from ..wallet.error import WalletError
 from ..wallet.base import BaseWallet
 from ..config.base import InjectionError
 from ..resolver.base import ResolverError
 from ..storage.vc_holder.base import VCHolder
+from .ld_proofs.error import LinkedDataProofException
+from .status_list.models import StatusListRecord
 from .vc_ld.models import web_schemas
 from .vc_ld.manager import VcLdpManager
 from .vc_ld.manager import VcLdpManagerError
@@ -63,6 +69,52 @@ async def fetch_credential_route(request: web.BaseRequest):
         return web.json_response({"message": err.roll_up}, status=400)
 
 
+def _issuer_did(credential: dict) -> str:
+    """Return the issuer DID of a credential."""
+    issuer = credential["issuer"]
+    return issuer if isinstance(issuer, str) else issuer["id"]
+
+
+async def _derive_proof_type(context: AdminRequestContext, did: str) -> Optional[str]:
+    """Derive the issuance proof type from the key type of an issuer DID."""
+    async with context.session() as session:
+        wallet: BaseWallet | None = session.inject_or(BaseWallet)
+        info = await wallet.get_local_did(did)
+        key_type = info.key_type.key_type
+
+    if key_type == "ed25519":
+        return "Ed25519Signature2020"
+    elif key_type == "bls12381g2":
+        return "BbsBlsSignature2020"
+    return None
+
+
+async def _set_issuance_proof_type(
+    context: AdminRequestContext, credentials: Sequence[dict], options: dict
+):
+    """Set the proofType of issuance options, derived from the issuer DIDs if absent.
+
+    All credentials must derive the same proof type, as the options apply
+    to every credential.
+    """
+    if not options.get("type", None) and not options.get("proofType", None):
+        proof_types = {
+            await _derive_proof_type(context, did)
+            for did in {_issuer_did(credential) for credential in credentials}
+        }
+        if len(proof_types) > 1:
+            raise VcLdpManagerError(
+                "Credentials of a batch must be issued with the same proof type"
+            )
+        proof_type = proof_types.pop()
+        if proof_type:
+            options["proofType"] = proof_type
+    else:
+        options["proofType"] = (
+            options.pop("type") if "type" in options else options["proofType"]
+        )
+
+
 @docs(tags=["vc-api"], summary="Issue a credential")
 @request_schema(web_schemas.IssueCredentialRequest())
 @response_schema(web_schemas.IssueCredentialResponse(), 200, description="")
@@ -79,24 +131,7 @@ async def issue_credential_route(request: web.BaseRequest):
     try:
         credential = body["credential"]
         options = {} if "options" not in body else body["options"]
-
-        # We derive the proofType from the issuer DID if not provided in options
-        if not options.get("type", None) and not options.get("proofType", None):
-            issuer = credential["issuer"]
-            did = issuer if isinstance(issuer, str) else issuer["id"]
-            async with context.session() as session:
-                wallet: BaseWallet | None = session.inject_or(BaseWallet)
-                info = await wallet.get_local_did(did)
-                key_type = info.key_type.key_type
-
-            if key_type == "ed25519":
-                options["proofType"] = "Ed25519Signature2020"
-            elif key_type == "bls12381g2":
-                options["proofType"] = "BbsBlsSignature2020"
-        else:
-            options["proofType"] = (
-                options.pop("type") if "type" in options else options["proofType"]
-            )
+        await _set_issuance_proof_type(context, [credential], options)
 
         credential = VerifiableCredential.deserialize(credential)
         options = LDProofVCOptions.deserialize(options)
@@ -108,6 +143,45 @@ async def issue_credential_route(request: web.BaseRequest):
         return web.json_response({"message": str(err)}, status=400)
 
 
+@docs(tags=["vc-api"], summary="Issue a batch of credentials")
+@request_schema(web_schemas.IssueCredentialsBatchRequest())
+@response_schema(web_schemas.IssueCredentialsBatchResponse(), 200, description="")
+async def issue_credentials_batch_route(request: web.BaseRequest):
+    """Request handler for issuing a batch of credentials.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    body = await request.json()
+    context: AdminRequestContext = request["context"]
+    manager = VcLdpManager(context.profile)
+    try:
+        credentials = body["credentials"]
+        if not credentials:
+            raise VcLdpManagerError("No credentials to issue")
+        options = {} if "options" not in body else body["options"]
+        await _set_issuance_proof_type(context, credentials, options)
+
+        credentials = [
+            VerifiableCredential.deserialize(credential) for credential in credentials
+        ]
+        options = LDProofVCOptions.deserialize(options)
+
+        vcs = await manager.issue_batch(credentials, options)
+        response = {"verifiableCredentials": [vc.serialize() for vc in vcs]}
+        return web.json_response(response, status=201)
+    except (
+        BaseModelError,
+        ValidationError,
+        VcLdpManagerError,
+        LinkedDataProofException,
+        WalletError,
+        InjectionError,
+    ) as err:
+        return web.json_response({"message": str(err)}, status=400)
+
+
 @docs(tags=["vc-api"], summary="Verify a credential")
 @request_schema(web_schemas.VerifyCredentialRequest())
 @response_schema(web_schemas.VerifyCredentialResponse(), 200, description="")
@@ -137,6 +211,57 @@ async def verify_credential_route(request: web.BaseRequest):
         return web.json_response({"message": str(err)}, status=400)
 
 
+@docs(
+    tags=["vc-api"],
+    summary="Verify a batch of credentials",
+    description=(
+        "Results are streamed back as newline delimited JSON, one line per "
+        "credential, in the order verification completes"
+    ),
+)
+@request_schema(web_schemas.VerifyCredentialsBatchRequest())
+@response_schema(web_schemas.VerifyCredentialsBatchResult(), 200, description="")
+async def verify_credentials_batch_route(request: web.BaseRequest):
+    """Request handler for verifying a batch of credentials.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    body = await request.json()
+    context: AdminRequestContext = request["context"]
+    manager = VcLdpManager(context.profile)
+
+    invalid = {}
+    indexes = []
+    vcs = []
+    for index, credential in enumerate(body.get("verifiableCredentials") or []):
+        try:
+            vcs.append(VerifiableCredential.deserialize(credential))
+            indexes.append(index)
+        except (BaseModelError, ValidationError) as err:
+            invalid[index] = str(err)
+
+    response = web.StreamResponse(
+        status=200, headers={"Content-Type": "application/x-ndjson"}
+    )
+    await response.prepare(request)
+
+    async def _write(result: dict):
+        await response.write(json.dumps(result).encode() + b"\n")
+
+    for index, error in invalid.items():
+        await _write({"index": index, "verified": False, "errors": [error]})
+    try:
+        async for position, result in manager.verify_credentials(vcs):
+            await _write({"index": indexes[position], **result.serialize()})
+    except (VcLdpManagerError, WalletError, InjectionError) as err:
+        await _write({"message": str(err)})
+
+    await response.write_eof()
+    return response
+
+
 @docs(tags=["vc-api"], summary="Store a credential")
 async def store_credential_route(request: web.BaseRequest):
     """Request handler for storing a credential.
@@ -172,6 +297,62 @@ async def store_credential_route(request: web.BaseRequest):
         return web.json_response({"message": str(err)}, status=400)
 
 
+@docs(tags=["vc-api"], summary="Update the status of credentials on a status list")
+@match_info_schema(web_schemas.StatusListMatchInfoSchema())
+@request_schema(web_schemas.UpdateCredentialStatusRequest())
+@response_schema(web_schemas.StatusListCredentialResponse(), 200, description="")
+async def update_credential_status_route(request: web.BaseRequest):
+    """Request handler for setting or unsetting the status of credentials.
+
+    The status list credential is signed and published again once for all
+    the credentials.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    context: AdminRequestContext = request["context"]
+    body = await request.json()
+    list_id = request.match_info["list_id"]
+    manager = VcLdpManager(context.profile)
+    try:
+        vc = await manager.update_credential_status(
+            list_id, body["indexes"], body.get("status", True)
+        )
+        return web.json_response({"verifiableCredential": vc.serialize()})
+    except (
+        VcLdpManagerError,
+        LinkedDataProofException,
+        StorageError,
+        WalletError,
+    ) as err:
+        return web.json_response({"message": str(err)}, status=400)
+
+
+@docs(tags=["vc-api"], summary="Fetch a status list credential")
+@match_info_schema(web_schemas.StatusListMatchInfoSchema())
+@response_schema(web_schemas.StatusListCredentialResponse(), 200, description="")
+async def fetch_status_list_route(request: web.BaseRequest):
+    """Request handler for fetching the signed credential of a status list.
+
+    Args:
+        request: aiohttp request object
+
+    """
+    context: AdminRequestContext = request["context"]
+    list_id = request.match_info["list_id"]
+    try:
+        async with context.profile.session() as session:
+            record = await StatusListRecord.retrieve_by_id(session, list_id)
+    except StorageNotFoundError as err:
+        raise web.HTTPNotFound(reason=err.roll_up) from err
+    except StorageError as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
+    if not record.list_credential:
+        raise web.HTTPNotFound(reason=f"Status list {list_id} is not published")
+    return web.json_response({"verifiableCredential": record.list_credential})
+
+
 @docs(tags=["vc-api"], summary="Prove a presentation")
 @request_schema(web_schemas.ProvePresentationRequest())
 @response_schema(web_schemas.ProvePresentationResponse(), 200, description="")
@@ -256,8 +437,16 @@ async def register(app: web.Application):
                 allow_head=False,
             ),
             web.post("/vc/credentials/issue", issue_credential_route),
+            web.post("/vc/credentials/issue-batch", issue_credentials_batch_route),
             web.post("/vc/credentials/store", store_credential_route),
             web.post("/vc/credentials/verify", verify_credential_route),
+            web.post("/vc/credentials/verify-batch", verify_credentials_batch_route),
+            web.get(
+                "/vc/status-lists/{list_id}", fetch_status_list_route, allow_head=False
+            ),
+            web.post(
+                "/vc/status-lists/{list_id}/status", update_credential_status_route
+            ),
             web.post("/vc/presentations/prove", prove_presentation_route),
             web.post("/vc/presentations/verify", verify_presentation_route),
         ]
@@ -0,0 +1,40 @@
+"""Compressed bitstrings of StatusList2021 credentials."""
+
+import base64
+import gzip
+
+# 16KB uncompressed, the minimum size recommended for herd privacy
+DEFAULT_LIST_SIZE = 131072
+
+
+def create_bitstring(size: int = DEFAULT_LIST_SIZE) -> bytearray:
+    """Create a bitstring of a number of bits, all unset."""
+    return bytearray(-(-size // 8))
+
+
+def encode_bitstring(bits: bytes) -> str:
+    """Compress and encode a bitstring as the encodedList of a status list.
+
+    The bitstring is GZIP-compressed and base64url encoded, without padding.
+    """
+    compressed = gzip.compress(bytes(bits), mtime=0)
+    return base64.urlsafe_b64encode(compressed).rstrip(b"=").decode("ascii")
+
+
+def decode_bitstring(encoded: str) -> bytearray:
+    """Decode and decompress the encodedList of a status list."""
+    padded = encoded + "=" * (-len(encoded) % 4)
+    return bytearray(gzip.decompress(base64.urlsafe_b64decode(padded)))
+
+
+def get_bit(bits: bytes, index: int) -> bool:
+    """Get a bit of a bitstring, the first bit being the most significant."""
+    return bool(bits[index // 8] & (0x80 >> (index % 8)))
+
+
+def set_bit(bits: bytearray, index: int, value: bool = True):
+    """Set or unset a bit of a bitstring, the first bit being the most significant."""
+    if value:
+        bits[index // 8] |= 0x80 >> (index % 8)
+    else:
+        bits[index // 8] &= ~(0x80 >> (index % 8)) & 0xFF
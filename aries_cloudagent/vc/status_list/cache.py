@@ -0,0 +1,64 @@
+"""Verifier cache of fetched status lists."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Tuple
+
+# seconds a fetched status list is used for, matching the document loader
+DEFAULT_CACHE_TTL = 300
+DEFAULT_MAX_LISTS = 256
+
+
+class StatusListCache:
+    """Cache of the decoded bitstrings of fetched status lists.
+
+    A status list is shared by many credentials, so a verifier fetches and
+    verifies each list credential once, then answers status checks from its
+    bitstring until the list expires. Concurrent checks against a list not
+    yet cached share a single fetch.
+    """
+
+    def __init__(self, ttl: int = None, max_lists: int = DEFAULT_MAX_LISTS):
+        """Initialize the cache.
+
+        Args:
+            ttl: The number of seconds a fetched list is used for
+            max_lists: The maximum number of lists kept
+        """
+        self.ttl = DEFAULT_CACHE_TTL if ttl is None else ttl
+        self.max_lists = max_lists
+        self._lists: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Get the bitstring of a status list, fetching it if needed.
+
+        Args:
+            key: The status list, by URL and the status it was verified for
+            fetch: Fetches, verifies and decodes the status list
+
+        Returns:
+            The decoded bitstring of the list
+
+        """
+        cached = self._lists.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._lists.move_to_end(key)
+            return cached[1]
+
+        pending = self._pending.get(key)
+        if not pending:
+            pending = asyncio.ensure_future(self._fetch(key, fetch))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        bits = bytes(await fetch())
+        if self.ttl > 0:
+            self._lists[key] = (time.monotonic() + self.ttl, bits)
+            self._lists.move_to_end(key)
+            while len(self._lists) > self.max_lists:
+                self._lists.popitem(last=False)
+        return bits
@@ -0,0 +1,244 @@
+"""Manager for the StatusList2021 status lists of an issuer."""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ...core.error import BaseError
+from ...core.profile import Profile
+from ...messaging.util import time_now
+from ...storage.error import StorageError, StorageNotFoundError
+from ..ld_proofs.constants import CREDENTIALS_CONTEXT_V1_URL
+from .bitstring import set_bit
+from .models import StatusListRecord
+
+LOGGER = logging.getLogger(__name__)
+
+STATUS_LIST_2021_CONTEXT_URL = "https://w3id.org/vc/status-list/2021/v1"
+STATUS_LIST_2021_CREDENTIAL_TYPE = "StatusList2021Credential"
+STATUS_LIST_2021_ENTRY_TYPE = "StatusList2021Entry"
+STATUS_LIST_2021_TYPES = {"StatusList2021", STATUS_LIST_2021_ENTRY_TYPE}
+
+
+class StatusListError(BaseError):
+    """Status list error."""
+
+
+class StatusListManager:
+    """Allocates, updates and stores the StatusList2021 status lists of issuers."""
+
+    def __init__(self, profile: Profile):
+        """Initialize the status list manager."""
+        self.profile = profile
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """Accessor for the base URL the status lists are published under."""
+        base_url = self.profile.settings.get("vc.status_list.base_url")
+        return base_url.rstrip("/") if base_url else None
+
+    def list_url(self, list_id: str) -> str:
+        """Get the URL a status list credential is published at."""
+        if not self.base_url:
+            raise StatusListError(
+                "Status list base URL is not configured, unable to use status lists"
+            )
+        return f"{self.base_url}/{list_id}"
+
+    def status_entry(self, record: StatusListRecord, index: int) -> dict:
+        """Get the credentialStatus entry of an index of a status list."""
+        url = self.list_url(record.list_id)
+        return {
+            "id": f"{url}#{index}",
+            "type": STATUS_LIST_2021_ENTRY_TYPE,
+            "statusPurpose": record.status_purpose,
+            "statusListIndex": str(index),
+            "statusListCredential": url,
+        }
+
+    async def allocate(
+        self,
+        issuer_id: str,
+        count: int = 1,
+        status_purpose: str = StatusListRecord.PURPOSE_REVOCATION,
+    ) -> List[Tuple[StatusListRecord, int]]:
+        """Allocate indexes on the active status lists of an issuer.
+
+        New status lists are created as the active ones fill. The indexes of
+        a batch are allocated under a single lock on the active list.
+
+        Args:
+            issuer_id: The issuer DID
+            count: The number of indexes to allocate
+            status_purpose: The purpose of the status list
+
+        Returns:
+            The status list and index of each allocation, in order
+
+        """
+        # fail before allocating if entries cannot be referenced
+        self.list_url("")
+
+        allocated = []
+        tag_filter = {
+            "issuer_id": issuer_id,
+            "status_purpose": status_purpose,
+            "state": StatusListRecord.STATE_ACTIVE,
+        }
+        async with self.profile.transaction() as txn:
+            while len(allocated) < count:
+                records = await StatusListRecord.query(txn, tag_filter)
+                if records:
+                    record = await StatusListRecord.retrieve_by_id(
+                        txn, records[0].list_id, for_update=True
+                    )
+                    if record.state != StatusListRecord.STATE_ACTIVE:
+                        continue
+                else:
+                    record = StatusListRecord(
+                        issuer_id=issuer_id,
+                        status_purpose=status_purpose,
+                        size=self.profile.settings.get_int("vc.status_list.size"),
+                    )
+                while len(allocated) < count and record.remaining:
+                    allocated.append((record, record.allocate()))
+                await record.save(txn, reason="Allocated status list indexes")
+            await txn.commit()
+        return allocated
+
+    async def release(self, allocated: Sequence[Tuple[StatusListRecord, int]]):
+        """Return the indexes of an allocation whose credentials were not issued.
+
+        Indexes are allocated from a counter, so a list takes its indexes back
+        only if nothing was allocated on it since. Otherwise they are left
+        unused, their status never set: a failed issuance can leak indexes.
+
+        Args:
+            allocated: The status list and index of each allocation, as allocated
+        """
+        counts: Dict[str, int] = {}
+        records: Dict[str, StatusListRecord] = {}
+        for record, _ in allocated:
+            counts[record.list_id] = counts.get(record.list_id, 0) + 1
+            records[record.list_id] = record
+        try:
+            async with self.profile.transaction() as txn:
+                for list_id, count in counts.items():
+                    record = await StatusListRecord.retrieve_by_id(
+                        txn, list_id, for_update=True
+                    )
+                    if record.allocated != records[list_id].allocated:
+                        LOGGER.debug(
+                            "Leaving %d unused index(es) of status list %s",
+                            count,
+                            list_id,
+                        )
+                        continue
+                    record.allocated -= count
+                    record.state = StatusListRecord.STATE_ACTIVE
+                    await record.save(txn, reason="Released status list indexes")
+                await txn.commit()
+        except StorageError as err:
+            LOGGER.warning("Unable to release status list indexes: %s", err.roll_up)
+
+    async def update_status(
+        self, list_id: str, indexes: Sequence[int], status: bool = True
+    ) -> StatusListRecord:
+        """Set or unset the status of indexes of a status list.
+
+        The list is decompressed and compressed once for all the indexes.
+
+        Args:
+            list_id: The status list identifier
+            indexes: The indexes to update
+            status: Whether to set or unset the status bits
+
+        Returns:
+            The updated status list, to be published again
+
+        """
+        async with self.profile.transaction() as txn:
+            try:
+                record = await StatusListRecord.retrieve_by_id(
+                    txn, list_id, for_update=True
+                )
+            except StorageNotFoundError as err:
+                raise StatusListError(f"Status list {list_id} not found") from err
+            invalid = [index for index in indexes if not 0 <= index < record.size]
+            if invalid:
+                raise StatusListError(
+                    f"Indexes {invalid} out of range of status list {list_id}"
+                )
+            bits = record.bitstring
+            for index in indexes:
+                set_bit(bits, index, status)
+            record.bitstring = bits
+            await record.save(txn, reason="Updated status list")
+            await txn.commit()
+        return record
+
+    def status_list_credential(self, record: StatusListRecord) -> dict:
+        """Get the unsigned status list credential of the current state of a list."""
+        url = self.list_url(record.list_id)
+        return {
+            "@context": [CREDENTIALS_CONTEXT_V1_URL, STATUS_LIST_2021_CONTEXT_URL],
+            "id": url,
+            "type": ["VerifiableCredential", STATUS_LIST_2021_CREDENTIAL_TYPE],
+            "issuer": record.issuer_id,
+            "issuanceDate": time_now(),
+            "credentialSubject": {
+                "id": f"{url}#list",
+                "type": "StatusList2021",
+                "statusPurpose": record.status_purpose,
+                "encodedList": record.encoded_list,
+            },
+        }
+
+    async def store_published(self, list_id: str, credential: dict) -> bool:
+        """Store the signed status list credential of a list.
+
+        A credential signed over a list since updated is discarded, the
+        update publishing its own, so that concurrent updates cannot publish
+        a stale list last.
+
+        Args:
+            list_id: The status list identifier
+            credential: The signed status list credential
+
+        Returns:
+            Whether the credential was stored
+
+        """
+        async with self.profile.transaction() as txn:
+            record = await StatusListRecord.retrieve_by_id(
+                txn, list_id, for_update=True
+            )
+            encoded_list = credential["credentialSubject"]["encodedList"]
+            if encoded_list != record.encoded_list:
+                return False
+            record.list_credential = credential
+            await record.save(txn, reason="Published status list")
+            publish_dir = self.profile.settings.get("vc.status_list.publish_dir")
+            if publish_dir:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, self._write_published, publish_dir, list_id, credential
+                )
+            await txn.commit()
+        return True
+
+    @staticmethod
+    def _write_published(publish_dir: str, list_id: str, credential: dict):
+        """Write a status list credential to the publish directory atomically."""
+        os.makedirs(publish_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=publish_dir, prefix=f".{list_id}.")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(credential, tmp_file)
+            os.replace(tmp_path, os.path.join(publish_dir, list_id))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        LOGGER.debug("Wrote status list credential %s to %s", list_id, publish_dir)
@@ -0,0 +1,184 @@
+"""Issuer status list records."""
+
+import math
+import secrets
+from typing import Any, Mapping, Optional
+
+from marshmallow import fields
+
+from ...messaging.models.base_record import BaseRecord, BaseRecordSchema
+from ...messaging.valid import UUID4_EXAMPLE
+from .bitstring import (
+    DEFAULT_LIST_SIZE,
+    create_bitstring,
+    decode_bitstring,
+    encode_bitstring,
+)
+
+
+class StatusListRecord(BaseRecord):
+    """Represents a StatusList2021 status list of an issuer.
+
+    The bitstring of the list is kept compressed, as published in the list
+    credential. Indexes are allocated in O(1) from a counter, mapped through
+    a random affine permutation of the list, so that consecutive credentials
+    do not get consecutive indexes.
+    """
+
+    class Meta:
+        """StatusListRecord metadata."""
+
+        schema_class = "StatusListRecordSchema"
+
+    RECORD_TYPE = "status_list_2021"
+    RECORD_ID_NAME = "list_id"
+    RECORD_TOPIC = "status_list_2021"
+    TAG_NAMES = {"issuer_id", "status_purpose", "state"}
+
+    STATE_ACTIVE = "active"
+    STATE_FULL = "full"
+
+    PURPOSE_REVOCATION = "revocation"
+    PURPOSE_SUSPENSION = "suspension"
+
+    def __init__(
+        self,
+        *,
+        list_id: str = None,
+        state: str = None,
+        issuer_id: str = None,
+        status_purpose: str = None,
+        size: int = None,
+        allocated: int = 0,
+        multiplier: int = None,
+        offset: int = None,
+        encoded_list: str = None,
+        list_credential: dict = None,
+        **kwargs,
+    ):
+        """Initialize a new StatusListRecord."""
+        super().__init__(list_id, state or StatusListRecord.STATE_ACTIVE, **kwargs)
+        self.issuer_id = issuer_id
+        self.status_purpose = status_purpose or StatusListRecord.PURPOSE_REVOCATION
+        self.size = size or DEFAULT_LIST_SIZE
+        self.allocated = allocated
+        if multiplier is None:
+            # any multiplier coprime with the size permutes the list
+            multiplier = secrets.randbelow(self.size) | 1
+            while math.gcd(multiplier, self.size) != 1:
+                multiplier += 2
+        self.multiplier = multiplier
+        self.offset = secrets.randbelow(self.size) if offset is None else offset
+        self.encoded_list = encoded_list or encode_bitstring(
+            create_bitstring(self.size)
+        )
+        self.list_credential = list_credential
+
+    @property
+    def list_id(self) -> str:
+        """Accessor for the ID associated with this status list."""
+        return self._id
+
+    @property
+    def record_value(self) -> Mapping:
+        """Accessor for JSON value properties of this status list record."""
+        return {
+            prop: getattr(self, prop)
+            for prop in (
+                "size",
+                "allocated",
+                "multiplier",
+                "offset",
+                "encoded_list",
+                "list_credential",
+            )
+        }
+
+    @property
+    def remaining(self) -> int:
+        """Accessor for the number of indexes left to allocate."""
+        return self.size - self.allocated
+
+    def allocate(self) -> Optional[int]:
+        """Allocate the next index of the list, None if the list is full."""
+        if self.allocated >= self.size:
+            return None
+        index = (self.allocated * self.multiplier + self.offset) % self.size
+        self.allocated += 1
+        if self.allocated >= self.size:
+            self.state = StatusListRecord.STATE_FULL
+        return index
+
+    @property
+    def bitstring(self) -> bytearray:
+        """Accessor for the decompressed bitstring of the list."""
+        return decode_bitstring(self.encoded_list)
+
+    @bitstring.setter
+    def bitstring(self, bits: bytes):
+        """Setter for the decompressed bitstring of the list."""
+        self.encoded_list = encode_bitstring(bits)
+
+    def __eq__(self, other: Any) -> bool:
+        """Comparison between records."""
+        return super().__eq__(other)
+
+
+class StatusListRecordSchema(BaseRecordSchema):
+    """Schema to allow de/serialization of status list records."""
+
+    class Meta:
+        """StatusListRecordSchema metadata."""
+
+        model_class = StatusListRecord
+
+    list_id = fields.Str(
+        required=False,
+        metadata={"description": "Status list identifier", "example": UUID4_EXAMPLE},
+    )
+    state = fields.Str(
+        required=False,
+        metadata={
+            "description": "Status list state",
+            "example": StatusListRecord.STATE_ACTIVE,
+        },
+    )
+    issuer_id = fields.Str(
+        required=False,
+        metadata={
+            "description": "Issuer DID of the status list",
+            "example": "did:key:z6MkpTHR8VNsBxYAAWHut2Geadd9jSwuBV8xRoAnwWsdvktH",
+        },
+    )
+    status_purpose = fields.Str(
+        required=False,
+        metadata={
+            "description": "Purpose of the status list",
+            "example": StatusListRecord.PURPOSE_REVOCATION,
+        },
+    )
+    size = fields.Int(
+        required=False,
+        metadata={"description": "Number of entries of the list", "example": 131072},
+    )
+    allocated = fields.Int(
+        required=False,
+        metadata={"description": "Number of entries allocated", "example": 1},
+    )
+    multiplier = fields.Int(
+        required=False,
+        metadata={"description": "Multiplier of the index permutation"},
+    )
+    offset = fields.Int(
+        required=False,
+        metadata={"description": "Offset of the index permutation"},
+    )
+    encoded_list = fields.Str(
+        required=False,
+        metadata={"description": "GZIP-compressed, base64url encoded bitstring"},
+    )
+    list_credential = fields.Dict(
+        required=False,
+        allow_none=True,
+        metadata={"description": "Signed status list credential, as published"},
+    )
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from ..bitstring import (
+    create_bitstring,
+    decode_bitstring,
+    encode_bitstring,
+    get_bit,
+    set_bit,
+)
+
+
+class TestBitstring(TestCase):
+    def test_encode_decode(self):
+        bits = create_bitstring(131072)
+        assert len(bits) == 16384
+        encoded = encode_bitstring(bits)
+        assert "=" not in encoded
+        # all unset bits compress well, and the same bits encode the same
+        assert len(encoded) < 200
+        assert encode_bitstring(bits) == encoded
+        assert decode_bitstring(encoded) == bits
+
+        set_bit(bits, 94567)
+        assert decode_bitstring(encode_bitstring(bits)) == bits
+
+    def test_bit_order(self):
+        bits = create_bitstring(16)
+        set_bit(bits, 0)
+        set_bit(bits, 9)
+        assert bits == bytearray([0x80, 0x40])
+        assert get_bit(bits, 0) and get_bit(bits, 9)
+        assert not get_bit(bits, 1)
+
+        set_bit(bits, 0, False)
+        assert bits == bytearray([0x00, 0x40])
+        assert not get_bit(bits, 0)
+
+    def test_spec_example(self):
+        # the empty 16KB list of the StatusList2021 specification
+        encoded = "H4sIAAAAAAAAA-3BMQEAAADCoPVPbQwfoAAAAAAAAAAAAAAAAAAAAIC3AYbSVKsAQAAA"
+        bits = decode_bitstring(encoded)
+        assert len(bits) == 16384
+        assert not any(bits)
@@ -0,0 +1,290 @@
+"""Test StatusListManager and StatusList2021 credential status."""
+
+import json
+
+import pytest
+
+from aries_cloudagent.tests import mock
+
+from ....core.in_memory.profile import InMemoryProfile
+from ....core.profile import Profile
+from ....resolver.default.key import KeyDIDResolver
+from ....resolver.did_resolver import DIDResolver
+from ....wallet.base import BaseWallet
+from ....wallet.default_verification_key_strategy import (
+    BaseVerificationKeyStrategy,
+    DefaultVerificationKeyStrategy,
+)
+from ....wallet.did_method import KEY, DIDMethods
+from ....wallet.key_type import ED25519
+from ...ld_proofs.document_loader import DocumentLoader
+from ...ld_proofs.error import LinkedDataProofException
+from ...ld_proofs.suites.ed25519_signature_2020 import Ed25519Signature2020
+from ...vc_ld import manager as test_module
+from ...vc_ld.manager import VcLdpManager, VcLdpManagerError
+from ...vc_ld.models.credential import VerifiableCredential
+from ...vc_ld.models.options import LDProofVCOptions
+from ..bitstring import get_bit
+from ..cache import StatusListCache
+from ..manager import STATUS_LIST_2021_CONTEXT_URL, StatusListError, StatusListManager
+from ..models import StatusListRecord
+
+BASE_URL = "https://issuer.example/status"
+
+
+@pytest.fixture
+def profile():
+    profile = InMemoryProfile.test_profile(
+        {"vc.status_list.base_url": BASE_URL, "vc.status_list.size": 64},
+        {
+            DIDMethods: DIDMethods(),
+            BaseVerificationKeyStrategy: DefaultVerificationKeyStrategy(),
+            DIDResolver: DIDResolver([KeyDIDResolver()]),
+        },
+    )
+    profile.context.injector.bind_instance(DocumentLoader, DocumentLoader(profile))
+    yield profile
+
+
+@pytest.fixture
+async def issuer_did(profile: Profile):
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        did = await wallet.create_local_did(method=KEY, key_type=ED25519)
+    yield did.did
+
+
+def _credentials(issuer_id: str, count: int):
+    return [
+        VerifiableCredential.deserialize(
+            {
+                "@context": [
+                    "https://www.w3.org/2018/credentials/v1",
+                    {"ex": "https://example.org/test#", "test": "ex:test"},
+                ],
+                "type": ["VerifiableCredential"],
+                "issuanceDate": "2021-04-12",
+                "issuer": issuer_id,
+                "credentialSubject": {"test": str(index)},
+            }
+        )
+        for index in range(count)
+    ]
+
+
+OPTIONS = LDProofVCOptions.deserialize(
+    {
+        "proofType": Ed25519Signature2020.signature_type,
+        "credentialStatus": {"type": "StatusList2021"},
+    }
+)
+
+
+@pytest.mark.asyncio
+async def test_allocate(profile: Profile):
+    manager = StatusListManager(profile)
+    allocated = await manager.allocate("did:key:issuer", 100)
+    assert len(allocated) == 100
+
+    # the first list is filled, then another is created
+    records = {record.list_id: record for record, _ in allocated}
+    assert len(records) == 2
+    first, second = records.values()
+    assert first.state == StatusListRecord.STATE_FULL and second.remaining == 28
+    assert sorted(index for record, index in allocated if record is first) == list(
+        range(64)
+    )
+    # indexes are not allocated in order
+    assert [index for _, index in allocated[:64]] != list(range(64))
+
+    more = await manager.allocate("did:key:issuer")
+    assert more[0][0].list_id == second.list_id
+    assert more[0][1] not in {index for record, index in allocated if record is second}
+
+    entry = manager.status_entry(*more[0])
+    assert entry == {
+        "id": f"{BASE_URL}/{second.list_id}#{more[0][1]}",
+        "type": "StatusList2021Entry",
+        "statusPurpose": "revocation",
+        "statusListIndex": str(more[0][1]),
+        "statusListCredential": f"{BASE_URL}/{second.list_id}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_release(profile: Profile):
+    manager = StatusListManager(profile)
+    first = await manager.allocate("did:key:issuer", 60)
+    allocated = await manager.allocate("did:key:issuer", 8)
+    records = {record.list_id: record for record, _ in allocated}
+    assert len(records) == 2
+
+    # the full list takes its indexes back, as does the new one
+    await manager.release(allocated)
+    async with profile.session() as session:
+        for list_id in records:
+            record = await StatusListRecord.retrieve_by_id(session, list_id)
+            assert record.state == StatusListRecord.STATE_ACTIVE
+            assert record.allocated == (60 if list_id == first[0][0].list_id else 0)
+
+    # indexes allocated before others are left unused
+    allocated = await manager.allocate("did:key:issuer", 2)
+    await manager.allocate("did:key:issuer")
+    await manager.release(allocated)
+    async with profile.session() as session:
+        record = await StatusListRecord.retrieve_by_id(session, allocated[0][0].list_id)
+    assert record.allocated == 63
+
+
+@pytest.mark.asyncio
+async def test_allocate_x_no_base_url(profile: Profile):
+    profile.settings["vc.status_list.base_url"] = None
+    with pytest.raises(StatusListError):
+        await StatusListManager(profile).allocate("did:key:issuer")
+
+
+@pytest.mark.asyncio
+async def test_update_status(profile: Profile):
+    manager = StatusListManager(profile)
+    allocated = await manager.allocate("did:key:issuer", 3)
+    list_id = allocated[0][0].list_id
+    indexes = [index for _, index in allocated]
+
+    record = await manager.update_status(list_id, indexes[:2])
+    bits = record.bitstring
+    assert [get_bit(bits, index) for index in indexes] == [True, True, False]
+    record = await manager.update_status(list_id, indexes[:1], False)
+    bits = record.bitstring
+    assert [get_bit(bits, index) for index in indexes] == [False, True, False]
+
+    with pytest.raises(StatusListError):
+        await manager.update_status(list_id, [64])
+    with pytest.raises(StatusListError):
+        await manager.update_status("missing", [0])
+
+
+@pytest.mark.asyncio
+async def test_store_published(profile: Profile, tmp_path):
+    profile.settings["vc.status_list.publish_dir"] = str(tmp_path)
+    manager = StatusListManager(profile)
+    ((record, index),) = await manager.allocate("did:key:issuer")
+    stale = manager.status_list_credential(record)
+    await manager.update_status(record.list_id, [index])
+    async with profile.session() as session:
+        updated = await StatusListRecord.retrieve_by_id(session, record.list_id)
+    current = manager.status_list_credential(updated)
+
+    assert await manager.store_published(record.list_id, current)
+    assert not await manager.store_published(record.list_id, stale)
+    assert json.loads((tmp_path / record.list_id).read_text()) == current
+
+
+@pytest.mark.asyncio
+async def test_issue_and_revoke(profile: Profile, issuer_did: str):
+    vc_manager = VcLdpManager(profile)
+    vcs = await vc_manager.issue_batch(_credentials(issuer_did, 3), OPTIONS)
+    entries = [vc.credential_status for vc in vcs]
+    assert all(STATUS_LIST_2021_CONTEXT_URL in vc.context_urls for vc in vcs)
+    assert len({entry["statusListIndex"] for entry in entries}) == 3
+    list_id = entries[0]["statusListCredential"].rsplit("/", 1)[1]
+
+    # the new list was published on issuance
+    async with profile.session() as session:
+        record = await StatusListRecord.retrieve_by_id(session, list_id)
+    published = VerifiableCredential.deserialize(record.list_credential)
+    assert (await vc_manager.verify_credential(published)).verified
+
+    results = dict([result async for result in vc_manager.verify_credentials(vcs)])
+    assert all(result.verified for result in results.values())
+
+    list_credential = await vc_manager.update_credential_status(
+        list_id, [int(entries[1]["statusListIndex"])]
+    )
+    assert list_credential.credential_subject["encodedList"] != (
+        published.credential_subject["encodedList"]
+    )
+    results = dict([result async for result in vc_manager.verify_credentials(vcs)])
+    assert [results[index].verified for index in range(3)] == [True, False, True]
+    assert "revocation" in str(results[1].errors[-1])
+
+    with pytest.raises(VcLdpManagerError):
+        await vc_manager.update_credential_status("missing", [0])
+
+
+@pytest.mark.asyncio
+async def test_issue_x_released(profile: Profile, issuer_did: str):
+    vc_manager = VcLdpManager(profile)
+    (vc,) = await vc_manager.issue_batch(_credentials(issuer_did, 1), OPTIONS)
+    list_id = vc.credential_status["statusListCredential"].rsplit("/", 1)[1]
+
+    with mock.patch.object(
+        test_module, "ldp_issue_batch", side_effect=LinkedDataProofException()
+    ), pytest.raises(LinkedDataProofException):
+        await vc_manager.issue_batch(_credentials(issuer_did, 3), OPTIONS)
+    with mock.patch.object(
+        test_module, "ldp_issue", side_effect=LinkedDataProofException()
+    ), pytest.raises(LinkedDataProofException):
+        await vc_manager.issue(_credentials(issuer_did, 1)[0], OPTIONS)
+
+    async with profile.session() as session:
+        record = await StatusListRecord.retrieve_by_id(session, list_id)
+    assert record.allocated == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_remote_status_list(profile: Profile, issuer_did: str):
+    vc_manager = VcLdpManager(profile)
+    (vc,) = await vc_manager.issue_batch(_credentials(issuer_did, 1), OPTIONS)
+    entry = vc.credential_status
+    list_id = entry["statusListCredential"].rsplit("/", 1)[1]
+    list_credential = await vc_manager.update_credential_status(
+        list_id, [int(entry["statusListIndex"])]
+    )
+
+    # verify as a third party, fetching the list credential
+    profile.settings["vc.status_list.base_url"] = "https://other.example/status"
+    cache = StatusListCache()
+    profile.context.injector.bind_instance(StatusListCache, cache)
+    document_loader = profile.inject(DocumentLoader)
+
+    async def _fetch_document(url, options):
+        assert url == entry["statusListCredential"]
+        return {"document": json.dumps(list_credential.serialize())}
+
+    with mock.patch.object(
+        document_loader, "fetch_document", side_effect=_fetch_document
+    ) as mock_fetch:
+        result = await vc_manager.verify_credential(vc)
+        assert not result.verified
+        result = await vc_manager.verify_credential(vc)
+        assert not result.verified
+    # the list was fetched and verified once
+    mock_fetch.assert_called_once()
+
+    # with no caching, the list is fetched for each verification
+    cache._lists.clear()
+    cache.ttl = 0
+    with mock.patch.object(
+        document_loader, "fetch_document", side_effect=_fetch_document
+    ) as mock_fetch:
+        await vc_manager.verify_credential(vc)
+        await vc_manager.verify_credential(vc)
+    assert mock_fetch.call_count == 2
+    assert entry["statusListCredential"] not in document_loader._documents
+
+    # a list credential of another issuer, or purpose, is rejected
+    with mock.patch.object(
+        document_loader, "fetch_document", side_effect=_fetch_document
+    ):
+        for issuer_id, status_purpose in (
+            ("did:key:other", "revocation"),
+            (issuer_did, "suspension"),
+        ):
+            with pytest.raises(LinkedDataProofException):
+                await vc_manager._get_status_list(
+                    entry["statusListCredential"],
+                    issuer_id,
+                    status_purpose,
+                    await vc_manager._get_all_proof_suites(),
+                    document_loader,
+                )
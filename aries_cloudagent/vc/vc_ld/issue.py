@@ -1,9 +1,12 @@
 """Verifiable Credential issuance methods."""
 
+from typing import List, Sequence
+
 from ..ld_proofs import (
     LinkedDataProof,
     ProofPurpose,
     sign,
+    sign_batch,
     CredentialIssuancePurpose,
     DocumentLoaderMethod,
     LinkedDataProofException,
@@ -59,3 +62,53 @@ async def issue(
     )
 
     return signed_credential
+
+
+async def issue_batch(
+    *,
+    credentials: Sequence[dict],
+    suite: LinkedDataProof,
+    document_loader: DocumentLoaderMethod,
+    purpose: ProofPurpose = None,
+) -> List[dict]:
+    """Issue a batch of verifiable credentials.
+
+    Takes the base credential documents, verifies them, and adds a digital
+    signature to each, with the signatures made in batches.
+
+    Args:
+        credentials (Sequence[dict]): Base credential documents.
+        suite (LinkedDataProof): Signature suite to sign the credentials with.
+        document_loader (DocumentLoader): Document loader to use
+        purpose (ProofPurpose, optional): A proof purpose instance that will match
+            proofs to be verified and ensure they were created according to the
+            appropriate purpose. Default to CredentialIssuancePurpose
+
+    Raises:
+        LinkedDataProofException: When a credential has an invalid structure
+            OR signing fails
+
+    Returns:
+        List[dict]: The signed verifiable credentials, in order
+
+    """
+    # Validate credentials
+    schema = CredentialSchema()
+    for index, credential in enumerate(credentials):
+        errors = schema.validate(credential)
+        if len(errors) > 0:
+            raise LinkedDataProofException(
+                f"Credential {index} contains invalid structure: {errors}"
+            )
+
+    # Set default proof purpose if not set
+    if not purpose:
+        purpose = CredentialIssuancePurpose()
+
+    # Sign the credentials with LD proofs
+    return await sign_batch(
+        documents=credentials,
+        suite=suite,
+        purpose=purpose,
+        document_loader=document_loader,
+    )
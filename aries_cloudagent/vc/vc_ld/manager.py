@@ -1,11 +1,24 @@
 """Manager for performing Linked Data Proof signatures over JSON-LD formatted W3C VCs."""
 
-from typing import Dict, List, Optional, Type, Union, cast
+import asyncio
+import json
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
 
 from ...core.profile import Profile
+from ...storage.error import StorageNotFoundError
 from ...storage.vc_holder.base import VCHolder
 from ...storage.vc_holder.vc_record import VCRecord
 from ...wallet.base import BaseWallet
@@ -18,7 +31,12 @@ from ..ld_proofs.constants import (
     SECURITY_CONTEXT_ED25519_2020_URL,
 )
 from ..ld_proofs.crypto.wallet_key_pair import WalletKeyPair
-from ..ld_proofs.document_loader import DocumentLoader
+from ..ld_proofs.error import LinkedDataProofException
+from ..ld_proofs.document_loader import (
+    DocumentLoader,
+    prefetch_documents,
+    run_jsonld,
+)
 from ..ld_proofs.purposes.authentication_proof_purpose import AuthenticationProofPurpose
 from ..ld_proofs.purposes.credential_issuance_purpose import CredentialIssuancePurpose
 from ..ld_proofs.purposes.proof_purpose import ProofPurpose
@@ -28,10 +46,22 @@ from ..ld_proofs.suites.ed25519_signature_2018 import Ed25519Signature2018
 from ..ld_proofs.suites.ed25519_signature_2020 import Ed25519Signature2020
 from ..ld_proofs.suites.linked_data_proof import LinkedDataProof
 from ..ld_proofs.validation_result import DocumentVerificationResult
+from ..status_list.bitstring import decode_bitstring, get_bit
+from ..status_list.cache import StatusListCache
+from ..status_list.manager import (
+    STATUS_LIST_2021_CONTEXT_URL,
+    STATUS_LIST_2021_CREDENTIAL_TYPE,
+    STATUS_LIST_2021_ENTRY_TYPE,
+    STATUS_LIST_2021_TYPES,
+    StatusListError,
+    StatusListManager,
+)
+from ..status_list.models import StatusListRecord
 from ..vc_ld.models.presentation import VerifiablePresentation
 from ..vc_ld.validation_result import PresentationVerificationResult
 from .external_suite import ExternalSuiteNotFoundError, ExternalSuiteProvider
 from .issue import issue as ldp_issue
+from .issue import issue_batch as ldp_issue_batch
 from .models.credential import VerifiableCredential
 from .models.linked_data_proof import LDProof
 from .models.options import LDProofVCOptions
@@ -83,6 +113,15 @@ KEY_TYPE_SIGNATURE_TYPE_MAPPING = {
     for key_type in SIGNATURE_SUITE_KEY_TYPE_MAPPING.values()
 }
 
+# proof types status list credentials are signed with, by issuer key type
+STATUS_LIST_PROOF_TYPES = {
+    ED25519: Ed25519Signature2020.signature_type,
+    BLS12381G2: BbsBlsSignature2020.signature_type,
+}
+
+# number of credentials of a batch verified at a time
+DEFAULT_VERIFY_CONCURRENCY = 16
+
 
 class VcLdpManagerError(Exception):
     """Generic VcLdpManager Error."""
@@ -397,15 +436,189 @@ class VcLdpManager:
             domain=options.domain,
         )
         document_loader = self.profile.inject(DocumentLoader)
+        allocated = await self._assign_credential_status([credential], options)
 
-        vc = await ldp_issue(
-            credential=credential.serialize(),
-            suite=suite,
-            document_loader=document_loader,
-            purpose=proof_purpose,
-        )
+        try:
+            vc = await ldp_issue(
+                credential=credential.serialize(),
+                suite=suite,
+                document_loader=document_loader,
+                purpose=proof_purpose,
+            )
+        except Exception:
+            await self._release_credential_status(allocated)
+            raise
         return VerifiableCredential.deserialize(vc)
 
+    async def issue_batch(
+        self, credentials: Sequence[VerifiableCredential], options: LDProofVCOptions
+    ) -> List[VerifiableCredential]:
+        """Sign a batch of VCs with Linked Data Proofs.
+
+        The signature suite, with the issuer key, is set up once per issuer
+        rather than per credential, and the credentials of each issuer are
+        signed together, the signatures made in batches through the wallet.
+
+        Args:
+            credentials: The credentials to sign
+            options: The options to sign all credentials with
+
+        Returns:
+            The signed credentials, in order
+
+        """
+        proof_purpose = self._get_proof_purpose(
+            proof_purpose=options.proof_purpose,
+            challenge=options.challenge,
+            domain=options.domain,
+        )
+        document_loader = self.profile.inject(DocumentLoader)
+
+        by_issuer: Dict[str, List[int]] = {}
+        prepared = []
+        for index, credential in enumerate(credentials):
+            credential = await self.prepare_credential(credential, options)
+            by_issuer.setdefault(credential.issuer_id, []).append(index)
+            prepared.append(credential)
+
+        issued: List[Optional[VerifiableCredential]] = [None] * len(prepared)
+        for indexes in by_issuer.values():
+            suite = await self._get_suite_for_document(prepared[indexes[0]], options)
+            allocated = await self._assign_credential_status(
+                [prepared[index] for index in indexes], options
+            )
+            try:
+                vcs = await ldp_issue_batch(
+                    credentials=[prepared[index].serialize() for index in indexes],
+                    suite=suite,
+                    document_loader=document_loader,
+                    purpose=proof_purpose,
+                )
+            except Exception:
+                await self._release_credential_status(allocated)
+                raise
+            for index, vc in zip(indexes, vcs):
+                issued[index] = VerifiableCredential.deserialize(vc)
+        return issued
+
+    async def _assign_credential_status(
+        self, credentials: Sequence[VerifiableCredential], options: LDProofVCOptions
+    ) -> List[Tuple[StatusListRecord, int]]:
+        """Allocate status list entries to credentials of an issuer.
+
+        Entries are only allocated when the options request a StatusList2021
+        credential status. The status list credentials of lists created
+        by the allocation are published before the credentials are issued.
+
+        Returns:
+            The status list and index allocated to each credential, to release
+            should the credentials not be issued
+
+        """
+        status = options.credential_status
+        if (
+            not credentials
+            or not status
+            or status.get("type") not in (STATUS_LIST_2021_TYPES)
+        ):
+            return []
+
+        status_purpose = status.get(
+            "statusPurpose", StatusListRecord.PURPOSE_REVOCATION
+        )
+        if status_purpose not in (
+            StatusListRecord.PURPOSE_REVOCATION,
+            StatusListRecord.PURPOSE_SUSPENSION,
+        ):
+            raise VcLdpManagerError(f"Unsupported status purpose: {status_purpose}")
+
+        status_lists = StatusListManager(self.profile)
+        try:
+            allocated = await status_lists.allocate(
+                credentials[0].issuer_id, len(credentials), status_purpose
+            )
+        except StatusListError as err:
+            raise VcLdpManagerError(err.roll_up) from err
+
+        unpublished: Dict[str, StatusListRecord] = {}
+        for credential, (record, index) in zip(credentials, allocated):
+            if STATUS_LIST_2021_CONTEXT_URL not in credential.context_urls:
+                credential.add_context(STATUS_LIST_2021_CONTEXT_URL)
+            credential.credential_status = status_lists.status_entry(record, index)
+            if not record.list_credential:
+                unpublished[record.list_id] = record
+        try:
+            for record in unpublished.values():
+                await self.publish_status_list(record)
+        except Exception:
+            await self._release_credential_status(allocated)
+            raise
+        return allocated
+
+    async def _release_credential_status(
+        self, allocated: Sequence[Tuple[StatusListRecord, int]]
+    ):
+        """Release the status list entries of credentials that were not issued."""
+        if allocated:
+            await StatusListManager(self.profile).release(allocated)
+
+    async def publish_status_list(
+        self, record: StatusListRecord
+    ) -> VerifiableCredential:
+        """Sign and store the status list credential of a status list.
+
+        Args:
+            record: The status list, as last updated
+
+        Returns:
+            The signed status list credential
+
+        """
+        status_lists = StatusListManager(self.profile)
+        try:
+            did_info = await self._did_info_for_did(record.issuer_id)
+        except WalletNotFoundError as err:
+            raise VcLdpManagerError(
+                f"Issuer did {record.issuer_id} of status list not found"
+            ) from err
+        proof_type = STATUS_LIST_PROOF_TYPES.get(did_info.key_type)
+        if proof_type not in PROOF_TYPE_SIGNATURE_SUITE_MAPPING:
+            raise VcLdpManagerError(
+                f"Unable to sign status list with key type {did_info.key_type.key_type}"
+            )
+
+        try:
+            credential = VerifiableCredential.deserialize(
+                status_lists.status_list_credential(record)
+            )
+        except StatusListError as err:
+            raise VcLdpManagerError(err.roll_up) from err
+        vc = await self.issue(credential, LDProofVCOptions(proof_type=proof_type))
+        await status_lists.store_published(record.list_id, vc.serialize())
+        return vc
+
+    async def update_credential_status(
+        self, list_id: str, indexes: Sequence[int], status: bool = True
+    ) -> VerifiableCredential:
+        """Set or unset the status of credentials, and publish their status list.
+
+        Args:
+            list_id: The status list identifier
+            indexes: The status list indexes of the credentials
+            status: Whether to set or unset the status of the credentials
+
+        Returns:
+            The signed status list credential
+
+        """
+        try:
+            record = await StatusListManager(self.profile).update_status(
+                list_id, indexes, status
+            )
+        except StatusListError as err:
+            raise VcLdpManagerError(err.roll_up) from err
+        return await self.publish_status_list(record)
+
     async def store_credential(
         self, vc: VerifiableCredential, options: LDProofVCOptions, cred_id: str = None
     ) -> VerifiableCredential:
@@ -413,8 +626,8 @@ class VcLdpManager:
 
         # Saving expanded type as a cred_tag
         document_loader = self.profile.inject(DocumentLoader)
-        expanded = jsonld.expand(
-            vc.serialize(), options={"documentLoader": document_loader}
+        expanded = await run_jsonld(
+            jsonld.expand, vc.serialize(), options={"documentLoader": document_loader}
         )
         types = JsonLdProcessor.get_values(
             expanded[0],
@@ -438,15 +651,193 @@ class VcLdpManager:
 
             await vc_holder.store_credential(vc_record)
 
+    async def _own_status_list(self, url: str) -> Optional[StatusListRecord]:
+        """Get the stored status list a URL refers to, if it is one of ours."""
+        base_url = StatusListManager(self.profile).base_url
+        if not base_url or not url.startswith(f"{base_url}/"):
+            return None
+        async with self.profile.session() as session:
+            try:
+                return await StatusListRecord.retrieve_by_id(
+                    session, url[len(base_url) + 1 :]
+                )
+            except StorageNotFoundError:
+                return None
+
+    async def _load_status_list(
+        self,
+        url: str,
+        issuer_id: str,
+        status_purpose: str,
+        suites: List[LinkedDataProof],
+        document_loader: DocumentLoader,
+    ) -> bytes:
+        """Get the bitstring of a status list from its verified list credential."""
+        # fetched afresh: how long the list is used for is up to the cache
+        document = (await document_loader.fetch_document(url, {}))["document"]
+        if isinstance(document, str):
+            document = json.loads(document)
+        result = await verify_credential(
+            credential=document, suites=suites, document_loader=document_loader
+        )
+        if not result.verified:
+            raise LinkedDataProofException(
+                f"Status list credential {url} could not be verified"
+            )
+        issuer = document.get("issuer")
+        subject = document.get("credentialSubject") or {}
+        if (
+            STATUS_LIST_2021_CREDENTIAL_TYPE not in document.get("type", [])
+            or (issuer.get("id") if isinstance(issuer, dict) else issuer) != issuer_id
+            or subject.get("statusPurpose") != status_purpose
+        ):
+            raise LinkedDataProofException(
+                f"Status list credential {url} does not match the credential status"
+            )
+        return decode_bitstring(subject["encodedList"])
+
+    async def _get_status_list(
+        self,
+        url: str,
+        issuer_id: str,
+        status_purpose: str,
+        suites: List[LinkedDataProof],
+        document_loader: DocumentLoader,
+    ) -> bytes:
+        """Get the bitstring of the status list of a credential status entry.
+
+        Our own status lists are read from storage, so that updates apply at
+        once. Others are fetched and verified, then cached.
+        """
+        record = await self._own_status_list(url)
+        if record:
+            if (record.issuer_id, record.status_purpose) != (issuer_id, status_purpose):
+                raise LinkedDataProofException(
+                    f"Status list {url} does not match the credential status"
+                )
+            return record.bitstring
+
+        cache = self.profile.inject_or(StatusListCache) or StatusListCache()
+        return await cache.get(
+            " ".join((url, issuer_id, status_purpose)),
+            lambda: self._load_status_list(
+                url, issuer_id, status_purpose, suites, document_loader
+            ),
+        )
+
+    async def _check_credential_status(
+        self,
+        credential: dict,
+        result: DocumentVerificationResult,
+        suites: List[LinkedDataProof],
+        document_loader: DocumentLoader,
+    ):
+        """Check the StatusList2021 entries of a verified credential.
+
+        The credential fails verification when a status it has is set, or
+        when its status list cannot be retrieved and verified.
+        """
+        entries = credential.get("credentialStatus") or []
+        if isinstance(entries, dict):
+            entries = [entries]
+        entries = [
+            entry
+            for entry in entries
+            if entry.get("type") == STATUS_LIST_2021_ENTRY_TYPE
+        ]
+        if not result.verified or not entries:
+            return
+
+        issuer = credential.get("issuer")
+        issuer_id = issuer.get("id") if isinstance(issuer, dict) else issuer
+        for entry in entries:
+            url = entry.get("statusListCredential")
+            status_purpose = entry.get("statusPurpose")
+            try:
+                index = int(entry.get("statusListIndex"))
+                bits = await self._get_status_list(
+                    url, issuer_id, status_purpose, suites, document_loader
+                )
+                if not 0 <= index < len(bits) * 8:
+                    raise LinkedDataProofException(
+                        f"Status list index {index} out of range of {url}"
+                    )
+            except Exception as err:
+                result.verified = False
+                result.errors = [*(result.errors or []), err]
+                return
+            if get_bit(bits, index):
+                result.verified = False
+                result.errors = [
+                    *(result.errors or []),
+                    LinkedDataProofException(f"Credential status is {status_purpose}"),
+                ]
+
     async def verify_credential(
         self, vc: VerifiableCredential
     ) -> DocumentVerificationResult:
         """Verify a VC with a Linked Data Proof."""
-        return await verify_credential(
-            credential=vc.serialize(),
-            suites=await self._get_all_proof_suites(),
-            document_loader=self.profile.inject(DocumentLoader),
+        credential = vc.serialize()
+        suites = await self._get_all_proof_suites()
+        document_loader = self.profile.inject(DocumentLoader)
+        result = await verify_credential(
+            credential=credential,
+            suites=suites,
+            document_loader=document_loader,
         )
+        await self._check_credential_status(credential, result, suites, document_loader)
+        return result
+
+    async def verify_credentials(
+        self,
+        vcs: Sequence[VerifiableCredential],
+        max_concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[int, DocumentVerificationResult]]:
+        """Verify a batch of VCs with Linked Data Proofs.
+
+        The contexts and DID documents the credentials refer to are loaded
+        once for the whole batch, concurrently, before verification. The
+        credentials are then verified concurrently, their canonicalization
+        running in the JSON-LD worker, and results are yielded as they
+        complete.
+
+        Args:
+            vcs: The credentials to verify
+            max_concurrency: The number of credentials verified at a time
+
+        Yields:
+            The position of each credential in the batch, with its result
+
+        """
+        suites = await self._get_all_proof_suites()
+        document_loader = self.profile.inject(DocumentLoader)
+        credentials = [vc.serialize() for vc in vcs]
+        await prefetch_documents(document_loader, *credentials)
+
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def _verify(index: int, credential: dict):
+            async with semaphore:
+                result = await verify_credential(
+                    credential=credential,
+                    suites=suites,
+                    document_loader=document_loader,
+                )
+                await self._check_credential_status(
+                    credential, result, suites, document_loader
+                )
+                return index, result
+
+        tasks = [
+            asyncio.ensure_future(_verify(index, credential))
+            for index, credential in enumerate(credentials)
+        ]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def prove(
         self, presentation: VerifiablePresentation, options: LDProofVCOptions
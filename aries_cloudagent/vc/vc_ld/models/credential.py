@@ -241,6 +241,11 @@ class VerifiableCredential(BaseModel):
         """Getter for credential status."""
         return self._credential_status
 
+    @credential_status.setter
+    def credential_status(self, credential_status: Optional[Union[dict, List[dict]]]):
+        """Setter for credential status."""
+        self._credential_status = credential_status
+
     @property
     def proof(self):
         """Getter for proof."""
@@ -7,6 +7,7 @@ from ....messaging.valid import (
     RFC3339_DATETIME_EXAMPLE,
     UUID4_EXAMPLE,
 )
+from ...ld_proofs.validation_result import DocumentVerificationResultSchema
 from ..validation_result import (
     PresentationVerificationResultSchema,
 )
@@ -28,12 +29,17 @@ class IssuanceOptionsSchema(Schema):
     created = fields.Str(required=False, metadata={"example": RFC3339_DATETIME_EXAMPLE})
     domain = fields.Str(required=False, metadata={"example": "website.example"})
     challenge = fields.Str(required=False, metadata={"example": UUID4_EXAMPLE})
-    # TODO, implement status list publication through a plugin
-    # credential_status = fields.Dict(
-    #     data_key="credentialStatus",
-    #     required=False,
-    #     metadata={"example": {"type": "StatusList2021"}},
-    # )
+    credential_status = fields.Dict(
+        data_key="credentialStatus",
+        required=False,
+        metadata={
+            "description": (
+                "Credential status to allocate, with StatusList2021 supported; the"
+                " statusPurpose defaults to revocation"
+            ),
+            "example": {"type": "StatusList2021", "statusPurpose": "revocation"},
+        },
+    )
 
 
 class ListCredentialsResponse(OpenAPISchema):
@@ -61,6 +67,19 @@ class IssueCredentialResponse(OpenAPISchema):
     verifiableCredential = fields.Nested(VerifiableCredentialSchema)
 
 
+class IssueCredentialsBatchRequest(OpenAPISchema):
+    """Request schema for issuing a batch of credentials."""
+
+    credentials = fields.List(fields.Nested(CredentialSchema), required=True)
+    options = fields.Nested(IssuanceOptionsSchema)
+
+
+class IssueCredentialsBatchResponse(OpenAPISchema):
+    """Response schema for issuing a batch of credentials."""
+
+    verifiableCredentials = fields.List(fields.Nested(VerifiableCredentialSchema))
+
+
 class VerifyCredentialRequest(OpenAPISchema):
     """Request schema for verifying a credential."""
 
@@ -74,6 +93,64 @@ class VerifyCredentialResponse(OpenAPISchema):
     results = fields.Nested(PresentationVerificationResultSchema)
 
 
+class VerifyCredentialsBatchRequest(OpenAPISchema):
+    """Request schema for verifying a batch of credentials."""
+
+    verifiableCredentials = fields.List(
+        fields.Dict(),
+        required=True,
+        metadata={"description": "The credentials to verify"},
+    )
+
+
+class VerifyCredentialsBatchResult(DocumentVerificationResultSchema):
+    """Result schema of a credential verified in a batch."""
+
+    index = fields.Int(
+        required=True,
+        metadata={
+            "description": "Position of the credential in the batch",
+            "example": 0,
+        },
+    )
+
+
+class StatusListMatchInfoSchema(OpenAPISchema):
+    """Path parameters and validators for requests on a status list."""
+
+    list_id = fields.Str(
+        required=True,
+        metadata={"description": "Status list identifier", "example": UUID4_EXAMPLE},
+    )
+
+
+class UpdateCredentialStatusRequest(OpenAPISchema):
+    """Request schema for updating the status of credentials on a status list."""
+
+    indexes = fields.List(
+        fields.Int(strict=True),
+        required=True,
+        metadata={
+            "description": "Status list indexes of the credentials",
+            "example": [94567],
+        },
+    )
+    status = fields.Bool(
+        required=False,
+        load_default=True,
+        metadata={
+            "description": "Set (true) or unset (false) the status",
+            "example": True,
+        },
+    )
+
+
+class StatusListCredentialResponse(OpenAPISchema):
+    """Response schema for a status list credential."""
+
+    verifiableCredential = fields.Nested(VerifiableCredentialSchema)
+
+
 class ProvePresentationRequest(OpenAPISchema):
     """Request schema for proving a presentation."""
 
@@ -1,5 +1,7 @@
 """Test VcLdpManager."""
 
+from copy import deepcopy
+
 import pytest
 
 from aries_cloudagent.tests import mock
@@ -393,3 +395,85 @@ async def test_store(
         holder = session.inject(VCHolder)
         record = await holder.retrieve_credential_by_id(record_id=TEST_UUID)
     assert record
+
+
+@pytest.mark.asyncio
+async def test_verify_credentials(profile: Profile, manager: VcLdpManager):
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        did = await wallet.create_local_did(
+            method=KEY,
+            key_type=ED25519,
+        )
+    credential = {
+        **VC["credential"],
+        "@context": [
+            "https://www.w3.org/2018/credentials/v1",
+            {"ex": "https://example.org/test#", "test": "ex:test"},
+        ],
+        "type": ["VerifiableCredential"],
+        "issuer": did.did,
+    }
+    options = LDProofVCOptions.deserialize(
+        {"proofType": Ed25519Signature2020.signature_type}
+    )
+    cred = await manager.issue(VerifiableCredential.deserialize(credential), options)
+    tampered = deepcopy(cred.serialize())
+    tampered["credentialSubject"]["test"] = "other"
+
+    document_loader = profile.inject(DocumentLoader)
+    with mock.patch.object(
+        document_loader.resolver, "resolve", wraps=document_loader.resolver.resolve
+    ) as mock_resolve:
+        results = dict(
+            [
+                result
+                async for result in manager.verify_credentials(
+                    [cred, VerifiableCredential.deserialize(tampered), cred]
+                )
+            ]
+        )
+    assert [results[index].verified for index in range(3)] == [True, False, True]
+    # the issuer is resolved once for the whole batch
+    assert mock_resolve.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_issue_batch(profile: Profile, manager: VcLdpManager):
+    dids = []
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        for _ in range(2):
+            dids.append(await wallet.create_local_did(method=KEY, key_type=ED25519))
+    credentials = [
+        VerifiableCredential.deserialize(
+            {
+                **VC["credential"],
+                "@context": [
+                    "https://www.w3.org/2018/credentials/v1",
+                    {"ex": "https://example.org/test#", "test": "ex:test"},
+                ],
+                "type": ["VerifiableCredential"],
+                "issuer": dids[index % 2].did,
+                "credentialSubject": {"test": str(index)},
+            }
+        )
+        for index in range(5)
+    ]
+    options = LDProofVCOptions.deserialize(
+        {"proofType": Ed25519Signature2020.signature_type}
+    )
+
+    with mock.patch.object(
+        manager, "_did_info_for_did", wraps=manager._did_info_for_did
+    ) as mock_did_info:
+        vcs = await manager.issue_batch(credentials, options)
+    # the suite is set up once per issuer
+    assert mock_did_info.call_count == 4
+
+    assert [vc.issuer_id for vc in vcs] == [dids[index % 2].did for index in range(5)]
+    assert [vc.credential_subject["test"] for vc in vcs] == [
+        str(index) for index in range(5)
+    ]
+    async for _, result in manager.verify_credentials(vcs):
+        assert result.verified
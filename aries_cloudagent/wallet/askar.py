@@ -647,7 +647,29 @@ class AskarWallet(BaseWallet):
             WalletError: If another backend error occurs
 
         """
-        if not message:
+        return (await self.sign_messages([message], from_verkey))[0]
+
+    async def sign_messages(
+        self, messages: Sequence[Union[List[bytes], bytes]], from_verkey: str
+    ) -> List[bytes]:
+        """Sign a batch of messages using the private key of a given verkey.
+
+        The key is fetched from the store once for the whole batch.
+
+        Args:
+            messages: The messages to sign, each signed separately
+            from_verkey: Sign using the private key related to this verkey
+
+        Returns:
+            The signatures, in the order of the messages
+
+        Raises:
+            WalletError: If a message is not provided
+            WalletError: If the verkey is not provided
+            WalletError: If another backend error occurs
+
+        """
+        if not messages or not all(messages):
             raise WalletError("Message not provided")
         if not from_verkey:
             raise WalletError("Verkey not provided")
@@ -658,14 +680,14 @@ class AskarWallet(BaseWallet):
             key = keypair.key
             if key.algorithm == KeyAlg.BLS12_381_G2:
                 # for now - must extract the key and use sign_message
-                return sign_message(
-                    message=message,
-                    secret=key.get_secret_bytes(),
-                    key_type=BLS12381G2,
-                )
+                secret = key.get_secret_bytes()
+                return [
+                    sign_message(message=message, secret=secret, key_type=BLS12381G2)
+                    for message in messages
+                ]
 
             else:
-                return key.sign_message(message)
+                return [key.sign_message(message) for message in messages]
         except AskarError as err:
             raise WalletError("Exception when signing message") from err
 
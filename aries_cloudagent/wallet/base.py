@@ -290,6 +290,21 @@ class BaseWallet(ABC):
 
         """
 
+    async def sign_messages(
+        self, messages: Sequence[Union[List[bytes], bytes]], from_verkey: str
+    ) -> List[bytes]:
+        """Sign a batch of messages using the private key of a given verkey.
+
+        Args:
+            messages: The messages to sign, each signed separately
+            from_verkey: Sign using the private key related to this verkey
+
+        Returns:
+            The signatures, in the order of the messages
+
+        """
+        return [await self.sign_message(message, from_verkey) for message in messages]
+
     @abstractmethod
     async def verify_message(
         self,
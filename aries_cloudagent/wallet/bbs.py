@@ -1,6 +1,6 @@
 """BBS+ crypto."""
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 from ..utils.dependencies import (
     assert_ursa_bbs_signatures_installed,
@@ -14,8 +14,15 @@ if is_ursa_bbs_signatures_module_installed():
         SignRequest,
         VerifyRequest,
         BlsKeyPair,
+        CreateProofRequest,
+        VerifyProofRequest,
+        ProofMessage,
+        ProofMessageType,
+        get_total_message_count,
         sign as bbs_sign,
         verify as bbs_verify,
+        create_proof as bbs_create_proof,
+        verify_proof as bbs_verify_proof,
         BbsException as NativeBbsException,
     )
     from ursa_bbs_signatures._ffi.FfiException import FfiException
@@ -82,6 +89,90 @@ def verify_signed_messages_bls12381g2(
         raise BbsException("Unable to verify BBS+ signature") from error
 
 
+def create_proof_bls12381g2(
+    messages: Sequence[str],
+    revealed: Sequence[int],
+    signature: bytes,
+    public_key: bytes,
+    nonce: bytes,
+) -> bytes:
+    """Derive a BBS+ proof revealing some of the signed messages.
+
+    Arguments are plain values, so that proofs can be derived in a worker
+    process.
+
+    Args:
+        messages: All the signed messages
+        revealed: The indexes of the messages to reveal
+        signature: The BBS+ signature over the messages
+        public_key: The bls12381g2 public key of the signer
+        nonce: The nonce of the proof
+
+    Returns:
+        The proof
+
+    """
+    assert_ursa_bbs_signatures_installed()
+
+    revealed = set(revealed)
+    try:
+        proof_request = CreateProofRequest(
+            public_key=BlsKeyPair(public_key=public_key).get_bbs_key(len(messages)),
+            messages=[
+                ProofMessage(
+                    message=message,
+                    proof_type=(
+                        ProofMessageType.Revealed
+                        if index in revealed
+                        else ProofMessageType.HiddenProofSpecificBlinding
+                    ),
+                )
+                for index, message in enumerate(messages)
+            ],
+            signature=signature,
+            nonce=nonce,
+        )
+        return bbs_create_proof(proof_request)
+    except (FfiException, NativeBbsException) as error:
+        # the cause is not kept when raised in a worker process
+        raise BbsException(f"Unable to create BBS+ proof: {error}") from error
+
+
+def verify_proof_bls12381g2(
+    messages: Sequence[str], proof: bytes, public_key: bytes, nonce: bytes
+) -> bool:
+    """Verify a BBS+ proof over the revealed messages.
+
+    Arguments are plain values, so that proofs can be verified in a worker
+    process.
+
+    Args:
+        messages: The revealed messages
+        proof: The proof to verify
+        public_key: The bls12381g2 public key of the signer
+        nonce: The nonce of the proof
+
+    Returns:
+        True if verified, else False
+
+    """
+    assert_ursa_bbs_signatures_installed()
+
+    try:
+        bbs_public_key = BlsKeyPair(public_key=public_key).get_bbs_key(
+            get_total_message_count(proof)
+        )
+        verify_request = VerifyProofRequest(
+            public_key=bbs_public_key,
+            proof=proof,
+            messages=list(messages),
+            nonce=nonce,
+        )
+        return bbs_verify_proof(verify_request)
+    except (FfiException, NativeBbsException) as error:
+        raise BbsException(f"Unable to verify BBS+ proof: {error}") from error
+
+
 def create_bls12381g2_keypair(seed: bytes = None) -> Tuple[bytes, bytes]:
     """Create a public and private bls12381g2 keypair from a seed value.
 
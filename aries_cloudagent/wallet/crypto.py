@@ -233,6 +233,27 @@ def verify_signed_message_ed25519(
     return True
 
 
+def verify_signed_messages_ed25519(
+    signed: Sequence[Tuple[bytes, bytes, bytes]],
+) -> List[bool]:
+    """Verify a batch of ed25519 signed messages.
+
+    Taking a single sequence, batches can be split in chunks verified in
+    worker processes.
+
+    Args:
+        signed: The message, signature and verkey of each signed message
+
+    Returns:
+        Whether each signature is valid, in order
+
+    """
+    return [
+        verify_signed_message_ed25519(message, signature, verkey)
+        for message, signature, verkey in signed
+    ]
+
+
 def add_pack_recipients(
     wrapper: JweEnvelope,
     cek: bytes,
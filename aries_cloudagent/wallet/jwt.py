@@ -1,8 +1,9 @@
 """Operations supporting JWT creation and verification."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from marshmallow import fields
 from pydid import DIDUrl, Resource, VerificationMethod
@@ -12,13 +13,18 @@ from ..messaging.jsonld.error import BadJWSHeaderError, InvalidVerificationMetho
 from ..messaging.jsonld.routes import SUPPORTED_VERIFICATION_METHOD_TYPES
 from ..messaging.models.base import BaseModel, BaseModelSchema
 from ..resolver.did_resolver import DIDResolver
+from ..utils.process_pool import ProcessPool
 from .default_verification_key_strategy import BaseVerificationKeyStrategy
 from .base import BaseWallet
+from .crypto import verify_signed_messages_ed25519
 from .key_type import ED25519
-from .util import b64_to_bytes, bytes_to_b64
+from .util import b58_to_bytes, b64_to_bytes, bytes_to_b64
 
 LOGGER = logging.getLogger(__name__)
 
+# batches of fewer signatures are verified inline rather than in the process pool
+MIN_POOL_BATCH = 64
+
 
 def dict_to_b64(value: Mapping[str, Any]) -> str:
     """Encode a dictionary as a b64 string."""
@@ -105,12 +111,14 @@ class JWTVerifyResult(BaseModel):
         payload: Mapping[str, Any],
         valid: bool,
         kid: str,
+        error: Optional[str] = None,
     ):
         """Initialize a JWTVerifyResult instance."""
         self.headers = headers
         self.payload = payload
         self.valid = valid
         self.kid = kid
+        self.error = error
 
 
 class JWTVerifyResultSchema(BaseModelSchema):
@@ -153,8 +161,8 @@ async def resolve_public_key_by_kid_for_verify(profile: Profile, kid: str) -> st
     return vmethod.material
 
 
-async def jwt_verify(profile: Profile, jwt: str) -> JWTVerifyResult:
-    """Verify a JWT and return the headers and payload."""
+def _decode_jwt(jwt: str) -> Tuple[dict, dict, bytes, bytes]:
+    """Decode the headers, payload, signing input and signature of a JWT."""
     encoded_headers, encoded_payload, encoded_signature = jwt.split(".", 3)
     headers = b64_to_dict(encoded_headers)
     if "alg" not in headers or headers["alg"] != "EdDSA" or "kid" not in headers:
@@ -163,8 +171,19 @@ async def jwt_verify(profile: Profile, jwt: str) -> JWTVerifyResult:
         )
 
     payload = b64_to_dict(encoded_payload)
-    verification_method = headers["kid"]
     decoded_signature = b64_to_bytes(encoded_signature, urlsafe=True)
+    return (
+        headers,
+        payload,
+        f"{encoded_headers}.{encoded_payload}".encode(),
+        decoded_signature,
+    )
+
+
+async def jwt_verify(profile: Profile, jwt: str) -> JWTVerifyResult:
+    """Verify a JWT and return the headers and payload."""
+    headers, payload, message, decoded_signature = _decode_jwt(jwt)
+    verification_method = headers["kid"]
 
     async with profile.session() as session:
         verkey = await resolve_public_key_by_kid_for_verify(
@@ -172,10 +191,93 @@ async def jwt_verify(profile: Profile, jwt: str) -> JWTVerifyResult:
         )
         wallet = session.inject(BaseWallet)
         valid = await wallet.verify_message(
-            f"{encoded_headers}.{encoded_payload}".encode(),
+            message,
             decoded_signature,
             verkey,
             ED25519,
         )
 
     return JWTVerifyResult(headers, payload, valid, verification_method)
+
+
+class JWTVerifier:
+    """Verifies many JWTs at once.
+
+    The public key of each kid is resolved once, however many JWTs it signed.
+    The signatures of the JWTs verified concurrently are checked together, in
+    chunks spread across the process pool for large batches.
+    """
+
+    def __init__(self, profile: Profile):
+        """Initialize the verifier.
+
+        Args:
+            profile: The profile to resolve keys with
+        """
+        self.profile = profile
+        self._keys: Dict[str, asyncio.Future] = {}
+        self._pending: List[Tuple[Tuple[bytes, bytes, bytes], asyncio.Future]] = []
+
+    async def verify(self, jwt: str) -> JWTVerifyResult:
+        """Verify a JWT and return the headers and payload."""
+        headers, payload, message, decoded_signature = _decode_jwt(jwt)
+        verification_method = headers["kid"]
+
+        verkey = await self.resolve_public_key(verification_method)
+        valid = await self._verify_signature(
+            message, decoded_signature, b58_to_bytes(verkey)
+        )
+
+        return JWTVerifyResult(headers, payload, valid, verification_method)
+
+    async def verify_all(self, jwts: Sequence[str]) -> List[JWTVerifyResult]:
+        """Verify JWTs, reporting the errors of those that cannot be verified."""
+        results = await asyncio.gather(
+            *(self.verify(jwt) for jwt in jwts), return_exceptions=True
+        )
+        return [
+            (
+                JWTVerifyResult({}, {}, False, None, error=str(result))
+                if isinstance(result, Exception)
+                else result
+            )
+            for result in results
+        ]
+
+    async def resolve_public_key(self, kid: str) -> str:
+        """Resolve the public key of a kid, once for all JWTs."""
+        if kid not in self._keys:
+            self._keys[kid] = asyncio.ensure_future(
+                resolve_public_key_by_kid_for_verify(self.profile, kid)
+            )
+        return await asyncio.shield(self._keys[kid])
+
+    async def _verify_signature(
+        self, message: bytes, signature: bytes, verkey: bytes
+    ) -> bool:
+        """Check a signature along with those of the other pending JWTs."""
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending.append(((message, signature, verkey), future))
+        if len(self._pending) == 1:
+            loop.call_soon(lambda: asyncio.ensure_future(self._verify_pending()))
+        return await future
+
+    async def _verify_pending(self):
+        """Check the signatures of the pending JWTs."""
+        pending, self._pending = self._pending, []
+        signed = [item for item, _ in pending]
+        try:
+            if len(signed) < MIN_POOL_BATCH:
+                results = verify_signed_messages_ed25519(signed)
+            else:
+                pool = self.profile.inject_or(ProcessPool) or ProcessPool(max_workers=0)
+                results = await pool.run_chunked(verify_signed_messages_ed25519, signed)
+        except Exception as err:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), valid in zip(pending, results):
+            if not future.done():
+                future.set_result(valid)
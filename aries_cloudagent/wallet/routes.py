@@ -56,8 +56,13 @@ from ..protocols.endorse_transaction.v1_0.util import (
 )
 from ..resolver.base import ResolverError
 from ..storage.error import StorageError, StorageNotFoundError
-from ..wallet.jwt import jwt_sign, jwt_verify
-from ..wallet.sd_jwt import sd_jwt_sign, sd_jwt_verify
+from ..wallet.jwt import JWTVerifier, jwt_sign, jwt_verify
+from ..wallet.sd_jwt import (
+    SDJWTError,
+    sd_jwt_sign,
+    sd_jwt_verify,
+    sd_jwt_verify_batch,
+)
 from .base import BaseWallet
 from .did_info import DIDInfo
 from .did_method import KEY, PEER2, PEER4, SOV, DIDMethod, DIDMethods, HolderDefinedDid
@@ -245,6 +250,44 @@ class SDJWSVerifyResponseSchema(JWSVerifyResponseSchema):
     )
 
 
+class JWSVerifyBatchSchema(OpenAPISchema):
+    """Request schema to verify a batch of jws created from DIDs."""
+
+    jwts = fields.List(
+        fields.Str(validate=JWT_VALIDATE, metadata={"example": JWT_EXAMPLE}),
+        required=True,
+        metadata={"description": "JWTs to verify"},
+    )
+
+
+class SDJWSVerifyBatchSchema(OpenAPISchema):
+    """Request schema to verify a batch of sd-jws created from DIDs."""
+
+    sd_jwts = fields.List(
+        fields.Str(validate=SD_JWT_VALIDATE, metadata={"example": SD_JWT_EXAMPLE}),
+        required=True,
+        metadata={"description": "SD-JWTs to verify"},
+    )
+
+
+class JWSVerifyBatchResponseSchema(OpenAPISchema):
+    """Response schema for batch JWT verification results."""
+
+    results = fields.List(
+        fields.Nested(JWSVerifyResponseSchema()),
+        metadata={"description": "Verification results, in the order of the JWTs"},
+    )
+
+
+class SDJWSVerifyBatchResponseSchema(OpenAPISchema):
+    """Response schema for batch SD-JWT verification results."""
+
+    results = fields.List(
+        fields.Nested(SDJWSVerifyResponseSchema()),
+        metadata={"description": "Verification results, in the order of the SD-JWTs"},
+    )
+
+
 class DIDEndpointSchema(OpenAPISchema):
     """Request schema to set DID endpoint; response schema to get DID endpoint."""
 
@@ -1159,7 +1202,7 @@ async def wallet_sd_jwt_verify(request: web.BaseRequest):
     sd_jwt = body["sd_jwt"]
     try:
         result = await sd_jwt_verify(context.profile, sd_jwt)
-    except (BadJWSHeaderError, InvalidVerificationMethod) as err:
+    except (BadJWSHeaderError, InvalidVerificationMethod, SDJWTError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
     except ResolverError as err:
         raise web.HTTPNotFound(reason=err.roll_up) from err
@@ -1167,6 +1210,52 @@ async def wallet_sd_jwt_verify(request: web.BaseRequest):
     return web.json_response(result.serialize())
 
 
+@docs(
+    tags=["wallet"],
+    summary="Verify a batch of EdDSA jws using did keys",
+    description=(
+        "The results of JWTs that cannot be verified report their error, "
+        "rather than failing the batch"
+    ),
+)
+@request_schema(JWSVerifyBatchSchema())
+@response_schema(JWSVerifyBatchResponseSchema(), 200, description="")
+async def wallet_jwt_verify_batch(request: web.BaseRequest):
+    """Request handler for batch jws validation using did.
+
+    Args:
+        "jwts": [ ... ]
+    """
+    context: AdminRequestContext = request["context"]
+    body = await request.json()
+    results = await JWTVerifier(context.profile).verify_all(body.get("jwts") or [])
+
+    return web.json_response({"results": [result.serialize() for result in results]})
+
+
+@docs(
+    tags=["wallet"],
+    summary="Verify a batch of EdDSA sd-jws using did keys",
+    description=(
+        "The results of SD-JWTs that cannot be verified report their error, "
+        "rather than failing the batch"
+    ),
+)
+@request_schema(SDJWSVerifyBatchSchema())
+@response_schema(SDJWSVerifyBatchResponseSchema(), 200, description="")
+async def wallet_sd_jwt_verify_batch(request: web.BaseRequest):
+    """Request handler for batch sd-jws validation using did.
+
+    Args:
+        "sd_jwts": [ ... ]
+    """
+    context: AdminRequestContext = request["context"]
+    body = await request.json()
+    results = await sd_jwt_verify_batch(context.profile, body.get("sd_jwts") or [])
+
+    return web.json_response({"results": [result.serialize() for result in results]})
+
+
 @docs(tags=["wallet"], summary="Query DID endpoint in wallet")
 @querystring_schema(DIDQueryStringSchema())
 @response_schema(DIDEndpointSchema, 200, description="")
@@ -1324,8 +1413,10 @@ async def register(app: web.Application):
             web.post("/wallet/set-did-endpoint", wallet_set_did_endpoint),
             web.post("/wallet/jwt/sign", wallet_jwt_sign),
             web.post("/wallet/jwt/verify", wallet_jwt_verify),
+            web.post("/wallet/jwt/verify-batch", wallet_jwt_verify_batch),
             web.post("/wallet/sd-jwt/sign", wallet_sd_jwt_sign),
             web.post("/wallet/sd-jwt/verify", wallet_sd_jwt_verify),
+            web.post("/wallet/sd-jwt/verify-batch", wallet_sd_jwt_verify_batch),
             web.get(
                 "/wallet/get-did-endpoint", wallet_get_did_endpoint, allow_head=False
             ),
@@ -1,18 +1,24 @@
 """Operations supporting SD-JWT creation and verification."""
 
+import asyncio
 import re
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, List, Mapping, Optional, Sequence, Union
 
 from jsonpath_ng.ext import parse as jsonpath_parse
 from marshmallow import fields
-from sd_jwt.common import SDObj
+from sd_jwt.common import DIGEST_ALG_KEY, SD_DIGESTS_KEY, SD_LIST_PREFIX, SDObj
 from sd_jwt.issuer import SDJWTIssuer
 from sd_jwt.verifier import SDJWTVerifier
 
 from ..core.error import BaseError
 from ..core.profile import Profile
 from ..messaging.valid import StrOrDictField
-from ..wallet.jwt import JWTVerifyResult, JWTVerifyResultSchema, jwt_sign, jwt_verify
+from ..wallet.jwt import (
+    JWTVerifier,
+    JWTVerifyResult,
+    JWTVerifyResultSchema,
+    jwt_sign,
+)
 
 CLAIMS_NEVER_SD = ["iss", "iat", "exp", "cnf"]
 
@@ -193,6 +199,7 @@ class SDJWTVerifyResult(JWTVerifyResult):
         valid,
         kid,
         disclosures,
+        error=None,
     ):
         """Initialize an SDJWTVerifyResult instance."""
         super().__init__(
@@ -200,6 +207,7 @@ class SDJWTVerifyResult(JWTVerifyResult):
             payload,
             valid,
             kid,
+            error,
         )
         self.disclosures = disclosures
 
@@ -238,6 +246,7 @@ class SDJWTVerifierACAPy(SDJWTVerifier):
         expected_aud: Union[str, None] = None,
         expected_nonce: Union[str, None] = None,
         serialization_format: str = "compact",
+        jwt_verifier: Optional[JWTVerifier] = None,
     ):
         """Initialize an SDJWTVerifierACAPy instance."""
         self.profile = profile
@@ -245,12 +254,17 @@ class SDJWTVerifierACAPy(SDJWTVerifier):
         self._serialization_format = serialization_format
         self.expected_aud = expected_aud
         self.expected_nonce = expected_nonce
+        # the key binding JWT shares the keys resolved for the SD-JWT
+        self.jwt_verifier = jwt_verifier or JWTVerifier(profile)
+
+    async def _verify_jwt(self, jwt: str) -> JWTVerifyResult:
+        """Verify a JWT, along with those of other SD-JWTs if batched."""
+        return await self.jwt_verifier.verify(jwt)
 
     async def _verify_sd_jwt(self) -> SDJWTVerifyResult:
-        verified = await jwt_verify(
-            self.profile,
-            self._unverified_input_sd_jwt,
-        )
+        verified = await self._verify_jwt(self._unverified_input_sd_jwt)
+        if verified.valid:
+            self._match_disclosures(verified.payload)
         return SDJWTVerifyResult(
             headers=verified.headers,
             payload=verified.payload,
@@ -259,6 +273,63 @@ class SDJWTVerifierACAPy(SDJWTVerifier):
             disclosures=self._disclosures_list,
         )
 
+    def _match_disclosures(self, payload: Mapping[str, Any]):
+        """Check that each disclosure is referenced by a digest of the SD-JWT.
+
+        The digests of the payload, and of the disclosed values they lead to,
+        are collected in a single pass and looked up in the hash mappings of
+        the disclosures, rather than searching the payload for each disclosure.
+
+        Raises:
+            SDJWTError: If a disclosure is not referenced, or referenced twice
+
+        """
+        if payload.get(DIGEST_ALG_KEY, self.HASH_ALG["name"]) != self.HASH_ALG["name"]:
+            raise SDJWTError(f"Unsupported hash algorithm: {payload[DIGEST_ALG_KEY]}")
+
+        found = set()
+        pending = [payload]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                # object property disclosures hold a salt, name and value
+                digests = [(digest, 3) for digest in value.get(SD_DIGESTS_KEY, ())]
+                pending.extend(
+                    item for key, item in value.items() if key != SD_DIGESTS_KEY
+                )
+            elif isinstance(value, list):
+                # array element disclosures hold a salt and value
+                digests = []
+                for item in value:
+                    if (
+                        isinstance(item, dict)
+                        and len(item) == 1
+                        and isinstance(item.get(SD_LIST_PREFIX), str)
+                    ):
+                        digests.append((item[SD_LIST_PREFIX], 2))
+                    else:
+                        pending.append(item)
+            else:
+                continue
+
+            for digest, length in digests:
+                if digest in found:
+                    raise SDJWTError(f"Duplicate digest found in SD-JWT: {digest}")
+                found.add(digest)
+                disclosure = self._hash_to_decoded_disclosure.get(digest)
+                if disclosure is None:
+                    # decoy digest, or claim not disclosed
+                    continue
+                if len(disclosure) != length:
+                    raise SDJWTError(f"Malformed disclosure for digest {digest}")
+                pending.append(disclosure[-1])
+
+        unreferenced = self._hash_to_decoded_disclosure.keys() - found
+        if unreferenced:
+            raise SDJWTError(
+                f"Disclosures not referenced by the SD-JWT: {sorted(unreferenced)}"
+            )
+
     async def verify(self) -> SDJWTVerifyResult:
         """Verify an sd-jwt."""
         self._parse_sd_jwt(self.sd_jwt_presentation)
@@ -284,9 +355,7 @@ class SDJWTVerifierACAPy(SDJWTVerifier):
         expected_aud: Union[str, None] = None,
         expected_nonce: Union[str, None] = None,
     ):
-        verified_kb_jwt = await jwt_verify(
-            self.profile, self._unverified_input_key_binding_jwt
-        )
+        verified_kb_jwt = await self._verify_jwt(self._unverified_input_key_binding_jwt)
         self._holder_public_key_payload = self.verified_sd_jwt.payload.get("cnf", None)
 
         if not self._holder_public_key_payload:
@@ -319,3 +388,31 @@ async def sd_jwt_verify(
         profile, sd_jwt_presentation, expected_aud, expected_nonce
     )
     return await sd_jwt_verifier.verify()
+
+
+async def sd_jwt_verify_batch(
+    profile: Profile, sd_jwt_presentations: Sequence[str]
+) -> List[SDJWTVerifyResult]:
+    """Verify many sd-jwts at once, reporting the errors of those that fail.
+
+    The signatures of all the sd-jwts are checked together, and the public
+    key of each kid resolved once.
+    """
+    jwt_verifier = JWTVerifier(profile)
+    results = await asyncio.gather(
+        *(
+            SDJWTVerifierACAPy(
+                profile, sd_jwt_presentation, jwt_verifier=jwt_verifier
+            ).verify()
+            for sd_jwt_presentation in sd_jwt_presentations
+        ),
+        return_exceptions=True,
+    )
+    return [
+        (
+            SDJWTVerifyResult({}, {}, False, None, [], error=str(result))
+            if isinstance(result, Exception)
+            else result
+        )
+        for result in results
+    ]
@@ -5,6 +5,8 @@ from ..bbs import (
     sign_messages_bls12381g2,
     verify_signed_messages_bls12381g2,
     create_bls12381g2_keypair,
+    create_proof_bls12381g2,
+    verify_proof_bls12381g2,
     BbsException,
 )
 
@@ -73,3 +75,24 @@ class TestBBS(TestCase):
             assert not verify_signed_messages_bls12381g2(
                 SIGN_MESSAGES, SIGNED_BYTES + b"10", PUBLIC_KEY_BYTES
             )
+
+    def test_proof(self):
+        messages = [message.decode("utf-8") for message in SIGN_MESSAGES]
+        proof = create_proof_bls12381g2(
+            messages, [1], SIGNED_BYTES, PUBLIC_KEY_BYTES, b"nonce"
+        )
+
+        assert verify_proof_bls12381g2(messages[1:], proof, PUBLIC_KEY_BYTES, b"nonce")
+        assert not verify_proof_bls12381g2(
+            messages[:1], proof, PUBLIC_KEY_BYTES, b"nonce"
+        )
+        assert not verify_proof_bls12381g2(
+            messages[1:], proof, PUBLIC_KEY_BYTES, b"other nonce"
+        )
+
+    def test_proof_x_modified_messages(self):
+        with self.assertRaises(BbsException) as context:
+            create_proof_bls12381g2(
+                ["modified", "message2"], [1], SIGNED_BYTES, PUBLIC_KEY_BYTES, b"n"
+            )
+        assert "Unable to create BBS+ proof" in str(context.exception)
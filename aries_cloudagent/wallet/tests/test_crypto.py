@@ -176,3 +176,14 @@ class TestCrypto(TestCase):
                 [b"message1", b"message2"], b"signature", b"verkey", BLS12381G1
             )
         assert "Unsupported key type: bls12381g1" in str(context.exception)
+
+    def test_verify_ed25519_batch(self):
+        verkey, secret = test_module.create_ed25519_keypair(SEED.encode())
+        signature = test_module.sign_message(b"message", secret, ED25519)
+        assert test_module.verify_signed_messages_ed25519(
+            [
+                (b"message", signature, verkey),
+                (b"other message", signature, verkey),
+                (b"message", signature[:10], verkey),
+            ]
+        ) == [True, False, False]
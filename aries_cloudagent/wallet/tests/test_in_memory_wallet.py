@@ -413,6 +413,10 @@ class TestInMemoryWallet:
         )
         assert not verify
 
+        signatures = await wallet.sign_messages([message_bin, bad_msg], info.verkey)
+        assert signatures[0] == signature
+        assert await wallet.verify_message(bad_msg, signatures[1], info.verkey, ED25519)
+
         with pytest.raises(WalletError):
             await wallet.sign_message(message_bin, self.missing_verkey)
 
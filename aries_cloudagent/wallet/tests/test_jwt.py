@@ -1,10 +1,18 @@
 import pytest
 
+from aries_cloudagent.tests import mock
 from aries_cloudagent.wallet.key_type import ED25519
 
 from ...wallet.did_method import KEY
 
-from ..jwt import jwt_sign, jwt_verify, resolve_public_key_by_kid_for_verify
+from ...utils.process_pool import ProcessPool
+from .. import jwt as test_module
+from ..jwt import (
+    JWTVerifier,
+    jwt_sign,
+    jwt_verify,
+    resolve_public_key_by_kid_for_verify,
+)
 
 
 class TestJWT:
@@ -88,3 +96,40 @@ class TestJWT:
         key_material = await resolve_public_key_by_kid_for_verify(profile, kid)
 
         assert key_material == "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+
+    @pytest.mark.asyncio
+    async def test_verifier_verify_all(self, profile, in_memory_wallet):
+        did_info = await in_memory_wallet.create_local_did(KEY, ED25519, self.seed)
+        signed = [
+            await jwt_sign(profile, {}, {"index": index}, did_info.did)
+            for index in range(3)
+        ]
+        tampered = signed[0].rsplit(".", 1)[0] + "." + signed[1].rsplit(".", 1)[1]
+
+        verifier = JWTVerifier(profile)
+        with mock.patch.object(
+            test_module,
+            "resolve_public_key_by_kid_for_verify",
+            mock.AsyncMock(wraps=resolve_public_key_by_kid_for_verify),
+        ) as resolve:
+            results = await verifier.verify_all([*signed, tampered, "not.a.jwt"])
+        resolve.assert_called_once()
+
+        assert [result.valid for result in results] == [True, True, True, False, False]
+        assert [result.payload.get("index") for result in results[:3]] == [0, 1, 2]
+        assert results[3].kid == results[0].kid
+        assert results[4].error
+
+    @pytest.mark.asyncio
+    async def test_verifier_process_pool(self, profile, in_memory_wallet):
+        did_info = await in_memory_wallet.create_local_did(KEY, ED25519, self.seed)
+        signed = await jwt_sign(profile, {}, {}, did_info.did)
+        pool = ProcessPool(max_workers=0)
+        profile.context.injector.bind_instance(ProcessPool, pool)
+
+        with mock.patch.object(test_module, "MIN_POOL_BATCH", 2), mock.patch.object(
+            pool, "run_chunked", mock.AsyncMock(wraps=pool.run_chunked)
+        ) as run_chunked:
+            results = await JWTVerifier(profile).verify_all([signed] * 3)
+        run_chunked.assert_called_once()
+        assert all(result.valid for result in results)
@@ -5,7 +5,13 @@ import pytest
 from ...wallet.did_method import KEY
 from ...wallet.key_type import ED25519
 from ...wallet.jwt import jwt_sign
-from ..sd_jwt import SDJWTVerifyResult, sd_jwt_sign, sd_jwt_verify
+from ..sd_jwt import (
+    SDJWTError,
+    SDJWTVerifyResult,
+    sd_jwt_sign,
+    sd_jwt_verify,
+    sd_jwt_verify_batch,
+)
 
 
 @pytest.fixture
@@ -96,6 +102,52 @@ class TestSDJWT:
         assert verified.payload["iat"] == payload["iat"]
         assert verified.payload["exp"] == payload["exp"]
 
+    @pytest.mark.asyncio
+    async def test_verify_batch(self, profile, in_memory_wallet):
+        did_info = await in_memory_wallet.create_local_did(KEY, ED25519, self.seed)
+        signed = [
+            await sd_jwt_sign(
+                profile,
+                self.headers,
+                {"sub": f"user_{index}", "given_name": "John", "iat": 1683000000},
+                ["sub"],
+                did_info.did,
+            )
+            for index in range(3)
+        ]
+
+        results = await sd_jwt_verify_batch(profile, [*signed, "not an sd-jwt~"])
+        assert [result.valid for result in results] == [True, True, True, False]
+        assert [result.payload.get("sub") for result in results[:3]] == [
+            "user_0",
+            "user_1",
+            "user_2",
+        ]
+        assert results[3].error
+        assert "error" not in results[0].serialize()
+
+    @pytest.mark.asyncio
+    async def test_verify_unreferenced_disclosure(self, profile, in_memory_wallet):
+        did_info = await in_memory_wallet.create_local_did(KEY, ED25519, self.seed)
+        signed = await sd_jwt_sign(
+            profile,
+            self.headers,
+            {"sub": "user_0", "given_name": "John", "iat": 1683000000},
+            [],
+            did_info.did,
+        )
+        other = await sd_jwt_sign(
+            profile,
+            self.headers,
+            {"family_name": "Doe", "iat": 1683000000},
+            [],
+            did_info.did,
+        )
+
+        disclosure = other.split("~")[1]
+        with pytest.raises(SDJWTError, match="not referenced"):
+            await sd_jwt_verify(profile, f"{signed.rstrip('~')}~{disclosure}~")
+
     @pytest.mark.asyncio
     async def test_flat_structure(
         self, profile, in_memory_wallet, create_address_payload